@@ -6,9 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.15 04:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
+import multiprocessing
+
 from pygpt_net.launcher import Launcher
 
 # plugins
@@ -228,6 +230,8 @@ def run(**kwargs):
         )
 
     """
+    multiprocessing.freeze_support()  # indexing worker processes in compiled versions
+
     # initialize app launcher
     launcher = Launcher()
     launcher.init()
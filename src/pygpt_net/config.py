@@ -6,18 +6,20 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.23 21:00:00                  #
+# Updated Date: 2025.01.20 21:00:00                  #
 # ================================================== #
 
 import copy
 import datetime
 import os
 import re
+import threading
 
 from pathlib import Path
 from packaging.version import Version
 
 from pygpt_net.core.profile import Profile
+from pygpt_net.core.scheduler import Scheduler
 from pygpt_net.provider.core.config.json_file import JsonFileProvider
 
 
@@ -48,6 +50,18 @@ class Config:
         self.data = {}  # user config
         self.data_base = {}  # base config
         self.data_session = {}  # temporary config (session only)
+        self.dirty = set()  # keys changed since last save
+        self.save_delay = 1000  # ms, saves are coalesced and written in background
+        self.save_delay_hot = 10000  # ms, delay if only frequently changed keys were changed
+        self.save_pending = None  # delay of pending save
+        self.hot_keys = [
+            "assistant_thread",
+            "ctx",
+            "ctx.list.expanded",
+            "ctx.records.filter.labels",
+            "ctx.search.string",
+            "dialog.last_dir",
+        ]
         self.version = version
         self.dirs = {
             "capture": "capture",
@@ -152,6 +166,8 @@ class Config:
         :param path: new path
         :param reload: reload config
         """
+        if self.save_pending is not None:
+            self.flush()  # write pending changes to the current workdir
         self.path = path
         self.provider.path = path
         if reload:
@@ -333,6 +349,8 @@ class Config:
         :param key: key
         :param value: value
         """
+        if key not in self.data or self.data[key] != value:
+            self.dirty.add(key)
         self.data[key] = value
 
     def set_session(self, key: str, value: any):
@@ -539,10 +557,61 @@ class Config:
         if list_loaded:
             print("Setting environment vars: {}".format(", ".join(list_loaded)))
 
-    def save(self, filename: str = "config.json"):
+    def save(self, filename: str = "config.json", force: bool = False):
         """
         Save config
 
+        Saves are delayed and coalesced, file is written in background thread.
+        If only frequently changed keys (e.g. current ctx) were changed then delay is longer.
+
+        :param filename: filename
+        :param force: save immediately and wait for write
+        """
+        if force or filename != self.provider.config_file or not self.is_delayed():
+            self.flush(filename)
+            return
+
+        delay = self.save_delay
+        if self.dirty and self.dirty.issubset(self.hot_keys):
+            delay = self.save_delay_hot
+        scheduler = self.window.core.scheduler
+        if self.save_pending is None or delay < self.save_pending or not scheduler.has("config.save"):
+            scheduler.add("config.save", self.flush_delayed, delay)
+            self.save_pending = delay
+
+    def flush(self, filename: str = "config.json"):
+        """
+        Save config immediately
+
         :param filename: filename
         """
+        if filename == self.provider.config_file:
+            self.cancel_delayed()
+            self.dirty.clear()
         self.provider.save(self.data, filename)
+
+    def flush_delayed(self):
+        """Save config in background (delayed save)"""
+        self.save_pending = None
+        self.dirty.clear()
+        self.provider.save(self.data, self.provider.config_file, background=True)
+
+    def cancel_delayed(self):
+        """Cancel pending delayed save"""
+        if self.save_pending is not None:
+            self.save_pending = None
+            if self.is_delayed():
+                self.window.core.scheduler.remove("config.save")
+
+    def is_delayed(self) -> bool:
+        """
+        Check if delayed saving is available (app scheduler is running and called from main thread)
+
+        :return: True if available
+        """
+        if self.save_delay <= 0 or self.window is None:
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        scheduler = getattr(self.window.core, "scheduler", None)
+        return isinstance(scheduler, Scheduler) and scheduler.timer is not None
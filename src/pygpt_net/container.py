@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.18 00:00:00                  #
+# Updated Date: 2025.01.20 19:00:00                  #
 # ================================================== #
 
 from pygpt_net.config import Config
@@ -38,6 +38,7 @@ from pygpt_net.core.platforms import Platforms
 from pygpt_net.core.plugins import Plugins
 from pygpt_net.core.presets import Presets
 from pygpt_net.core.prompt import Prompt
+from pygpt_net.core.scheduler import Scheduler
 from pygpt_net.core.settings import Settings
 from pygpt_net.core.tabs import Tabs
 from pygpt_net.core.tokens import Tokens
@@ -87,6 +88,7 @@ class Container:
         self.plugins = Plugins(window)
         self.presets = Presets(window)
         self.prompt = Prompt(window)
+        self.scheduler = Scheduler(window)
         self.settings = Settings(window)
         self.tabs = Tabs(window)
         self.tokens = Tokens(window)
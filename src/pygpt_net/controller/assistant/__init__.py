@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from typing import Optional
@@ -72,6 +72,7 @@ class Assistant:
                 if has_unclosed_code_tag(ctx.output):
                     ctx.output += "\n```"  # fix for code block without closing ```
                 self.window.core.ctx.update_item(ctx)  # save current output
+                self.window.controller.chat.render.invalidate(ctx)
 
                 # get status
                 try:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 00:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -166,6 +166,7 @@ class Output:
 
             ctx.from_previous()  # append previous result again before save
             self.window.core.ctx.update_item(ctx)  # update ctx in DB
+            self.window.controller.chat.render.invalidate(ctx)  # output changed
 
         # render: end
         if ctx.sub_calls == 0:  # if no experts called
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.20 23:00:00                  #
 # ================================================== #
 
 from typing import Optional, List
@@ -290,6 +290,30 @@ class Render:
         self.instance().append_context(meta, items, clear)
         self.update()
 
+    def invalidate(self, ctx: CtxItem):
+        """
+        Invalidate rendered HTML cache of ctx item
+
+        :param ctx: context item
+        """
+        self.web_renderer.cache.invalidate(ctx.id)
+
+    def load_more(self, pid: int):
+        """
+        Render previous page of items (windowed output)
+
+        :param pid: context PID
+        """
+        self.instance().load_more(pid)
+
+    def trim(self, pid: int):
+        """
+        Remove far-off items (windowed output)
+
+        :param pid: context PID
+        """
+        self.instance().trim(pid)
+
     def append_input(
             self,
             meta: CtxMeta,
@@ -6,12 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 00:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
-from typing import Any
+import time
+from functools import partial
+from typing import Any, Optional
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QObject, Signal, QRunnable, Slot, QEventLoop
 
 from pygpt_net.core.events import RenderEvent
 from pygpt_net.item.ctx import CtxItem
@@ -30,11 +32,12 @@ class Stream:
         """
         Handle stream response
 
+        Stream is read in worker thread, chunks are coalesced and rendered at most once per frame (interval)
+
         :param ctx: CtxItem
         """
         output = ""
         output_tokens = 0
-        begin = True
 
         # chunks: stream begin
         data = {
@@ -49,113 +52,32 @@ class Stream:
             if ctx.stream is not None:
                 self.log("[chat] Stream begin...")  # log
 
-                tool_calls = []
-
-                for chunk in ctx.stream:
-                    # if force stop then break
-                    if self.window.controller.kernel.stopped():
-                        break
-
-                    response = None
-                    chunk_type = "raw"
-                    if (hasattr(chunk, 'choices')
-                            and chunk.choices[0] is not None
-                            and hasattr(chunk.choices[0], 'delta')
-                            and chunk.choices[0].delta is not None):
-                        chunk_type = "api_chat"
-                    elif (hasattr(chunk, 'choices')
-                          and chunk.choices[0] is not None
-                          and hasattr(chunk.choices[0], 'text')
-                          and chunk.choices[0].text is not None):
-                        chunk_type = "api_completion"
-                    elif (hasattr(chunk, 'content')
-                          and chunk.content is not None):
-                        chunk_type = "langchain_chat"
-                    elif (hasattr(chunk, 'delta')
-                          and chunk.delta is not None):
-                        chunk_type = "llama_chat"
-
-                    # OpenAI chat completion
-                    if chunk_type == "api_chat":
-                        if chunk.choices[0].delta and chunk.choices[0].delta.content is not None:
-                            response = chunk.choices[0].delta.content
-                        if chunk.choices[0].delta and chunk.choices[0].delta.tool_calls:
-                            tool_chunks = chunk.choices[0].delta.tool_calls
-                            for tool_chunk in tool_chunks:
-                                if len(tool_calls) <= tool_chunk.index:
-                                    tool_calls.append(
-                                        {
-                                            "id": "",
-                                            "type": "function",
-                                            "function": {
-                                                "name": "",
-                                                "arguments": ""
-                                            }
-                                        }
-                                    )
-                                tool_call = tool_calls[tool_chunk.index]
-                                if tool_chunk.id:
-                                    tool_call["id"] += tool_chunk.id
-                                if tool_chunk.function.name:
-                                    tool_call["function"]["name"] += tool_chunk.function.name
-                                if tool_chunk.function.arguments:
-                                    tool_call["function"]["arguments"] += tool_chunk.function.arguments
-
-                    # OpenAI completion
-                    elif chunk_type == "api_completion":
-                        if chunk.choices[0].text is not None:
-                            response = chunk.choices[0].text
-
-                    # langchain chat
-                    elif chunk_type == "langchain_chat":
-                        if chunk.content is not None:
-                            response = str(chunk.content)
-
-                    # llama chat
-                    elif chunk_type == "llama_chat":
-                        if chunk.delta is not None:
-                            response = str(chunk.delta)
-                        tool_chunks = chunk.message.additional_kwargs.get("tool_calls", [])
-                        if tool_chunks:
-                            for tool_chunk in tool_chunks:
-                                args = tool_chunk.function.arguments
-                                if not args:
-                                    args = "{}"  # JSON encoded
-                                tool_call = {
-                                        "id": tool_chunk.id,
-                                        "type": "function",
-                                        "function": {
-                                            "name": tool_chunk.function.name,
-                                            "arguments": args
-                                        }
-                                    }
-                                tool_calls.clear()
-                                tool_calls.append(tool_call)
-
-                    # raw text: llama-index and langchain completion
-                    else:
-                        if chunk is not None:
-                            response = str(chunk)
-
-                    if response is not None and response != "":
-                        if begin and response == "":  # prevent empty beginning
-                            continue
-                        output += response
-                        output_tokens += 1
-                        data = {
-                            "meta": ctx.meta,
-                            "ctx": ctx,
-                            "chunk": response,
-                            "begin": begin,
-                        }
-                        event = RenderEvent(RenderEvent.STREAM_APPEND, data)
-                        self.window.dispatch(event)
-                        QApplication.processEvents()  # process events to update UI after each chunk
-                        begin = False
+                # state is kept per stream, another stream may be started from local event loop
+                state = StreamState(ctx)
+
+                # wait for worker in local event loop, UI is still responsive
+                loop = QEventLoop()
+                worker = StreamWorker()
+                worker.window = self.window
+                worker.ctx = ctx
+                worker.interval = self.get_interval()
+                worker.signals.chunk.connect(partial(self.handle_chunk, state))
+                worker.signals.finished.connect(partial(self.handle_finished, state))
+                worker.signals.finished.connect(loop.quit)
+                self.window.threadpool.start(worker)
+                loop.exec()
+                state.ctx = None  # ignore late chunks
+
+                result = state.result
+                if result is not None:
+                    output = result["output"]
+                    output_tokens = result["output_tokens"]
+                    if result["error"] is not None:
+                        self.window.core.debug.log(result["error"])
 
-                # unpack and store tool calls
-                if tool_calls:
-                    self.window.core.command.unpack_tool_calls_chunks(ctx, tool_calls)
+                    # unpack and store tool calls
+                    if result["tool_calls"]:
+                        self.window.core.command.unpack_tool_calls_chunks(ctx, result["tool_calls"])
 
         except Exception as e:
             self.window.core.debug.log(e)
@@ -177,6 +99,42 @@ class Stream:
         # log
         self.log("[chat] Stream end.")
 
+    def handle_chunk(self, state: "StreamState", chunk: str):
+        """
+        Handle coalesced chunk from stream worker
+
+        :param state: stream state
+        :param chunk: text chunk (all chunks received since last update)
+        """
+        if state.ctx is None:
+            return
+        data = {
+            "meta": state.ctx.meta,
+            "ctx": state.ctx,
+            "chunk": chunk,
+            "begin": state.begin,
+        }
+        event = RenderEvent(RenderEvent.STREAM_APPEND, data)
+        self.window.dispatch(event)
+        state.begin = False
+
+    def handle_finished(self, state: "StreamState", result: dict):
+        """
+        Handle stream worker finished
+
+        :param state: stream state
+        :param result: stream result (output, output_tokens, tool_calls, error)
+        """
+        state.result = result
+
+    def get_interval(self) -> float:
+        """
+        Get minimum interval between UI updates
+
+        :return: interval in seconds
+        """
+        return int(self.window.core.config.get("render.stream.interval", 30) or 0) / 1000
+
     def log(self, data: Any):
         """
         Log data to debug
@@ -184,3 +142,166 @@ class Stream:
         :param data: Data to log
         """
         self.window.core.debug.info(data)
+
+
+class StreamState:
+    def __init__(self, ctx: CtxItem):
+        """
+        Stream state (per stream)
+
+        :param ctx: CtxItem
+        """
+        self.ctx = ctx
+        self.begin = True  # first chunk
+        self.result = None  # worker result
+
+
+class StreamSignals(QObject):
+    chunk = Signal(str)  # coalesced text chunk
+    finished = Signal(object)  # result dict
+
+
+class StreamWorker(QObject, QRunnable):
+    def __init__(self, *args, **kwargs):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.signals = StreamSignals()
+        self.args = args
+        self.kwargs = kwargs
+        self.window = None
+        self.ctx = None
+        self.interval = 0.03  # min interval between chunk signals, in seconds
+
+    @Slot()
+    def run(self):
+        """Read stream and emit buffered chunks"""
+        output = ""
+        output_tokens = 0
+        tool_calls = []
+        buffer = ""
+        last_emit = 0
+        error = None
+
+        try:
+            for chunk in self.ctx.stream:
+                # if force stop then break
+                if self.window.controller.kernel.stopped():
+                    break
+
+                response = self.parse_chunk(chunk, tool_calls)
+                if response is not None and response != "":
+                    output += response
+                    output_tokens += 1
+                    buffer += response
+
+                    # emit max once per interval
+                    now = time.monotonic()
+                    if now - last_emit >= self.interval:
+                        self.signals.chunk.emit(buffer)
+                        buffer = ""
+                        last_emit = now
+
+        except Exception as e:
+            error = e
+
+        # flush the rest
+        if buffer:
+            self.signals.chunk.emit(buffer)
+
+        self.signals.finished.emit({
+            "output": output,
+            "output_tokens": output_tokens,
+            "tool_calls": tool_calls,
+            "error": error,
+        })
+
+    def parse_chunk(self, chunk: Any, tool_calls: list) -> Optional[str]:
+        """
+        Parse stream chunk
+
+        :param chunk: stream chunk
+        :param tool_calls: tool calls list (updated in place)
+        :return: text from chunk
+        """
+        response = None
+        chunk_type = "raw"
+        if (hasattr(chunk, 'choices')
+                and chunk.choices[0] is not None
+                and hasattr(chunk.choices[0], 'delta')
+                and chunk.choices[0].delta is not None):
+            chunk_type = "api_chat"
+        elif (hasattr(chunk, 'choices')
+              and chunk.choices[0] is not None
+              and hasattr(chunk.choices[0], 'text')
+              and chunk.choices[0].text is not None):
+            chunk_type = "api_completion"
+        elif (hasattr(chunk, 'content')
+              and chunk.content is not None):
+            chunk_type = "langchain_chat"
+        elif (hasattr(chunk, 'delta')
+              and chunk.delta is not None):
+            chunk_type = "llama_chat"
+
+        # OpenAI chat completion
+        if chunk_type == "api_chat":
+            if chunk.choices[0].delta and chunk.choices[0].delta.content is not None:
+                response = chunk.choices[0].delta.content
+            if chunk.choices[0].delta and chunk.choices[0].delta.tool_calls:
+                tool_chunks = chunk.choices[0].delta.tool_calls
+                for tool_chunk in tool_chunks:
+                    if len(tool_calls) <= tool_chunk.index:
+                        tool_calls.append(
+                            {
+                                "id": "",
+                                "type": "function",
+                                "function": {
+                                    "name": "",
+                                    "arguments": ""
+                                }
+                            }
+                        )
+                    tool_call = tool_calls[tool_chunk.index]
+                    if tool_chunk.id:
+                        tool_call["id"] += tool_chunk.id
+                    if tool_chunk.function.name:
+                        tool_call["function"]["name"] += tool_chunk.function.name
+                    if tool_chunk.function.arguments:
+                        tool_call["function"]["arguments"] += tool_chunk.function.arguments
+
+        # OpenAI completion
+        elif chunk_type == "api_completion":
+            if chunk.choices[0].text is not None:
+                response = chunk.choices[0].text
+
+        # langchain chat
+        elif chunk_type == "langchain_chat":
+            if chunk.content is not None:
+                response = str(chunk.content)
+
+        # llama chat
+        elif chunk_type == "llama_chat":
+            if chunk.delta is not None:
+                response = str(chunk.delta)
+            tool_chunks = chunk.message.additional_kwargs.get("tool_calls", [])
+            if tool_chunks:
+                for tool_chunk in tool_chunks:
+                    args = tool_chunk.function.arguments
+                    if not args:
+                        args = "{}"  # JSON encoded
+                    tool_call = {
+                            "id": tool_chunk.id,
+                            "type": "function",
+                            "function": {
+                                "name": tool_chunk.function.name,
+                                "arguments": args
+                            }
+                        }
+                    tool_calls.clear()
+                    tool_calls.append(tool_call)
+
+        # raw text: llama-index and langchain completion
+        else:
+            if chunk is not None:
+                response = str(chunk)
+
+        return response
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from typing import Optional, List
@@ -47,6 +47,7 @@ class Ctx:
     def setup(self):
         """Setup ctx"""
         self.common.restore_display_filter()  # load filters first
+        self.window.core.ctx.writer.signals.error.connect(self.handle_write_error)
 
         # load ctx list
         self.window.core.ctx.load_meta()
@@ -895,6 +896,18 @@ class Ctx:
         self.window.core.config.set('ctx.list.expanded', expanded)
         self.window.core.config.save()
 
+    def handle_write_error(self, errors: list):
+        """
+        Handle failed context writes (from write-behind queue)
+
+        :param errors: list of errors
+        """
+        for err in errors:
+            self.window.core.debug.log(err)
+        msg = "\n".join(str(err) for err in errors)
+        self.window.ui.dialogs.alert(trans("ctx.write.error") + "\n\n" + msg)
+        self.window.update_status(trans("ctx.write.error"))
+
     def restore_expanded_groups(self):
         """
         Restore expanded groups in ctx list
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from PySide6.QtWidgets import QApplication
@@ -231,4 +231,6 @@ class Extra:
             prev_item.output += current_item.output
             self.window.core.ctx.update_item(prev_item)
             self.window.core.ctx.remove_item(current_item.id)
+            self.window.controller.chat.render.invalidate(prev_item)
+            self.window.controller.chat.render.invalidate(current_item)
             self.window.controller.ctx.refresh()
\ No newline at end of file
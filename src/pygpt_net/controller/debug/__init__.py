@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.20 19:00:00                  #
 # ================================================== #
 
 from datetime import datetime
@@ -94,6 +94,14 @@ class Debug(QObject):
 
         self.window.ui.dialogs.app_log.update_log_level()
 
+    def has_post_update(self) -> bool:
+        """
+        Check if post-update loop is required (any debug window active)
+
+        :return: True if required
+        """
+        return self.window.controller.dialogs.debug.has_active()
+
     def on_post_update(self, all: bool = False):
         """
         Update debug windows (only if active)
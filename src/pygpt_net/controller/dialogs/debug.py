@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 00:00:00                  #
+# Updated Date: 2025.01.21 03:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -28,6 +28,7 @@ from pygpt_net.core.debug.plugins import PluginsDebug
 from pygpt_net.core.debug.presets import PresetsDebug
 from pygpt_net.core.debug.tabs import TabsDebug
 from pygpt_net.core.debug.ui import UIDebug
+from pygpt_net.core.debug.web import WebDebug
 
 
 class Debug:
@@ -57,6 +58,7 @@ class Debug:
         self.workers['presets'] = PresetsDebug(self.window)
         self.workers['tabs'] = TabsDebug(self.window)
         self.workers['ui'] = UIDebug(self.window)
+        self.workers['web'] = WebDebug(self.window)
 
         # prepare debug ids
         self.ids = self.workers.keys()
@@ -154,6 +156,14 @@ class Debug:
             return False
         return self.active[id]
 
+    def has_active(self) -> bool:
+        """
+        Check if any debug window is active
+
+        :return: True if any active
+        """
+        return any(self.active.values())
+
     def show(self, id: str):
         """
         Activate debug window
@@ -164,6 +174,7 @@ class Debug:
             return
         self.active[id] = True
         self.window.ui.dialogs.open('debug.' + id, width=800, height=600)
+        self.window.update_loop()  # debug windows are refreshed in post-update loop
 
     def hide(self, id: str):
         """
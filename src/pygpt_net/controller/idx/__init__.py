@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 20:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import datetime
@@ -295,6 +295,7 @@ class Idx:
 
     def reload(self):
         """Reload indexer"""
+        self.window.core.idx.storage.clear_cache()  # drop indexes loaded from previous workdir
         self.setup()
 
     def on_idx_start(self):
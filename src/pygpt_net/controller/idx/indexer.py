@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 import datetime
@@ -652,14 +652,18 @@ class Indexer(QObject):
         :param silent: silent mode (no msg and status update)
         """
         num = len(files)
-        if num > 0:
-            msg = trans('idx.status.success') + f" {num}"
+        stats = self.window.core.idx.indexing.get_stats()
+        info = trans('idx.status.stats').format(**stats)
+        if num > 0 or stats["removed"] > 0:
+            msg = trans('idx.status.success') + f" {num} " + info
             self.window.core.idx.append(idx, files)  # append files list to index
             self.update_idx_status(idx)
             self.window.controller.idx.after_index(idx)  # post-actions (update UI, etc.)
             if not silent:
                 self.window.update_status(msg)
                 self.window.ui.dialogs.alert(msg)
+        elif stats["skipped"] > 0:
+            self.window.update_status(trans('idx.status.empty') + " " + info)
         else:
             self.window.update_status(trans('idx.status.empty'))
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 import json
@@ -101,6 +101,7 @@ class Reply:
 
         prev_ctx = self.window.core.ctx.as_previous(self.reply_ctx)  # copy result to previous ctx and clear current ctx
         self.window.core.ctx.update_item(self.reply_ctx)  # update context in db
+        self.window.controller.chat.render.invalidate(self.reply_ctx)
         self.window.update_status('...')
 
         # if response from sub call, from experts
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 21:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from PySide6.QtGui import QAction
@@ -65,7 +65,7 @@ class Lang:
         :param id: language code to toggle
         """
         self.window.core.config.set('lang', id)
-        self.window.core.config.save()
+        self.window.core.config.save(force=True)  # locale is reloaded from file
         trans('', True)  # force reload locale
 
         self.update()  # update menu
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 04:00:00                  #
 # ================================================== #
 
 import copy
@@ -236,6 +236,7 @@ class Editor:
         # save config
         if persist:
             self.window.core.models.save()
+            self.window.core.idx.llm.reset()  # drop LLM instances created with old args
             self.close()
             self.window.update_status(trans("info.settings.saved"))
 
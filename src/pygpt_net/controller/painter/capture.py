@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import datetime
@@ -17,7 +17,6 @@ from typing import Optional, Union
 import mss
 import mss.tools
 from PIL import Image, ImageDraw
-from pynput.mouse import Controller
 
 from PySide6.QtGui import QImage
 
@@ -54,6 +53,7 @@ class Capture:
         :param save_path: Save path
         :return: Save path
         """
+        from pynput.mouse import Controller
         cursor_path = os.path.join(self.window.core.config.get_app_path(), "data", "icons", "cursor.png")
 
         with mss.mss() as sct:
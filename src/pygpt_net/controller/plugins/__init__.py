@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.17 13:00:00                  #
+# Updated Date: 2025.01.20 19:00:00                  #
 # ================================================== #
 
 from typing import List, Dict, Any
@@ -19,6 +19,7 @@ from pygpt_net.core.types import (
 from pygpt_net.controller.plugins.presets import Presets
 from pygpt_net.controller.plugins.settings import Settings
 from pygpt_net.core.events import Event
+from pygpt_net.plugin.base.plugin import BasePlugin
 from pygpt_net.item.ctx import CtxItem
 from pygpt_net.utils import trans
 
@@ -123,6 +124,7 @@ class Plugins:
         if self.window.core.plugins.is_registered(id):
             self.enabled[id] = True
             self.window.core.plugins.enable(id)
+            self.window.update_loop()
 
             # dispatch plugin enable event
             event = Event(Event.ENABLE, {
@@ -147,6 +149,7 @@ class Plugins:
         if self.window.core.plugins.is_registered(id):
             self.enabled[id] = False
             self.window.core.plugins.disable(id)
+            self.window.update_loop()
 
             if not silent:
                 # dispatch plugin disable event
@@ -311,19 +314,62 @@ class Plugins:
         """Called on update"""
         for id in self.window.core.plugins.get_ids():
             if self.is_enabled(id):
-                try:
-                    self.window.core.plugins.get(id).on_update()
-                except AttributeError:
-                    pass
+                plugin = self.window.core.plugins.get(id)
+                if self.is_hooked(plugin, "on_update"):
+                    try:
+                        plugin.on_update()
+                    except AttributeError:
+                        pass
 
     def on_post_update(self):
         """Called on post update"""
         for id in self.window.core.plugins.get_ids():
             if self.is_enabled(id):
-                try:
-                    self.window.core.plugins.get(id).on_post_update()
-                except AttributeError:
-                    pass
+                plugin = self.window.core.plugins.get(id)
+                if self.is_hooked(plugin, "on_post_update"):
+                    try:
+                        plugin.on_post_update()
+                    except AttributeError:
+                        pass
+
+    def has_update(self) -> bool:
+        """
+        Check if any enabled plugin requires update loop
+
+        :return: True if required
+        """
+        return self.has_hook("on_update")
+
+    def has_post_update(self) -> bool:
+        """
+        Check if any enabled plugin requires post-update loop
+
+        :return: True if required
+        """
+        return self.has_hook("on_post_update")
+
+    def has_hook(self, name: str) -> bool:
+        """
+        Check if any enabled plugin implements loop hook
+
+        :param name: hook name
+        :return: True if implemented
+        """
+        for id in self.window.core.plugins.get_ids():
+            if self.is_enabled(id) and self.is_hooked(self.window.core.plugins.get(id), name):
+                return True
+        return False
+
+    def is_hooked(self, plugin: BasePlugin, name: str) -> bool:
+        """
+        Check if plugin implements loop hook (plugins without own implementation are not polled)
+
+        :param plugin: plugin instance
+        :param name: hook name
+        :return: True if implemented
+        """
+        hook = getattr(type(plugin), name, None)
+        return hook is not None and hook is not getattr(BasePlugin, name)
 
     def update_info(self):
         """Update plugins info"""
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 04:00:00                  #
 # ================================================== #
 
 import copy
@@ -143,6 +143,14 @@ class Editor:
             self.window.core.filesystem.install()
             self.window.controller.files.update_explorer()
 
+        # recreate shared API clients (API keys, endpoints, proxy may change)
+        self.window.core.gpt.reset_clients()
+        self.window.core.idx.llm.reset()
+
+        # recreate HTTP connection pools with new size
+        if self.config_changed('web.http.pool.size'):
+            self.window.core.web.http.reset()
+
         # switch log level in runtime
         if self.config_changed('log.level'):
             self.window.controller.debug.set_log_level(self.window.core.config.get('log.level'))
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import copy
@@ -402,6 +402,7 @@ class Profile:
         path_to = new_path
         print("Copying all files from {} to: {}".format(path_from, path_to))
         self.window.update_status("Copying files...")
+        self.window.core.config.save(force=True)  # write pending config changes before copy
         result = self.window.core.filesystem.copy_workdir(
             path_from,
             path_to,
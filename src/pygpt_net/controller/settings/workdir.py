@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.04.14 18:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import os
@@ -159,6 +159,7 @@ class Workdir:
 
         # copy workdir
         try:
+            self.window.core.config.save(force=True)  # write pending config changes before copy
             result = self.window.core.filesystem.copy_workdir(current, path)
         except Exception as e:
             self.window.core.debug.log(e)
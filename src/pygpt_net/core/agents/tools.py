@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.20 12:00:00                  #
 # ================================================== #
 
 import json
@@ -55,7 +55,7 @@ class Tools:
         idx = extra.get("agent_idx", None)
         if idx is not None and idx != "_":
             llm, embed_model = self.window.core.idx.llm.get_service_context(model=context.model)
-            index = self.window.core.idx.storage.get(idx, llm, embed_model)  # get index
+            index = self.window.core.idx.storage.get(idx, llm, embed_model, cache=True)  # get index (cached)
             if index is not None:
                 query_engine = index.as_query_engine(similarity_top_k=3)
                 query_engine_tools = [
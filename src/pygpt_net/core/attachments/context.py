@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2025.01.20 12:00:00                  #
 # ================================================== #
 
 import copy
@@ -676,6 +676,7 @@ class Context:
         meta_path = self.get_dir(meta)
         if os.path.exists(meta_path) and os.path.isdir(meta_path):
             shutil.rmtree(meta_path)
+            self.window.core.idx.storage.clear_cache()
             if self.is_verbose():
                 print("Attachment deleted dir: {}".format(meta_path))
 
@@ -716,6 +717,7 @@ class Context:
             if os.path.exists(idx_path) and os.path.isdir(idx_path):
                 shutil.rmtree(idx_path)
             os.makedirs(idx_path, exist_ok=True)
+            self.window.core.idx.storage.clear_cache()
         except Exception as e:
             self.window.core.debug.error("Attachment.truncate", e)
 
@@ -6,12 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 import copy
 import datetime
 import uuid
+from bisect import bisect_left
+from itertools import accumulate
 from typing import Optional, Tuple, List, Dict
 
 from packaging.version import Version
@@ -37,6 +39,7 @@ from pygpt_net.utils import trans
 from .idx import Idx
 from .container import Container
 from .output import Output
+from .writer import Writer
 
 
 class Ctx:
@@ -51,6 +54,7 @@ class Ctx:
         self.container = Container(window)  # context container
         self.output = Output(window)  # context render output
         self.idx = Idx(window)  # context indexing core
+        self.writer = Writer(window)  # write-behind queue
         self.meta = {}
         self.current = None
         self.last_item = None
@@ -357,6 +361,10 @@ class Ctx:
         """
         return self.provider.patch(app_version)
 
+    def reset_schema(self):
+        """Reset cached database schema state (after DB migration)"""
+        self.provider.reset_schema()
+
     def get_provider(self) -> BaseProvider:
         """
         Get provider instance
@@ -1003,19 +1011,9 @@ class Ctx:
         :param max_tokens: max tokens
         :return: ctx items count, ctx tokens count
         """
-        i = 0
-        # loop on items from end to start
-        tokens = used_tokens
-        context_tokens = 0
-        for item in reversed(history_items):
-            num = self.window.core.tokens.from_ctx(item, mode, model)  # get num tokens for input and output
-            tokens += num
-            if tokens > max_tokens:
-                break
-            context_tokens += num
-            i += 1
-
-        return i, context_tokens
+        sums = self.get_tokens_sums(history_items, model, mode)
+        i = self.count_fit(sums, max_tokens - used_tokens)
+        return i, sums[-1] - sums[len(sums) - 1 - i]
 
     def get_history(
             self,
@@ -1037,22 +1035,45 @@ class Ctx:
         :param ignore_first: ignore current item (provided by user)
         :return: ctx items list
         """
-        items = []
-        # loop on items from end to start
-        tokens = used_tokens
-        is_first = True
-        for item in reversed(history_items):
-            if is_first and ignore_first:
-                is_first = False
-                continue
-            tokens += self.window.core.tokens.from_ctx(item, mode, model)
-            if tokens > max_tokens:
-                break
-            items.append(item)
+        if ignore_first:
+            history_items = history_items[:-1]  # current item
+        sums = self.get_tokens_sums(history_items, model, mode)
+        i = self.count_fit(sums, max_tokens - used_tokens)
+        if i == 0:
+            return []
+        return history_items[-i:]
 
-        # reverse items
-        items.reverse()
-        return items
+    def get_tokens_sums(
+            self,
+            history_items: List[CtxItem],
+            model: str,
+            mode: str
+    ) -> List[int]:
+        """
+        Return prefix sums of ctx items tokens (item tokens are memoized in items)
+
+        :param history_items: history items list
+        :param model: model
+        :param mode: mode
+        :return: prefix sums, sums[i] = tokens of first i items
+        """
+        counts = [self.window.core.tokens.from_ctx(item, mode, model) for item in history_items]
+        return list(accumulate(counts, initial=0))
+
+    def count_fit(self, sums: List[int], budget: int) -> int:
+        """
+        Return number of last items that fit in tokens budget (binary search on prefix sums)
+
+        :param sums: prefix sums of items tokens
+        :param budget: tokens budget
+        :return: number of last items
+        """
+        total = sums[-1]
+        if budget < 0:
+            return 0
+        # first index j where tokens of items[j:] fit in budget
+        j = bisect_left(sums, total - budget)
+        return len(sums) - 1 - j
 
     def count_prompt_items(
             self,
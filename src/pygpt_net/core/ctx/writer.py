@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Any, Dict, List
+
+from PySide6.QtCore import QObject, Signal
+from sqlalchemy import text
+
+
+class WriterSignals(QObject):
+    error = Signal(object)  # list of errors from failed commit
+
+
+class Writer:
+
+    DELAY = 0.2  # seconds to collect writes (one turn) before commit
+
+    def __init__(self, window=None):
+        """
+        Context write-behind queue (unit of work)
+
+        Collects inserts and updates and commits them in a single transaction
+        from background thread. Repeated updates of the same row are coalesced.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.signals = WriterSignals()
+        self.queue = OrderedDict()  # key => statement
+        self.ids = {}  # table => last allocated ID
+        self.cond = threading.Condition()
+        self.thread = None
+        self.flushing = False  # batch is being committed
+        self.stopped = False
+        self.counter = 0
+        self.batches = 0
+        self.writes = 0
+
+    def is_enabled(self) -> bool:
+        """
+        Check if write-behind is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("ctx.write_behind", False)) and not self.stopped
+
+    def add(self, stmt, key: Optional[Any] = None):
+        """
+        Add statement to queue
+
+        :param stmt: SQLAlchemy statement with bound params
+        :param key: coalescing key (e.g. table and row ID), previous statement with the same key is replaced
+        """
+        with self.cond:
+            if key is None:
+                self.counter += 1
+                key = ("stmt", self.counter)
+            self.queue[key] = stmt  # replaced statement keeps its position
+            self.start()
+            self.cond.notify_all()
+
+    def insert(self, table: str, stmt) -> int:
+        """
+        Add insert statement to queue with allocated row ID
+
+        :param table: table name (with AUTOINCREMENT primary key)
+        :param stmt: SQLAlchemy insert statement with unbound `id` param
+        :return: row ID
+        """
+        with self.cond:
+            id = self.next_id(table)
+            self.add(stmt.bindparams(id=id))
+            return id
+
+    def next_id(self, table: str) -> int:
+        """
+        Allocate ID for queued insert
+
+        :param table: table name (with AUTOINCREMENT primary key)
+        :return: row ID
+        """
+        with self.cond:
+            if table not in self.ids:
+                db = self.window.core.db.get_db()
+                with db.connect() as conn:
+                    seq = conn.execute(text("""
+                        SELECT seq FROM sqlite_sequence WHERE name = :name
+                    """).bindparams(name=table)).scalar()
+                    last = conn.execute(text("SELECT MAX(id) FROM {}".format(table))).scalar()
+                self.ids[table] = max(seq or 0, last or 0)
+            self.ids[table] += 1
+            return self.ids[table]
+
+    def start(self):
+        """Start background thread"""
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def run(self):
+        """Commit queued statements in background"""
+        while True:
+            with self.cond:
+                while not self.queue and not self.stopped:
+                    self.cond.wait()
+                if self.stopped:
+                    return
+                self.cond.wait_for(lambda: self.stopped, timeout=self.DELAY)  # collect more writes
+            self.commit()
+
+    def commit(self):
+        """Commit queued statements in single transaction"""
+        with self.cond:
+            while self.flushing:
+                self.cond.wait()
+            if not self.queue:
+                return
+            batch = list(self.queue.values())
+            self.queue.clear()
+            self.flushing = True
+        errors = []
+        try:
+            db = self.window.core.db.get_db()
+            with db.begin() as conn:
+                for stmt in batch:
+                    conn.execute(stmt)
+            self.batches += 1
+            self.writes += len(batch)
+        except Exception as e:
+            self.window.core.debug.log(e)
+            errors = self.retry(batch)  # do not lose whole batch because of single statement
+        finally:
+            with self.cond:
+                self.flushing = False
+                if not self.queue:
+                    self.ids.clear()  # re-read on next insert, rows may be changed outside of queue
+                self.cond.notify_all()
+        if errors:
+            self.signals.error.emit(errors)
+
+    def retry(self, batch: list) -> List[Exception]:
+        """
+        Commit statements one by one after failed batch
+
+        :param batch: list of statements
+        :return: errors of statements that failed again
+        """
+        errors = []
+        db = self.window.core.db.get_db()
+        for stmt in batch:
+            try:
+                with db.begin() as conn:
+                    conn.execute(stmt)
+                self.writes += 1
+            except Exception as e:
+                self.window.core.debug.log(e)
+                print("Error while saving context: {}".format(e))
+                errors.append(e)
+        self.batches += 1
+        return errors
+
+    def flush(self):
+        """Wait until all queued statements are committed (barrier for reads)"""
+        if not self.queue and not self.flushing:
+            return
+        self.commit()
+
+    def stop(self):
+        """Commit queued statements and stop background thread"""
+        self.flush()
+        with self.cond:
+            self.stopped = True
+            self.cond.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+        self.flush()  # statements added before stop
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue stats
+
+        :return: dict with queued statements, committed batches and writes
+        """
+        return {
+            "queued": len(self.queue),
+            "batches": self.batches,
+            "writes": self.writes,
+        }
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 import os
@@ -14,7 +14,7 @@ import shutil
 import time
 from typing import Optional, Any, Dict
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 
 from pygpt_net.migrations import Migrations
 from .viewer import Viewer
@@ -30,6 +30,15 @@ class Database:
         self.initialized = False
         self.echo = True
 
+        # SQLite connection tuning, applied on every new connection
+        self.pragmas = {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -32000,  # in KiB (negative value), ~32 MB
+            'mmap_size': 268435456,  # 256 MB
+            'temp_store': 'MEMORY',
+        }
+
         # Tables configuration
         columns = {}
         columns["calendar_note"] = [
@@ -156,6 +165,9 @@ class Database:
             'store',
             'idx',
             'uuid',
+            'hash',
+            'size',
+            'mtime',
         ]
         columns["notepad"] = [
             'id',
@@ -337,10 +349,27 @@ class Database:
             echo=self.echo,
             future=True
         )
+        event.listen(self.engine, "connect", self.on_connect)
         if not self.is_installed():
             self.install()
         self.initialized = True
 
+    def on_connect(self, dbapi_conn, conn_record):
+        """
+        Apply SQLite pragmas on new connection
+
+        :param dbapi_conn: DBAPI connection
+        :param conn_record: connection record
+        """
+        cursor = dbapi_conn.cursor()
+        try:
+            for key, value in self.pragmas.items():
+                cursor.execute("PRAGMA {} = {}".format(key, value))
+        except Exception as e:
+            print("[DB] Error while setting pragmas: {}".format(e))
+        finally:
+            cursor.close()
+
     def close(self):
         """Close database connection"""
         self.engine.dispose()
@@ -429,6 +458,10 @@ class Database:
             backup_path = os.path.join(self.window.core.config.path, 'db.sqlite.backup')
             if os.path.exists(backup_path):
                 os.remove(backup_path)
+            if self.engine is not None:
+                # flush WAL into the main database file before copy
+                with self.engine.connect() as conn:
+                    conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
             shutil.copyfile(self.db_path, backup_path)
             return backup_path
         except Exception as e:
@@ -447,6 +480,7 @@ class Database:
             with self.engine.begin() as conn:
                 for migration in sorted_migrations:
                     self.apply_migration(migration, conn, db_version)
+            self.window.core.ctx.reset_schema()  # tables may be changed
 
     def get_param(self, key: str) -> Optional[str]:
         """
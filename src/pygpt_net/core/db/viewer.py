@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import json
@@ -26,6 +26,15 @@ class Viewer:
         self.tables = {}
         self.auto_backup = True
 
+    def get_db(self):
+        """
+        Get database engine (commit queued ctx writes first)
+
+        :return: database engine
+        """
+        self.database.window.core.ctx.writer.flush()
+        return self.database.get_db()
+
     def fetch_data(
             self,
             table: str,
@@ -86,7 +95,7 @@ class Viewer:
 
         query = f"{base_query}{where_clause}{order_clause}{limit_clause}"
         stmt = text(query).bindparams(**params)
-        with self.database.get_db().connect() as conn:
+        with self.get_db().connect() as conn:
             result = conn.execute(stmt).fetchall()
             return result
 
@@ -136,7 +145,7 @@ class Viewer:
 
         query = f"{base_query}{where_clause}"
         stmt = text(query).bindparams(**params)
-        with self.database.get_db().connect() as conn:
+        with self.get_db().connect() as conn:
             count = conn.execute(stmt).scalar()
             return count
 
@@ -162,7 +171,7 @@ class Viewer:
                 self.log(msg)
 
         # delete row
-        with self.database.get_db().begin() as conn:
+        with self.get_db().begin() as conn:
             conn.execute(
                 text(f"DELETE FROM {data['table']} WHERE id = :row_id")
                 .bindparams(row_id=data['row_id'])
@@ -213,7 +222,7 @@ class Viewer:
                 self.log(msg)
 
         # update row
-        with self.database.get_db().begin() as conn:
+        with self.get_db().begin() as conn:
             conn.execute(
                 text(f"UPDATE {data['table']} SET {data['field']} = :value WHERE {primary_key} = :id")
                 .bindparams(id=data['id'], value=value)
@@ -237,7 +246,7 @@ class Viewer:
                 self.log(msg)
 
         # truncate table
-        with self.database.get_db().begin() as conn:
+        with self.get_db().begin() as conn:
             conn.execute(text(f"DELETE FROM {data['table']}"))
             if reset:  # reset table sequence (autoincrement)
                 conn.execute(text(f"DELETE FROM sqlite_sequence WHERE name='{data['table']}'"))
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.08.25 04:00:00                  #
+# Updated Date: 2025.01.20 16:00:00                  #
 # ================================================== #
 
 import datetime
@@ -57,6 +57,8 @@ class IndexesDebug:
                                    str(list(self.window.core.idx.storage.storages.keys())))
         self.window.core.debug.add(self.id, 'Temp (in-memory) indices:',
                                    str(self.window.core.idx.storage.count_tmp()))
+        self.window.core.debug.add(self.id, 'Embeddings cache:',
+                                   str(self.window.core.idx.llm.embeddings_cache.get_stats()))
 
         # loaders
         self.window.core.debug.add(self.id, 'Offline loaders [files]:',
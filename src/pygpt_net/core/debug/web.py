@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 03:00:00                  #
+# ================================================== #
+
+class WebDebug:
+    def __init__(self, window=None):
+        """
+        Web (HTTP) debug
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.id = 'web'
+
+    def update(self):
+        """Update debug window."""
+        stats = self.window.core.web.http.get_stats()
+        cache = stats['cache']
+        self.window.core.debug.begin(self.id)
+        self.window.core.debug.add(self.id, 'Requests:', str(stats['requests']))
+        self.window.core.debug.add(self.id, 'Pools (hosts):', str(stats['pools']))
+        self.window.core.debug.add(self.id, 'Pool size:', str(self.window.core.config.get('web.http.pool.size')))
+        self.window.core.debug.add(self.id, 'Cache enabled:', str(cache['enabled']))
+        self.window.core.debug.add(self.id, 'Cache hits:', str(cache['hits']))
+        self.window.core.debug.add(self.id, 'Cache misses:', str(cache['misses']))
+        self.window.core.debug.add(self.id, 'Cache revalidated:', str(cache['revalidated']))
+        self.window.core.debug.add(self.id, 'Cache size:', str(cache['size']))
+        self.window.core.debug.add(self.id, 'Cache limit:', str(cache['limit']))
+        self.window.core.debug.end(self.id)
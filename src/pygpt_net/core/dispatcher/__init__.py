@@ -6,9 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.21 17:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
+from typing import List, Optional
+
 from pygpt_net.core.events import (
     BaseEvent,
     KernelEvent,
@@ -28,6 +30,9 @@ class Dispatcher:
         self.window = window
         self.nolog_events = ["system.prompt", "render.stream.append"]
         self.call_id = 0
+        self.handlers = None  # event name => enabled plugin ids, built on first dispatch
+        self.broadcast = []  # enabled plugin ids without declared events, receive all events
+        self.plugins_key = None  # plugins registry state used to build the table
 
     def dispatch(
             self,
@@ -90,7 +95,11 @@ class Dispatcher:
 
         # dispatch event to plugins
         affected = []
-        for id in list(self.window.core.plugins.plugins.keys()):
+        if all:
+            ids = list(self.window.core.plugins.plugins.keys())
+        else:
+            ids = self.get_handlers(event.name)
+        for id in ids:
             if self.window.controller.plugins.is_enabled(id) or all:
                 if event.stop:
                     self.window.core.debug.info("[event] Skipping... (stopped):  " + event.name)
@@ -108,6 +117,64 @@ class Dispatcher:
         self.call_id += 1
         return affected, event
 
+    def get_handlers(self, name: str) -> List[str]:
+        """
+        Get enabled plugin ids subscribed to event
+
+        :param name: event name
+        :return: list of plugin ids (in plugins order)
+        """
+        plugins = self.window.core.plugins.plugins
+        if self.handlers is None or self.plugins_key != (id(plugins), len(plugins)):
+            self.build()
+        return self.handlers.get(name, self.broadcast)
+
+    def build(self):
+        """Build subscriptions table (event name => enabled plugin ids)"""
+        plugins = self.window.core.plugins.plugins
+        key = (id(plugins), len(plugins))
+        ids = [plugin_id for plugin_id in list(plugins.keys()) if self.window.controller.plugins.is_enabled(plugin_id)]
+        declared = {}
+        for plugin_id in ids:
+            declared[plugin_id] = self.get_events(plugins[plugin_id])
+
+        # plugins without declared events are added to every list, order of plugins is preserved
+        names = set()
+        for events in declared.values():
+            if events is not None:
+                names.update(events)
+        handlers = {name: [] for name in names}
+        broadcast = []
+        for plugin_id in ids:
+            events = declared[plugin_id]
+            if events is None:
+                broadcast.append(plugin_id)
+                for name in handlers:
+                    handlers[name].append(plugin_id)
+            else:
+                for name in events:
+                    handlers[name].append(plugin_id)
+        self.handlers = handlers
+        self.broadcast = broadcast
+        self.plugins_key = key
+
+    def get_events(self, plugin) -> Optional[List[str]]:
+        """
+        Get event names declared by plugin
+
+        :param plugin: plugin instance
+        :return: list of event names or None if not declared
+        """
+        events = getattr(plugin, "events", None)
+        if isinstance(events, (list, tuple, set)):
+            return list(dict.fromkeys(events))
+        return None
+
+    def reset(self):
+        """Reset subscriptions table (on plugin register, enable or disable)"""
+        self.handlers = None
+        self.broadcast = []
+
     def apply(
             self,
             id: str,
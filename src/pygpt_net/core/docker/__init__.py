@@ -6,17 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 00:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import os
 from typing import Optional, Any
 
-import docker
 import io
 import tarfile
 
-from docker.errors import DockerException
 
 class Docker:
     def __init__(self, plugin = None):
@@ -73,6 +71,7 @@ class Docker:
 
         :return: True if the image exists.
         """
+        import docker
         client = self.get_docker_client()
         try:
             client.images.get(self.get_image_name())
@@ -104,12 +103,13 @@ class Docker:
         except FileExistsError:
             pass
 
-    def get_docker_client(self) -> docker.DockerClient:
+    def get_docker_client(self) -> "docker.DockerClient":
         """
         Get the Docker client.
 
         :return: Docker client.
         """
+        import docker
         return docker.from_env()
 
     def end(self, all: bool = False):
@@ -127,6 +127,7 @@ class Docker:
 
         :param name: Container name.
         """
+        import docker
         client = self.get_docker_client()
         try:
             container = client.containers.get(name)
@@ -141,6 +142,7 @@ class Docker:
 
         :param name: Container name.
         """
+        import docker
         client = self.get_docker_client()
         image_name = self.get_image_name()
         entrypoint = self.get_entrypoint()
@@ -186,6 +188,7 @@ class Docker:
 
         :param name: Container name.
         """
+        import docker
         client = self.get_docker_client()
         image_name = self.get_image_name()
         entrypoint = self.get_entrypoint()
@@ -384,6 +387,8 @@ class Docker:
 
         :return: True if installed
         """
+        import docker
+        from docker.errors import DockerException
         try:
             if self.client is None:
                 client = docker.from_env()
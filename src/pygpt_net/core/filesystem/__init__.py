@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import os
@@ -19,6 +19,7 @@ from uuid import uuid4
 from PySide6.QtCore import QUrl
 
 from .actions import Actions
+from .catalog import Catalog
 from .editor import Editor
 from .packer import Packer
 from .types import Types
@@ -33,6 +34,7 @@ class Filesystem:
         """
         self.window = window
         self.actions = Actions(window)
+        self.catalog = Catalog(window)
         self.editor = Editor(window)
         self.packer = Packer(window)
         self.types = Types(window)
@@ -328,7 +330,7 @@ class Filesystem:
         :param human_readable: return human-readable format
         :return: total size of the database file
         """
-        db_files = ["db.sqlite", "db.sqlite.backup"]
+        db_files = ["db.sqlite", "db.sqlite-wal", "db.sqlite-shm", "db.sqlite.backup"]
         total_size = 0
         for file in db_files:
             db_file = os.path.join(path, file)
@@ -375,6 +377,8 @@ class Filesystem:
         excluded_dirs = []
         if not copy_db:
             excluded_files.append("db.sqlite")
+            excluded_files.append("db.sqlite-wal")
+            excluded_files.append("db.sqlite-shm")
             excluded_files.append("db.sqlite.backup")
         if not copy_datadir:
             excluded_dirs.append("data")
@@ -420,6 +424,8 @@ class Filesystem:
             excluded_dirs.append("data")
         if not remove_db:
             excluded_files.append("db.sqlite")
+            excluded_files.append("db.sqlite-wal")  # WAL sidecars of the open database
+            excluded_files.append("db.sqlite-shm")
         for item in os.listdir(path):
             item_path = os.path.join(path, item)
             if os.path.isfile(item_path):
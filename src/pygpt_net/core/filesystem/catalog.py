@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 06:00:00                  #
+# ================================================== #
+
+import fnmatch
+import os
+import threading
+import time
+from stat import S_ISDIR
+from typing import Optional, List, Dict, Any, Tuple
+
+from sqlalchemy import create_engine, text
+
+RACY_TIME = 2  # dirs modified this close to the scan time are re-listed on next refresh
+
+
+class Catalog:
+    def __init__(self, window=None):
+        """
+        Catalog of files in data directory (path, size, mtime) stored in SQLite
+
+        Directories are re-listed only if their mtime has changed since the last scan,
+        so refresh of the whole tree costs one stat per directory.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.engine = None
+        self.engine_path = None
+        self.lock = threading.Lock()
+        self.scanned = 0  # number of directories re-listed in last refresh
+
+    def get_root(self) -> str:
+        """
+        Get catalog root directory
+
+        :return: data directory path
+        """
+        return os.path.normpath(self.window.core.config.get_user_dir('data'))
+
+    def get_path(self) -> str:
+        """
+        Get catalog database path
+
+        :return: path to database file
+        """
+        return os.path.join(self.window.core.config.get_user_dir('tmp'), "files_catalog.db")
+
+    def get_db(self):
+        """
+        Get catalog database engine (create database if not exists)
+
+        :return: SQLAlchemy engine
+        """
+        path = self.get_path()
+        if self.engine is None or self.engine_path != path:  # workdir may be changed
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            engine = create_engine("sqlite:///{}".format(path))
+            with engine.begin() as conn:
+                conn.execute(text("PRAGMA journal_mode=WAL;"))
+                conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS file (
+                    path TEXT NOT NULL PRIMARY KEY,
+                    parent TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    is_dir INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    depth INTEGER NOT NULL,
+                    is_link INTEGER NOT NULL
+                ) WITHOUT ROWID;
+                """))
+                conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_file_parent ON file (parent);
+                """))
+                conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS dir (
+                    path TEXT NOT NULL PRIMARY KEY,
+                    mtime REAL NOT NULL,
+                    scanned_ts REAL NOT NULL
+                ) WITHOUT ROWID;
+                """))
+            self.engine = engine
+            self.engine_path = path
+        return self.engine
+
+    def get_id(self, path: str) -> Optional[str]:
+        """
+        Get catalog path (relative to data directory, "/" separated, same as indexed file ID)
+
+        :param path: absolute path
+        :return: catalog path, "" for root, None if path is outside data directory
+        """
+        root = self.get_root()
+        path = os.path.normpath(os.path.abspath(path))
+        try:
+            if os.path.commonpath([root, path]) != root:
+                return None
+        except ValueError:
+            return None  # different drives
+        rel = os.path.relpath(path, root)
+        if rel == ".":
+            return ""
+        return rel.replace(os.sep, "/")
+
+    def to_abs(self, id: str) -> str:
+        """
+        Get absolute path from catalog path
+
+        :param id: catalog path
+        :return: absolute path
+        """
+        if id == "":
+            return self.get_root()
+        return os.path.join(self.get_root(), *id.split("/"))
+
+    def is_cataloged(self, path: str) -> bool:
+        """
+        Check if path can be queried from catalog
+
+        :param path: absolute path
+        :return: True if path is in data directory
+        """
+        return self.get_id(path) is not None
+
+    def get_range(self, id: str) -> Tuple[str, str]:
+        """
+        Get key range of all descendants of directory
+
+        :param id: catalog path of directory
+        :return: (lower, upper) bounds, lower inclusive, upper exclusive
+        """
+        if id == "":
+            return "", "\U0010ffff"
+        return id + "/", id + "0"  # "0" is next char after "/"
+
+    def join(self, parent: str, name: str) -> str:
+        """
+        Join catalog paths
+
+        :param parent: parent catalog path
+        :param name: entry name
+        :return: catalog path
+        """
+        if parent == "":
+            return name
+        return parent + "/" + name
+
+    def refresh(self, path: Optional[str] = None):
+        """
+        Update catalog for directory subtree (re-list only modified directories)
+
+        :param path: absolute directory path (default: data directory)
+        """
+        id = "" if path is None else self.get_id(path)
+        if id is None:
+            return
+        with self.lock:
+            db = self.get_db()
+            lower, upper = self.get_range(id)
+            with db.begin() as conn:
+                known = {}
+                for row in conn.execute(text("""
+                    SELECT path, mtime, scanned_ts FROM dir
+                    WHERE path = :path OR (path >= :lower AND path < :upper)
+                """), {"path": id, "lower": lower, "upper": upper}):
+                    data = row._asdict()
+                    known[data["path"]] = (data["mtime"], data["scanned_ts"])
+                subdirs = {}
+                for row in conn.execute(text("""
+                    SELECT path, parent FROM file
+                    WHERE is_dir = 1 AND is_link = 0 AND (path >= :lower AND path < :upper)
+                """), {"path": id, "lower": lower, "upper": upper}):
+                    data = row._asdict()
+                    subdirs.setdefault(data["parent"], []).append(data["path"])
+
+                self.scanned = 0
+                stack = [id]
+                while stack:
+                    current = stack.pop()
+                    try:
+                        stat = os.stat(self.to_abs(current))
+                    except OSError:
+                        self.remove(conn, current)
+                        continue
+                    if not S_ISDIR(stat.st_mode):
+                        continue
+                    mtime = stat.st_mtime
+                    if current in known:
+                        prev_mtime, scanned_ts = known[current]
+                        if prev_mtime == mtime and scanned_ts - mtime > RACY_TIME:
+                            stack.extend(subdirs.get(current, []))  # not changed
+                            continue
+                    stack.extend(self.scan(conn, current, mtime))
+
+    def scan(self, conn, id: str, mtime: float) -> List[str]:
+        """
+        Re-list directory entries
+
+        :param conn: database connection
+        :param id: catalog path of directory
+        :param mtime: directory mtime
+        :return: catalog paths of subdirectories to check
+        """
+        self.scanned += 1
+        depth = 0 if id == "" else id.count("/") + 1
+        rows = {}
+        subdirs = []
+        try:
+            with os.scandir(self.to_abs(id)) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                        is_link = entry.is_symlink()
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    path = self.join(id, entry.name)
+                    rows[path] = {
+                        "path": path,
+                        "parent": id,
+                        "name": entry.name,
+                        "is_dir": 1 if is_dir else 0,
+                        "size": 0 if is_dir else stat.st_size,
+                        "mtime": stat.st_mtime,
+                        "depth": depth,
+                        "is_link": 1 if is_link else 0,
+                    }
+                    if is_dir and not is_link:
+                        subdirs.append(path)  # do not follow links, same as os.walk
+        except OSError:
+            self.remove(conn, id)
+            return []
+
+        # remove deleted entries (with their subtrees)
+        stored = conn.execute(text("""
+            SELECT path, is_dir, is_link FROM file WHERE parent = :parent
+        """), {"parent": id}).fetchall()
+        for path, is_dir, is_link in stored:
+            if path not in rows:
+                self.remove(conn, path)
+            elif is_dir and not is_link and (not rows[path]["is_dir"] or rows[path]["is_link"]):
+                self.remove(conn, path)  # directory replaced with file or link
+        if rows:
+            conn.execute(text("""
+                INSERT OR REPLACE INTO file (path, parent, name, is_dir, size, mtime, depth, is_link)
+                VALUES (:path, :parent, :name, :is_dir, :size, :mtime, :depth, :is_link)
+            """), list(rows.values()))
+        conn.execute(text("""
+            INSERT OR REPLACE INTO dir (path, mtime, scanned_ts) VALUES (:path, :mtime, :ts)
+        """), {"path": id, "mtime": mtime, "ts": time.time()})
+        return subdirs
+
+    def remove(self, conn, id: str):
+        """
+        Remove entry and its subtree from catalog
+
+        :param conn: database connection
+        :param id: catalog path
+        """
+        lower, upper = self.get_range(id)
+        params = {"path": id, "lower": lower, "upper": upper}
+        conn.execute(text("""
+            DELETE FROM file WHERE path = :path OR (path >= :lower AND path < :upper)
+        """), params)
+        conn.execute(text("""
+            DELETE FROM dir WHERE path = :path OR (path >= :lower AND path < :upper)
+        """), params)
+
+    def list_dir(
+            self,
+            path: str,
+            pattern: Optional[str] = None,
+            limit: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        List directory entries
+
+        :param path: absolute directory path
+        :param pattern: name pattern (glob)
+        :param limit: max number of entries (0 = no limit)
+        :return: list of entries (name, path, is_dir, size, mtime) sorted by name
+        """
+        id = self.get_id(path)
+        self.refresh(path)
+        db = self.get_db()
+        with db.connect() as conn:
+            rows = conn.execute(text("""
+                SELECT path, name, is_dir, size, mtime FROM file WHERE parent = :parent ORDER BY name
+            """), {"parent": id})
+            return self.filter(rows, pattern, limit)
+
+    def find(
+            self,
+            path: str,
+            pattern: str,
+            recursive: bool = True,
+            files_only: bool = True,
+            limit: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Find entries by name pattern
+
+        :param path: absolute directory path
+        :param pattern: name pattern (glob)
+        :param recursive: search in subdirectories
+        :param files_only: skip directories
+        :param limit: max number of entries (0 = no limit)
+        :return: list of entries sorted by path
+        """
+        if not recursive:
+            items = self.list_dir(path, pattern)
+            if files_only:
+                items = [item for item in items if not item["is_dir"]]
+            return items[:limit] if limit > 0 else items
+        id = self.get_id(path)
+        self.refresh(path)
+        lower, upper = self.get_range(id)
+        db = self.get_db()
+        sql = """
+            SELECT path, name, is_dir, size, mtime FROM file
+            WHERE path >= :lower AND path < :upper
+        """
+        if files_only:
+            sql += " AND is_dir = 0"
+        sql += " ORDER BY path"
+        with db.connect() as conn:
+            rows = conn.execute(text(sql), {"lower": lower, "upper": upper})
+            return self.filter(rows, pattern, limit)
+
+    def walk(
+            self,
+            path: str,
+            max_depth: int = 0
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get directory subtree
+
+        :param path: absolute directory path
+        :param max_depth: max depth (0 = no limit, 1 = only direct entries)
+        :return: dict: parent catalog path => list of entries sorted by name
+        """
+        id = self.get_id(path)
+        self.refresh(path)
+        lower, upper = self.get_range(id)
+        depth = 0 if id == "" else id.count("/") + 1
+        params = {"lower": lower, "upper": upper, "depth": depth + max_depth - 1}
+        sql = """
+            SELECT path, parent, name, is_dir, size, mtime FROM file
+            WHERE path >= :lower AND path < :upper
+        """
+        if max_depth > 0:
+            sql += " AND depth <= :depth"
+        sql += " ORDER BY name"
+        children = {}
+        db = self.get_db()
+        with db.connect() as conn:
+            for row in conn.execute(text(sql), params):
+                data = row._asdict()
+                children.setdefault(data["parent"], []).append(data)
+        return children
+
+    def filter(
+            self,
+            rows,
+            pattern: Optional[str] = None,
+            limit: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter rows by name pattern
+
+        :param rows: result rows
+        :param pattern: name pattern (glob)
+        :param limit: max number of entries (0 = no limit)
+        :return: list of entries
+        """
+        items = []
+        for row in rows:
+            data = row._asdict()
+            if pattern and not fnmatch.fnmatch(data["name"], pattern):
+                continue
+            data["is_dir"] = bool(data["is_dir"])
+            items.append(data)
+            if 0 < limit <= len(items):
+                break
+        return items
+
+    def clear(self):
+        """Clear catalog"""
+        with self.lock:
+            db = self.get_db()
+            with db.begin() as conn:
+                conn.execute(text("DELETE FROM file"))
+                conn.execute(text("DELETE FROM dir"))
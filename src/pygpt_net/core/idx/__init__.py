@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 import datetime
@@ -152,6 +152,7 @@ class Idx:
             llm=llm,
             embed_model=embed_model,
         )  # get or create index
+        removed = self.indexing.stats["removed"]
         files, errors = self.indexing.index_files(
             idx=idx,
             index=index,
@@ -159,7 +160,7 @@ class Idx:
             replace=replace,
             recursive=recursive,
         )  # index files
-        if len(files) > 0:
+        if len(files) > 0 or self.indexing.stats["removed"] > removed:
             self.storage.store(
                 id=idx,
                 index=index,
@@ -440,6 +441,7 @@ class Idx:
             doc_id = files[path]
             file_id = self.files.get_id(path)
             ts = int(datetime.datetime.now().timestamp())
+            state = self.files.get_state(path)  # content hash, size, mtime
             if file_id not in self.items[store_id][idx].items:
                 id = self.files.append(
                     store_id=store_id,
@@ -447,6 +449,7 @@ class Idx:
                     file_id=file_id,
                     path=path,
                     doc_id=doc_id,
+                    state=state,
                 )
                 if id is not None:
                     self.items[store_id][idx].items[file_id] = {
@@ -455,15 +458,20 @@ class Idx:
                         "path": path,
                         "indexed_ts": ts,
                     }
+                    if state is not None:
+                        self.items[store_id][idx].items[file_id].update(state)
             else:
-                # update indexed timestamp only
+                # update indexed timestamp and file state only
                 self.files.update(
                     id=self.items[store_id][idx].items[file_id]["db_id"],  # DB id
                     doc_id=doc_id,
                     ts=ts,
+                    state=state,
                 )
                 self.items[store_id][idx].items[file_id]["id"] = doc_id
                 self.items[store_id][idx].items[file_id]["indexed_ts"] = ts
+                if state is not None:
+                    self.items[store_id][idx].items[file_id].update(state)
 
     def remove_doc(
             self,
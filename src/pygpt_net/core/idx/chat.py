@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.20 12:00:00                  #
 # ================================================== #
 
 import json
@@ -495,7 +495,7 @@ class Chat:
         if model is None:
             model = self.window.core.models.from_defaults()
         llm, embed_model = self.window.core.idx.llm.get_service_context(model=model)
-        index = self.storage.get_ctx_idx(path, llm, embed_model)
+        index = self.storage.get_ctx_idx(path, llm, embed_model, cache=True)
 
         # 1. try to retrieve directly from index
         retriever = index.as_retriever()
@@ -630,7 +630,7 @@ class Chat:
             # raise Exception("Index not prepared")
 
         llm, embed_model = self.window.core.idx.llm.get_service_context(model=model)
-        index = self.storage.get(idx, llm, embed_model)  # get index
+        index = self.storage.get(idx, llm, embed_model, cache=True)  # get index (cached)
         return index, llm
 
     def get_metadata(
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 09:00:00                  #
+# ================================================== #
+
+import hashlib
+import os
+import threading
+import time
+from array import array
+from typing import Optional, List, Dict, Any
+
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+from sqlalchemy import create_engine, text, bindparam
+
+
+class EmbeddingCache:
+    def __init__(self, window=None):
+        """
+        Embeddings cache (on disk, shared across indexes)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.engine = None
+        self.engine_path = None
+        self.hits = 0
+        self.misses = 0
+        self.size = None  # total size of stored vectors in bytes, loaded on first use
+        self.last_used = 0
+        self.lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        """
+        Check if cache is enabled
+
+        :return: True if enabled
+        """
+        return self.get_limit() > 0
+
+    def get_limit(self) -> int:
+        """
+        Get max cache size
+
+        :return: size limit in bytes, 0 = cache disabled
+        """
+        limit = self.window.core.config.get("llama.idx.embeddings.cache.size", 1024)
+        return max(0, int(limit or 0)) * 1024 * 1024
+
+    def get_path(self) -> str:
+        """
+        Get cache database path
+
+        :return: path to database file
+        """
+        return os.path.join(
+            self.window.core.config.get_user_dir('idx'),
+            "_cache",  # cache directory
+            "embeddings.db",
+        )
+
+    def get_db(self):
+        """
+        Get cache database engine (create database if not exists)
+
+        :return: SQLAlchemy engine
+        """
+        path = self.get_path()
+        if self.engine is None or self.engine_path != path:  # workdir may be changed
+            if self.engine is not None:
+                self.engine.dispose()
+                self.size = None  # size of previous database
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            engine = create_engine("sqlite:///{}".format(path))
+            with engine.begin() as conn:
+                conn.execute(text("PRAGMA journal_mode=WAL;"))
+                conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS embedding (
+                    model TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_ts INTEGER NOT NULL,
+                    used_ts INTEGER NOT NULL,
+                    PRIMARY KEY (model, hash)
+                ) WITHOUT ROWID;
+                """))
+                conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_embedding_used_ts ON embedding (used_ts);
+                """))
+            self.engine = engine
+            self.engine_path = path
+        return self.engine
+
+    def get_used_ts(self) -> int:
+        """
+        Get last use timestamp (milliseconds, strictly increasing, keeps LRU order of writes in the same second)
+
+        :return: timestamp
+        """
+        with self.lock:
+            self.last_used = max(int(time.time() * 1000), self.last_used + 1)
+            return self.last_used
+
+    def get_hash(self, text: str) -> str:
+        """
+        Get hash of text
+
+        :param text: text
+        :return: hash
+        """
+        return hashlib.sha256(text.encode("utf-8", errors="replace")).hexdigest()
+
+    def get_many(
+            self,
+            model_id: str,
+            texts: List[str]
+    ) -> Dict[str, Embedding]:
+        """
+        Get cached embeddings
+
+        :param model_id: embeddings model ID
+        :param texts: list of texts
+        :return: dict: text => embedding (only found)
+        """
+        hashes = {}
+        for text_item in texts:
+            hashes[self.get_hash(text_item)] = text_item
+        found = {}
+        stmt = text("""
+            SELECT hash, vector FROM embedding WHERE model = :model AND hash IN :hashes
+        """).bindparams(bindparam("hashes", expanding=True))
+        update = text("""
+            UPDATE embedding SET used_ts = :ts WHERE model = :model AND hash IN :hashes
+        """).bindparams(bindparam("hashes", expanding=True))
+        keys = list(hashes.keys())
+        db = self.get_db()
+        with db.begin() as conn:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                result = conn.execute(stmt, {"model": model_id, "hashes": chunk})
+                used = []
+                for row in result:
+                    data = row._asdict()
+                    vector = array("d")
+                    vector.frombytes(data["vector"])
+                    found[hashes[data["hash"]]] = vector.tolist()
+                    used.append(data["hash"])
+                if used:
+                    conn.execute(update, {"ts": self.get_used_ts(), "model": model_id, "hashes": used})
+        with self.lock:
+            self.hits += len(found)
+            self.misses += len(hashes) - len(found)
+        return found
+
+    def put_many(
+            self,
+            model_id: str,
+            items: Dict[str, Embedding]
+    ):
+        """
+        Store embeddings in cache
+
+        :param model_id: embeddings model ID
+        :param items: dict: text => embedding
+        """
+        ts = int(time.time())
+        used_ts = self.get_used_ts()
+        rows = []
+        for text_item, embedding in items.items():
+            vector = array("d", embedding).tobytes()
+            rows.append({
+                "model": model_id,
+                "hash": self.get_hash(text_item),
+                "vector": vector,
+                "size": len(vector),
+                "created_ts": ts,
+                "used_ts": used_ts,
+            })
+        if not rows:
+            return
+        stmt = text("""
+            INSERT OR REPLACE INTO embedding (model, hash, vector, size, created_ts, used_ts)
+            VALUES (:model, :hash, :vector, :size, :created_ts, :used_ts)
+        """)
+        db = self.get_db()
+        with db.begin() as conn:
+            conn.execute(stmt, rows)
+        with self.lock:
+            if self.size is not None:
+                self.size += sum(row["size"] for row in rows)
+        self.evict()
+
+    def get_size(self) -> int:
+        """
+        Get total size of cached vectors
+
+        :return: size in bytes
+        """
+        with self.lock:
+            if self.size is None:
+                db = self.get_db()
+                with db.connect() as conn:
+                    row = conn.execute(text("SELECT COALESCE(SUM(size), 0) AS size FROM embedding")).fetchone()
+                    self.size = int(row._asdict()["size"])
+            return self.size
+
+    def evict(self):
+        """Remove least recently used embeddings if cache is over the size limit"""
+        limit = self.get_limit()
+        size = self.get_size()
+        if size <= limit:
+            return
+        target = int(limit * 0.9)  # free some space to avoid eviction on every insert
+        select = text("""
+            SELECT model, hash, size FROM embedding ORDER BY used_ts ASC LIMIT 1000
+        """)
+        delete = text("""
+            DELETE FROM embedding WHERE model = :model AND hash = :hash
+        """)
+        db = self.get_db()
+        with db.begin() as conn:
+            while size > target:
+                rows = [row._asdict() for row in conn.execute(select)]
+                if not rows:
+                    size = 0
+                    break
+                removed = []
+                for row in rows:
+                    if size <= target:
+                        break
+                    removed.append({"model": row["model"], "hash": row["hash"]})
+                    size -= row["size"]
+                conn.execute(delete, removed)
+        with self.lock:
+            self.size = size
+
+    def clear(self):
+        """Clear cache"""
+        db = self.get_db()
+        with db.begin() as conn:
+            conn.execute(text("DELETE FROM embedding"))
+        with self.lock:
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache stats
+
+        :return: dict with hits, misses and size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": self.size,
+            "limit": self.get_limit(),
+        }
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embeddings model wrapper, text embeddings are read from the cache if already computed"""
+
+    _embed_model: BaseEmbedding = PrivateAttr()
+    _cache: EmbeddingCache = PrivateAttr()
+    _model_id: str = PrivateAttr()
+
+    def __init__(
+            self,
+            embed_model: BaseEmbedding,
+            cache: EmbeddingCache,
+            model_id: str,
+            **kwargs: Any
+    ):
+        super().__init__(
+            model_name=embed_model.model_name or embed_model.__class__.__name__,
+            embed_batch_size=embed_model.embed_batch_size,
+            callback_manager=embed_model.callback_manager,
+            **kwargs,
+        )
+        self._embed_model = embed_model
+        self._cache = cache
+        self._model_id = model_id
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    def get_embed_model(self) -> BaseEmbedding:
+        """
+        Get wrapped embeddings model
+
+        :return: embeddings model instance
+        """
+        return self._embed_model
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self._embed_model.get_query_embedding(query)
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        return await self._embed_model.aget_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        cached = {}
+        try:
+            cached = self._cache.get_many(self._model_id, texts)
+        except Exception as e:
+            self._cache.window.core.debug.log(e)
+
+        missing = list(dict.fromkeys(text_item for text_item in texts if text_item not in cached))
+        if missing:
+            embeddings = self._embed_model.get_text_embedding_batch(missing)
+            computed = dict(zip(missing, embeddings))
+            try:
+                self._cache.put_many(self._model_id, computed)
+            except Exception as e:
+                self._cache.window.core.debug.log(e)
+            cached.update(computed)
+        return [cached[text_item] for text_item in texts]
@@ -6,24 +6,31 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import datetime
 import os.path
+import threading
 import time
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Iterator
 
 from sqlalchemy import text
 
 from llama_index.core.indices.base import BaseIndex
-from llama_index.core.schema import Document
+from llama_index.core.ingestion import run_transformations
+from llama_index.core.schema import Document, MetadataMode
 from llama_index.core import SimpleDirectoryReader
 
 from pygpt_net.item.model import ModelItem
 from pygpt_net.provider.loaders.base import BaseLoader
+from pygpt_net.provider.loaders.pool import load_file
 from pygpt_net.utils import parse_args, pack_arg
 
 
@@ -39,10 +46,24 @@ class Indexing:
             "file": {},  # file loaders
             "web": {},   # web loaders
         }
+        self.loader_args = {
+            "file": {},  # loader id => reader arguments
+            "web": {},
+        }
         self.data_providers = {}  # data providers (loaders)
+        self.extensions = {}  # file extension => loader id
         self.external_instructions = {}
         self.external_config = {}
         self.last_call = None
+        self.stats = {
+            "new": 0,  # new files indexed
+            "updated": 0,  # changed files re-indexed
+            "skipped": 0,  # unchanged files skipped
+            "removed": 0,  # files removed from index (deleted from disk)
+        }
+        self.buffers = {}  # index => nodes and documents waiting for batch insert
+        self.lock = threading.Lock()
+        self.readers_lock = threading.Lock()
 
     def register_loader(self, loader: BaseLoader):
         """
@@ -62,50 +83,74 @@ class Indexing:
         types = loader.type  # available types
 
         if "file" in types:
-            loader.set_args(self.get_loader_arguments(loader.id, "file"))  # set reader arguments
-            try:
-                reader = loader.get()  # get data reader instance
-                for ext in extensions:
-                    self.loaders["file"][ext] = reader  # set reader instance, by file extension
-            except ImportError as e:
-                msg = "Error while registering data loader: " + loader.id + " - " + str(e)
-                self.window.core.debug.log(msg)
-                self.window.core.debug.log(e)
+            args = self.get_loader_arguments(loader.id, "file")
+            loader.set_args(args)  # set reader arguments
+            self.loader_args["file"][loader.id] = args
+            for ext in extensions:
+                self.loaders["file"][ext] = loader.id  # reader is created on first use, by file extension
+                self.extensions[ext] = loader.id
 
         if "web" in types:
-            loader.set_args(self.get_loader_arguments(loader.id, "web"))  # set reader arguments
-            try:
-                reader = loader.get()  # get data reader instance
-                self.loaders["web"][loader.id] = reader # set reader instance, by id
-                if loader.instructions:
-                    for item in loader.instructions:
-                        cmd = list(item.keys())[0]
-                        self.external_instructions[cmd] = item[cmd]
-                if loader.init_args:
-                    for key in loader.init_args:
-                        if loader.id not in self.external_config:
-                            self.external_config[loader.id] = {}
-                        self.external_config[loader.id][key] = {
-                            "key": key,
-                            "value": loader.init_args[key],
-                            "type": "str",  # default = str
-                            "label": key,
-                            "description": None,
-                        }
-                        # from config
-                        if key in loader.args:
-                            self.external_config[loader.id][key]["value"] = loader.args[key]
-                        if key in loader.init_args_types:
-                            self.external_config[loader.id][key]["type"] = loader.init_args_types[key]
-                        if key in loader.init_args_labels:
-                            self.external_config[loader.id][key]["label"] = loader.init_args_labels[key]
-                        if key in loader.init_args_desc:
-                            self.external_config[loader.id][key]["description"] = loader.init_args_desc[key]
+            args = self.get_loader_arguments(loader.id, "web")
+            loader.set_args(args)  # set reader arguments
+            self.loader_args["web"][loader.id] = args
+            self.loaders["web"][loader.id] = loader.id  # reader is created on first use, by id
+            if loader.instructions:
+                for item in loader.instructions:
+                    cmd = list(item.keys())[0]
+                    self.external_instructions[cmd] = item[cmd]
+            if loader.init_args:
+                for key in loader.init_args:
+                    if loader.id not in self.external_config:
+                        self.external_config[loader.id] = {}
+                    self.external_config[loader.id][key] = {
+                        "key": key,
+                        "value": loader.init_args[key],
+                        "type": "str",  # default = str
+                        "label": key,
+                        "description": None,
+                    }
+                    # from config
+                    if key in loader.args:
+                        self.external_config[loader.id][key]["value"] = loader.args[key]
+                    if key in loader.init_args_types:
+                        self.external_config[loader.id][key]["type"] = loader.init_args_types[key]
+                    if key in loader.init_args_labels:
+                        self.external_config[loader.id][key]["label"] = loader.init_args_labels[key]
+                    if key in loader.init_args_desc:
+                        self.external_config[loader.id][key]["description"] = loader.init_args_desc[key]
+
+    def get_reader(self, type: str, key: str) -> Optional[Any]:
+        """
+        Get data reader instance (created on first use)
 
+        :param type: loader type (file, web)
+        :param key: file extension or loader id
+        :return: data reader instance or None if not available
+        """
+        reader = self.loaders[type].get(key)
+        if not isinstance(reader, str):
+            return reader
+        loader = self.data_providers[reader]
+        with self.readers_lock:
+            reader = self.loaders[type].get(key)
+            if not isinstance(reader, str):
+                return reader  # created in other thread
+            try:
+                loader.set_args(self.loader_args[type].get(loader.id, {}))
+                instance = loader.get()  # get data reader instance
             except ImportError as e:
-                msg = "Error while registering data loader: " + loader.id + " - " + str(e)
+                msg = "Error while loading data loader: " + loader.id + " - " + str(e)
                 self.window.core.debug.log(msg)
                 self.window.core.debug.log(e)
+                # unregister, the same error will occur on every use
+                for k in [k for k, v in self.loaders[type].items() if v == loader.id]:
+                    del self.loaders[type][k]
+                return None
+            # share instance between all extensions handled by loader
+            for k in [k for k, v in self.loaders[type].items() if v == loader.id]:
+                self.loaders[type][k] = instance
+            return instance
 
     def get_loader(self, loader: str) -> Optional[BaseLoader]:
         """
@@ -131,8 +176,8 @@ class Indexing:
         """
         if loader in self.data_providers:
             self.data_providers[loader].set_args(args)
-            reader = self.data_providers[loader].get()  # get data reader instance
-            self.loaders["web"][loader] = reader  # update reader instance
+            self.loader_args["web"][loader] = args
+            self.loaders["web"][loader] = loader  # recreate reader on next use
 
             # update in config
             config = self.window.core.config.get("llama.hub.loaders.args")
@@ -337,10 +382,12 @@ class Indexing:
                 if tmp_path:
                     return self.get_documents(tmp_path, force=force, silent=silent, loader_kwargs=loader_kwargs)
 
+            reader = None
             if ext in self.loaders["file"]:
+                reader = self.get_reader("file", ext)
+            if reader is not None:
                 if not silent:
                     self.window.core.idx.log("Using loader for: {}".format(ext))
-                reader = self.loaders["file"][ext]
 
                 # use custom loader method if available
                 if hasattr(reader, "load_data_custom") and loader_kwargs:
@@ -432,7 +479,10 @@ class Indexing:
             args = self.data_providers[type].prepare_args(**extra_args)
 
             # get documents from external resource
-            documents = self.loaders["web"][type].load_data(
+            reader = self.get_reader("web", type)
+            if reader is None:
+                raise ValueError("No web loader for type: {}".format(type))
+            documents = reader.load_data(
                 **args
             )
         except Exception as e:
@@ -470,6 +520,13 @@ class Indexing:
         :param recursive: True if recursive indexing
         :return: dict with indexed files, errors
         """
+        # remove files deleted from disk since last indexing
+        if not is_tmp and self.is_incremental() and os.path.isdir(path):
+            is_recursive = recursive
+            if is_recursive is None:
+                is_recursive = self.window.core.config.get("llama.idx.recursive")
+            self.remove_missing_files(idx, index, path, bool(is_recursive))
+
         if recursive is not None:
             if recursive:
                 return self.index_files_recursive(idx, index, path, is_tmp, replace)
@@ -477,8 +534,6 @@ class Indexing:
             if self.window.core.config.get("llama.idx.recursive"):
                 return self.index_files_recursive(idx, index, path, is_tmp, replace)
 
-        indexed = {}
-        errors = []
         files = []
         if os.path.isdir(path):
             files = [os.path.join(path, f)
@@ -486,40 +541,7 @@ class Indexing:
         elif os.path.isfile(path):
             files = [path]
 
-        for file in files:   # per file to allow use of multiple loaders
-            try:
-                if self.is_stopped():  # force stop
-                    break
-
-                # force replace or not old document
-                if replace is not None:
-                    if replace:
-                        file_id = self.window.core.idx.files.get_id(file)
-                        self.remove_old_file(idx, file_id, force=True)
-                else:
-                    # if auto, only replace if not temporary
-                    if not is_tmp:
-                        file_id = self.window.core.idx.files.get_id(file)
-                        self.remove_old_file(idx, file_id)
-
-                # index new version of file
-                documents = self.get_documents(file)
-                for d in documents:
-                    if self.is_stopped():  # force stop
-                        break
-
-                    self.prepare_document(d)
-                    self.index_document(index, d)
-                    indexed[file] = d.id_  # add to index
-                    self.window.core.idx.log("Inserted document: {}, metadata: {}".format(d.id_, d.metadata))
-            except Exception as e:
-                errors.append(str(e))
-                print("Error while indexing file: " + file)
-                self.window.core.debug.log(e)
-                if self.stop_enabled():
-                    break  # break loop if error
-
-        return indexed, errors
+        return self.index_file_list(idx, index, files, is_tmp, replace)
 
     def index_files_recursive(
             self,
@@ -539,59 +561,47 @@ class Indexing:
         :param replace: True if replace old document
         :return: dict with indexed files, errors
         """
-        indexed = {}
-        errors = []
-        is_break = False
-
-        # directory
+        files = []
         if os.path.isdir(path):
-            for root, dirs, files in os.walk(path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        # remove old file from index if exists
-                        file_id = self.window.core.idx.files.get_id(file_path)
-
-                        if self.is_stopped():  # force stop
-                            break
-
-                        # force replace or not old document
-                        if replace is not None:
-                            if replace:
-                                self.remove_old_file(idx, file_id, force=True)
-                        else:
-                            # if auto, only replace if not temporary
-                            if not is_tmp:
-                                self.remove_old_file(idx, file_id)
-
-                        # index new version of file
-                        documents = self.get_documents(file_path)
-                        for d in documents:
-                            if self.is_stopped():  # force stop
-                                break
-
-                            self.prepare_document(d)
-                            self.index_document(index, d)
-                            indexed[file_path] = d.id_  # add to index
-                            self.window.core.idx.log("Inserted document: {}, metadata: {}".format(d.id_, d.metadata))
-                    except Exception as e:
-                        errors.append(str(e))
-                        print("Error while indexing file: " + file_path)
-                        self.window.core.debug.log(e)
-                        if self.stop_enabled():
-                            is_break = True
-                            break  # break loop if error
+            files = (os.path.join(root, file)
+                     for root, dirs, names in os.walk(path) for file in names)  # lazy, walked while indexing
+        elif os.path.isfile(path):
+            files = [path]
 
-                if is_break or self.is_stopped():
-                    break  # stop os.walk if error or forced stop
+        return self.index_file_list(idx, index, files, is_tmp, replace)
 
-        # file
-        elif os.path.isfile(path):
+    def index_file_list(
+            self,
+            idx: str,
+            index: BaseIndex,
+            files: Iterable[str],
+            is_tmp: bool = False,
+            replace: Optional[bool] = None
+    ) -> Tuple[dict, list]:
+        """
+        Index files from list (files are read in parallel, indexed in order)
+
+        :param idx: index name
+        :param index: index instance
+        :param files: file paths
+        :param is_tmp: True if temporary index
+        :param replace: True if replace old document
+        :return: dict with indexed files, errors
+        """
+        indexed = {}
+        pending = {}  # indexed, but waiting for batch insert
+        errors = []
+
+        for file, status, documents, error in self.read_files(idx, files, is_tmp):
             try:
-                # remove old file from index if exists
-                file_id = self.window.core.idx.files.get_id(path)
+                if self.is_stopped():  # force stop
+                    break
+
+                if error is not None:
+                    raise error  # reading error
 
                 # force replace or not old document
+                file_id = self.window.core.idx.files.get_id(file)
                 if replace is not None:
                     if replace:
                         self.remove_old_file(idx, file_id, force=True)
@@ -601,22 +611,142 @@ class Indexing:
                         self.remove_old_file(idx, file_id)
 
                 # index new version of file
-                documents = self.get_documents(path)
                 for d in documents:
                     if self.is_stopped():  # force stop
                         break
 
                     self.prepare_document(d)
                     self.index_document(index, d)
-                    indexed[path] = d.id_  # add to index
+                    pending[file] = d.id_  # add to index
                     self.window.core.idx.log("Inserted document: {}, metadata: {}".format(d.id_, d.metadata))
+                self.stats[status] += 1
             except Exception as e:
                 errors.append(str(e))
-                print("Error while indexing file: " + path)
+                print("Error while indexing file: " + file)
                 self.window.core.debug.log(e)
+                if self.stop_enabled():
+                    break  # break loop if error
+
+            # insert if batch is full
+            num_errors = len(errors)
+            indexed.update(self.flush_pending(index, pending, errors, force=False))
+            if len(errors) > num_errors and self.stop_enabled():
+                break
 
+        indexed.update(self.flush_pending(index, pending, errors))
         return indexed, errors
 
+    def read_files(
+            self,
+            idx: str,
+            files: Iterable[str],
+            is_tmp: bool = False
+    ) -> Iterator[Tuple[str, str, List[Document], Optional[Exception]]]:
+        """
+        Read documents from files using pool of loader workers
+
+        CPU-bound parsers (loaders with `allow_process`, e.g. PDF, DOCX) run in worker processes,
+        other loaders (API calls, archives, default reader) run in threads.
+        Results are yielded in the same order as files, at most 2 x workers files are read ahead.
+        Unchanged files are skipped.
+
+        :param idx: index name
+        :param files: file paths
+        :param is_tmp: True if temporary index
+        :return: generator of: file path, file status, documents, reading error
+        """
+        files = iter(files)
+        workers = self.get_workers()
+        if workers <= 1:
+            for file in files:
+                if self.is_stopped():  # force stop
+                    return
+                status = self.get_file_status(idx, file, is_tmp)
+                if status == "unchanged":
+                    self.stats["skipped"] += 1
+                    self.window.core.idx.log("Skipping unchanged file: {}".format(file))
+                    continue
+                try:
+                    yield file, status, self.get_documents(file), None
+                except Exception as e:
+                    yield file, status, [], e
+            return
+
+        queue = deque()  # file, status, future, runs in process - in order
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="idx-loader")
+        processes = None  # started on first CPU-bound file
+        try:
+            while True:
+                # read ahead
+                while len(queue) < workers * 2 and not self.is_stopped():
+                    file = next(files, None)
+                    if file is None:
+                        break
+                    status = self.get_file_status(idx, file, is_tmp)
+                    if status == "unchanged":
+                        self.stats["skipped"] += 1
+                        self.window.core.idx.log("Skipping unchanged file: {}".format(file))
+                        continue
+                    args = self.get_process_args(file)
+                    if args is not None:
+                        if processes is None:
+                            processes = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+                        self.window.core.idx.log("Reading documents from path: {}".format(file))
+                        queue.append((file, status, processes.submit(load_file, *args, file), True))
+                    else:
+                        queue.append((file, status, executor.submit(self.get_documents, file), False))
+
+                if not queue:
+                    break
+                file, status, future, in_process = queue.popleft()
+                try:
+                    documents = future.result()
+                    if in_process:
+                        self.window.core.idx.metadata.append_file_metadata(documents, file)
+                except (BrokenProcessPool, ImportError) as e:
+                    self.window.core.debug.log(e)
+                    try:
+                        documents = self.get_documents(file)  # worker died or loader is not available, read here
+                    except Exception as e:
+                        yield file, status, [], e
+                        continue
+                except Exception as e:
+                    yield file, status, [], e
+                    continue
+                yield file, status, documents, None
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)  # on stop, error or finish
+            if processes is not None:
+                processes.shutdown(wait=True, cancel_futures=True)
+
+    def get_process_args(self, path: str) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Get arguments for reading file in worker process
+
+        :param path: file path
+        :return: loader module, loader class name, reader arguments or None if file must be read in main process
+        """
+        if not os.path.isfile(path):
+            return None
+        ext = os.path.splitext(path)[1][1:].lower()
+        if ext not in self.loaders["file"] or self.is_excluded(ext) or self.is_excluded_path(path):
+            return None  # default reader, ignored or unregistered (handled by get_documents)
+        if self.window.core.filesystem.packer.is_archive(path):
+            return None
+        loader = self.data_providers.get(self.extensions.get(ext))
+        if loader is None or getattr(loader, "allow_process", False) is not True:
+            return None
+        cls = type(loader)
+        return cls.__module__, cls.__qualname__, dict(self.loader_args["file"].get(loader.id, {}))
+
+    def get_workers(self) -> int:
+        """
+        Get number of file loader workers
+
+        :return: number of workers
+        """
+        return int(self.window.core.config.get("llama.idx.workers", 4) or 0)
+
     def get_db_data_from_ts(
             self,
             updated_ts: int = 0
@@ -627,6 +757,7 @@ class Indexing:
         :param updated_ts: timestamp
         :return: list of documents
         """
+        self.window.core.ctx.writer.flush()  # commit queued ctx writes first
         db = self.window.core.db.get_db()
         documents = []
         query = f"""
@@ -670,6 +801,7 @@ class Indexing:
         :param updated_ts: timestamp
         :return: list of IDs
         """
+        self.window.core.ctx.writer.flush()  # commit queued ctx writes first
         db = self.window.core.db.get_db()
         ids = []
         query = f"""
@@ -699,6 +831,7 @@ class Indexing:
         :param updated_ts: timestamp from which to get data
         :return: list of documents
         """
+        self.window.core.ctx.writer.flush()  # commit queued ctx writes first
         db = self.window.core.db.get_db()
         documents = []
         query = f"""
@@ -758,14 +891,17 @@ class Indexing:
 
             # get items from database
             documents = self.get_db_data_by_id(id, from_ts)
+            pending = {}  # indexed, but waiting for batch insert
             for d in documents:
                 if self.is_stopped():  # force stop
                     break
 
                 self.index_document(index, d)
-                doc_id = d.id_
+                pending[d.id_] = id
                 self.window.core.idx.log("Inserted ctx DB document: {} / {}, id: {}, metadata: {}".
-                                         format(n+1, len(documents), d.id_, d.metadata))
+                                         format(len(pending), len(documents), d.id_, d.metadata))
+
+            for doc_id in self.flush_pending(index, pending, errors):
                 self.window.core.ctx.idx.set_meta_as_indexed(id, idx, doc_id)  # update ctx
                 n += 1
         except Exception as e:
@@ -831,7 +967,9 @@ class Indexing:
 
         try:
             # remove old content from index if already indexed
-            loader = self.loaders["web"][type]
+            loader = self.get_reader("web", type)
+            if loader is None:
+                raise ValueError("No web loader for type: {}".format(type))
 
             # additional keyword arguments for data loader
             if extra_args is None:
@@ -866,12 +1004,17 @@ class Indexing:
             # append custom metadata
             self.window.core.idx.metadata.append_web_metadata(documents, type, args)
 
+            pending = {}  # indexed, but waiting for batch insert
             for d in documents:
                 if self.is_stopped():  # force stop
                     break
 
                 self.index_document(index, d)
-                doc_id = d.id_  # URL is used as document ID
+                pending[d.id_] = unique_id  # URL is used as document ID
+                self.window.core.idx.log("Inserted web document: {} / {}, id: {}, metadata: {}".
+                                         format(len(pending), len(documents), d.id_, d.metadata))
+
+            for doc_id in self.flush_pending(index, pending, errors):
                 if not is_tmp:
                     self.window.core.idx.external.set_indexed(
                         content=unique_id,
@@ -879,8 +1022,6 @@ class Indexing:
                         idx=idx,
                         doc_id=doc_id,
                     )  # update external index
-                self.window.core.idx.log("Inserted web document: {} / {}, id: {}, metadata: {}".
-                                         format(n+1, len(documents), d.id_, d.metadata))
                 n += 1
         except Exception as e:
             errors.append(str(e))
@@ -966,6 +1107,99 @@ class Indexing:
                 return True
         return False
 
+    def is_incremental(self) -> bool:
+        """
+        Check if incremental re-indexing is enabled (skip unchanged files)
+
+        :return: True if enabled
+        """
+        return self.window.core.config.get("llama.idx.incremental", True)
+
+    def reset_stats(self):
+        """Reset indexing stats"""
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get indexing stats (new, updated, skipped and removed files)
+
+        :return: dict with counters
+        """
+        return dict(self.stats)
+
+    def get_file_status(
+            self,
+            idx: str,
+            path: str,
+            is_tmp: bool = False
+    ) -> str:
+        """
+        Get file status compared to last indexed version
+
+        :param idx: index name
+        :param path: file path
+        :param is_tmp: True if temporary index
+        :return: new, updated or unchanged
+        """
+        if is_tmp:
+            return "new"
+        store = self.window.core.idx.get_current_store()
+        file_id = self.window.core.idx.files.get_id(path)
+        if not self.window.core.idx.files.exists(store, idx, file_id):
+            return "new"
+        if self.is_incremental() \
+                and not self.window.core.idx.files.is_changed(store, idx, file_id, path):
+            return "unchanged"
+        return "updated"
+
+    def remove_missing_files(
+            self,
+            idx: str,
+            index: BaseIndex,
+            path: str,
+            recursive: bool = False
+    ) -> int:
+        """
+        Remove files deleted from disk from index
+
+        :param idx: index name
+        :param index: index instance
+        :param path: indexed directory
+        :param recursive: True if check also subdirectories
+        :return: number of removed files
+        """
+        store = self.window.core.idx.get_current_store()
+        items = self.window.core.idx.items
+        if store not in items or idx not in items[store]:
+            return 0
+        root = os.path.normpath(path)
+        files = items[store][idx].items
+        num = 0
+        for file_id in list(files.keys()):
+            file_path = files[file_id].get("path")
+            if not file_path:
+                continue
+            file_path = os.path.normpath(file_path)
+            if recursive:
+                if not file_path.startswith(root + os.sep):
+                    continue
+            elif os.path.dirname(file_path) != root:
+                continue
+            if os.path.exists(file_path):
+                continue
+            doc_id = files[file_id]["id"]
+            self.window.core.idx.log("Removing deleted file: {}, document id: {}".format(file_path, doc_id))
+            try:
+                index.delete_ref_doc(doc_id)
+            except Exception as e:
+                self.window.core.debug.log(e)
+            self.window.core.idx.files.remove(store, idx, doc_id)
+            del files[file_id]
+            num += 1
+        self.stats["removed"] += num
+        return num
+
     def remove_old_file(
             self,
             idx: str,
@@ -1042,10 +1276,12 @@ class Indexing:
         """
         Index document
 
+        Document is parsed into nodes and buffered, nodes are embedded and inserted
+        in batches by flush_documents()
+
         :param index: index instance
         :param doc: document
         """
-        self.apply_rate_limit()  # apply RPM limit
         """
         try:
             # display embedding model info
@@ -1054,7 +1290,105 @@ class Indexing:
         except Exception as e:
             self.window.core.debug.log(e)
         """
-        index.insert(document=doc)
+        transformations = getattr(index, "_transformations", None)
+        if transformations is None \
+                or getattr(index, "_embed_model", None) is None \
+                or self.get_batch_size() <= 1:
+            self.apply_rate_limit()  # apply RPM limit
+            index.insert(document=doc)  # no batching
+            return
+
+        nodes = run_transformations([doc], transformations)
+        with self.lock:
+            if id(index) not in self.buffers:
+                self.buffers[id(index)] = {
+                    "nodes": [],
+                    "docs": [],
+                }
+            self.buffers[id(index)]["nodes"].extend(nodes)
+            self.buffers[id(index)]["docs"].append(doc)
+
+    def flush_documents(
+            self,
+            index: BaseIndex,
+            force: bool = True
+    ) -> bool:
+        """
+        Embed and insert buffered nodes to index (in batches)
+
+        :param index: index instance
+        :param force: insert even if batch is not full
+        :return: True if buffer was flushed
+        """
+        batch_size = self.get_batch_size()
+        with self.lock:
+            buffer = self.buffers.get(id(index))
+            if buffer is None or not buffer["nodes"]:
+                self.buffers.pop(id(index), None)
+                return force
+            if not force and len(buffer["nodes"]) < batch_size:
+                return False
+            del self.buffers[id(index)]
+
+        nodes = buffer["nodes"]
+        embed_model = index._embed_model
+        size = max(1, batch_size)
+        model_batch_size = getattr(embed_model, "embed_batch_size", None)
+        if isinstance(model_batch_size, int) and 0 < model_batch_size < size:
+            size = model_batch_size  # one API call per batch
+        to_embed = [node for node in nodes if node.embedding is None]
+        for i in range(0, len(to_embed), size):
+            batch = to_embed[i:i + size]
+            self.apply_rate_limit()  # apply RPM limit per API call
+            embeddings = embed_model.get_text_embedding_batch(
+                [node.get_content(metadata_mode=MetadataMode.EMBED) for node in batch],
+            )
+            for node, embedding in zip(batch, embeddings):
+                node.embedding = embedding
+        self.window.core.idx.log("Embedded {} nodes in {} batch(es)".format(
+            len(to_embed),
+            (len(to_embed) + size - 1) // size,
+        ))
+
+        index.insert_nodes(nodes)  # bulk insert, embeddings are already computed
+        for doc in buffer["docs"]:
+            index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+        return True
+
+    def flush_pending(
+            self,
+            index: BaseIndex,
+            pending: Dict[str, Any],
+            errors: List[str],
+            force: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Flush buffered documents and return pending items if inserted
+
+        :param index: index instance
+        :param pending: items waiting for insert (cleared if inserted or failed)
+        :param errors: errors list (updated in place)
+        :param force: insert even if batch is not full
+        :return: inserted items
+        """
+        inserted = {}
+        try:
+            if self.flush_documents(index, force):
+                inserted = dict(pending)
+                pending.clear()
+        except Exception as e:
+            pending.clear()  # buffer is dropped on error
+            errors.append(str(e))
+            self.window.core.debug.log(e)
+        return inserted
+
+    def get_batch_size(self) -> int:
+        """
+        Get embeddings batch size (number of nodes per insert and per API call)
+
+        :return: batch size
+        """
+        return int(self.window.core.config.get("llama.idx.embeddings.batch_size", 100) or 0)
 
     def index_attachment(
             self,
@@ -1095,6 +1429,7 @@ class Indexing:
             self.index_document(index, d)
             doc_ids.append(d.id_)  # add to index
 
+        self.flush_documents(index)  # insert remaining batch
         self.window.core.idx.storage.store_ctx_idx(index_path, index)
         return doc_ids
 
@@ -1138,6 +1473,7 @@ class Indexing:
             self.index_document(index, d)
             doc_ids.append(d.id_)  # add to index
 
+        self.flush_documents(index)  # insert remaining batch
         self.window.core.idx.storage.store_ctx_idx(index_path, index)
         return doc_ids
 
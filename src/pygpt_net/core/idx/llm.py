@@ -6,21 +6,23 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.21 04:00:00                  #
 # ================================================== #
 
+import json
 import os.path
-from typing import Optional, Union
+import threading
+from typing import Optional, Union, List, Dict, Any
 
 from llama_index.core.llms.llm import BaseLLM
 from llama_index.core.multi_modal_llms import MultiModalLLM
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.llms.openai import OpenAI
 
 from pygpt_net.core.types import (
     MODE_LLAMA_INDEX,
 )
 from pygpt_net.item.model import ModelItem
+from .embeddings import EmbeddingCache, CachedEmbedding
 
 
 class Llm:
@@ -34,6 +36,9 @@ class Llm:
         self.default_model = "gpt-3.5-turbo"
         self.default_embed = "openai"
         self.initialized = False
+        self.embeddings_cache = EmbeddingCache(window)
+        self.instances = {}  # shared LLM and embeddings instances (with their HTTP clients)
+        self.lock = threading.Lock()
 
     def init(self):
         """Init base ENV vars"""
@@ -73,6 +78,17 @@ class Llm:
                         mode=MODE_LLAMA_INDEX,
                         sub_mode="",
                     )
+                    key = self.get_key(
+                        "llm",
+                        provider,
+                        model.id,
+                        multimodal,
+                        model.llama_index.get('args'),
+                        model.llama_index.get('env'),
+                    )
+                    llm = self.get_instance(key)
+                    if llm is not None:
+                        return llm
                     # get llama LLM instance
                     if multimodal and model.is_multimodal():
                         # at first, try to get multimodal provider
@@ -89,14 +105,21 @@ class Llm:
                             window=self.window,
                             model=model,
                         )
+                    if llm is not None:
+                        self.set_instance(key, llm)
 
         # default model
         if llm is None:
             self.init()  # init env vars
-            llm = OpenAI(
-                temperature=0.0,
-                model=self.default_model,
-            )
+            key = self.get_key("llm", "default", self.default_model)
+            llm = self.get_instance(key)
+            if llm is None:
+                from llama_index.llms.openai import OpenAI
+                llm = OpenAI(
+                    temperature=0.0,
+                    model=self.default_model,
+                )
+                self.set_instance(key, llm)
         return llm
 
     def get_embeddings_provider(self) -> BaseEmbedding:
@@ -116,10 +139,47 @@ class Llm:
             window=self.window,
             env=env,
         )
-        return self.window.core.llm.llms[provider].get_embeddings_model(
+        cached = self.embeddings_cache.is_enabled()
+        key = self.get_key("embeddings", provider, cached, args, env)
+        embed_model = self.get_instance(key)
+        if embed_model is not None:
+            return embed_model
+
+        embed_model = self.window.core.llm.llms[provider].get_embeddings_model(
             window=self.window,
             config=args,
         )
+        if embed_model is not None and cached:
+            embed_model = CachedEmbedding(
+                embed_model=embed_model,
+                cache=self.embeddings_cache,
+                model_id=self.get_embeddings_id(provider, embed_model),
+            )
+        if embed_model is not None:
+            self.set_instance(key, embed_model)
+        return embed_model
+
+    def get_embeddings_id(
+            self,
+            provider: str,
+            embed_model: BaseEmbedding
+    ) -> str:
+        """
+        Get embeddings model identifier (used as embeddings cache key)
+
+        :param provider: embeddings provider ID
+        :param embed_model: embeddings model instance
+        :return: embeddings model ID
+        """
+        parts = [
+            provider,
+            embed_model.__class__.__name__,
+            str(embed_model.model_name),
+        ]
+        dimensions = getattr(embed_model, "dimensions", None)
+        if dimensions:
+            parts.append(str(dimensions))
+        return ":".join(parts)
 
     def get_service_context(
             self,
@@ -134,3 +194,74 @@ class Llm:
         llm = self.get(model=model)
         embed_model = self.get_embeddings_provider()
         return llm, embed_model
+
+    def get_key(self, *parts) -> str:
+        """
+        Get shared instance key
+
+        Key contains provider arguments and resolved ENV values (with API keys), so instances
+        are recreated when model or API config changes.
+
+        :param parts: key parts (provider, model, args, env config)
+        :return: instance key
+        """
+        config = self.window.core.config.all()
+        resolved = []
+        for part in parts:
+            if isinstance(part, list):
+                part = self.resolve_env(part, config)
+            resolved.append(part)
+        resolved.append([
+            config.get('api_key'),
+            config.get('api_endpoint'),
+            config.get('organization_key'),
+            config.get('api_proxy'),
+        ])
+        return json.dumps(resolved, sort_keys=True, default=str)
+
+    def resolve_env(self, items: List[Dict], config: Dict[str, Any]) -> List[Any]:
+        """
+        Resolve config placeholders in ENV / args list
+
+        :param items: list of name/value dicts
+        :param config: config dict
+        :return: list with resolved values
+        """
+        resolved = []
+        for item in items:
+            if not isinstance(item, dict):
+                resolved.append(item)
+                continue
+            item = dict(item)
+            if isinstance(item.get('value'), str):
+                try:
+                    item['value'] = item['value'].format(**config)
+                except Exception:
+                    pass
+            resolved.append(item)
+        return resolved
+
+    def get_instance(self, key: str) -> Optional[Any]:
+        """
+        Get shared instance
+
+        :param key: instance key
+        :return: LLM or embeddings instance or None if not created yet
+        """
+        with self.lock:
+            return self.instances.get(key)
+
+    def set_instance(self, key: str, instance: Any):
+        """
+        Store shared instance
+
+        :param key: instance key
+        :param instance: LLM or embeddings instance
+        """
+        with self.lock:
+            self.instances[key] = instance
+
+    def reset(self):
+        """Drop shared instances (will be recreated on next use)"""
+        with self.lock:
+            self.instances = {}
@@ -6,12 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 00:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 import datetime
+import hashlib
 import os.path
-from typing import Optional
+from typing import Optional, Dict, Any
 
 
 class Files:
@@ -24,6 +25,7 @@ class Files:
         """
         self.window = window
         self.provider = provider
+        self.hashes = {}  # path => (size, mtime, hash), computed hashes cache
 
     def append(
             self,
@@ -31,7 +33,8 @@ class Files:
             idx: str,
             file_id: str,
             path: str,
-            doc_id: str
+            doc_id: str,
+            state: Optional[Dict[str, Any]] = None
     ) -> int:
         """
         Append file to index
@@ -41,6 +44,7 @@ class Files:
         :param file_id: file id
         :param path: file path
         :param doc_id: document id
+        :param state: file state (hash, size, mtime)
         :return: ID of appended file
         """
         data = {
@@ -49,6 +53,8 @@ class Files:
             "indexed_ts": datetime.datetime.now().timestamp(),
             "id": doc_id,
         }
+        if state is not None:
+            data.update(state)
         return self.provider.append_file(
             store_id=store_id,
             idx=idx,
@@ -68,6 +74,82 @@ class Files:
         path = path.replace("\\", "/").strip(r'\/')
         return path
 
+    def get_state(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Get current file state (content hash, size and mtime)
+
+        :param path: file path
+        :return: file state or None if file not exists
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        size = stat.st_size
+        mtime = int(stat.st_mtime)
+        cached = self.hashes.get(path)
+        if cached is not None and cached[0] == size and cached[1] == mtime:
+            hash = cached[2]
+        else:
+            sha = hashlib.sha256()
+            try:
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        sha.update(chunk)
+            except OSError:
+                return None
+            hash = sha.hexdigest()
+            self.hashes[path] = (size, mtime, hash)
+        return {
+            "hash": hash,
+            "size": size,
+            "mtime": mtime,
+        }
+
+    def is_changed(
+            self,
+            store_id: str,
+            idx: str,
+            file_id: str,
+            path: str
+    ) -> bool:
+        """
+        Check if file was changed since last indexing
+
+        Size and mtime are compared first, content hash is checked only if they differ.
+
+        :param store_id: store id
+        :param idx: index name
+        :param file_id: file id
+        :param path: file path
+        :return: True if file is new or changed
+        """
+        stored = self.provider.get_file_state(
+            store_id=store_id,
+            idx=idx,
+            file_id=file_id,
+        )
+        if stored is None or not stored.get("hash"):
+            return True
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return True
+        if stored.get("size") == stat.st_size and stored.get("mtime") == int(stat.st_mtime):
+            return False  # fast path
+        state = self.get_state(path)
+        if state is None or state["hash"] != stored["hash"]:
+            return True
+
+        # content not changed (e.g. touched), refresh stored mtime
+        self.provider.update_file_state(
+            store_id=store_id,
+            idx=idx,
+            file_id=file_id,
+            state=state,
+        )
+        return False
+
     def get_doc_id(
             self,
             store_id: str,
@@ -112,7 +194,8 @@ class Files:
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Update timestamp of indexed file
@@ -120,12 +203,14 @@ class Files:
         :param id: database record ID
         :param doc_id: document ID
         :param ts: timestamp
+        :param state: file state (hash, size, mtime)
         :return: True if file was updated
         """
         return self.provider.update_file(
             id=id,
             doc_id=doc_id,
             ts=ts,
+            state=state,
         )
 
     def remove(
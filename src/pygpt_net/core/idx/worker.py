@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.14 01:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
@@ -51,6 +51,8 @@ class IndexWorker(QObject, QRunnable):
             ))
 
             # execute indexing
+            if self.type in ["file", "files"]:
+                self.window.core.idx.indexing.reset_stats()  # new, updated, skipped, removed
             if self.type == "file":
                 result, errors = self.window.core.idx.index_files(
                     self.idx,
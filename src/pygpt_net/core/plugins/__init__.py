@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 import copy
@@ -98,6 +98,7 @@ class Plugins:
         plugin.attach(self.window)
         id = plugin.id
         self.plugins[id] = plugin
+        self.window.core.dispatcher.reset()
 
         # make copy of options
         if hasattr(plugin, 'options'):
@@ -169,6 +170,7 @@ class Plugins:
         """
         if self.is_registered(id):
             self.plugins.pop(id)
+            self.window.core.dispatcher.reset()
 
     def enable(self, id: str):
         """
@@ -180,6 +182,7 @@ class Plugins:
             self.plugins[id].enabled = True
             self.window.core.config.data['plugins_enabled'][id] = True
             self.window.core.config.save()
+            self.window.core.dispatcher.reset()
 
     def disable(self, id: str):
         """
@@ -191,6 +194,7 @@ class Plugins:
             self.plugins[id].enabled = False
             self.window.core.config.data['plugins_enabled'][id] = False
             self.window.core.config.save()
+            self.window.core.dispatcher.reset()
 
     def destroy(self, id: str):
         """
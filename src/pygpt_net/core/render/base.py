@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.20 22:00:00                  #
 # ================================================== #
 
 from typing import Optional, List
@@ -168,6 +168,22 @@ class BaseRenderer:
         """
         pass
 
+    def load_more(self, pid: int):
+        """
+        Render previous page of items (windowed output)
+
+        :param pid: context PID
+        """
+        pass
+
+    def trim(self, pid: int):
+        """
+        Remove far-off items (windowed output)
+
+        :param pid: context PID
+        """
+        pass
+
     def append_input(
             self,
             meta: CtxMeta,
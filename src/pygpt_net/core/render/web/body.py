@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.20 22:00:00                  #
 # ================================================== #
 
 import os
@@ -397,6 +397,9 @@ class Body:
         
         let scrollTimeout = null;
         let prevScroll = 0;
+        let hasMore = false;  // older items not rendered yet
+        let loadingMore = false;
+        let trimPending = false;
         let bridge;
         let pid = """ + str(pid) + """
         new QWebChannel(qt.webChannelTransport, function (channel) {
@@ -572,6 +575,48 @@ class Body:
             highlightCode();
             scrollToBottom();
         }
+        function appendOutputDelta(bot_name, completed, tail) {
+            const element = document.getElementById('_append_output_');
+            if (element) {
+                let box = element.querySelector('.msg-box');
+                let msg;
+                if (!box) {
+                    box = document.createElement('div');
+                    box.classList.add('msg-box');
+                    box.classList.add('msg-bot');
+                    const name = document.createElement('div');
+                    name.classList.add('name-header');
+                    name.classList.add('name-bot');
+                    name.textContent = bot_name;
+                    msg = document.createElement('div');
+                    msg.classList.add('msg');
+                    box.appendChild(name);
+                    box.appendChild(msg);
+                    element.appendChild(box);
+                } else {
+                    msg = box.querySelector('.msg');
+                }
+                if (msg) {
+                    let frozen = msg.querySelector('.msg-frozen');
+                    let open = msg.querySelector('.msg-tail');
+                    if (!frozen || !open) {
+                        msg.innerHTML = '';
+                        frozen = document.createElement('div');
+                        frozen.classList.add('msg-frozen');
+                        open = document.createElement('div');
+                        open.classList.add('msg-tail');
+                        msg.appendChild(frozen);
+                        msg.appendChild(open);
+                    }
+                    if (completed) {
+                        frozen.insertAdjacentHTML('beforeend', completed);
+                    }
+                    open.innerHTML = tail;
+                }
+            }
+            highlightCode();
+            scrollToBottom();
+        }
         function appendToolOutput(content) {
             hideToolOutputLoader();
             enableToolOutput();
@@ -755,7 +800,57 @@ class Body:
         function setScrollPosition(pos) {
             window.scrollTo(0, pos);
             prevScroll = parseInt(pos);
-        }  
+        }
+        function setHasMore(value) {
+            hasMore = value;
+            loadingMore = false;
+        }
+        function prependNodes(content, more) {
+            const element = document.getElementById('_nodes_');
+            if (element) {
+                const height = document.body.scrollHeight;
+                const pos = window.scrollY;
+                element.classList.remove('empty_list');
+                element.insertAdjacentHTML('afterbegin', content);
+                highlightCode();
+                window.scrollTo(0, pos + document.body.scrollHeight - height);  // keep position
+                prevScroll = document.body.scrollHeight;
+                trimPending = true;
+            }
+            setHasMore(more);
+        }
+        function trimNodes(id) {
+            const container = document.getElementById('_nodes_');
+            if (!container) {
+                return false;
+            }
+            const elements = Array.from(container.children);
+            const idx = elements.findIndex(el => el.id.endsWith('-' + id));
+            if (idx < 0) {
+                return false;
+            }
+            const height = document.body.scrollHeight;
+            const pos = window.scrollY;
+            for (let i = 0; i < idx; i++) {
+                elements[i].remove();
+            }
+            window.scrollTo(0, Math.max(0, pos - (height - document.body.scrollHeight)));
+            prevScroll = document.body.scrollHeight;
+            hasMore = true;
+            return true;
+        }
+        window.addEventListener('scroll', function() {
+            if (!bridge) {
+                return;
+            }
+            if (hasMore && !loadingMore && window.scrollY < 300) {
+                loadingMore = true;
+                bridge.load_more(pid);  // render previous page
+            } else if (trimPending && window.innerHeight + window.scrollY >= document.body.scrollHeight - 50) {
+                trimPending = false;
+                bridge.trim_nodes(pid);  // back at the bottom, remove far-off items
+            }
+        });  
         document.addEventListener('DOMContentLoaded', function() {
             const container = document.getElementById('container');
             function addClassToMsg(id, className) {
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import hashlib
+import os
+import shutil
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+
+class RenderCache:
+    def __init__(self, window=None):
+        """
+        Rendered HTML cache (LRU in memory, optional spill to disk)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.items = OrderedDict()  # key => (ctx id, html)
+        self.ids = {}  # ctx id => set of keys
+        self.size = 0  # size of cached HTML in memory (chars)
+        self.disk_size = None  # size of cached HTML on disk (bytes), loaded on first spill
+        self.hits = 0
+        self.misses = 0
+
+    def get_limit(self) -> int:
+        """
+        Get max memory cache size
+
+        :return: size limit in bytes, 0 = cache disabled
+        """
+        limit = self.window.core.config.get("render.cache.size", 32)
+        return max(0, int(limit or 0)) * 1024 * 1024
+
+    def is_disk(self) -> bool:
+        """
+        Check if spill to disk is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("render.cache.disk", False))
+
+    def get_path(self) -> str:
+        """
+        Get disk cache directory
+
+        :return: path to directory
+        """
+        return os.path.join(self.window.core.config.get_user_dir("tmp"), "render_cache")
+
+    def get_key(self, id: int, type: int, text: str) -> str:
+        """
+        Get cache key (content hash and render settings)
+
+        :param id: ctx item ID
+        :param type: node type
+        :param text: source text
+        :return: cache key
+        """
+        config = self.window.core.config
+        data = "\n".join([
+            str(id),
+            str(type),
+            str(config.get("theme")),
+            str(config.get("lang")),  # translated labels in HTML
+            str(config.get("render.code_syntax")),
+            config.get_user_path(),
+            text,
+        ])
+        return hashlib.sha1(data.encode("utf-8", errors="replace")).hexdigest()
+
+    def get(self, id: Optional[int], type: int, text: str) -> Optional[str]:
+        """
+        Get cached HTML
+
+        :param id: ctx item ID
+        :param type: node type
+        :param text: source text
+        :return: HTML or None if not cached
+        """
+        if id is None or self.get_limit() == 0:
+            return None
+        key = self.get_key(id, type, text)
+        if key in self.items:
+            self.items.move_to_end(key)
+            self.hits += 1
+            return self.items[key][1]
+        if self.is_disk():
+            html = self.load(id, key)
+            if html is not None:
+                self.hits += 1
+                self.store(id, key, html)
+                return html
+        self.misses += 1
+
+    def put(self, id: Optional[int], type: int, text: str, html: str):
+        """
+        Store rendered HTML in cache
+
+        :param id: ctx item ID
+        :param type: node type
+        :param text: source text
+        :param html: rendered HTML
+        """
+        if id is None or self.get_limit() == 0:
+            return
+        self.store(id, self.get_key(id, type, text), html)
+
+    def store(self, id: int, key: str, html: str):
+        """
+        Store HTML in memory and evict least recently used items
+
+        :param id: ctx item ID
+        :param key: cache key
+        :param html: HTML
+        """
+        if key in self.items:
+            self.size -= len(self.items[key][1])
+        self.items[key] = (id, html)
+        self.ids.setdefault(id, set()).add(key)
+        self.size += len(html)
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used items if cache is over the size limit"""
+        limit = self.get_limit()
+        disk = self.is_disk()
+        while self.size > limit and self.items:
+            key, (id, html) = self.items.popitem(last=False)
+            self.size -= len(html)
+            keys = self.ids.get(id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.ids[id]
+            if disk:
+                self.spill(id, key, html)
+
+    def load(self, id: int, key: str) -> Optional[str]:
+        """
+        Load HTML from disk
+
+        :param id: ctx item ID
+        :param key: cache key
+        :return: HTML or None if not found
+        """
+        path = os.path.join(self.get_path(), str(id), key + ".html")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def spill(self, id: int, key: str, html: str):
+        """
+        Write evicted HTML to disk
+
+        :param id: ctx item ID
+        :param key: cache key
+        :param html: HTML
+        """
+        dir = os.path.join(self.get_path(), str(id))
+        path = os.path.join(dir, key + ".html")
+        try:
+            if os.path.exists(path):
+                return
+            os.makedirs(dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html)
+            if self.disk_size is None:
+                self.disk_size = self.get_disk_size()
+            else:
+                self.disk_size += os.path.getsize(path)
+            if self.disk_size > self.get_limit() * 4:
+                self.evict_disk()
+        except OSError as e:
+            self.window.core.debug.log(e)
+
+    def get_disk_size(self) -> int:
+        """
+        Get size of cached HTML on disk
+
+        :return: size in bytes
+        """
+        size = 0
+        for root, dirs, files in os.walk(self.get_path()):
+            for file in files:
+                try:
+                    size += os.path.getsize(os.path.join(root, file))
+                except OSError:
+                    pass
+        return size
+
+    def evict_disk(self):
+        """Remove oldest files from disk cache"""
+        files = []
+        for root, dirs, names in os.walk(self.get_path()):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                    files.append((stat.st_mtime, stat.st_size, path))
+                except OSError:
+                    pass
+        files.sort()
+        size = sum(file[1] for file in files)
+        target = int(self.get_limit() * 4 * 0.75)  # free some space to avoid eviction on every spill
+        for mtime, file_size, path in files:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                size -= file_size
+            except OSError:
+                pass
+        self.disk_size = size
+
+    def invalidate(self, id: Optional[int]):
+        """
+        Remove cached HTML of ctx item (memory and disk)
+
+        :param id: ctx item ID
+        """
+        if id is None:
+            return
+        for key in self.ids.pop(id, set()):
+            if key in self.items:
+                self.size -= len(self.items.pop(key)[1])
+        dir = os.path.join(self.get_path(), str(id))
+        if self.is_disk() and os.path.exists(dir):
+            shutil.rmtree(dir, ignore_errors=True)
+            self.disk_size = None
+
+    def clear(self, disk: bool = False):
+        """
+        Clear cache
+
+        :param disk: clear disk cache too
+        """
+        self.items = OrderedDict()
+        self.ids = {}
+        self.size = 0
+        if disk:
+            shutil.rmtree(self.get_path(), ignore_errors=True)
+            self.disk_size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache stats
+
+        :return: dict with hits, misses and size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "items": len(self.items),
+            "size": self.size,
+            "disk_size": self.disk_size,
+            "limit": self.get_limit(),
+        }
@@ -6,10 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.21 22:00:00                  #
+# Updated Date: 2025.01.20 10:00:00                  #
 # ================================================== #
 
 import os
+import re
 
 import markdown
 from mdx_math import MathExtension
@@ -90,6 +91,57 @@ class Parser:
             pass
         return text
 
+    def get_completed_offset(self, text: str) -> int:
+        """
+        Get offset of the end of completed top-level blocks in markdown text
+
+        Completed blocks (paragraphs, tables, closed code fences, etc.) will not change anymore
+        when more text is appended, so they can be parsed once and frozen (incremental mode).
+
+        :param text: markdown text
+        :return: offset of the last completed block end (0 if none)
+        """
+        offset = 0
+        pos = 0
+        pending = None  # candidate offset after blank line, confirmed by the next line
+        in_fence = False
+        fence = ""
+        fence_top = False
+        in_list = False
+        for line in text.splitlines(keepends=True):
+            if not line.endswith("\n"):
+                break  # incomplete line
+            stripped = line.strip()
+            pos += len(line)
+            if in_fence:
+                if stripped.startswith(fence) and stripped.strip(fence[0]) == "":
+                    in_fence = False
+                    if fence_top and not in_list:
+                        offset = pos  # closed top-level fence
+                        pending = None
+                continue
+            if stripped.startswith("```") or stripped.startswith("~~~"):
+                if pending is not None and line[0] not in " \t":
+                    offset = pending
+                    in_list = False
+                pending = None
+                in_fence = True
+                fence = stripped[:3]
+                fence_top = line[0] not in " \t"
+                continue
+            if stripped == "":
+                if text[offset:pos].count("$$") % 2 == 0:  # not inside math block
+                    pending = pos
+                continue
+            is_list_item = re.match(r'^\s*([-*+]|\d+[.)])\s', line) is not None
+            if pending is not None and line[0] not in " \t" and not (in_list and is_list_item):
+                offset = pending  # next block started, previous one is completed
+                in_list = False
+            pending = None
+            if is_list_item and line[0] not in " \t":
+                in_list = True
+        return offset
+
     def parse_code(self, text: str) -> str:
         """
         Parse code markdown text
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 04:00:00                  #
+# Updated Date: 2025.01.20 22:00:00                  #
 # ================================================== #
 
 from pygpt_net.utils import trans
@@ -22,6 +22,7 @@ class PidData():
         self.urls_appended = []
         self.files_appended = []
         self.buffer = ""  # stream buffer
+        self.buffer_offset = 0  # stream buffer offset, already rendered (frozen) part in incremental mode
         self.is_cmd = False
         self.html = ""  # html buffer
         self.document = ""
@@ -33,4 +34,6 @@ class PidData():
         self.name_bot = trans("chat.name.bot")
         self.last_time_called = 0
         self.cooldown = 1 / 6  # max chunks to parse per second
+        self.items = []  # all items of rendered context (windowed rendering)
+        self.offset = 0  # index of the first rendered item (windowed rendering)
         self.throttling_min_chars = 5000  # min chunk chars to activate cooldown
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2025.01.20 23:00:00                  #
 # ================================================== #
 
 import json
@@ -23,6 +23,7 @@ from pygpt_net.utils import trans
 from pygpt_net.core.tabs.tab import Tab
 
 from .body import Body
+from .cache import RenderCache
 from .helpers import Helpers
 from .parser import Parser
 from .pid import PidData
@@ -43,6 +44,7 @@ class Renderer(BaseRenderer):
         self.body = Body(window)
         self.helpers = Helpers(window)
         self.parser = Parser(window)
+        self.cache = RenderCache(window)
         self.pids = {}  # per node data
 
     def prepare(self):
@@ -84,6 +86,7 @@ class Renderer(BaseRenderer):
             self.clear_nodes(pid)
             self.append(pid, self.pids[pid].html, flush=True)
             self.pids[pid].html = ""
+        self.update_window(pid)
 
     def get_pid(self, meta: CtxMeta):
         """
@@ -236,12 +239,48 @@ class Renderer(BaseRenderer):
 
         if clear:
             self.reset(meta)
-        i = 0
 
+        # render only the last window of items, older items are rendered on scroll up
+        offset = 0
+        size = self.get_window_size()
+        if 0 < size < len(items):
+            offset = len(items) - size
+        self.pids[pid].meta = meta
+        self.pids[pid].items = items
+        self.pids[pid].offset = offset
+        self.render_items(meta, pid, offset, len(items))  # to html buffer
+
+        # flush
+        if self.pids[pid].html != "":
+            self.append(
+                pid,
+                self.pids[pid].html,
+                flush=True
+            )  # flush buffer if page loaded, otherwise it will be flushed on page load
+        self.update_window(pid)
+
+    def render_items(
+            self,
+            meta: CtxMeta,
+            pid: int,
+            start: int,
+            end: int
+    ) -> str:
+        """
+        Render range of context items to HTML buffer
+
+        :param meta: context meta
+        :param pid: context PID
+        :param start: index of the first item
+        :param end: index after the last item
+        :return: rendered HTML
+        """
+        items = self.pids[pid].items
         self.pids[pid].use_buffer = True
         self.pids[pid].html = ""
-        prev_ctx = None
-        for item in items:
+        prev_ctx = items[start - 1] if start > 0 else None
+        for i in range(start, end):
+            item = items[i]
             self.update_names(meta, item)
             item.idx = i
             if i == 0:
@@ -254,16 +293,85 @@ class Renderer(BaseRenderer):
                 next_ctx=next_item
             )  # to html buffer
             prev_ctx = item
-            i += 1
         self.pids[pid].use_buffer = False
+        return self.pids[pid].html
 
-        # flush
-        if self.pids[pid].html != "":
-            self.append(
-                pid,
-                self.pids[pid].html,
-                flush=True
-            )  # flush buffer if page loaded, otherwise it will be flushed on page load
+    def get_window_size(self) -> int:
+        """
+        Get number of items rendered at once (windowed rendering)
+
+        :return: number of items, 0 = render all items
+        """
+        return max(0, int(self.window.core.config.get("render.window.size", 50) or 0))
+
+    def load_more(self, pid: Optional[int]):
+        """
+        Render previous page of items and prepend it to output (called from JS on scroll up)
+
+        :param pid: context PID
+        """
+        if pid not in self.pids or not self.pids[pid].loaded:
+            return
+        data = self.pids[pid]
+        if data.offset > len(data.items):
+            data.offset = len(data.items)  # items list changed
+        if data.offset > 0:
+            start = max(0, data.offset - max(1, self.get_window_size()))
+            html = self.render_items(data.meta, pid, start, data.offset)
+            data.html = ""
+            data.offset = start
+            if data.items:
+                self.update_names(data.meta, data.items[-1])  # restore current names
+            try:
+                self.get_output_node_by_pid(pid).page().runJavaScript(
+                    "prependNodes({}, {});".format(json.dumps(html), json.dumps(start > 0))
+                )
+            except Exception as e:
+                pass
+        else:
+            self.update_window(pid)
+
+    def trim(self, pid: Optional[int]):
+        """
+        Remove far-off older items from output (called from JS on scroll to the bottom)
+
+        :param pid: context PID
+        """
+        if pid not in self.pids or not self.pids[pid].loaded:
+            return
+        data = self.pids[pid]
+        size = self.get_window_size()
+        start = max(0, len(data.items) - size)
+        if size == 0 or start <= data.offset:
+            return
+        first = data.items[start]
+
+        def on_trimmed(result):
+            if result and data.items and data.offset < start:
+                data.offset = start
+
+        try:
+            self.get_output_node_by_pid(pid).page().runJavaScript(
+                "trimNodes({});".format(json.dumps(first.id)), 0, on_trimmed
+            )
+        except Exception as e:
+            pass
+
+    def update_window(self, pid: Optional[int]):
+        """
+        Update windowed rendering state in output
+
+        :param pid: context PID
+        """
+        if pid not in self.pids or not self.pids[pid].loaded:
+            return
+        has_more = 0 < self.pids[pid].offset
+        try:
+            self.get_output_node_by_pid(pid).page().runJavaScript(
+                "setHasMore({});".format(json.dumps(has_more))
+            )
+        except Exception as e:
+            pass
 
     def append_input(
             self, meta: CtxMeta,
@@ -358,6 +466,7 @@ class Renderer(BaseRenderer):
         if text_chunk is None or text_chunk == "":
             if begin:
                 self.pids[pid].buffer = ""  # always reset buffer
+                self.pids[pid].buffer_offset = 0
             return
 
         self.update_names(meta, ctx)
@@ -370,10 +479,16 @@ class Renderer(BaseRenderer):
             if debug:
                 raw_chunk = debug + raw_chunk
             self.pids[pid].buffer = ""  # reset buffer
+            self.pids[pid].buffer_offset = 0
             self.pids[pid].is_cmd = False  # reset command flag
             self.clear_chunks_output(pid)
         self.pids[pid].buffer += raw_chunk
 
+        # incremental mode: parse only the last, not completed block
+        if self.is_stream_incremental():
+            self.append_chunk_delta(meta, pid)
+            return
+
         """
         # cooldown (throttling) to prevent high CPU usage on huge text chunks
         if len(self.buffer) > self.throttling_min_chars:
@@ -396,6 +511,39 @@ class Renderer(BaseRenderer):
         except Exception as e:
             pass
 
+    def append_chunk_delta(
+            self,
+            meta: CtxMeta,
+            pid: int
+    ):
+        """
+        Append output chunk to output (incremental mode)
+
+        Completed blocks are parsed once and appended to output, only the open tail block is re-parsed
+
+        :param meta: context meta
+        :param pid: context PID
+        """
+        offset = self.pids[pid].buffer_offset
+        tail = self.pids[pid].buffer[offset:]
+        completed = self.parser.get_completed_offset(tail)
+        html_completed = ""
+        if completed > 0:
+            html_completed = self.parser.parse(tail[:completed])
+            tail = tail[completed:]
+            self.pids[pid].buffer_offset = offset + completed
+
+        html_tail = ""
+        if tail.strip() != "":
+            if has_unclosed_code_tag(tail):
+                tail += "\n```"  # fix for code block without closing ```
+            html_tail = self.parser.parse(tail)
+        try:
+            self.get_output_node(meta).page().runJavaScript(
+                f"appendOutputDelta('{self.pids[pid].name_bot}', {json.dumps(html_completed)}, {json.dumps(html_tail)});")
+        except Exception as e:
+            pass
+
     def append_chunk_input(
             self,
             meta: CtxMeta,
@@ -660,6 +808,8 @@ class Renderer(BaseRenderer):
         self.parser.reset()
         self.pids[pid].item = None
         self.pids[pid].html = ""
+        self.pids[pid].items = []
+        self.pids[pid].offset = 0
         self.clear_nodes(pid)
         self.clear_chunks(pid)
         self.pids[pid].images_appended = []
@@ -791,6 +941,39 @@ class Renderer(BaseRenderer):
                 next_ctx=next_ctx
             )
 
+    def format_text(
+            self,
+            ctx: CtxItem,
+            text: str,
+            type: int
+    ) -> str:
+        """
+        Format message text to HTML (cached per ctx item)
+
+        :param ctx: CtxItem instance
+        :param text: message text
+        :param type: type of message
+        :return: formatted HTML
+        """
+        source = self.append_timestamp(ctx, "", type=type) + "\n" + text
+        html = self.cache.get(ctx.id, type, source)
+        if html is not None:
+            return html
+        if type == self.NODE_INPUT:
+            content = self.append_timestamp(
+                ctx,
+                self.helpers.format_user_text(text),
+                type=self.NODE_INPUT
+            )
+            html = "<p>" + content + "</p>"
+        else:
+            html = self.helpers.pre_format_text(text)
+            html = self.append_timestamp(ctx, html, type=self.NODE_OUTPUT)
+            html = self.parser.parse(html)
+        html = self.helpers.post_format_text(html)
+        self.cache.put(ctx.id, type, source, html)
+        return html
+
     def prepare_node_input(
             self,
             pid,
@@ -810,13 +993,7 @@ class Renderer(BaseRenderer):
         :return: prepared HTML
         """
         msg_id = "msg-user-" + str(ctx.id) if ctx is not None else ""
-        content = self.append_timestamp(
-            ctx,
-            self.helpers.format_user_text(html),
-            type=self.NODE_INPUT
-        )
-        html = "<p>" + content + "</p>"
-        html = self.helpers.post_format_text(html)
+        html = self.format_text(ctx, html, self.NODE_INPUT)
         name = self.pids[pid].name_user
 
         if ctx.internal and ctx.input.startswith("[{"):
@@ -880,10 +1057,7 @@ class Renderer(BaseRenderer):
         msg_id = "msg-bot-" + str(ctx.id) if ctx is not None else ""
         # if is_cmd:
         # html = self.helpers.format_cmd_text(html)
-        html = self.helpers.pre_format_text(html)
-        html = self.append_timestamp(ctx, html, type=self.NODE_OUTPUT)
-        html = self.parser.parse(html)
-        html = self.helpers.post_format_text(html)
+        html = self.format_text(ctx, html, self.NODE_OUTPUT)
         extra = self.append_extra(meta, ctx, footer=True, render=False)
         footer = self.body.prepare_action_icons(ctx)
 
@@ -1217,6 +1391,8 @@ class Renderer(BaseRenderer):
             self.clear_chunks(pid)
             self.clear_nodes(pid)
             self.pids[pid].html = ""
+            self.pids[pid].items = []
+            self.pids[pid].offset = 0
 
     def scroll_to_bottom(self):
         """Scroll to bottom"""
@@ -1261,6 +1437,7 @@ class Renderer(BaseRenderer):
     def on_theme_change(self):
         """On theme change"""
         self.window.controller.theme.markdown.load()
+        self.cache.clear()
         for pid in self.pids:
             if self.pids[pid].loaded:
                 self.reload_css()
@@ -1347,6 +1524,14 @@ class Renderer(BaseRenderer):
         debug = "<b>" +title+ ":</b> pid: "+str(pid)+", ctx: " + str(ctx.to_dict())
         return "<div class='debug'>" + debug + "</div>"
 
+    def is_stream_incremental(self) -> bool:
+        """
+        Check if incremental stream rendering is enabled
+
+        :return: True if enabled
+        """
+        return self.window.core.config.get("render.stream.incremental", True)
+
     def is_debug(self) -> bool:
         """
         Check if debug mode is enabled
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 19:00:00                  #
+# ================================================== #
+
+import heapq
+import math
+import time
+from typing import Optional, Callable, Dict, Any, List
+
+from PySide6.QtCore import QTimer
+
+
+class Scheduler:
+    def __init__(self, window=None):
+        """
+        Scheduler core (one-shot and periodic callbacks with deadlines)
+
+        All jobs share a single timer armed for the earliest deadline,
+        the timer is stopped when nothing is scheduled. Use from the main thread only.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.jobs = {}  # id => job
+        self.queue = []  # heap: (deadline, seq, id)
+        self.seq = 0
+        self.timer = None
+        self.armed = None  # deadline the timer is armed for
+        self.running = False
+
+    def setup(self):
+        """Set up scheduler timer"""
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self.run)
+        self.arm()
+
+    def add(
+            self,
+            id: str,
+            callback: Callable,
+            interval: int,
+            repeat: bool = False,
+            delay: Optional[int] = None
+    ) -> str:
+        """
+        Schedule callback (replaces existing job with the same ID)
+
+        :param id: job ID
+        :param callback: callback to run
+        :param interval: interval in milliseconds (delay if not repeat)
+        :param repeat: True if periodic, False if one-shot
+        :param delay: first run delay in milliseconds (default: interval)
+        :return: job ID
+        """
+        if delay is None:
+            delay = interval
+        self.seq += 1
+        deadline = time.monotonic() + max(0, delay) / 1000
+        self.jobs[id] = {
+            "callback": callback,
+            "interval": max(1 if repeat else 0, interval),
+            "repeat": repeat,
+            "deadline": deadline,
+            "seq": self.seq,
+        }
+        heapq.heappush(self.queue, (deadline, self.seq, id))
+        self.arm()
+        return id
+
+    def at(
+            self,
+            id: str,
+            callback: Callable,
+            ts: float
+    ) -> str:
+        """
+        Schedule one-shot callback at timestamp
+
+        :param id: job ID
+        :param callback: callback to run
+        :param ts: unix timestamp
+        :return: job ID
+        """
+        delay = int(math.ceil(max(0.0, ts - time.time()) * 1000))
+        return self.add(id, callback, delay)
+
+    def remove(self, id: str):
+        """
+        Remove scheduled job
+
+        :param id: job ID
+        """
+        if id in self.jobs:
+            del self.jobs[id]  # heap entry is skipped when popped
+            self.arm()
+
+    def has(self, id: str) -> bool:
+        """
+        Check if job is scheduled
+
+        :param id: job ID
+        :return: True if scheduled
+        """
+        return id in self.jobs
+
+    def get_ids(self) -> List[str]:
+        """
+        Get scheduled job IDs
+
+        :return: list of job IDs
+        """
+        return list(self.jobs.keys())
+
+    def get_next(self) -> Optional[float]:
+        """
+        Get earliest deadline (skip removed or replaced jobs)
+
+        :return: deadline (monotonic time) or None if nothing is scheduled
+        """
+        while self.queue:
+            deadline, seq, id = self.queue[0]
+            job = self.jobs.get(id)
+            if job is not None and job["seq"] == seq:
+                return deadline
+            heapq.heappop(self.queue)  # stale entry
+        return None
+
+    def arm(self):
+        """Arm timer for the earliest deadline, stop if nothing is scheduled"""
+        if self.timer is None or self.running:
+            return
+        deadline = self.get_next()
+        if deadline is None:
+            self.timer.stop()
+            self.armed = None
+            return
+        if self.armed == deadline and self.timer.isActive():
+            return
+        self.armed = deadline
+        delay = int(math.ceil(max(0.0, deadline - time.monotonic()) * 1000))
+        self.timer.start(delay)
+
+    def run(self):
+        """Run due jobs and re-arm timer"""
+        self.running = True
+        try:
+            now = time.monotonic()
+            while True:
+                deadline = self.get_next()
+                if deadline is None or deadline > now:
+                    break
+                _, seq, id = heapq.heappop(self.queue)
+                job = self.jobs[id]
+                if job["repeat"]:
+                    # next deadline, skip missed intervals
+                    next_deadline = deadline + job["interval"] / 1000
+                    if next_deadline <= now:
+                        next_deadline = now + job["interval"] / 1000
+                    self.seq += 1
+                    job["deadline"] = next_deadline
+                    job["seq"] = self.seq
+                    heapq.heappush(self.queue, (next_deadline, self.seq, id))
+                else:
+                    del self.jobs[id]
+                try:
+                    job["callback"]()
+                except Exception as e:
+                    self.window.core.debug.log(e)
+        finally:
+            self.running = False
+        self.armed = None
+        self.arm()
+
+    def clear(self):
+        """Remove all jobs and stop timer"""
+        self.jobs = {}
+        self.queue = []
+        self.armed = None
+        if self.timer is not None:
+            self.timer.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler stats
+
+        :return: dict with jobs count and next deadline (in seconds from now)
+        """
+        deadline = self.get_next()
+        return {
+            "jobs": len(self.jobs),
+            "next": None if deadline is None else max(0.0, deadline - time.monotonic()),
+        }
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import copy
@@ -143,6 +143,8 @@ class Settings:
         :param path: file path (force load) or None
         """
         # load file
+        if file == "config.json":
+            self.window.core.config.save(force=True)  # write pending changes, file is read from disk
         if path is None:
             if file.endswith('.json'):
                 path = os.path.join(self.window.core.config.get_user_path(), file)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 17:00:00                  #
 # ================================================== #
 
 from typing import Tuple, List
@@ -50,6 +50,7 @@ class Tokens:
         :param window: Window instance
         """
         self.window = window
+        self.system_cache = None  # (key, num) of last counted system prompt
 
     @staticmethod
     def from_str(
@@ -234,6 +235,57 @@ class Tokens:
         """
         Return number of tokens from context ctx
 
+        Count is memoized in ctx item and recalculated only if model, mode or content was changed
+
+        :param ctx: CtxItem
+        :param mode: mode
+        :param model: model ID
+        :return: number of tokens
+        """
+        key = Tokens.get_ctx_key(ctx, mode, model)
+        cached = ctx.tokens_cache
+        if isinstance(cached, tuple) and cached[0] == key:
+            return cached[1]
+        num = Tokens.count_ctx(ctx, mode, model)
+        ctx.tokens_cache = (key, num)
+        return num
+
+    @staticmethod
+    def get_ctx_key(
+            ctx: CtxItem,
+            mode: str = MODE_CHAT,
+            model: str = "gpt-4"
+    ) -> tuple:
+        """
+        Return tokens memo key for context ctx
+
+        :param ctx: CtxItem
+        :param mode: mode
+        :param model: model ID
+        :return: key
+        """
+        if mode in CHAT_MODES:
+            mode = MODE_CHAT  # same count for all chat modes
+        return (
+            mode,
+            model,
+            ctx.input,
+            ctx.hidden_input,
+            ctx.output,
+            ctx.hidden_output,
+            ctx.input_name,
+            ctx.output_name,
+        )
+
+    @staticmethod
+    def count_ctx(
+            ctx: CtxItem,
+            mode: str = MODE_CHAT,
+            model: str = "gpt-4"
+    ) -> int:
+        """
+        Count number of tokens from context ctx (without memo)
+
         :param ctx: CtxItem
         :param mode: mode
         :param model: model ID
@@ -337,8 +389,7 @@ class Tokens:
             system_prompt = self.window.core.prompt.build_final_system_prompt(system_prompt)  # add addons
 
             if system_prompt is not None and system_prompt != "":
-                system_tokens = self.from_prompt(system_prompt, "", model_id)
-                system_tokens += self.from_text("system", model_id)
+                system_tokens = self.from_system_prompt(system_prompt, model_id)
 
             # input prompt
             if input_prompt is not None and input_prompt != "":
@@ -395,6 +446,26 @@ class Tokens:
         return input_tokens, system_tokens, extra_tokens, ctx_tokens, ctx_len, ctx_len_all, \
                sum_tokens, max_current, threshold
 
+    def from_system_prompt(
+            self,
+            system_prompt: str,
+            model: str = "gpt-4"
+    ) -> int:
+        """
+        Return number of tokens from system prompt (memoized, prompt is recounted only if changed)
+
+        :param system_prompt: system prompt
+        :param model: model ID
+        :return: number of tokens
+        """
+        key = (system_prompt, model)
+        if self.system_cache is not None and self.system_cache[0] == key:
+            return self.system_cache[1]
+        num = self.from_prompt(system_prompt, "", model)
+        num += self.from_text("system", model)
+        self.system_cache = (key, num)
+        return num
+
     def from_user(
             self,
             system_prompt: str,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 19:00:00                  #
+# Updated Date: 2025.01.21 03:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Dict
@@ -14,6 +14,7 @@ from typing import Optional, List, Dict
 from pygpt_net.provider.web.base import BaseProvider
 
 from .helpers import Helpers
+from .http import Http
 
 
 class Web:
@@ -28,6 +29,7 @@ class Web:
         """
         self.window = window
         self.helpers = Helpers(window)
+        self.http = Http(window)
         self.providers = {
             self.PROVIDER_SEARCH_ENGINE: {},
         }
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 03:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Tuple
+
+
+class HttpCache:
+    def __init__(self, window=None):
+        """
+        HTTP responses cache (on disk, honors ETag, Last-Modified and max-age)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0  # not modified (304) responses
+        self.size = None  # size of cached responses in bytes, loaded on first store
+        self.lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        """
+        Check if cache is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("web.http.cache", False)) and self.get_limit() > 0
+
+    def get_limit(self) -> int:
+        """
+        Get max cache size
+
+        :return: size limit in bytes
+        """
+        limit = self.window.core.config.get("web.http.cache.size", 64)
+        return max(0, int(limit or 0)) * 1024 * 1024
+
+    def get_path(self) -> str:
+        """
+        Get cache directory
+
+        :return: path to directory
+        """
+        return os.path.join(self.window.core.config.get_user_dir("tmp"), "http_cache")
+
+    def get_key(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        Get cache key
+
+        :param url: URL
+        :param headers: request headers (user agent may change response)
+        :return: cache key
+        """
+        agent = ""
+        if headers:
+            agent = headers.get("User-Agent", "")
+        return hashlib.sha256("{}\n{}".format(url, agent).encode("utf-8", errors="replace")).hexdigest()
+
+    def get_expires(self, headers: Dict[str, str]) -> Optional[float]:
+        """
+        Get expiration time from response headers
+
+        :param headers: response headers
+        :return: timestamp, 0 = must revalidate, None = do not store
+        """
+        headers = {k.lower(): v for k, v in headers.items()}
+        control = headers.get("cache-control", "").lower()
+        if "no-store" in control:
+            return None
+        if "no-cache" in control:
+            return 0.0
+        match = re.search(r"max-age=(\d+)", control)
+        if match:
+            return time.time() + int(match.group(1))
+        if "expires" in headers:
+            try:
+                return parsedate_to_datetime(headers["expires"]).timestamp()
+            except (TypeError, ValueError):
+                return 0.0
+        if "etag" in headers or "last-modified" in headers:
+            return 0.0
+        return None  # no validators, nothing to revalidate with
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """
+        Load cached response
+
+        :param key: cache key
+        :return: (meta, content) or None if not cached
+        """
+        path = os.path.join(self.get_path(), key[:2], key)
+        try:
+            with open(path + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(path + ".bin", "rb") as f:
+                content = f.read()
+            os.utime(path + ".bin")  # used recently
+        except (OSError, ValueError):
+            return None
+        return meta, content
+
+    def is_fresh(self, meta: Dict[str, Any]) -> bool:
+        """
+        Check if cached response can be used without revalidation
+
+        :param meta: cached response meta
+        :return: True if fresh
+        """
+        return time.time() < meta.get("expires", 0)
+
+    def get_validators(self, meta: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Get conditional request headers
+
+        :param meta: cached response meta
+        :return: headers dict
+        """
+        headers = {}
+        stored = {k.lower(): v for k, v in meta.get("headers", {}).items()}
+        if "etag" in stored:
+            headers["If-None-Match"] = stored["etag"]
+        if "last-modified" in stored:
+            headers["If-Modified-Since"] = stored["last-modified"]
+        return headers
+
+    def store(
+            self,
+            key: str,
+            url: str,
+            status_code: int,
+            headers: Dict[str, str],
+            content: bytes
+    ) -> bool:
+        """
+        Store response in cache
+
+        :param key: cache key
+        :param url: URL
+        :param status_code: response status code
+        :param headers: response headers
+        :param content: response content
+        :return: True if stored
+        """
+        expires = self.get_expires(headers)
+        if expires is None or len(content) > self.get_limit() // 4:
+            return False
+        dir = os.path.join(self.get_path(), key[:2])
+        path = os.path.join(dir, key)
+        meta = {
+            "url": url,
+            "status_code": status_code,
+            "headers": dict(headers),
+            "expires": expires,
+            "stored": time.time(),
+        }
+        try:
+            os.makedirs(dir, exist_ok=True)
+            with open(path + ".bin.tmp", "wb") as f:
+                f.write(content)
+            os.replace(path + ".bin.tmp", path + ".bin")
+            with open(path + ".json", "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except OSError as e:
+            self.window.core.debug.log(e)
+            return False
+        with self.lock:
+            if self.size is None:
+                self.size = self.get_size()
+            else:
+                self.size += len(content)
+            over = self.size > self.get_limit()
+        if over:
+            self.evict()
+        return True
+
+    def update(self, key: str, headers: Dict[str, str]):
+        """
+        Update expiration time after revalidation
+
+        :param key: cache key
+        :param headers: response headers (304)
+        """
+        path = os.path.join(self.get_path(), key[:2], key + ".json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            expires = self.get_expires(headers)
+            meta["expires"] = expires if expires is not None else 0.0
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except (OSError, ValueError):
+            pass
+
+    def get_size(self) -> int:
+        """
+        Get size of cached responses
+
+        :return: size in bytes
+        """
+        size = 0
+        for root, dirs, files in os.walk(self.get_path()):
+            for file in files:
+                if file.endswith(".bin"):
+                    try:
+                        size += os.path.getsize(os.path.join(root, file))
+                    except OSError:
+                        pass
+        return size
+
+    def evict(self):
+        """Remove least recently used responses if cache is over the size limit"""
+        files = []
+        for root, dirs, names in os.walk(self.get_path()):
+            for name in names:
+                if not name.endswith(".bin"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                    files.append((stat.st_mtime, stat.st_size, path))
+                except OSError:
+                    pass
+        files.sort()
+        size = sum(file[1] for file in files)
+        target = int(self.get_limit() * 0.9)  # free some space to avoid eviction on every store
+        for mtime, file_size, path in files:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                os.remove(path[:-len(".bin")] + ".json")
+            except OSError:
+                pass
+            size -= file_size
+        with self.lock:
+            self.size = size
+
+    def clear(self):
+        """Clear cache"""
+        shutil.rmtree(self.get_path(), ignore_errors=True)
+        with self.lock:
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+            self.revalidated = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache stats
+
+        :return: dict with hits, misses and size
+        """
+        return {
+            "enabled": self.is_enabled(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "size": self.size,
+            "limit": self.get_limit(),
+        }
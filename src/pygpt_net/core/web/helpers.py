@@ -6,15 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.15 01:00:00                  #
+# Updated Date: 2025.01.21 03:00:00                  #
 # ================================================== #
 
 import os
 import uuid
 from typing import Optional, List, Dict, Tuple, Union
 
-import requests
-
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
@@ -65,7 +63,7 @@ class Helpers:
         upload = {}
         try:
             method = method.upper()
-            session = requests.Session()
+            session = self.window.core.web.http.get_session()  # shared connections, no shared cookies
             args = {}
 
             if data:
@@ -124,7 +122,7 @@ class Helpers:
         :param url: URL to get image from
         :return: image URL
         """
-        response = requests.get(url)
+        response = self.window.core.web.http.get(url)
         soup = BeautifulSoup(response.content, 'html.parser')
 
         og_image = soup.find('meta', property='og:image')
@@ -148,14 +146,14 @@ class Helpers:
                 src = img.get('src')
                 if not src:
                     continue
-                src = requests.compat.urljoin(url, src)
+                src = urljoin(url, src)
                 try:
-                    img_response = requests.get(src, stream=True, timeout=5)
-                    img_response.raw.decode_content = True
+                    with self.window.core.web.http.request("GET", src, stream=True, timeout=5) as img_response:
+                        img_response.raw.decode_content = True
 
-                    from PIL import Image
-                    image = Image.open(img_response.raw)
-                    width, height = image.size
+                        from PIL import Image
+                        image = Image.open(img_response.raw)
+                        width, height = image.size
                     area = width * height
                     if area > max_area:
                         max_area = area
@@ -173,7 +171,7 @@ class Helpers:
         :param url: URL to get links from
         :return: links list
         """
-        response = requests.get(url)
+        response = self.window.core.web.http.get(url)
         soup = BeautifulSoup(response.content, 'html.parser')
         links = []
         urls = []
@@ -204,7 +202,7 @@ class Helpers:
         :param url: URL to get images from
         :return: images list
         """
-        response = requests.get(url)
+        response = self.window.core.web.http.get(url)
         soup = BeautifulSoup(response.content, 'html.parser')
         images = []
         for img in soup.find_all('img'):
@@ -226,7 +224,7 @@ class Helpers:
         :return: local path to image
         """
         dir = self.window.core.config.get_user_dir("img")
-        response = requests.get(img, stream=True)
+        response = self.window.core.web.http.get(img)
         name = img.replace("http://", "").replace("https://", "").replace("/", "_")
         path = os.path.join(dir, name)
         if os.path.exists(path):
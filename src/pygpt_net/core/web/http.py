@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import threading
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .cache import HttpCache
+
+
+class HttpResponse:
+    def __init__(
+            self,
+            url: str,
+            status_code: int,
+            headers: Dict[str, str],
+            content: bytes,
+            from_cache: bool = False
+    ):
+        """
+        HTTP response (from network or cache)
+
+        :param url: URL
+        :param status_code: status code
+        :param headers: response headers
+        :param content: response content
+        :param from_cache: True if read from cache
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        """
+        Get response content as text
+
+        :return: decoded content
+        """
+        encoding = get_encoding_from_headers(self.headers) or "utf-8"
+        try:
+            return self.content.decode(encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+class Http:
+
+    MAX_HOSTS = 32  # max number of per-host connection pools kept alive
+
+    def __init__(self, window=None):
+        """
+        Shared HTTP connections (pooled keep-alive connections) and responses cache
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.cache = HttpCache(window)
+        self.adapter = None
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def get_adapter(self) -> HTTPAdapter:
+        """
+        Get shared transport adapter (connection pools)
+
+        :return: HTTP adapter
+        """
+        with self.lock:
+            if self.adapter is None:
+                size = int(self.window.core.config.get("web.http.pool.size", 10) or 10)
+                self.adapter = HTTPAdapter(
+                    pool_connections=self.MAX_HOSTS,
+                    pool_maxsize=max(1, size),
+                    pool_block=True,  # limit connections per host
+                )
+            return self.adapter
+
+    def get_session(self) -> requests.Session:
+        """
+        Get new HTTP session with shared transport adapter
+
+        Session is created per request, so cookies and auth are never shared
+        between unrelated requests; only pooled connections are reused.
+        Do not close returned session, it would close shared connection pools.
+
+        :return: requests session
+        """
+        adapter = self.get_adapter()
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Make HTTP request using shared connections (not cached)
+
+        :param method: HTTP method
+        :param url: URL
+        :param kwargs: requests keyword arguments
+        :return: response
+        """
+        self.requests += 1
+        return self.get_session().request(method, url, **kwargs)
+
+    def get(
+            self,
+            url: str,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = 10,
+            verify: bool = True,
+            cache: bool = True
+    ) -> HttpResponse:
+        """
+        Make GET request, use cached response if available
+
+        :param url: URL
+        :param headers: request headers
+        :param timeout: timeout in seconds
+        :param verify: verify SSL certificate
+        :param cache: use cache (if enabled in config)
+        :return: response
+        """
+        headers = dict(headers or {})
+        if not cache or not self.cache.is_enabled():
+            response = self.request("GET", url, headers=headers, timeout=timeout, verify=verify)
+            return HttpResponse(url, response.status_code, dict(response.headers), response.content)
+
+        key = self.cache.get_key(url, headers)
+        cached = self.cache.load(key)
+        if cached is not None:
+            meta, content = cached
+            if self.cache.is_fresh(meta):
+                self.cache.hits += 1
+                return HttpResponse(url, meta["status_code"], meta["headers"], content, from_cache=True)
+            headers.update(self.cache.get_validators(meta))
+
+        response = self.request("GET", url, headers=headers, timeout=timeout, verify=verify)
+        if response.status_code == 304 and cached is not None:
+            self.cache.revalidated += 1
+            self.cache.update(key, dict(response.headers))
+            return HttpResponse(url, meta["status_code"], meta["headers"], content, from_cache=True)
+
+        self.cache.misses += 1
+        result = HttpResponse(url, response.status_code, dict(response.headers), response.content)
+        if response.status_code == 200:
+            self.cache.store(key, url, response.status_code, dict(response.headers), response.content)
+        return result
+
+    def reset(self):
+        """Close pooled connections (will be recreated with current config on next request)"""
+        with self.lock:
+            adapter = self.adapter
+            self.adapter = None
+        if adapter is not None:
+            adapter.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get HTTP stats
+
+        :return: dict with requests count, pool size and cache stats
+        """
+        pools = 0
+        if self.adapter is not None:
+            pools = len(self.adapter.poolmanager.pools)
+        return {
+            "requests": self.requests,
+            "pools": pools,
+            "cache": self.cache.get_stats(),
+        }
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2025.01.20 17:00:00                  #
 # ================================================== #
 
 import copy
@@ -56,6 +56,7 @@ class CtxItem:
         self.input_tokens = 0
         self.output_tokens = 0
         self.total_tokens = 0
+        self.tokens_cache = None  # memoized tokens count: (key, num), not stored
         self.extra = {}
         self.extra_ctx = None
         self.current = False
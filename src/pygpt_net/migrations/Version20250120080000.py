@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 08:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from .base import BaseMigration
+
+
+class Version20250120080000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20250120080000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        # full-text search index (FTS5) for ctx search, skip if SQLite is compiled without FTS5
+        try:
+            conn.execute(text("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS ctx_item_fts USING fts5(
+                input,
+                output,
+                content='ctx_item',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            );"""))
+            conn.execute(text("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS ctx_meta_fts USING fts5(
+                name,
+                content='ctx_meta',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            );"""))
+        except OperationalError as e:
+            print("[DB] FTS5 is not available, skipping full-text index: {}".format(e))
+            return
+
+        # keep index in sync with ctx_item
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_item_fts_ai AFTER INSERT ON ctx_item BEGIN
+            INSERT INTO ctx_item_fts (rowid, input, output) VALUES (new.id, new.input, new.output);
+        END;"""))
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_item_fts_ad AFTER DELETE ON ctx_item BEGIN
+            INSERT INTO ctx_item_fts (ctx_item_fts, rowid, input, output)
+            VALUES ('delete', old.id, old.input, old.output);
+        END;"""))
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_item_fts_au AFTER UPDATE OF input, output ON ctx_item
+        WHEN old.input IS NOT new.input OR old.output IS NOT new.output BEGIN
+            INSERT INTO ctx_item_fts (ctx_item_fts, rowid, input, output)
+            VALUES ('delete', old.id, old.input, old.output);
+            INSERT INTO ctx_item_fts (rowid, input, output) VALUES (new.id, new.input, new.output);
+        END;"""))
+
+        # keep index in sync with ctx_meta
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_meta_fts_ai AFTER INSERT ON ctx_meta BEGIN
+            INSERT INTO ctx_meta_fts (rowid, name) VALUES (new.id, new.name);
+        END;"""))
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_meta_fts_ad AFTER DELETE ON ctx_meta BEGIN
+            INSERT INTO ctx_meta_fts (ctx_meta_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        END;"""))
+        conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS ctx_meta_fts_au AFTER UPDATE OF name ON ctx_meta
+        WHEN old.name IS NOT new.name BEGIN
+            INSERT INTO ctx_meta_fts (ctx_meta_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            INSERT INTO ctx_meta_fts (rowid, name) VALUES (new.id, new.name);
+        END;"""))
+
+        # index existing history
+        conn.execute(text("INSERT INTO ctx_item_fts (ctx_item_fts) VALUES ('rebuild');"))
+        conn.execute(text("INSERT INTO ctx_meta_fts (ctx_meta_fts) VALUES ('rebuild');"))
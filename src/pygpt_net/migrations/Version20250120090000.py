@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 09:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20250120090000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20250120090000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        # ctx items: loaded by meta, ordered by ID
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_ctx_item_meta_id ON ctx_item (meta_id, id);
+        """))
+
+        # ctx meta: list ordered by update time, filtered by root, group and pinned
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_ctx_meta_updated_ts ON ctx_meta (updated_ts);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_ctx_meta_root_id ON ctx_meta (root_id, updated_ts);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_ctx_meta_group_id ON ctx_meta (group_id, updated_ts);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_ctx_meta_is_important ON ctx_meta (is_important, updated_ts);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_ctx_meta_indexed_ts ON ctx_meta (indexed_ts);
+        """))
+
+        # indexes: lookups by meta, doc ID and store/idx
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_idx_ctx_meta_id ON idx_ctx (meta_id, store, idx);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_idx_ctx_doc_id ON idx_ctx (doc_id);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_idx_file_store_idx ON idx_file (store, idx, name);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_idx_file_doc_id ON idx_file (doc_id);
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS ix_idx_external_store_idx ON idx_external (store, idx, doc_id);
+        """))
+        conn.execute(text("ANALYZE;"))
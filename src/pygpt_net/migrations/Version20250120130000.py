@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 13:00:00                  #
+# ================================================== #
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20250120130000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20250120130000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        # indexed files: content hash, size and mtime (skip unchanged files on re-index)
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN hash TEXT;
+        """))
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN size INTEGER;
+        """))
+        conn.execute(text("""
+        ALTER TABLE idx_file ADD COLUMN mtime INTEGER;
+        """))
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.15 11:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 from .Version20231227152900 import Version20231227152900  # 2.0.59
@@ -23,6 +23,9 @@ from .Version20240501030000 import Version20240501030000  # 2.2.7
 from .Version20241122130000 import Version20241122130000  # 2.4.21
 from .Version20241126170000 import Version20241126170000  # 2.4.34
 from .Version20241215110000 import Version20241215110000  # 2.4.43
+from .Version20250120080000 import Version20250120080000  # 2.4.58
+from .Version20250120090000 import Version20250120090000  # 2.4.58
+from .Version20250120130000 import Version20250120130000  # 2.4.58
 
 class Migrations:
     def __init__(self):
@@ -50,4 +53,7 @@ class Migrations:
             Version20241122130000(),  # 2.4.21
             Version20241126170000(),  # 2.4.34
             Version20241215110000(),  # 2.4.43
+            Version20250120080000(),  # 2.4.58
+            Version20250120090000(),  # 2.4.58
+            Version20250120130000(),  # 2.4.58
         ]
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -29,6 +29,20 @@ class Plugin(BasePlugin):
             "cmd.inline",
         ]
         self.order = 9998
+        self.events = [
+            Event.FORCE_STOP,
+            Event.PLUGIN_SETTINGS_CHANGED,
+            Event.ENABLE,
+            Event.DISABLE,
+            Event.CTX_BEFORE,
+            Event.CTX_AFTER,
+            Event.CTX_END,
+            Event.USER_SEND,
+            Event.SYSTEM_PROMPT,
+            Event.INPUT_BEFORE,
+            Event.CMD_INLINE,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.config = Config(self)
         self.init_options()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 19:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import os
@@ -21,7 +21,6 @@ from pygpt_net.item.ctx import CtxItem
 from pygpt_net.utils import trans
 
 from .config import Config
-from .worker import Worker
 from .simple import Simple
 
 
@@ -48,6 +47,18 @@ class Plugin(BasePlugin):
             'Thank you for watching',
         ]  # phrases to ignore (fix for empty phrases)
         self.order = 1
+        self.events = [
+            Event.INPUT_BEFORE,
+            Event.CTX_BEGIN,
+            Event.CTX_END,
+            Event.ENABLE,
+            Event.DISABLE,
+            Event.AUDIO_INPUT_TOGGLE,
+            Event.AUDIO_INPUT_RECORD_TOGGLE,
+            Event.AUDIO_INPUT_STOP,
+            Event.AUDIO_INPUT_TRANSCRIBE,
+            Event.PLUGIN_OPTION_GET,
+        ]
         self.use_locale = True
         self.input_file = "input.wav"
         self.config = Config(self)
@@ -301,6 +312,7 @@ class Plugin(BasePlugin):
 
         :param path: audio file path
         """
+        from .worker import Worker
         try:
             worker = Worker()
             worker.from_defaults(self)
@@ -325,6 +337,7 @@ class Plugin(BasePlugin):
 
         :param force: force start
         """
+        from .worker import Worker
         if self.thread_started and not force:
             return
 
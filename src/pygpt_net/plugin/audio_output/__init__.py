@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.18 03:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from typing import Any
@@ -20,7 +20,6 @@ from pygpt_net.core.events import Event
 from pygpt_net.item.ctx import CtxItem
 
 from .config import Config
-from .worker import Worker
 
 
 class Plugin(BasePlugin):
@@ -34,6 +33,13 @@ class Plugin(BasePlugin):
         self.input_text = None
         self.playback = None
         self.order = 1
+        self.events = [
+            Event.INPUT_BEFORE,
+            Event.CTX_AFTER,
+            Event.AUDIO_READ_TEXT,
+            Event.AUDIO_PLAYBACK,
+            Event.AUDIO_OUTPUT_STOP,
+        ]
         self.use_locale = True
         self.output_file = "output.mp3"
         self.config = Config(self)
@@ -159,6 +165,7 @@ class Plugin(BasePlugin):
         :param ctx: CtxItem
         :param event: Event
         """
+        from .worker import Worker
         # check if provider is configured
         if not self.get_provider().is_configured():
             msg = self.get_provider().get_config_message()
@@ -211,6 +218,7 @@ class Plugin(BasePlugin):
         :param ctx: CtxItem
         :param event: Event
         """
+        from .worker import Worker
         try:
             self.stop_audio()
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 05:00:00                  #
 # ================================================== #
 
 import copy
@@ -39,6 +39,7 @@ class BasePlugin(QObject):
         self.enabled = False
         self.use_locale = False
         self.order = 0
+        self.events = None  # handled event names, None = all events (not declared)
 
     def setup(self) -> Dict[str, Any]:
         """
@@ -96,6 +97,7 @@ class BasePlugin(QObject):
 
         :param cmd: command name
         :param kwargs: additional keyword arguments for command properties
+            (read_only=True for side-effect free commands, they can be executed concurrently)
         :return: added option config dict
         """
         cmd_syntax = {
@@ -116,6 +118,7 @@ class BasePlugin(QObject):
         name = "cmd." + cmd
         kwargs["cmd"] = cmd
         kwargs["value"] = cmd_syntax
+        kwargs["read_only"] = bool(kwargs.get("read_only", False))
 
         # static keys
         kwargs["params_keys"] = {
@@ -169,6 +172,21 @@ class BasePlugin(QObject):
         """
         return self.window.core.config.get("cmd")
 
+    def is_cmd_read_only(
+            self,
+            cmd: str
+    ) -> bool:
+        """
+        Check if command is read-only (side-effect free, can be executed concurrently)
+
+        :param cmd: command name
+        :return: True if read-only
+        """
+        key = "cmd." + cmd
+        if key in self.options:
+            return bool(self.options[key].get("read_only", False))
+        return False
+
     def get_cmd(
             self,
             cmd: str
@@ -6,10 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 05:00:00                  #
 # ================================================== #
 
-from typing import Optional, Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Any, Dict, List, Callable, Tuple
 
 from PySide6.QtCore import QObject, QRunnable
 from typing_extensions import deprecated
@@ -256,6 +257,94 @@ class BaseWorker(QObject, QRunnable):
             return self.plugin.window.controller.kernel.stopped()
         return False
 
+    def get_max_workers(self) -> int:
+        """
+        Get max number of concurrently executed read-only commands
+
+        :return: max workers (1 = sequential execution)
+        """
+        if self.plugin is None or self.plugin.window is None:
+            return 1
+        return max(1, int(self.plugin.window.core.config.get("cmd.parallel", 1) or 1))
+
+    def is_read_only(self, item: Dict[str, Any]) -> bool:
+        """
+        Check if command item can be executed concurrently
+
+        :param item: command item
+        :return: True if read-only
+        """
+        if self.plugin is None:
+            return False
+        return self.plugin.is_cmd_read_only(item["cmd"])
+
+    def exec_cmd(
+            self,
+            handler: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+            item: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Execute single command item
+
+        :param handler: command handler, returns response or None
+        :param item: command item
+        :return: response item or None
+        """
+        try:
+            return handler(item)
+        except Exception as e:
+            return self.make_response(
+                item,
+                self.throw_error(e)
+            )
+
+    def run_cmds(
+            self,
+            handler: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+            is_read_only: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute commands, consecutive read-only commands are executed concurrently
+        and commands with side effects are executed one by one, after all previous commands
+
+        :param handler: command handler, returns response or None
+        :param is_read_only: read-only check (default: from command definition)
+        :return: responses in order of commands
+        """
+        if is_read_only is None:
+            is_read_only = self.is_read_only
+        max_workers = self.get_max_workers()
+        if max_workers <= 1 or len(self.cmds) < 2:
+            max_workers = 1
+
+        results = []
+        pending: List[Tuple[int, Future]] = []
+        executor = None
+        try:
+            for item in self.cmds:
+                if self.is_stopped():
+                    break
+                if max_workers > 1 and is_read_only(item):
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=max_workers,
+                            thread_name_prefix="cmd",
+                        )
+                    pending.append((len(results), executor.submit(self.exec_cmd, handler, item)))
+                    results.append(None)
+                    continue
+                # wait for previous commands before executing command with side effects
+                for i, future in pending:
+                    results[i] = future.result()
+                pending = []
+                results.append(self.exec_cmd(handler, item))
+            for i, future in pending:
+                results[i] = future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        return [response for response in results if response]
+
     def run_sync(self):
         """Run synchronous"""
         self.run()
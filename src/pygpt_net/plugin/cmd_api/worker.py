@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.18 21:00:00                  #
+# Updated Date: 2025.01.21 05:00:00                  #
 # ================================================== #
 
 import json
@@ -30,40 +30,55 @@ class Worker(BaseWorker):
         self.plugin = None
         self.cmds = None
         self.ctx = None
+        self.msg = None
 
     @Slot()
     def run(self):
-        responses = []
-        msg = None
-        for item in self.cmds:
-            if self.is_stopped():
-                break
-            for my_cmd in self.plugin.get_option_value("cmds"):
-                if self.is_stopped():
-                    break
-                if my_cmd["name"] == item["cmd"]:
-                    try:
-                        response = self.handle_cmd(my_cmd, item)
-                        if response is False:
-                            continue
-                        responses.append(response)
-
-                    except Exception as e:
-                        msg = "Error: {}".format(e)
-                        responses.append(
-                            self.make_response(
-                                item,
-                                self.throw_error(e)
-                            )
-                        )
+        responses = self.run_cmds(self.handle)
 
         # send response
         if len(responses) > 0:
             self.reply_more(responses)
 
         # update status
-        if msg is not None:
-            self.status(msg)
+        if self.msg is not None:
+            self.status(self.msg)
+
+    def handle(self, item: dict) -> dict or None:
+        """
+        Handle requested item
+
+        :param item: requested item
+        :return: response or None
+        """
+        for my_cmd in self.plugin.get_option_value("cmds"):
+            if self.is_stopped():
+                break
+            if my_cmd["name"] == item["cmd"]:
+                try:
+                    response = self.handle_cmd(my_cmd, item)
+                    if response is False:
+                        continue
+                    return response
+
+                except Exception as e:
+                    self.msg = "Error: {}".format(e)
+                    return self.make_response(
+                        item,
+                        self.throw_error(e)
+                    )
+
+    def is_read_only(self, item: dict) -> bool:
+        """
+        Check if requested item can be executed concurrently (GET requests only)
+
+        :param item: requested item
+        :return: True if read-only
+        """
+        for my_cmd in self.plugin.get_option_value("cmds"):
+            if my_cmd["name"] == item["cmd"]:
+                return my_cmd.get("type", "GET") == "GET"
+        return False
 
     def handle_cmd(self, command: dict, item: dict) -> dict or bool:
         """
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.12 01:00:00                  #
+# Updated Date: 2025.01.21 01:00:00                  #
 # ================================================== #
 
 import os
@@ -23,6 +23,7 @@ from .builder import Builder
 from .ipython import LocalKernel
 from .ipython import DockerKernel
 from .output import Output
+from .pool import Pool
 from .runner import Runner
 from .worker import Worker
 
@@ -53,6 +54,13 @@ class Plugin(BasePlugin):
             "render_html_output",
             "get_html_output",
         ]
+        self.events = [
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+            Event.TOOL_OUTPUT_RENDER,
+            Event.PLUGIN_SETTINGS_CHANGED,
+            Event.DISABLE,
+        ]
         self.use_locale = True
         self.docker = Docker(self)
         self.runner = Runner(self)
@@ -60,6 +68,7 @@ class Plugin(BasePlugin):
         self.ipython_local = LocalKernel(self)
         self.builder = Builder(self)
         self.output = Output(self)
+        self.pool = Pool(self)
         self.worker = None
         self.config = Config(self)
         self.init_options()
@@ -95,6 +104,13 @@ class Plugin(BasePlugin):
             if data['tool'] == self.id:
                 data['html'] = self.output.handle(ctx, data['content'])
 
+        elif name == Event.PLUGIN_SETTINGS_CHANGED:
+            self.pool.shutdown()  # restart workers with new options on next run
+
+        elif name == Event.DISABLE:
+            if data['value'] == self.id:
+                self.pool.shutdown()
+
     def cmd_syntax(self, data: dict):
         """
         Event: CMD_SYNTAX
@@ -262,6 +278,10 @@ class Plugin(BasePlugin):
         self.window.tools.get("html_canvas").set_output(data)
         self.window.tools.get("html_canvas").auto_open()
         
+    def destroy(self):
+        """Stop Python workers"""
+        self.pool.shutdown()
+
     def get_interpreter(self):
         """
         Get interpreter
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.25 02:00:00                  #
+# Updated Date: 2025.01.21 01:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -226,6 +226,66 @@ class Config(BaseConfig):
             description="Python command template to execute, use {filename} for filename placeholder",
             tab="python_legacy",
         )
+        plugin.add_option(
+            "python_worker",
+            type="bool",
+            value=False,
+            label="Use warm worker process",
+            description="Executes code on host in a pre-started Python process (reused between runs) "
+                        "instead of starting a new process for every run",
+            tab="python_legacy",
+        )
+        plugin.add_option(
+            "python_worker_preload",
+            type="text",
+            value="",
+            label="Worker: preload modules",
+            description="Modules imported at worker start, separated by comma, e.g.: numpy, pandas",
+            tab="python_legacy",
+        )
+        plugin.add_option(
+            "python_worker_timeout",
+            type="int",
+            value=120,
+            label="Worker: timeout",
+            description="Max execution time in seconds, the worker is killed on timeout, 0 = no limit",
+            min=0,
+            max=86400,
+            tab="python_legacy",
+        )
+        plugin.add_option(
+            "python_worker_memory",
+            type="int",
+            value=0,
+            label="Worker: memory limit (MB)",
+            description="Max memory of the worker process in MB (Linux/macOS only), 0 = no limit",
+            min=0,
+            max=1048576,
+            tab="python_legacy",
+            advanced=True,
+        )
+        plugin.add_option(
+            "python_worker_max_runs",
+            type="int",
+            value=20,
+            label="Worker: max runs",
+            description="Restart the worker after N executions, 0 = never",
+            min=0,
+            max=10000,
+            tab="python_legacy",
+            advanced=True,
+        )
+        plugin.add_option(
+            "python_worker_pool",
+            type="int",
+            value=1,
+            label="Worker: pool size",
+            description="Number of warm worker processes kept ready",
+            min=1,
+            max=16,
+            tab="python_legacy",
+            advanced=True,
+        )
         plugin.add_option(
             "dockerfile",
             type="textarea",
@@ -6,18 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.25 02:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import os
 import json
 import re
-import docker
 import io
 import tarfile
 
-from jupyter_client import BlockingKernelClient
-from docker.errors import DockerException
 
 class DockerKernel:
     def __init__(self, plugin = None):
@@ -89,6 +86,7 @@ class DockerKernel:
 
     def is_image(self):
         """Check if the Docker image for the IPython kernel exists."""
+        import docker
         client = self.get_docker_client()
         try:
             client.images.get(self.get_image_name())
@@ -121,6 +119,7 @@ class DockerKernel:
 
         :param force: Force reinitialization.
         """
+        from jupyter_client import BlockingKernelClient
         if self.initialized and not force:
             return
         self.prepare_local_data_dir()
@@ -144,12 +143,13 @@ class DockerKernel:
         except FileExistsError:
             pass
 
-    def get_docker_client(self) -> docker.DockerClient:
+    def get_docker_client(self) -> "docker.DockerClient":
         """
         Get the Docker client.
 
         :return: Docker client.
         """
+        import docker
         return docker.from_env()
 
     def prepare_conn(self):
@@ -212,6 +212,7 @@ class DockerKernel:
 
         :param name: Container name.
         """
+        import docker
         client = self.get_docker_client()
         try:
             container = client.containers.get(name)
@@ -227,6 +228,7 @@ class DockerKernel:
         :param name: Container name.
         :return: True if the container was started successfully, False otherwise.
         """
+        import docker
         client = self.get_docker_client()
         ports = self.get_ports()
         # at first, check for image
@@ -268,6 +270,7 @@ class DockerKernel:
 
         :param name: Container name.
         """
+        import docker
         client = self.get_docker_client()
         try:
             client.containers.get(name)
@@ -283,6 +286,7 @@ class DockerKernel:
 
         :param name: Container name.
         """
+        import docker
         client = self.get_docker_client()
         try:
             container = client.containers.get(name)
@@ -385,6 +389,7 @@ class DockerKernel:
 
         :return: True if the kernel was restarted successfully, False otherwise.
         """
+        from jupyter_client import BlockingKernelClient
         self.send_output("Restarting...")
         self.restart_container(self.get_container_name())
         if self.client is not None:
@@ -414,6 +419,8 @@ class DockerKernel:
 
         :return: True if installed
         """
+        import docker
+        from docker.errors import DockerException
         try:
             if self.client is None:
                 client = docker.from_env()
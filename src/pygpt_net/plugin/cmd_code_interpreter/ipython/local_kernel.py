@@ -6,11 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.25 02:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import re
-from jupyter_client import KernelManager
+
 
 class LocalKernel:
     def __init__(self, plugin = None):
@@ -48,6 +48,7 @@ class LocalKernel:
 
         :param force: Force reinitialization.
         """
+        from jupyter_client import KernelManager
         if self.initialized and not force:
             return
         self.manager = KernelManager()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 01:00:00                  #
+# ================================================== #
+
+import json
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from typing import Optional, Callable, Tuple, List, Dict, Any
+
+STARTUP_TIMEOUT = 60  # max seconds to wait for worker ready (preload), in addition to run timeout
+
+
+class Process:
+    def __init__(self, cmd: str, options: Dict[str, Any]):
+        """
+        Warm Python worker process
+
+        :param cmd: command to start worker
+        :param options: worker options
+        """
+        self.options = options
+        self.frames = queue.Queue()
+        self.runs = 0
+        self.seq = 0
+        self.ready = False
+        self.broken = False
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True  # kill whole process group on timeout
+        self.proc = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **kwargs
+        )
+        threading.Thread(target=self.read_stdout, daemon=True).start()
+        threading.Thread(target=self.read_stderr, daemon=True).start()
+        self.send({
+            "preload": options["preload"],
+            "memory_limit": options["memory_limit"],
+        })
+
+    def read_stdout(self):
+        """Read protocol frames from worker"""
+        for line in iter(self.proc.stdout.readline, b""):
+            text = line.decode("utf-8", errors="replace")
+            try:
+                frame = json.loads(text)
+            except ValueError:
+                frame = {"type": "stdout", "data": text}  # not a protocol frame
+            self.frames.put(frame)
+        self.frames.put({"type": "exit"})
+
+    def read_stderr(self):
+        """Read raw stderr output from worker"""
+        for data in iter(lambda: self.proc.stderr.read1(4096), b""):
+            self.frames.put({"type": "stderr", "data": data.decode("utf-8", errors="replace")})
+
+    def send(self, msg: dict):
+        """
+        Send message to worker
+
+        :param msg: message dict
+        """
+        self.proc.stdin.write((json.dumps(msg) + "\n").encode("utf-8"))
+        self.proc.stdin.flush()
+
+    def is_alive(self) -> bool:
+        """
+        Check if worker is running
+
+        :return: True if running
+        """
+        return not self.broken and self.proc.poll() is None
+
+    def wait_ready(self, timeout: float, callback: Optional[Callable] = None) -> bool:
+        """
+        Wait until worker preloads modules
+
+        :param timeout: timeout in seconds
+        :param callback: output callback (data, type)
+        :return: True if ready
+        """
+        deadline = time.monotonic() + timeout
+        while not self.ready:
+            try:
+                frame = self.frames.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                return False
+            if frame["type"] == "ready":
+                self.ready = True
+            elif frame["type"] == "exit":
+                self.broken = True
+                return False
+            elif frame["type"] == "stderr" and callback is not None:
+                callback(frame["data"], "stderr")  # preload errors
+        return True
+
+    def execute(
+            self,
+            path: str,
+            timeout: float = 0,
+            callback: Optional[Callable] = None
+    ) -> Tuple[str, str, str]:
+        """
+        Execute Python file in worker
+
+        :param path: file path
+        :param timeout: timeout in seconds (0 = no limit)
+        :param callback: output callback (data, type), called as output arrives
+        :return: stdout, stderr, status (ok, error, memory, timeout, exit)
+        """
+        self.seq += 1
+        self.runs += 1
+        stdout = []
+        stderr = []
+        self.send({"id": self.seq, "path": path})
+        deadline = time.monotonic() + timeout if timeout > 0 else None
+        while True:
+            try:
+                if deadline is None:
+                    frame = self.frames.get()
+                else:
+                    frame = self.frames.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.kill()
+                return "".join(stdout), "".join(stderr), "timeout"
+            type = frame["type"]
+            if type in ("stdout", "stderr"):
+                if type == "stdout":
+                    stdout.append(frame["data"])
+                else:
+                    stderr.append(frame["data"])
+                if callback is not None:
+                    callback(frame["data"], type)
+            elif type == "done" and frame.get("id") == self.seq:
+                if frame.get("status") == "memory":
+                    self.broken = True  # recycle after out of memory
+                return "".join(stdout), "".join(stderr), frame.get("status", "ok")
+            elif type == "exit":
+                self.broken = True
+                return "".join(stdout), "".join(stderr), "exit"
+
+    def kill(self):
+        """Kill worker process (with its children)"""
+        self.broken = True
+        if self.proc.poll() is not None:
+            return
+        try:
+            if os.name == "nt":
+                subprocess.call(
+                    ["taskkill", "/F", "/T", "/PID", str(self.proc.pid)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            else:
+                os.killpg(self.proc.pid, signal.SIGKILL)
+        except OSError:
+            self.proc.kill()
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+class Pool:
+    def __init__(self, plugin=None):
+        """
+        Pool of warm Python worker processes (host mode)
+
+        :param plugin: plugin instance
+        """
+        self.plugin = plugin
+        self.idle = []  # ready to use workers
+        self.lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        """
+        Check if worker mode is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.plugin.get_option_value("python_worker"))
+
+    def get_options(self) -> Dict[str, Any]:
+        """
+        Get worker options
+
+        :return: options dict
+        """
+        preload = self.plugin.get_option_value("python_worker_preload") or ""
+        return {
+            "cmd": self.plugin.get_option_value("python_cmd_tpl"),
+            "preload": [name.strip() for name in preload.split(",") if name.strip()],
+            "memory_limit": int(self.plugin.get_option_value("python_worker_memory") or 0),
+            "timeout": int(self.plugin.get_option_value("python_worker_timeout") or 0),
+            "max_runs": int(self.plugin.get_option_value("python_worker_max_runs") or 0),
+            "size": max(1, int(self.plugin.get_option_value("python_worker_pool") or 1)),
+        }
+
+    def get_worker_path(self) -> str:
+        """
+        Get worker script path
+
+        :return: path to worker script
+        """
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), "pool_worker.py")
+
+    def spawn(self, options: Dict[str, Any]) -> Process:
+        """
+        Start new worker process
+
+        :param options: worker options
+        :return: worker process
+        """
+        path = self.get_worker_path()
+        if '"{filename}"' not in options["cmd"]:
+            path = '"{}"'.format(path)  # package path may contain spaces
+        return Process(options["cmd"].format(filename=path), options)
+
+    def is_compatible(self, proc: Process, options: Dict[str, Any]) -> bool:
+        """
+        Check if worker was started with current options
+
+        :param proc: worker process
+        :param options: current options
+        :return: True if compatible
+        """
+        keys = ("cmd", "preload", "memory_limit")
+        return proc.is_alive() and all(proc.options[key] == options[key] for key in keys)
+
+    def acquire(self, options: Dict[str, Any]) -> Process:
+        """
+        Get idle worker or start new one
+
+        :param options: worker options
+        :return: worker process
+        """
+        with self.lock:
+            while self.idle:
+                proc = self.idle.pop(0)
+                if self.is_compatible(proc, options):
+                    return proc
+                proc.kill()
+        return self.spawn(options)
+
+    def release(self, proc: Process, options: Dict[str, Any]):
+        """
+        Return worker to pool or recycle it
+
+        :param proc: worker process
+        :param options: worker options
+        """
+        max_runs = options["max_runs"]
+        if not proc.is_alive() or (0 < max_runs <= proc.runs):
+            proc.kill()
+        else:
+            with self.lock:
+                self.idle.append(proc)
+        self.fill(options)
+
+    def fill(self, options: Dict[str, Any]):
+        """
+        Start workers up to pool size, so next run is warm
+
+        :param options: worker options
+        """
+        with self.lock:
+            self.idle = [proc for proc in self.idle if proc.is_alive()]
+            missing = options["size"] - len(self.idle)
+        for i in range(missing):
+            try:
+                proc = self.spawn(options)
+            except Exception as e:
+                self.plugin.log("Error while starting Python worker: {}".format(e))
+                return
+            with self.lock:
+                self.idle.append(proc)
+
+    def execute(
+            self,
+            path: str,
+            callback: Optional[Callable] = None
+    ) -> Tuple[str, str, str]:
+        """
+        Execute Python file in warm worker
+
+        :param path: file path
+        :param callback: output callback (data, type), called as output arrives
+        :return: stdout, stderr, status (ok, error, memory, timeout, exit)
+        """
+        options = self.get_options()
+        proc = self.acquire(options)
+        try:
+            if not proc.wait_ready(options["timeout"] + STARTUP_TIMEOUT, callback):
+                proc.kill()
+                return "", "Python worker not started", "exit"
+            return proc.execute(path, options["timeout"], callback)
+        finally:
+            self.release(proc, options)
+
+    def get_workers(self) -> List[Process]:
+        """
+        Get idle workers
+
+        :return: list of workers
+        """
+        return list(self.idle)
+
+    def shutdown(self):
+        """Stop all idle workers"""
+        with self.lock:
+            idle = self.idle
+            self.idle = []
+        for proc in idle:
+            proc.kill()
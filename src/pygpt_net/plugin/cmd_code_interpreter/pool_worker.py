@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+# Warm Python worker process, started by the code interpreter pool (pool.py).
+# Runs standalone (no pygpt_net imports), protocol: JSON lines.
+#
+# stdin:  {"preload": [...], "memory_limit": MB}  (first line, init)
+#         {"id": n, "path": "/path/to/file.py"}  (run file)
+# stdout: {"type": "ready"}
+#         {"type": "stdout" | "stderr", "data": "..."}
+#         {"type": "done", "id": n, "status": "ok" | "error" | "memory"}
+
+import importlib
+import io
+import os
+import runpy
+import sys
+import threading
+import time
+import traceback
+from json import JSONEncoder, JSONDecoder
+
+# bound at import, user code may patch or replace the json module
+_encode = JSONEncoder().encode
+_decode = JSONDecoder().decode
+
+FLUSH_SIZE = 4096  # flush buffered output if larger than N chars
+FLUSH_INTERVAL = 0.05  # or if older than N seconds
+
+
+class Channel:
+    def __init__(self, stream):
+        """
+        Protocol output channel
+
+        :param stream: output stream
+        """
+        self.stream = stream
+        self.lock = threading.Lock()
+
+    def send(self, frame: dict):
+        """
+        Send frame to parent process
+
+        :param frame: frame dict
+        """
+        with self.lock:
+            self.stream.write(_encode(frame) + "\n")
+            self.stream.flush()
+
+
+class Output(io.TextIOBase):
+    def __init__(self, channel: Channel, name: str):
+        """
+        Buffered stdout/stderr replacement, sends output to parent as it arrives
+
+        :param channel: protocol channel
+        :param name: stream name (stdout, stderr)
+        """
+        super().__init__()
+        self.channel = channel
+        self.name = name
+        self.buffer = []
+        self.size = 0
+        self.last = time.monotonic()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: str) -> int:
+        if not data:
+            return 0
+        self.buffer.append(data)
+        self.size += len(data)
+        if self.size >= FLUSH_SIZE or ("\n" in data and time.monotonic() - self.last >= FLUSH_INTERVAL):
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.buffer:
+            data = "".join(self.buffer)
+            self.buffer = []
+            self.size = 0
+            self.channel.send({"type": self.name, "data": data})
+        self.last = time.monotonic()
+
+
+def set_memory_limit(limit: int):
+    """
+    Set memory limit (address space) of the process
+
+    :param limit: limit in MB, 0 = no limit
+    """
+    if limit <= 0:
+        return
+    try:
+        import resource
+        size = limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (size, size))
+    except (ImportError, ValueError, OSError) as e:
+        sys.stderr.write("Memory limit not set: {}\n".format(e))
+
+
+def preload(modules: list):
+    """
+    Import modules before first run
+
+    :param modules: list of module names
+    """
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            sys.stderr.write("Preload failed: {}: {}\n".format(name, e))
+
+
+def print_exception(path: str):
+    """
+    Print traceback of the current exception, without worker frames
+
+    :param path: executed file path
+    """
+    exc_type, exc, tb = sys.exc_info()
+    start = tb
+    while tb is not None:
+        if tb.tb_frame.f_code.co_filename == path:
+            start = tb
+            break
+        tb = tb.tb_next
+    traceback.print_exception(exc_type, exc, start)
+
+
+def run(path: str) -> str:
+    """
+    Run Python file in clean globals
+
+    :param path: file path
+    :return: status
+    """
+    status = "ok"
+    cwd = os.getcwd()
+    argv = sys.argv
+    sys_path = list(sys.path)
+    sys.argv = [path]
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status = "error"
+            if not isinstance(e.code, int):
+                sys.stderr.write("{}\n".format(e.code))
+    except MemoryError:
+        status = "memory"
+        print_exception(path)
+    except BaseException:
+        status = "error"
+        print_exception(path)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.argv = argv
+        sys.path[:] = sys_path
+        try:
+            os.chdir(cwd)
+        except OSError:
+            pass
+    return status
+
+
+def main():
+    # protocol streams, raw writes to fd 1 (e.g. from subprocesses) go to stderr
+    proto_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    proto_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    null = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null, 0)
+    os.close(null)
+
+    channel = Channel(proto_out)
+    sys.stdin = io.StringIO("")
+    sys.stdout = Output(channel, "stdout")
+    sys.stderr = Output(channel, "stderr")
+
+    line = proto_in.readline()
+    if not line:
+        return
+    init = _decode(line)
+    set_memory_limit(int(init.get("memory_limit", 0)))
+    preload(init.get("preload", []))
+    sys.stderr.flush()
+    channel.send({"type": "ready"})
+
+    for line in proto_in:
+        if not line.strip():
+            continue
+        msg = _decode(line)
+        status = run(msg["path"])
+        channel.send({"type": "done", "id": msg.get("id"), "status": status})
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.12 01:00:00                  #
+# Updated Date: 2025.01.21 01:00:00                  #
 # ================================================== #
 
 import os.path
 import re
 import subprocess
-import docker
 
 from pygpt_net.item.ctx import CtxItem
 
@@ -85,6 +84,37 @@ class Runner:
             self.log(result)
         return result
 
+    def handle_result_worker(self, stdout: str, stderr: str, status: str) -> str:
+        """
+        Handle result from Python worker (output is already sent to interpreter)
+
+        :param stdout: stdout
+        :param stderr: stderr
+        :param status: execution status
+        :return: result
+        """
+        if status == "timeout":
+            msg = "Execution timeout, worker process killed"
+            stderr += ("\n" if stderr else "") + msg
+            self.send_interpreter_output(msg, "stderr")
+        elif status == "memory":
+            self.log("Memory limit exceeded, worker process recycled")
+        elif status == "exit":
+            msg = "Python worker process exited"
+            stderr += ("\n" if stderr else "") + msg
+            self.send_interpreter_output(msg, "stderr")
+        result = None
+        if stdout:
+            result = stdout
+            self.log("STDOUT: {}".format(stdout))
+        if stderr:
+            result = stderr
+            self.log("STDERR: {}".format(stderr))
+        if result is None:
+            result = "No result (STDOUT/STDERR empty)"
+            self.log(result)
+        return result
+
     def handle_result_docker(self, response) -> str:
         """
         Handle result from docker container
@@ -172,12 +202,13 @@ class Runner:
         """
         return self.plugin.get_option_value('sandbox_ipython')
 
-    def get_docker(self) -> docker.client.DockerClient:
+    def get_docker(self) -> "docker.client.DockerClient":
         """
         Get docker client
 
         :return: docker client instance
         """
+        import docker
         return docker.from_env()
 
     def get_docker_image(self) -> str:
@@ -246,6 +277,33 @@ class Runner:
         """
 
         # run code
+        result = self.run_host(path)
+        return {
+            "request": request,
+            "result": str(result),
+            "context": "PYTHON OUTPUT:\n--------------------------------\n" + self.parse_result(result),
+        }
+
+    def run_host(self, path: str) -> str:
+        """
+        Run Python file on host machine (warm worker or new process)
+
+        :param path: file path
+        :return: result
+        """
+        if self.plugin.pool.is_enabled():
+            self.log("Running in Python worker: {}".format(path))
+            try:
+                stdout, stderr, status = self.plugin.pool.execute(
+                    path,
+                    callback=self.send_interpreter_output,  # stream output as it arrives
+                )
+            except Exception as e:
+                self.error(e)
+                stdout, stderr, status = "", str(e), "error"
+                self.send_interpreter_output(stderr, "stderr")
+            return self.handle_result_worker(stdout, stderr, status)
+
         cmd = self.plugin.get_option_value('python_cmd_tpl').format(filename=path)
         self.log("Running command: {}".format(cmd))
         try:
@@ -260,12 +318,7 @@ class Runner:
             self.error(e)
             stdout = None
             stderr = str(e).encode("utf-8")
-        result = self.handle_result(stdout, stderr)
-        return {
-            "request": request,
-            "result": str(result),
-            "context": "PYTHON OUTPUT:\n--------------------------------\n" + self.parse_result(result),
-        }
+        return self.handle_result(stdout, stderr)
 
     def code_execute_file_sandbox(self, ctx: CtxItem, item: dict, request: dict) -> dict:
         """
@@ -328,21 +381,7 @@ class Runner:
         self.send_interpreter_input(data)  # send input to interpreter
 
         # run code
-        cmd = self.plugin.get_option_value('python_cmd_tpl').format(filename=path)
-        self.log("Running command: {}".format(cmd))
-        try:
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            stdout, stderr = process.communicate()
-        except Exception as e:
-            self.error(e)
-            stdout = None
-            stderr = str(e).encode("utf-8")
-        result = self.handle_result(stdout, stderr)
+        result = self.run_host(path)
         return {
             "request": request,
             "result": str(result),
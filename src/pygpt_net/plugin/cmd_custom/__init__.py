@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -25,6 +25,10 @@ class Plugin(BasePlugin):
         self.description = "Provides availability to create and execute custom commands"
         self.prefix = "Custom"
         self.order = 100
+        self.events = [
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2025.01.21 07:00:00                  #
 # ================================================== #
 
 import os
@@ -17,6 +17,7 @@ from pygpt_net.item.ctx import CtxItem
 
 from .config import Config
 from .output import Output
+from .reader import Reader
 from .worker import Worker
 
 
@@ -52,9 +53,15 @@ class Plugin(BasePlugin):
             "cwd",
             "file_index",
         ]
+        self.events = [
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+            Event.TOOL_OUTPUT_RENDER,
+        ]
         self.use_locale = True
         self.worker = None
         self.output = Output(self)
+        self.reader = Reader(self)
         self.config = Config(self)
         self.init_options()
 
@@ -131,21 +138,34 @@ class Plugin(BasePlugin):
         except Exception as e:
             self.error(e)
 
-    def read_as_text(self, path: str, use_loaders: bool = True) -> str:
+    def read_as_text(
+            self,
+            path: str,
+            use_loaders: bool = True,
+            max_tokens: int = 0
+    ) -> str:
         """
         Read file and return content as text
 
         :param path: file path
         :param use_loaders: use Llama-index loader to read file
+        :param max_tokens: max tokens of content, 0 = no limit
         :return: text content
         """
-        # use_loaders = False
-        if use_loaders:
-            content, docs = str(self.window.core.idx.indexing.read_text_content(path))
-            return content
+        if not os.path.isfile(path):
+            return ""
+        size = os.path.getsize(path)
+        max_size = self.reader.get_max_size(max_tokens)
+        truncated = False
+        if 0 < max_size < size and self.reader.is_text(path):
+            # large text file, read only the beginning instead of loading whole file
+            data, truncated = self.reader.read_range(path, 0, 0, max_size=max_size)
+        elif use_loaders:
+            data, docs = self.window.core.idx.indexing.read_text_content(path)
         else:
-            data = ""
-            if os.path.isfile(path):
-                with open(path, 'r', encoding="utf-8") as file:
-                    data = file.read()
-            return data
+            with open(path, 'r', encoding="utf-8") as file:
+                data = file.read()
+        data, cut = self.reader.truncate(data, max_tokens)
+        if truncated or cut:
+            data += "\n\n" + self.reader.get_note(size)
+        return data
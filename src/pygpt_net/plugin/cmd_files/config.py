@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.18 19:00:00                  #
+# Updated Date: 2025.01.21 07:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -66,6 +66,33 @@ class Config(BaseConfig):
             description="If enabled, file will be indexed without reading it",
             tab="indexing",
         )
+        plugin.add_option(
+            "use_catalog",
+            type="bool",
+            value=True,
+            label="Use files catalog",
+            description="If enabled, `list_dir`, `tree` and `find` commands will query the files catalog "
+                        "of the data directory (updated incrementally) instead of walking the directory on every call",
+        )
+        plugin.add_option(
+            "max_entries",
+            type="int",
+            value=1000,
+            label="Max entries",
+            description="Max number of entries returned by `list_dir`, `tree` and `find` commands, 0 = no limit",
+            min=0,
+            max=100000,
+        )
+        plugin.add_option(
+            "max_tokens",
+            type="int",
+            value=10000,
+            label="Max tokens per file",
+            description="Max number of tokens of file content returned by `read_file` command, longer content is "
+                        "truncated (large text files are read partially), 0 = no limit",
+            min=0,
+            max=1000000,
+        )
 
         # commands
         plugin.add_cmd(
@@ -92,9 +119,64 @@ class Config(BaseConfig):
                     "description": "path(s) to files",
                     "required": True,
                 },
+                {
+                    "name": "offset",
+                    "type": "int",
+                    "description": "start byte offset, negative = from end of file",
+                    "required": False,
+                },
+                {
+                    "name": "length",
+                    "type": "int",
+                    "description": "number of bytes to read from offset",
+                    "required": False,
+                },
+                {
+                    "name": "line_start",
+                    "type": "int",
+                    "description": "first line to read (1-based)",
+                    "required": False,
+                },
+                {
+                    "name": "line_end",
+                    "type": "int",
+                    "description": "last line to read",
+                    "required": False,
+                },
+                {
+                    "name": "head",
+                    "type": "int",
+                    "description": "read first N lines",
+                    "required": False,
+                },
+                {
+                    "name": "tail",
+                    "type": "int",
+                    "description": "read last N lines",
+                    "required": False,
+                },
+                {
+                    "name": "grep",
+                    "type": "str",
+                    "description": "regex, return only matching lines with line numbers",
+                    "required": False,
+                },
+                {
+                    "name": "context",
+                    "type": "int",
+                    "description": "number of context lines around grep matches",
+                    "required": False,
+                },
+                {
+                    "name": "ignore_case",
+                    "type": "bool",
+                    "description": "case-insensitive grep",
+                    "required": False,
+                },
             ],
             enabled=True,
             description="Enable: Read file",
+            read_only=True,
         )
         plugin.add_cmd(
             "query_file",
@@ -181,9 +263,22 @@ class Config(BaseConfig):
                     "description": "path",
                     "required": True,
                 },
+                {
+                    "name": "pattern",
+                    "type": "str",
+                    "description": "name pattern, e.g. *.txt",
+                    "required": False,
+                },
+                {
+                    "name": "limit",
+                    "type": "int",
+                    "description": "max number of entries",
+                    "required": False,
+                },
             ],
             enabled=True,
             description="Enable: List files in directory (ls)",
+            read_only=True,
         )
         plugin.add_cmd(
             "tree",
@@ -195,9 +290,22 @@ class Config(BaseConfig):
                     "description": "path",
                     "required": True,
                 },
+                {
+                    "name": "depth",
+                    "type": "int",
+                    "description": "max depth",
+                    "required": False,
+                },
+                {
+                    "name": "limit",
+                    "type": "int",
+                    "description": "max number of entries",
+                    "required": False,
+                },
             ],
             enabled=True,
             description="Enable: get directory tree",
+            read_only=True,
         )
         plugin.add_cmd(
             "mkdir",
@@ -320,6 +428,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="Enable: Check if path is directory",
+            read_only=True,
         )
         plugin.add_cmd(
             "is_file",
@@ -334,6 +443,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="Enable: Check if path is file",
+            read_only=True,
         )
         plugin.add_cmd(
             "file_exists",
@@ -348,6 +458,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="Enable: Check if file or directory exists",
+            read_only=True,
         )
         plugin.add_cmd(
             "file_size",
@@ -362,6 +473,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="Enable: Get file size",
+            read_only=True,
         )
         plugin.add_cmd(
             "file_info",
@@ -376,6 +488,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="Enable: Get file info",
+            read_only=True,
         )
         plugin.add_cmd(
             "cwd",
@@ -383,6 +496,7 @@ class Config(BaseConfig):
             params=[],
             enabled=True,
             description="Enable: Get current working directory (cwd)",
+            read_only=True,
         )
         plugin.add_cmd(
             "file_index",
@@ -420,7 +534,14 @@ class Config(BaseConfig):
                     "description": "recursive search",
                     "required": True,
                 },
+                {
+                    "name": "limit",
+                    "type": "int",
+                    "description": "max number of entries",
+                    "required": False,
+                },
             ],
             enabled=True,
             description="Enable: Find file or directory",
+            read_only=True,
         )
\ No newline at end of file
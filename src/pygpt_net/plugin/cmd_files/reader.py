@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 07:00:00                  #
+# ================================================== #
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+CHUNK_SIZE = 1024 * 1024  # lines are counted in chunks, file is never copied at once
+MAX_LINE = 2000  # max bytes of single line in grep results
+CHARS_PER_TOKEN = 16  # upper bound used to cap bytes read before exact token count
+
+
+class Reader:
+    def __init__(self, plugin=None):
+        """
+        Streaming file reader (memory-mapped, reads only requested parts of file)
+
+        :param plugin: plugin
+        """
+        self.plugin = plugin
+
+    @contextmanager
+    def map_file(self, path: str):
+        """
+        Map file into memory (read-only)
+
+        :param path: file path
+        :return: mmap object (or empty bytes for empty file)
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""  # empty file cannot be mapped
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+    def is_text(self, path: str) -> bool:
+        """
+        Check if file looks like text (no NUL bytes in the beginning)
+
+        :param path: file path
+        :return: True if text
+        """
+        with open(path, "rb") as f:
+            return b"\x00" not in f.read(8192)
+
+    def decode(self, data: bytes) -> str:
+        """
+        Decode bytes to text
+
+        :param data: bytes
+        :return: text
+        """
+        return data.decode("utf-8", errors="replace")
+
+    def count_lines(self, mm, start: int, end: int) -> int:
+        """
+        Count newlines in range
+
+        :param mm: mapped file
+        :param start: start offset
+        :param end: end offset (exclusive)
+        :return: number of newlines
+        """
+        count = 0
+        for pos in range(start, end, CHUNK_SIZE):
+            count += mm[pos:min(pos + CHUNK_SIZE, end)].count(b"\n")
+        return count
+
+    def seek_line(self, mm, line: int) -> int:
+        """
+        Get offset of line start
+
+        :param mm: mapped file
+        :param line: line number (1-based)
+        :return: offset (file size if line is beyond the end of file)
+        """
+        size = len(mm)
+        left = line - 1  # newlines to skip
+        pos = 0
+        while left > 0 and pos < size:
+            chunk = mm[pos:pos + CHUNK_SIZE]
+            count = chunk.count(b"\n")
+            if count < left:
+                left -= count
+                pos += len(chunk)
+                continue
+            idx = -1
+            for i in range(left):
+                idx = chunk.find(b"\n", idx + 1)
+            return pos + idx + 1
+        return min(pos, size)
+
+    def read_range(
+            self,
+            path: str,
+            offset: int = 0,
+            length: int = 0,
+            max_size: int = 0
+    ) -> Tuple[str, bool]:
+        """
+        Read bytes range
+
+        :param path: file path
+        :param offset: start offset, negative = from end of file
+        :param length: number of bytes, 0 = to end of file
+        :param max_size: max bytes to read, 0 = no limit
+        :return: text, True if truncated
+        """
+        with self.map_file(path) as mm:
+            size = len(mm)
+            start = max(0, size + offset) if offset < 0 else min(offset, size)
+            end = size if length <= 0 else min(size, start + length)
+            truncated = False
+            if 0 < max_size < end - start:
+                end = start + max_size
+                truncated = True
+            return self.decode(mm[start:end]), truncated
+
+    def read_lines(
+            self,
+            path: str,
+            start: int = 1,
+            end: int = 0,
+            max_size: int = 0
+    ) -> Tuple[str, bool]:
+        """
+        Read lines range
+
+        :param path: file path
+        :param start: first line (1-based)
+        :param end: last line (inclusive), 0 = to end of file
+        :param max_size: max bytes to read, 0 = no limit
+        :return: text, True if truncated
+        """
+        with self.map_file(path) as mm:
+            begin = self.seek_line(mm, max(1, start))
+            stop = len(mm) if end <= 0 else self.seek_line(mm, end + 1)
+            truncated = False
+            if 0 < max_size < stop - begin:
+                stop = begin + max_size
+                truncated = True
+            return self.decode(mm[begin:stop]), truncated
+
+    def tail(
+            self,
+            path: str,
+            lines: int,
+            max_size: int = 0
+    ) -> Tuple[str, bool]:
+        """
+        Read last lines
+
+        :param path: file path
+        :param lines: number of lines
+        :param max_size: max bytes to read (from end), 0 = no limit
+        :return: text, True if truncated
+        """
+        with self.map_file(path) as mm:
+            size = len(mm)
+            pos = size
+            if size > 0 and mm[size - 1:size] == b"\n":
+                pos -= 1  # skip trailing newline
+            for i in range(max(0, lines)):
+                pos = mm.rfind(b"\n", 0, pos)
+                if pos < 0:
+                    break
+            begin = pos + 1 if lines > 0 else size
+            truncated = False
+            if 0 < max_size < size - begin:
+                begin = size - max_size
+                truncated = True
+            return self.decode(mm[begin:size]), truncated
+
+    def grep(
+            self,
+            path: str,
+            pattern: str,
+            context: int = 0,
+            ignore_case: bool = False,
+            max_size: int = 0
+    ) -> Tuple[str, bool]:
+        """
+        Search lines matching regular expression (grep -n -C)
+
+        :param path: file path
+        :param pattern: regular expression
+        :param context: number of context lines before and after match
+        :param ignore_case: case-insensitive search
+        :param max_size: max bytes of result, 0 = no limit
+        :return: matching lines prefixed with line numbers, True if truncated
+        """
+        flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        regex = re.compile(pattern.encode("utf-8"), flags)
+        context = max(0, context)
+        output = []
+        state = {"size": 0}
+
+        def emit(line: int, sep: str, data: bytes) -> bool:
+            if len(data) > MAX_LINE:
+                data = data[:MAX_LINE] + b"..."
+            text = "{}{}{}".format(line, sep, self.decode(data.rstrip(b"\r")))
+            output.append(text)
+            state["size"] += len(text) + 1
+            return 0 < max_size < state["size"]
+
+        with self.map_file(path) as mm:
+            size = len(mm)
+            printed = 0  # last printed line number
+            printed_end = 0  # offset of line after last printed line
+            after = 0  # context lines left after last match
+            counted, line = 0, 1  # line number at offset
+            pos = 0
+            while pos < size:
+                match = regex.search(mm, pos)
+                if match is None:
+                    break
+                begin = mm.rfind(b"\n", 0, match.start()) + 1
+                stop = mm.find(b"\n", match.start())
+                stop = size if stop < 0 else stop
+                line += self.count_lines(mm, counted, begin)
+                counted = begin
+
+                # context after previous match
+                while after > 0 and printed + 1 < line:
+                    end = mm.find(b"\n", printed_end)
+                    end = size if end < 0 else end
+                    printed += 1
+                    after -= 1
+                    if emit(printed, "-", mm[printed_end:end]):
+                        return "\n".join(output), True
+                    printed_end = end + 1
+
+                # context before match
+                first = max(line - context, printed + 1)
+                before = []
+                offset = begin
+                for num in range(line - 1, first - 1, -1):
+                    end = offset - 1
+                    offset = mm.rfind(b"\n", 0, end) + 1
+                    before.append((num, mm[offset:end]))
+                if printed > 0 and first > printed + 1:
+                    output.append("--")
+                for num, data in reversed(before):
+                    if emit(num, "-", data):
+                        return "\n".join(output), True
+                if emit(line, ":", mm[begin:stop]):
+                    return "\n".join(output), True
+                printed = line
+                printed_end = stop + 1
+                after = context
+                pos = stop + 1
+
+            # context after last match
+            while after > 0 and printed_end < size:
+                end = mm.find(b"\n", printed_end)
+                end = size if end < 0 else end
+                printed += 1
+                after -= 1
+                if emit(printed, "-", mm[printed_end:end]):
+                    return "\n".join(output), True
+                printed_end = end + 1
+        return "\n".join(output), False
+
+    def truncate(self, text: str, max_tokens: int) -> Tuple[str, bool]:
+        """
+        Truncate text to tokens budget
+
+        :param text: text
+        :param max_tokens: max tokens, 0 = no limit
+        :return: text, True if truncated
+        """
+        if max_tokens <= 0:
+            return text, False
+        truncated = False
+        max_chars = max_tokens * CHARS_PER_TOKEN
+        if len(text) > max_chars:
+            text = text[:max_chars]
+            truncated = True
+        tokens = self.plugin.window.core.tokens.from_str(text)
+        while tokens > max_tokens and text:
+            text = text[:int(len(text) * max_tokens / tokens * 0.95)]
+            tokens = self.plugin.window.core.tokens.from_str(text)
+            truncated = True
+        return text, truncated
+
+    def get_max_size(self, max_tokens: int) -> int:
+        """
+        Get max bytes to read for tokens budget
+
+        :param max_tokens: max tokens, 0 = no limit
+        :return: max bytes, 0 = no limit
+        """
+        return max(0, max_tokens) * CHARS_PER_TOKEN
+
+    def read(
+            self,
+            path: str,
+            params: dict,
+            max_tokens: int = 0
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Read part of file specified in command params
+
+        :param path: file path
+        :param params: command params (offset, length, line_start, line_end, head, tail, grep, context)
+        :param max_tokens: max tokens, 0 = no limit
+        :return: text, truncation note (None if not truncated)
+        """
+        max_size = self.get_max_size(max_tokens)
+        size = os.path.getsize(path)
+        if params.get("grep"):
+            content, truncated = self.grep(
+                path,
+                params["grep"],
+                context=int(params.get("context") or 0),
+                ignore_case=bool(params.get("ignore_case", False)),
+                max_size=max_size,
+            )
+            if content == "":
+                content = "No matches found"
+        elif params.get("tail"):
+            content, truncated = self.tail(path, int(params["tail"]), max_size=max_size)
+        elif params.get("head"):
+            content, truncated = self.read_lines(path, 1, int(params["head"]), max_size=max_size)
+        elif params.get("line_start") or params.get("line_end"):
+            content, truncated = self.read_lines(
+                path,
+                int(params.get("line_start") or 1),
+                int(params.get("line_end") or 0),
+                max_size=max_size,
+            )
+        else:
+            content, truncated = self.read_range(
+                path,
+                int(params.get("offset") or 0),
+                int(params.get("length") or 0),
+                max_size=max_size,
+            )
+        content, cut = self.truncate(content, max_tokens)
+        if truncated or cut:
+            return content, self.get_note(size)
+        return content, None
+
+    def get_note(self, size: int) -> str:
+        """
+        Get truncation note
+
+        :param size: file size
+        :return: note appended to truncated content
+        """
+        return "[truncated: file size is {} bytes, use `offset` and `length`, `line_start` and `line_end`, " \
+               "`head`, `tail` or `grep` params to read other parts of file]".format(size)
+
+    def is_partial(self, params: dict) -> bool:
+        """
+        Check if command params request part of file
+
+        :param params: command params
+        :return: True if partial read
+        """
+        keys = ["offset", "length", "line_start", "line_end", "head", "tail", "grep"]
+        return any(params.get(key) not in (None, "", 0) for key in keys)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.17 13:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 import fnmatch
@@ -37,113 +37,7 @@ class Worker(BaseWorker):
 
     @Slot()
     def run(self):
-        responses = []
-        for item in self.cmds:
-            if self.is_stopped():
-                break
-            try:
-                response = None
-                if item["cmd"] in self.plugin.allowed_cmds and self.plugin.has_cmd(item["cmd"]):
-
-                    # save file
-                    if item["cmd"] == "save_file":
-                        response = self.cmd_save_file(item)
-
-                    # append to file
-                    elif item["cmd"] == "append_file":
-                        response = self.cmd_append_file(item)
-
-                    # read file
-                    elif item["cmd"] == "read_file":
-                        response = self.cmd_read_file(item)
-
-                    # query file
-                    elif item["cmd"] == "query_file":
-                        response = self.cmd_query_file(item)
-
-                    # delete file
-                    elif item["cmd"] == "delete_file":
-                        response = self.cmd_delete_file(item)
-
-                    # list files
-                    elif item["cmd"] == "list_dir":
-                        response = self.cmd_list_dir(item)
-
-                    # tree
-                    elif item["cmd"] == "tree":
-                        response = self.cmd_tree(item)
-
-                    # mkdir
-                    elif item["cmd"] == "mkdir":
-                        response = self.cmd_mkdir(item)
-
-                    # rmdir
-                    elif item["cmd"] == "rmdir":
-                        response = self.cmd_rmdir(item)
-
-                    # download
-                    elif item["cmd"] == "download_file":
-                        response = self.cmd_download_file(item)
-
-                    # copy file
-                    elif item["cmd"] == "copy_file":
-                        response = self.cmd_copy_file(item)
-
-                    # copy dir
-                    elif item["cmd"] == "copy_dir":
-                        response = self.cmd_copy_dir(item)
-
-                    # move
-                    elif item["cmd"] == "move":
-                        response = self.cmd_move(item)
-
-                    # is dir
-                    elif item["cmd"] == "is_dir":
-                        response = self.cmd_is_dir(item)
-
-                    # is file
-                    elif item["cmd"] == "is_file":
-                        response = self.cmd_is_file(item)
-
-                    # file exists
-                    elif item["cmd"] == "file_exists":
-                        response = self.cmd_file_exists(item)
-
-                    # file size
-                    elif item["cmd"] == "file_size":
-                        response = self.cmd_file_size(item)
-
-                    # file info
-                    elif item["cmd"] == "file_info":
-                        response = self.cmd_file_info(item)
-
-                    # cwd
-                    elif item["cmd"] == "cwd":
-                        response = self.cmd_cwd(item)
-
-                    # get file as attachment
-                    elif item["cmd"] == "send_file":
-                        response = self.cmd_send_file(item)
-
-                    # index file or directory
-                    elif item["cmd"] == "file_index":
-                        response = self.cmd_file_index(item)
-
-                    # find file or directory
-                    elif item["cmd"] == "find":
-                        response = self.cmd_find(item)
-
-                    # store response
-                    if response:
-                        responses.append(response)
-
-            except Exception as e:
-                responses.append(
-                    self.make_response(
-                        item,
-                        self.throw_error(e)
-                    )
-                )
+        responses = self.run_cmds(self.handle)
 
         # send response
         if len(responses) > 0:
@@ -152,6 +46,118 @@ class Worker(BaseWorker):
         if self.msg is not None:
             self.status(self.msg)
 
+    def handle(self, item: dict) -> dict or None:
+        """
+        Handle command item
+
+        :param item: item with parameters
+        :return: response item or None
+        """
+        response = None
+        if item["cmd"] in self.plugin.allowed_cmds and self.plugin.has_cmd(item["cmd"]):
+
+            # save file
+            if item["cmd"] == "save_file":
+                response = self.cmd_save_file(item)
+
+            # append to file
+            elif item["cmd"] == "append_file":
+                response = self.cmd_append_file(item)
+
+            # read file
+            elif item["cmd"] == "read_file":
+                response = self.cmd_read_file(item)
+
+            # query file
+            elif item["cmd"] == "query_file":
+                response = self.cmd_query_file(item)
+
+            # delete file
+            elif item["cmd"] == "delete_file":
+                response = self.cmd_delete_file(item)
+
+            # list files
+            elif item["cmd"] == "list_dir":
+                response = self.cmd_list_dir(item)
+
+            # tree
+            elif item["cmd"] == "tree":
+                response = self.cmd_tree(item)
+
+            # mkdir
+            elif item["cmd"] == "mkdir":
+                response = self.cmd_mkdir(item)
+
+            # rmdir
+            elif item["cmd"] == "rmdir":
+                response = self.cmd_rmdir(item)
+
+            # download
+            elif item["cmd"] == "download_file":
+                response = self.cmd_download_file(item)
+
+            # copy file
+            elif item["cmd"] == "copy_file":
+                response = self.cmd_copy_file(item)
+
+            # copy dir
+            elif item["cmd"] == "copy_dir":
+                response = self.cmd_copy_dir(item)
+
+            # move
+            elif item["cmd"] == "move":
+                response = self.cmd_move(item)
+
+            # is dir
+            elif item["cmd"] == "is_dir":
+                response = self.cmd_is_dir(item)
+
+            # is file
+            elif item["cmd"] == "is_file":
+                response = self.cmd_is_file(item)
+
+            # file exists
+            elif item["cmd"] == "file_exists":
+                response = self.cmd_file_exists(item)
+
+            # file size
+            elif item["cmd"] == "file_size":
+                response = self.cmd_file_size(item)
+
+            # file info
+            elif item["cmd"] == "file_info":
+                response = self.cmd_file_info(item)
+
+            # cwd
+            elif item["cmd"] == "cwd":
+                response = self.cmd_cwd(item)
+
+            # get file as attachment
+            elif item["cmd"] == "send_file":
+                response = self.cmd_send_file(item)
+
+            # index file or directory
+            elif item["cmd"] == "file_index":
+                response = self.cmd_file_index(item)
+
+            # find file or directory
+            elif item["cmd"] == "find":
+                response = self.cmd_find(item)
+
+        return response
+
+    def is_read_only(self, item: dict) -> bool:
+        """
+        Check if command can be executed concurrently
+
+        :param item: command item
+        :return: True if read-only
+        """
+        if self.plugin.get_option_value("auto_index") \
+                or self.plugin.get_option_value("only_index"):
+            return False  # read files are indexed
+        return super(Worker, self).is_read_only(item)
+
     def cmd_save_file(self, item: dict) -> dict:
         """
         Save file
@@ -215,7 +221,7 @@ class Worker(BaseWorker):
                 paths = path
             elif isinstance(path, str):
                 paths = [path]
-            data, context = self.read_files(paths)
+            data, context = self.read_files(paths, item["params"])
             context_str = None
             if context:
                 context_str = "\n\n".join(context)
@@ -318,13 +324,25 @@ class Worker(BaseWorker):
             path = self.plugin.window.core.config.get_user_dir('data')
             if "path" in item["params"]:
                 path = self.prepare_path(item["params"]['path'])
+            pattern = self.get_param(item, "pattern")
+            limit = self.get_limit(item)
             self.msg = "Listing directory: {}".format(path)
             self.log(self.msg)
             if os.path.exists(path):
-                files = os.listdir(path)
-                result = files
+                if self.use_catalog(path):
+                    entries = self.plugin.window.core.filesystem.catalog.list_dir(
+                        path,
+                        pattern=pattern,
+                        limit=limit + 1 if limit > 0 else 0,
+                    )
+                    files = [entry["name"] for entry in entries]
+                else:
+                    files = os.listdir(path)
+                    if pattern:
+                        files = fnmatch.filter(files, pattern)
+                result = self.apply_limit(files, limit)
                 self.log("Files listed: {}".format(path))
-                self.log("Result: {}".format(files))
+                self.log("Result: {}".format(result))
             else:
                 result = "Directory not found"
                 self.log("Directory not found: {}".format(path))
@@ -340,29 +358,50 @@ class Worker(BaseWorker):
         :param item: item with parameters
         :return: response item
         """
-        context = None
         try:
             path = self.plugin.window.core.config.get_user_dir('data')
             if "path" in item["params"]:
                 path = self.prepare_path(item["params"]['path'])
+            depth = int(self.get_param(item, "depth", 0) or 0)
+            limit = self.get_limit(item)
             self.msg = "Listing directory: {}".format(path)
             self.log(self.msg)
-            tree_str = ""
-            tree = {}
             if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
-                    dirs.sort()
-                    files.sort()
-                    level = root.replace(path, '').count(os.sep)
-                    indent = ' ' * 4 * (level)
-                    tree_str += '{}{}/\n'.format(indent, os.path.basename(root))
-                    sub_indent = ' ' * 4 * (level + 1)
-                    files = sorted(files)
-                    for f in files:
-                        tree_str += '{}{}\n'.format(sub_indent, f)
-                    tree[os.path.basename(root)] = files
+                if self.use_catalog(path):
+                    catalog = self.plugin.window.core.filesystem.catalog
+                    children = catalog.walk(path, max_depth=depth)
+
+                    def get_entries(key: str) -> (list, list):
+                        entries = children.get(key, [])
+                        files = [entry["name"] for entry in entries if not entry["is_dir"]]
+                        dirs = [(entry["path"], entry["name"]) for entry in entries if entry["is_dir"]]
+                        return files, dirs
+
+                    root = catalog.get_id(path)
+                else:
+                    def get_entries(key: str) -> (list, list):
+                        files = []
+                        dirs = []
+                        try:
+                            with os.scandir(key) as entries:
+                                for entry in entries:
+                                    if entry.is_dir():
+                                        dirs.append((entry.path, entry.name))
+                                    else:
+                                        files.append(entry.name)
+                        except OSError:
+                            pass
+                        return sorted(files), sorted(dirs, key=lambda x: x[1])
+
+                    root = path
+                tree, tree_str = self.build_tree(
+                    root,
+                    os.path.basename(os.path.normpath(path)),
+                    get_entries,
+                    depth,
+                    limit,
+                )
                 result = tree
-                context = path + "\n--------------------------------\n" + tree_str
                 self.log("Directory tree: {}".format(path))
                 self.log("Result: {}".format(tree_str))
             else:
@@ -374,6 +413,62 @@ class Worker(BaseWorker):
         extra = self.prepare_extra(item, result)
         return self.make_response(item, result, extra=extra)
 
+    def build_tree(
+            self,
+            root: str,
+            name: str,
+            get_entries: callable,
+            depth: int = 0,
+            limit: int = 0
+    ) -> (dict, str):
+        """
+        Build directory tree
+
+        :param root: root directory key
+        :param name: root directory name
+        :param get_entries: callback returning sorted files and (key, name) dirs of directory
+        :param depth: max depth (0 = no limit)
+        :param limit: max number of entries (0 = no limit)
+        :return: dict with files in directories, tree as string
+        """
+        tree = {}
+        lines = []
+        count = 0
+        truncated = False
+        stack = [(root, name, 0)]
+        while stack and not truncated:
+            key, name, level = stack.pop()
+            files, dirs = get_entries(key)
+            indent = ' ' * 4 * level
+            sub_indent = ' ' * 4 * (level + 1)
+            lines.append('{}{}/'.format(indent, name))
+            if 0 < limit < count + len(files):
+                files = files[:max(0, limit - count)]
+                truncated = True
+            count += len(files)
+            tree[name] = files
+            for f in files:
+                lines.append('{}{}'.format(sub_indent, f))
+            if truncated:
+                break
+            if depth == 0 or level + 1 < depth:
+                for dir_key, dir_name in reversed(dirs):
+                    stack.append((dir_key, dir_name, level + 1))
+            else:
+                if 0 < limit < count + len(dirs):
+                    dirs = dirs[:max(0, limit - count)]
+                    truncated = True
+                for dir_key, dir_name in dirs:
+                    lines.append('{}{}/'.format(sub_indent, dir_name))  # not expanded
+            count += len(dirs)
+            if 0 < limit < count:
+                truncated = True
+        if truncated:
+            msg = "... (limit of {} entries reached, use depth or limit params)".format(limit)
+            lines.append(msg)
+            tree["..."] = [msg]
+        return tree, "\n".join(lines) + "\n"
+
     def cmd_mkdir(self, item: dict) -> dict:
         """
         Make directory
@@ -771,12 +866,13 @@ class Worker(BaseWorker):
                 path = self.prepare_path(item["params"]['path'])
             if "recursive" in item["params"]:
                 recursive = item["params"]['recursive']
+            limit = self.get_limit(item)
             self.msg = "Searching in directory: {}".format(path)
             self.log(self.msg)
             if os.path.exists(path):
-                files = self.find_files(path, pattern, recursive)
-                result = files
-                self.log("Result: {}".format(files))
+                files = self.find_files(path, pattern, recursive, limit + 1 if limit > 0 else 0)
+                result = self.apply_limit(files, limit)
+                self.log("Result: {}".format(result))
             else:
                 result = "Directory not found"
                 self.log("{}: {}".format(result, path))
@@ -786,26 +882,90 @@ class Worker(BaseWorker):
         extra = self.prepare_extra(item, result)
         return self.make_response(item, result, extra=extra)
 
-    def find_files(self, directory: str, pattern: str, recursive: bool = True) -> list:
+    def find_files(
+            self,
+            directory: str,
+            pattern: str,
+            recursive: bool = True,
+            limit: int = 0
+    ) -> list:
         """
         Find files in directory
 
         :param directory: search directory
         :param pattern: search pattern
         :param recursive: search recursively
+        :param limit: max number of files (0 = no limit)
         :return: list of files
         """
+        if self.use_catalog(directory):
+            catalog = self.plugin.window.core.filesystem.catalog
+            entries = catalog.find(
+                directory,
+                pattern,
+                recursive=recursive,
+                files_only=recursive,
+                limit=limit,
+            )
+            return [catalog.to_abs(entry["path"]) for entry in entries]
+
         matches = []
         if recursive:
             for root, dirs, files in os.walk(directory):
                 for filename in fnmatch.filter(files, pattern):
                     matches.append(os.path.join(root, filename))
+                    if 0 < limit <= len(matches):
+                        return matches
         else:
             for filename in os.listdir(directory):
                 if fnmatch.fnmatch(filename, pattern):
                     matches.append(os.path.join(directory, filename))
+                    if 0 < limit <= len(matches):
+                        return matches
         return matches
 
+    def use_catalog(self, path: str) -> bool:
+        """
+        Check if directory can be queried from files catalog
+
+        :param path: directory path
+        :return: True if catalog can be used
+        """
+        if not self.plugin.get_option_value("use_catalog"):
+            return False
+        return os.path.isdir(path) and self.plugin.window.core.filesystem.catalog.is_cataloged(path)
+
+    def get_limit(self, item: dict) -> int:
+        """
+        Get max number of returned entries
+
+        :param item: item with parameters
+        :return: limit (0 = no limit)
+        """
+        max_entries = int(self.plugin.get_option_value("max_entries") or 0)
+        try:
+            limit = int(self.get_param(item, "limit", 0) or 0)
+        except (TypeError, ValueError):
+            limit = 0
+        if limit <= 0:
+            return max_entries
+        if max_entries > 0:
+            return min(limit, max_entries)
+        return limit
+
+    def apply_limit(self, items: list, limit: int) -> list:
+        """
+        Truncate list of entries
+
+        :param items: list of entries
+        :param limit: limit (0 = no limit)
+        :return: truncated list (with info if truncated)
+        """
+        if 0 < limit < len(items):
+            items = items[:limit]
+            items.append("... (limit of {} entries reached, use pattern or limit params)".format(limit))
+        return items
+
     def get_human_readable_size(self, size, decimal_places=2):
         """
         Return a human-readable file size.
@@ -847,13 +1007,16 @@ class Worker(BaseWorker):
                 path,
             )
 
-    def read_files(self, paths: list) -> (dict, str):
+    def read_files(self, paths: list, params: dict = None) -> (dict, str):
         """
         Read files from directory
 
         :param paths: list of paths
+        :param params: command params (range, head, tail or grep)
         :return: response data and context
         """
+        params = params or {}
+        max_tokens = int(self.plugin.get_option_value("max_tokens") or 0)
         data = []
         context = []
         for path in paths:
@@ -878,11 +1041,17 @@ class Worker(BaseWorker):
                         self.log("File read (index only): {}".format(path))
                         return data, context
 
-                # read file as text
-                content = self.plugin.read_as_text(
-                    path,
-                    use_loaders=self.plugin.get_option_value("use_loaders"),
-                )
+                # read file as text (or only requested part of file)
+                if self.plugin.reader.is_partial(params) and os.path.isfile(path):
+                    content, note = self.plugin.reader.read(path, params, max_tokens)
+                    if note:
+                        content += "\n\n" + note
+                else:
+                    content = self.plugin.read_as_text(
+                        path,
+                        use_loaders=self.plugin.get_option_value("use_loaders"),
+                        max_tokens=max_tokens,
+                    )
                 data.append({
                     "path": os.path.basename(path),
                     "content": content,
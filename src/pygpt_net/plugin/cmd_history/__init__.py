@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 21:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 import json
@@ -43,6 +43,15 @@ class Plugin(BasePlugin):
             "remove_day_note",
         ]
         self.order = 100
+        self.events = [
+            Event.CMD_SYNTAX_INLINE,
+            Event.CMD_SYNTAX,
+            Event.SYSTEM_PROMPT,
+            Event.POST_PROMPT,
+            Event.USER_SEND,
+            Event.CMD_INLINE,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 04:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import Slot, QTimer
@@ -17,7 +17,6 @@ from pygpt_net.core.events import Event, KernelEvent
 from pygpt_net.item.ctx import CtxItem
 
 from .config import Config
-from .worker import Worker
 
 
 class Plugin(BasePlugin):
@@ -37,6 +36,11 @@ class Plugin(BasePlugin):
             "keyboard_key",
             "keyboard_type",
         ]
+        self.events = [
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+            Event.SYSTEM_PROMPT,
+        ]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
@@ -87,6 +91,7 @@ class Plugin(BasePlugin):
         :param ctx: CtxItem
         :param cmds: commands dict
         """
+        from .worker import Worker
         is_cmd = False
         my_commands = []
         for item in cmds:
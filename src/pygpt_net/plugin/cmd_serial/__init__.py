@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -14,7 +14,6 @@ from pygpt_net.core.events import Event
 from pygpt_net.item.ctx import CtxItem
 
 from .config import Config
-from .worker import Worker
 
 
 class Plugin(BasePlugin):
@@ -30,6 +29,10 @@ class Plugin(BasePlugin):
             "serial_send_bytes",
             "serial_read",
         ]
+        self.events = [
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.worker = None
         self.config = Config(self)
@@ -77,6 +80,7 @@ class Plugin(BasePlugin):
         :param ctx: CtxItem
         :param cmds: commands dict
         """
+        from .worker import Worker
         is_cmd = False
         my_commands = []
         for item in cmds:
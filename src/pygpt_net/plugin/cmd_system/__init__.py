@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.24 06:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 import os
@@ -40,6 +40,11 @@ class Plugin(BasePlugin):
         self.allowed_cmds = [
             "sys_exec",
         ]
+        self.events = [
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+            Event.TOOL_OUTPUT_RENDER,
+        ]
         self.use_locale = True
         self.docker = Docker(self)
         self.runner = Runner(self)
@@ -6,13 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.21 22:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import os.path
 import re
 import subprocess
-import docker
 
 from pygpt_net.item.ctx import CtxItem
 
@@ -79,12 +78,13 @@ class Runner:
         """
         return self.plugin.get_option_value('sandbox_docker')
 
-    def get_docker(self) -> docker.client.DockerClient:
+    def get_docker(self) -> "docker.client.DockerClient":
         """
         Get docker client
 
         :return: docker client instance
         """
+        import docker
         return docker.from_env()
 
     def get_volumes(self) -> dict:
@@ -6,12 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.15 01:00:00                  #
+# Updated Date: 2025.01.21 03:00:00                  #
 # ================================================== #
 
-import ssl
-from urllib.request import Request, urlopen
-
 from pygpt_net.plugin.base.plugin import BasePlugin
 from pygpt_net.provider.web.base import BaseProvider
 from pygpt_net.core.events import Event
@@ -43,6 +40,11 @@ class Plugin(BasePlugin):
             "web_extract_images",
         ]
         self.order = 100
+        self.events = [
+            Event.INPUT_BEFORE,
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.worker = None
         self.websearch = WebSearch(self)
@@ -410,26 +412,18 @@ class Plugin(BasePlugin):
         if extra_headers is not None:
             headers.update(extra_headers)
 
-        req = Request(
-            url=url,
-            headers=headers,
-        )
         data = ""
         try:
-            if self.get_option_value('disable_ssl'):
-                context = ssl.create_default_context()
-                context.check_hostname = False
-                context.verify_mode = ssl.CERT_NONE
-                data = urlopen(
-                    req,
-                    context=context,
-                    timeout=self.get_option_value('timeout'),
-                ).read()
+            response = self.window.core.web.http.get(
+                url,
+                headers=headers,
+                timeout=self.get_option_value('timeout'),
+                verify=not self.get_option_value('disable_ssl'),
+            )
+            if response.status_code >= 400:
+                data = "HTTP Error {}".format(response.status_code)
             else:
-                data = urlopen(
-                    req,
-                    timeout=self.get_option_value('timeout'),
-                ).read()
+                data = response.content
         except Exception as e:
             data = str(e)
         return data
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.15 01:00:00                  #
+# Updated Date: 2025.01.21 05:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -68,6 +68,44 @@ class Config(BaseConfig):
             min=1,
             max=None,
         )
+        plugin.add_option(
+            "pipeline",
+            type="bool",
+            value=False,
+            label="Pipelined mode (all pages at once)",
+            description="Fetch all found pages concurrently, summarize chunks in parallel and merge summaries "
+                        "into one result. If disabled, the first page with content is used",
+        )
+        plugin.add_option(
+            "pipeline_fetch_workers",
+            type="int",
+            value=5,
+            label="Pipelined mode: concurrent downloads",
+            description="Max number of pages downloaded at once",
+            min=1,
+            max=32,
+            advanced=True,
+        )
+        plugin.add_option(
+            "pipeline_summary_workers",
+            type="int",
+            value=4,
+            label="Pipelined mode: concurrent summaries",
+            description="Max number of summarize requests sent at once",
+            min=1,
+            max=32,
+            advanced=True,
+        )
+        plugin.add_option(
+            "pipeline_rpm",
+            type="int",
+            value=0,
+            label="Pipelined mode: requests per minute",
+            description="Max summarize requests per minute (0 = unlimited)",
+            min=0,
+            max=None,
+            advanced=True,
+        )
         plugin.add_option(
             "raw",
             type="bool",
@@ -189,6 +227,18 @@ class Config(BaseConfig):
             advanced=True,
         )
 
+        plugin.add_option(
+            "prompt_reduce",
+            type="textarea",
+            value="Combine the following summaries of web pages into one summary in English, keep the most "
+                  "important content that can help answer the following question: {query}",
+            label="Merge prompt (pipelined mode)",
+            description="Prompt used for merging summaries of many pages, use {query} as a placeholder for "
+                        "search query",
+            tooltip="Prompt",
+            advanced=True,
+        )
+
         # commands
         plugin.add_cmd(
             "web_url_open",
@@ -203,6 +253,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="If enabled, model will be able to open URL and read text content from it",
+            read_only=True,
         )
         plugin.add_cmd(
             "web_url_raw",
@@ -217,6 +268,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="If enabled, model will be able to open specified URL and get raw HTML body from it",
+            read_only=True,
         )
         plugin.add_cmd(
             "web_search",
@@ -246,6 +298,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="If enabled, model will be able to search the Web and get founded URLs list",
+            read_only=True,
         )
         plugin.add_cmd(
             "web_request",
@@ -327,6 +380,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="If enabled, model will be able to open URL and get list of all links from it",
+            read_only=True,
         )
         plugin.add_cmd(
             "web_extract_images",
@@ -347,6 +401,7 @@ class Config(BaseConfig):
             ],
             enabled=True,
             description="If enabled, model will be able to open URL and get list of all images from it",
+            read_only=True,
         )
         plugin.add_cmd(
             "web_index",
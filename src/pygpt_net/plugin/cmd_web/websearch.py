@@ -6,16 +6,43 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 02:00:00                  #
 # ================================================== #
 
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Any, List
 
 from bs4 import BeautifulSoup
 
 from pygpt_net.core.events import KernelEvent
 from pygpt_net.core.bridge.context import BridgeContext
+from pygpt_net.item.model import ModelItem
+
+
+class RateLimiter:
+    def __init__(self, rpm: int = 0):
+        """
+        Requests per minute limiter (shared between threads)
+
+        :param rpm: max requests per minute, 0 = no limit
+        """
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self.next = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Wait for next request slot"""
+        if self.interval <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next)
+            self.next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
 
 class WebSearch:
@@ -117,21 +144,18 @@ class WebSearch:
             return []
         return [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
 
-    def get_summary(
+    def get_summary_prompt(
             self,
-            chunks: list,
             query: str,
             summarize_prompt: Optional[str] = None
     ) -> str:
         """
-        Get summarized text from chunks
+        Get system prompt for summarize
 
-        :param chunks: chunks of text
         :param query: query string
         :param summarize_prompt: custom summarize prompt
-        :return: summarized text
+        :return: system prompt
         """
-        summary = ""
         sys_prompt = "Summarize text in English in a maximum of 3 paragraphs, trying to find the most important " \
                      "content that can help answer the following question: {query}".format(query=query)
 
@@ -145,7 +169,6 @@ class WebSearch:
                 self.debug(
                     "Plugin: cmd_web:get_summary: prompt error: {}".format(e)
                 )
-        max_tokens = int(self.plugin.get_option_value("summary_max_tokens"))
 
         # custom summarize prompt
         if summarize_prompt is not None and summarize_prompt != "":
@@ -155,42 +178,221 @@ class WebSearch:
                 sys_prompt = str(self.plugin.get_option_value(
                     'prompt_summarize_url'
                 ).format(query=query))
+        return sys_prompt
+
+    def get_summary_model(self) -> ModelItem:
+        """
+        Get model used for summarize
 
-        # get model
+        :return: model item
+        """
         model = self.plugin.window.core.models.from_defaults()
         tmp_model = self.plugin.get_option_value("summary_model")
         if self.plugin.window.core.models.has(tmp_model):
             model = self.plugin.window.core.models.get(tmp_model)
+        return model
 
-        # summarize per chunk
-        for chunk in chunks:
-            # print("Chunk: " + chunk)
+    def summarize(
+            self,
+            text: str,
+            sys_prompt: str,
+            model: ModelItem,
+            max_tokens: int
+    ) -> str:
+        """
+        Summarize text (single LLM call)
+
+        :param text: text to summarize
+        :param sys_prompt: system prompt
+        :param model: model item
+        :param max_tokens: max output tokens
+        :return: summary or empty string on error
+        """
+        self.debug(
+            "Plugin: cmd_web:get_summary (chunk, max_tokens): {}, {}".format(text, max_tokens)
+        )
+        try:
+            bridge_context = BridgeContext(
+                prompt=text,
+                system_prompt=sys_prompt,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=0.0,
+            )
+            event = KernelEvent(KernelEvent.CALL, {
+                'context': bridge_context,
+                'extra': {},
+            })
+            self.plugin.window.dispatch(event)
+            response = event.data.get('response')
+            if response is not None:
+                return response
+        except Exception as e:
+            self.error(e)
             self.debug(
-                "Plugin: cmd_web:get_summary (chunk, max_tokens): {}, {}".format(chunk, max_tokens)
+                "Plugin: cmd_web:get_summary: error: {}".format(e)
             )
-            try:
-                bridge_context = BridgeContext(
-                    prompt=chunk,
-                    system_prompt=sys_prompt,
-                    model=model,
-                    max_tokens=max_tokens,
-                    temperature=0.0,
-                )
-                event = KernelEvent(KernelEvent.CALL, {
-                    'context': bridge_context,
-                    'extra': {},
-                })
-                self.plugin.window.dispatch(event)
-                response = event.data.get('response')
-                if response is not None and response != "":
-                    summary += response
-            except Exception as e:
-                self.error(e)
-                self.debug(
-                    "Plugin: cmd_web:get_summary: error: {}".format(e)
-                )
+        return ""
+
+    def get_summary(
+            self,
+            chunks: list,
+            query: str,
+            summarize_prompt: Optional[str] = None
+    ) -> str:
+        """
+        Get summarized text from chunks
+
+        :param chunks: chunks of text
+        :param query: query string
+        :param summarize_prompt: custom summarize prompt
+        :return: summarized text
+        """
+        summary = ""
+        sys_prompt = self.get_summary_prompt(query, summarize_prompt)
+        max_tokens = int(self.plugin.get_option_value("summary_max_tokens"))
+        model = self.get_summary_model()
+
+        # summarize per chunk
+        for chunk in chunks:
+            summary += self.summarize(chunk, sys_prompt, model, max_tokens)
         return summary
 
+    def get_summaries(
+            self,
+            chunks: List[str],
+            query: str,
+            summarize_prompt: Optional[str] = None
+    ) -> List[str]:
+        """
+        Summarize chunks concurrently (map step)
+
+        :param chunks: chunks of text
+        :param query: query string
+        :param summarize_prompt: custom summarize prompt
+        :return: list of summaries (in order of chunks)
+        """
+        if not chunks:
+            return []
+        sys_prompt = self.get_summary_prompt(query, summarize_prompt)
+        max_tokens = int(self.plugin.get_option_value("summary_max_tokens"))
+        model = self.get_summary_model()
+        limiter = RateLimiter(int(self.plugin.get_option_value("pipeline_rpm") or 0))
+        workers = max(1, int(self.plugin.get_option_value("pipeline_summary_workers") or 1))
+
+        def call(chunk: str) -> str:
+            limiter.wait()
+            return self.summarize(chunk, sys_prompt, model, max_tokens)
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            return list(executor.map(call, chunks))
+
+    def reduce_summaries(
+            self,
+            summaries: List[Tuple[str, str]],
+            query: str
+    ) -> str:
+        """
+        Merge summaries from many pages into one (reduce step)
+
+        :param summaries: list of (url, summary)
+        :param query: query string
+        :return: merged summary
+        """
+        summaries = [(url, summary) for url, summary in summaries if summary]
+        if not summaries:
+            return ""
+        if len(summaries) == 1:
+            return summaries[0][1]
+        text = "\n\n".join(
+            "From: {}\n{}".format(url, summary) for url, summary in summaries
+        )
+        sys_prompt = "Combine the following summaries of web pages into one summary in English, " \
+                     "keep the most important content that can help answer the following question: {query}"
+        custom_reduce = self.plugin.get_option_value('prompt_reduce')
+        if custom_reduce is not None and custom_reduce != "":
+            sys_prompt = custom_reduce
+        try:
+            sys_prompt = str(sys_prompt.format(query=query))
+        except Exception as e:
+            self.error(e)
+        max_tokens = int(self.plugin.get_option_value("summary_max_tokens"))
+        result = self.summarize(text, sys_prompt, self.get_summary_model(), max_tokens)
+        if result == "":
+            result = text  # fallback to map results
+        return result
+
+    def query_urls(self, urls: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Query URLs concurrently and return text contents
+
+        :param urls: list of URLs
+        :return: list of (url, text content) in order of URLs
+        """
+        if not urls:
+            return []
+        workers = max(1, int(self.plugin.get_option_value("pipeline_fetch_workers") or 1))
+        with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as executor:
+            return list(zip(urls, executor.map(self.query_url, urls)))
+
+    def make_query_pipeline(
+            self,
+            query: str,
+            urls: List[str],
+            summarize_prompt: str = ""
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Get result from all found URLs (concurrent fetch, map-reduce summarize)
+
+        :param query: query string
+        :param urls: list of URLs
+        :param summarize_prompt: custom prompt
+        :return: result, first URL with content
+        """
+        is_summary = not self.plugin.get_option_value("raw")
+        max_per_page = int(self.plugin.get_option_value("max_page_content_length"))
+        chunk_size = int(self.plugin.get_option_value("chunk_size"))
+
+        self.log("Fetching {} URLs...".format(len(urls)))
+        pages = []
+        for url, content in self.query_urls(urls):
+            if content is None or content == "":
+                continue
+            if 0 < max_per_page < len(content):
+                content = content[:max_per_page]
+            pages.append((url, content))
+        if not pages:
+            return "", None
+        self.log("Content found on {} pages (chars: {}). Please wait...".format(
+            len(pages),
+            sum(len(content) for url, content in pages),
+        ))
+
+        if is_summary:
+            # map: summarize all chunks from all pages at once
+            chunks = []
+            for i, (url, content) in enumerate(pages):
+                for chunk in self.to_chunks(content, chunk_size):
+                    chunks.append((i, chunk))
+            summaries = self.get_summaries([chunk for i, chunk in chunks], str(query), summarize_prompt)
+            per_page = [""] * len(pages)
+            for (i, chunk), summary in zip(chunks, summaries):
+                per_page[i] += summary
+            # reduce
+            result = self.reduce_summaries(
+                [(url, per_page[i]) for i, (url, content) in enumerate(pages)],
+                str(query),
+            )
+        else:
+            result = "\n\n".join(
+                "From: {}\n{}".format(url, content) for url, content in pages
+            )
+
+        if result:
+            for url, content in pages:
+                self.index_url(url)  # index webpages if auto-index is enabled
+        return result, pages[0][0]
+
     def make_query(
             self,
             query: str,
@@ -222,51 +424,67 @@ class WebSearch:
         current = 1
         url = ""
         img = None
-        for url in urls:
-            if url is None or url == "":
-                continue
-
-            # check if requested page number
-            if current != page_no:
-                current += 1
-                continue
 
-            self.log("Web attempt: " + str(i) + " of " + str(len(urls)))
-            self.log("URL: " + url)
-            content = self.query_url(url)
-            if content is None or content == "":
-                i += 1
-                continue
-
-            self.log("Content found (chars: {}). Please wait...".format(len(content)))
-            if 0 < max_per_page < len(content):
-                content = content[:max_per_page]
-
-            # get summary
-            if is_summary:
-                chunks = self.to_chunks(content, chunk_size)  # it returns list of chunks
-                self.debug(
-                    "Plugin: cmd_web: URL: {}".format(url)
-                )
-                result = self.get_summary(
-                    chunks,
-                    str(query),
-                    summarize_prompt,
-                )
-            else:
-                # no summary
-                result = str(content)
-
-            # if result then stop
-            if result is not None and result != "":
-                # get thumbnail image
-                if self.plugin.get_option_value("img_thumbnail"):
-                    img = self.plugin.window.core.web.helpers.get_main_image(url)
+        # all pages at once
+        if self.plugin.get_option_value("pipeline"):
+            result, first_url = self.make_query_pipeline(
+                query,
+                [item for item in urls[max(0, page_no - 1):] if item],
+                summarize_prompt,
+            )
+            current = total_found
+            url = first_url or ""
+            if url and self.plugin.get_option_value("img_thumbnail"):
+                img = self.plugin.window.core.web.helpers.get_main_image(url)
+            if result:
                 self.log("Summary generated (chars: {})".format(len(result)))
-                # index webpage if auto-index is enabled
-                self.index_url(url)
-                break
-            i += 1
+        else:
+            # first page with content
+            for url in urls:
+                if url is None or url == "":
+                    continue
+
+                # check if requested page number
+                if current != page_no:
+                    current += 1
+                    continue
+
+                self.log("Web attempt: " + str(i) + " of " + str(len(urls)))
+                self.log("URL: " + url)
+                content = self.query_url(url)
+                if content is None or content == "":
+                    i += 1
+                    continue
+
+                self.log("Content found (chars: {}). Please wait...".format(len(content)))
+                if 0 < max_per_page < len(content):
+                    content = content[:max_per_page]
+
+                # get summary
+                if is_summary:
+                    chunks = self.to_chunks(content, chunk_size)  # it returns list of chunks
+                    self.debug(
+                        "Plugin: cmd_web: URL: {}".format(url)
+                    )
+                    result = self.get_summary(
+                        chunks,
+                        str(query),
+                        summarize_prompt,
+                    )
+                else:
+                    # no summary
+                    result = str(content)
+
+                # if result then stop
+                if result is not None and result != "":
+                    # get thumbnail image
+                    if self.plugin.get_option_value("img_thumbnail"):
+                        img = self.plugin.window.core.web.helpers.get_main_image(url)
+                    self.log("Summary generated (chars: {})".format(len(result)))
+                    # index webpage if auto-index is enabled
+                    self.index_url(url)
+                    break
+                i += 1
 
         self.debug(
             "Plugin: cmd_web: summary: {}".format(result)
@@ -335,7 +553,10 @@ class WebSearch:
                 content,
                 chunk_size,
             )  # it returns list of chunks
-            result = self.get_summary(chunks, "", summarize_prompt)
+            if self.plugin.get_option_value("pipeline"):
+                result = "".join(self.get_summaries(chunks, "", summarize_prompt))  # concurrent
+            else:
+                result = self.get_summary(chunks, "", summarize_prompt)
         else:
             # no summary
             result = str(content)
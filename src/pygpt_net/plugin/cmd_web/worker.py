@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.15 01:00:00                  #
+# Updated Date: 2025.01.21 05:00:00                  #
 # ================================================== #
 
 import json
@@ -34,57 +34,63 @@ class Worker(BaseWorker):
 
     @Slot()
     def run(self):
-        responses = []
-        for item in self.cmds:
-            if self.is_stopped():
-                break
-            response = None
-            try:
-                if item["cmd"] == "web_search":
-                    response = self.cmd_web_urls(item)  # return URLs
+        responses = self.run_cmds(self.handle)
 
-                elif item["cmd"] == "web_url_open":
-                    response = self.cmd_web_url_open(item)
+        # send response
+        if len(responses) > 0:
+            self.reply_more(responses)
 
-                elif item["cmd"] == "web_url_raw":
-                    response = self.cmd_web_url_raw(item)
+        if self.msg is not None:
+            self.log(self.msg)
+            self.status(self.msg)
 
-                elif item["cmd"] == "web_urls":
-                    response = self.cmd_web_urls(item)
+    def handle(self, item: dict) -> dict or None:
+        """
+        Handle command item
 
-                elif item["cmd"] == "web_index":
-                    response = self.cmd_web_index(item)
+        :param item: command item
+        :return: response item or None
+        """
+        response = None
+        if item["cmd"] == "web_search":
+            response = self.cmd_web_urls(item)  # return URLs
 
-                elif item["cmd"] == "web_index_query":
-                    response = self.cmd_web_index_query(item)
+        elif item["cmd"] == "web_url_open":
+            response = self.cmd_web_url_open(item)
 
-                elif item["cmd"] == "web_extract_links":
-                    response = self.cmd_web_extract_links(item)
+        elif item["cmd"] == "web_url_raw":
+            response = self.cmd_web_url_raw(item)
 
-                elif item["cmd"] == "web_extract_images":
-                    response = self.cmd_web_extract_images(item)
+        elif item["cmd"] == "web_urls":
+            response = self.cmd_web_urls(item)
 
-                elif item["cmd"] == "web_request":
-                    response = self.cmd_web_request(item)
+        elif item["cmd"] == "web_index":
+            response = self.cmd_web_index(item)
 
-                if response:
-                    responses.append(response)
+        elif item["cmd"] == "web_index_query":
+            response = self.cmd_web_index_query(item)
 
-            except Exception as e:
-                responses.append(
-                    self.make_response(
-                        item,
-                        self.throw_error(e)
-                    )
-                )
+        elif item["cmd"] == "web_extract_links":
+            response = self.cmd_web_extract_links(item)
 
-        # send response
-        if len(responses) > 0:
-            self.reply_more(responses)
+        elif item["cmd"] == "web_extract_images":
+            response = self.cmd_web_extract_images(item)
 
-        if self.msg is not None:
-            self.log(self.msg)
-            self.status(self.msg)
+        elif item["cmd"] == "web_request":
+            response = self.cmd_web_request(item)
+
+        return response
+
+    def is_read_only(self, item: dict) -> bool:
+        """
+        Check if command can be executed concurrently
+
+        :param item: command item
+        :return: True if read-only
+        """
+        if self.plugin.get_option_value("auto_index"):
+            return False  # results are indexed
+        return super(Worker, self).is_read_only(item)
 
     def cmd_web_search(self, item: dict) -> dict:
         """
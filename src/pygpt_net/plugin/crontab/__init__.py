@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 21:00:00                  #
+# Updated Date: 2025.01.20 20:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.bridge.context import BridgeContext
@@ -14,11 +14,12 @@ from pygpt_net.plugin.base.plugin import BasePlugin
 from pygpt_net.core.events import Event, KernelEvent
 
 from datetime import datetime
-from croniter import croniter
+from typing import Optional, List, Tuple
 
 from pygpt_net.utils import trans
 
 from .config import Config
+from .scheduler import Scheduler
 
 
 class Plugin(BasePlugin):
@@ -33,8 +34,16 @@ class Plugin(BasePlugin):
                            "you can schedule prompts to be sent at any time using cron-based syntax for task setup."
         self.prefix = "Cron"
         self.order = 100
+        self.events = [
+            Event.PLUGIN_SETTINGS_CHANGED,
+            Event.PLUGIN_OPTION_GET,
+            Event.ENABLE,
+            Event.DISABLE,
+        ]
         self.use_locale = True
-        self.timers = []
+        self.scheduler = Scheduler(self)
+        self.job_id = "plugin.crontab"  # app scheduler job ID
+        self.max_sleep = 60  # max seconds between checks, wall clock may change (e.g. after suspend)
         self.config = Config(self)
         self.init_options()
 
@@ -42,15 +51,6 @@ class Plugin(BasePlugin):
         """Initialize options"""
         self.config.from_defaults(self)
 
-    def on_update(self):
-        pass
-
-    def on_post_update(self):
-        """
-        On post update hook
-        """
-        self.schedule_tasks()
-
     def count_active(self) -> int:
         """
         Count active tasks
@@ -75,9 +75,20 @@ class Plugin(BasePlugin):
         data = event.data
 
         if name == Event.PLUGIN_SETTINGS_CHANGED:
-            self.window.ui.tray.update_schedule_tasks(
-                self.count_active()
-            )
+            if self.enabled:
+                self.schedule_tasks()  # recompute next runs
+            else:
+                self.window.ui.tray.update_schedule_tasks(
+                    self.count_active()
+                )
+
+        elif name == Event.ENABLE:
+            if data['value'] == self.id:
+                self.schedule_tasks()
+
+        elif name == Event.DISABLE:
+            if data['value'] == self.id:
+                self.unschedule_tasks()
 
         elif name == Event.PLUGIN_OPTION_GET:
             if "name" in data and data["name"] == "scheduled_tasks_count":
@@ -130,59 +141,72 @@ class Plugin(BasePlugin):
         self.window.dispatch(event)
 
     def schedule_tasks(self):
-        """Schedule tasks based on crontab"""
+        """Rebuild tasks queue from crontab and arm timer"""
+        self.scheduler.build(self.get_option_value("crontab"))
+        self.arm()
+        self.update_status()
+
+    def unschedule_tasks(self):
+        """Remove all scheduled tasks"""
+        self.scheduler.clear()
+        self.window.core.scheduler.remove(self.job_id)
+        self.update_status()
+
+    def on_timer(self):
+        """Run due tasks (called by app scheduler on next run time)"""
+        if not self.enabled:
+            self.unschedule_tasks()
+            return
         crontab = self.get_option_value("crontab")
-        # remove unused or inactive items
-        for timer in self.timers:
-            if not timer["item"]["enabled"] or timer["item"] not in crontab:
-                self.timers.remove(timer)
-
-        for item in crontab:
+        if self.scheduler.is_changed(crontab):
+            self.schedule_tasks()
+            return
+        due = self.scheduler.get_due(datetime.now(), self.get_option_value("catch_up"))
+        for item in due:
             try:
-                if not item["enabled"]:
-                    continue
-                cron = item["crontab"]
-                base_time = datetime.now()
-                iter = croniter(cron, base_time)
-                is_timer = False
-                timer = None
-                for timer in self.timers:
-                    if item == timer["item"]:
-                        is_timer = True
-                        break
-
-                # add to timers if not exists
-                if not is_timer:
-                    timer = {
-                        "item": item,
-                        "next_time": None,
-                    }
-                    self.timers.append(timer)
-
-                next_time = timer["next_time"]
-
-                # if first run
-                if next_time is None:
-                    next_time = iter.get_next(datetime)
-                    timer["next_time"] = next_time
-                    continue
-
-                if datetime.now() >= next_time:
-                    next_time = iter.get_next(datetime)
-                    timer["next_time"] = next_time
-                    self.job(item)
-
-                timer["next_time"] = iter.get_next(datetime)
+                self.job(item)
             except Exception as e:
                 self.log("Error: {}".format(e))
+        self.arm()
+        if due:
+            self.update_status()
+
+    def arm(self):
+        """Arm app scheduler for the next run time"""
+        next_time = self.scheduler.get_next()
+        if next_time is None:
+            self.window.core.scheduler.remove(self.job_id)
+            return
+        delay = (next_time - datetime.now()).total_seconds()
+        delay = min(max(0.0, delay), self.max_sleep)
+        self.window.core.scheduler.add(self.job_id, self.on_timer, int(delay * 1000))
+
+    def get_next_run(self) -> Optional[datetime]:
+        """
+        Get next task run time
+
+        :return: next run time or None if no tasks
+        """
+        return self.scheduler.get_next()
+
+    def get_upcoming(self, limit: int = 5) -> List[Tuple[datetime, dict]]:
+        """
+        Get upcoming task runs
+
+        :param limit: max number of runs
+        :return: list of (run time, crontab item)
+        """
+        return self.scheduler.get_upcoming(limit)
 
-        # show number of scheduled jobs
-        num_jobs = len(self.timers)
+    def update_status(self):
+        """Show number of scheduled jobs"""
+        num_jobs = self.scheduler.count()
         if num_jobs > 0:
             self.window.ui.plugin_addon['schedule'].setVisible(True)
             self.window.ui.plugin_addon['schedule'].setText(
-                "+ Cron: {} job(s)".format(len(self.timers)),
+                "+ Cron: {} job(s)".format(num_jobs),
             )
         else:
             self.window.ui.plugin_addon['schedule'].setVisible(False)
             self.window.ui.plugin_addon['schedule'].setText("")
+        self.window.ui.tray.update_schedule_tasks(num_jobs, self.get_next_run())
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.18 19:00:00                  #
+# Updated Date: 2025.01.20 20:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -70,4 +70,17 @@ class Config(BaseConfig):
             value=True,
             label="Show notification on job run",
             description="If enabled, then a tray notification will be shown on every run of the job",
-        )
\ No newline at end of file
+        )
+        plugin.add_option(
+            "catch_up",
+            type="combo",
+            value="once",
+            label="Missed runs",
+            description="What to do with runs missed while the computer was suspended or the app was busy: "
+                        "run once, skip, or run every missed run (max 10 per task)",
+            keys=[
+                {"once": "Run once"},
+                {"skip": "Skip"},
+                {"all": "Run all"},
+            ],
+        )
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 20:00:00                  #
+# ================================================== #
+
+import copy
+import heapq
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from croniter import croniter
+
+CATCH_UP_ONCE = "once"  # run missed task once
+CATCH_UP_SKIP = "skip"  # skip missed runs
+CATCH_UP_ALL = "all"  # run every missed run (limited)
+
+
+class Scheduler:
+    MAX_CATCH_UP = 10  # max missed runs executed per task
+    MISSED_AFTER = 90  # run is treated as missed if late more than N seconds
+
+    def __init__(self, plugin=None):
+        """
+        Cron tasks queue (min-heap of next run times)
+
+        :param plugin: plugin instance
+        """
+        self.plugin = plugin
+        self.queue = []  # heap: (next_time, idx)
+        self.entries = []  # idx => {"item": dict, "iter": croniter}
+        self.source = None  # copy of crontab used to build queue
+
+    def is_changed(self, crontab: list) -> bool:
+        """
+        Check if crontab was changed since queue build
+
+        :param crontab: crontab items
+        :return: True if changed
+        """
+        return self.source != crontab
+
+    def build(self, crontab: list, now: Optional[datetime] = None):
+        """
+        Build queue from crontab items
+
+        :param crontab: crontab items
+        :param now: current time
+        """
+        if now is None:
+            now = datetime.now()
+        self.queue = []
+        self.entries = []
+        self.source = copy.deepcopy(crontab)
+        for item in crontab:
+            try:
+                if not item["enabled"]:
+                    continue
+                iter = croniter(item["crontab"], now)
+                next_time = iter.get_next(datetime)
+            except Exception as e:
+                self.log("Error: {}".format(e))
+                continue
+            self.entries.append({
+                "item": item,
+                "iter": iter,
+            })
+            self.queue.append((next_time, len(self.entries) - 1))
+        heapq.heapify(self.queue)
+
+    def get_due(
+            self,
+            now: Optional[datetime] = None,
+            policy: str = CATCH_UP_ONCE
+    ) -> List[dict]:
+        """
+        Pop due tasks and schedule their next runs
+
+        :param now: current time
+        :param policy: catch-up policy for missed runs (once, skip, all)
+        :return: list of crontab items to run (in order of run time)
+        """
+        if now is None:
+            now = datetime.now()
+        due = []
+        missed_after = timedelta(seconds=self.MISSED_AFTER)
+        while self.queue and self.queue[0][0] <= now:
+            next_time, idx = heapq.heappop(self.queue)
+            entry = self.entries[idx]
+            iter = entry["iter"]
+            runs = 1
+            if now - next_time > missed_after:
+                # missed runs (e.g. after suspend)
+                if policy == CATCH_UP_SKIP:
+                    runs = 0
+                elif policy == CATCH_UP_ALL:
+                    while runs < self.MAX_CATCH_UP and iter.get_next(datetime) <= now:
+                        runs += 1
+            due.extend([entry["item"]] * runs)
+            # next run after now, missed runs are not repeated
+            entry["iter"] = croniter(entry["item"]["crontab"], now)
+            heapq.heappush(self.queue, (entry["iter"].get_next(datetime), idx))
+        return due
+
+    def get_next(self) -> Optional[datetime]:
+        """
+        Get next run time
+
+        :return: next run time or None if no tasks
+        """
+        if not self.queue:
+            return None
+        return self.queue[0][0]
+
+    def get_upcoming(self, limit: int = 5) -> List[Tuple[datetime, dict]]:
+        """
+        Get upcoming runs
+
+        :param limit: max number of runs
+        :return: list of (run time, crontab item)
+        """
+        return [(next_time, self.entries[idx]["item"]) for next_time, idx in heapq.nsmallest(limit, self.queue)]
+
+    def count(self) -> int:
+        """
+        Count scheduled tasks
+
+        :return: number of scheduled tasks
+        """
+        return len(self.queue)
+
+    def clear(self):
+        """Clear queue"""
+        self.queue = []
+        self.entries = []
+        self.source = None
+
+    def log(self, msg: str):
+        """
+        Log message
+
+        :param msg: message
+        """
+        if self.plugin is not None:
+            self.plugin.log(msg)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.21 20:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.types import (
@@ -32,6 +32,9 @@ class Plugin(BasePlugin):
             "expert_call",
         ]
         self.order = 9998
+        self.events = [
+            Event.SYSTEM_PROMPT,
+        ]
         self.use_locale = True
         self.disallowed_modes = [MODE_AGENT, MODE_EXPERT]
         self.config = Config(self)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.29 23:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 import json
@@ -39,6 +39,15 @@ class Plugin(BasePlugin):
             "cmd.inline",
         ]
         self.order = 100
+        self.events = [
+            Event.SYSTEM_PROMPT,
+            Event.INPUT_BEFORE,
+            Event.POST_PROMPT_END,
+            Event.CMD_SYNTAX,
+            Event.CMD_SYNTAX_INLINE,
+            Event.CMD_INLINE,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.worker = None
         self.mode = None  # current mode
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 19:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.types import (
@@ -51,6 +51,13 @@ class Plugin(BasePlugin):
             "image",
         ]
         self.order = 100
+        self.events = [
+            Event.SYSTEM_PROMPT,
+            Event.CMD_SYNTAX_INLINE,
+            Event.CMD_SYNTAX,
+            Event.CMD_INLINE,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.config = Config(self)
         self.init_options()
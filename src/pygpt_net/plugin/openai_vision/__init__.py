@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 19:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.types import (
@@ -37,6 +37,23 @@ class Plugin(BasePlugin):
         self.description = "Integrates GPT-4 Vision abilities with any chat mode"
         self.prefix = "Vision"
         self.order = 100
+        self.events = [
+            Event.MODE_BEFORE,
+            Event.MODEL_BEFORE,
+            Event.PRE_PROMPT,
+            Event.INPUT_BEFORE,
+            Event.SYSTEM_PROMPT,
+            Event.UI_ATTACHMENTS,
+            Event.UI_VISION,
+            Event.CTX_SELECT,
+            Event.MODE_SELECT,
+            Event.MODEL_SELECT,
+            Event.CMD_SYNTAX,
+            Event.CMD_SYNTAX_INLINE,
+            Event.CMD_INLINE,
+            Event.CMD_EXECUTE,
+            Event.AGENT_PROMPT,
+        ]
         self.use_locale = True
         self.prompt = ""
         self.allowed_urls_ext = [
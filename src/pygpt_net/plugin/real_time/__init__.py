@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.29 23:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 from datetime import datetime
@@ -30,6 +30,12 @@ class Plugin(BasePlugin):
             "get_time",
         ]
         self.order = 2
+        self.events = [
+            Event.POST_PROMPT_END,
+            Event.AGENT_PROMPT,
+            Event.CMD_SYNTAX,
+            Event.CMD_EXECUTE,
+        ]
         self.use_locale = True
         self.config = Config(self)
         self.init_options()
@@ -6,15 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any
 
-from llama_index.agent.openai import OpenAIAgent as Agent
-
 from .base import BaseAgent
 
+
 class OpenAIAgent(BaseAgent):
     def __init__(self, *args, **kwargs):
         super(OpenAIAgent, self).__init__(*args, **kwargs)
@@ -29,6 +28,7 @@ class OpenAIAgent(BaseAgent):
         :param kwargs: keyword arguments
         :return: Agent provider instance
         """
+        from llama_index.agent.openai import OpenAIAgent as Agent
         tools = kwargs.get("tools", [])
         verbose = kwargs.get("verbose", False)
         llm = kwargs.get("llm", None)
@@ -6,13 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any
 
-from llama_index.agent.openai import OpenAIAssistantAgent as Agent
-
 from pygpt_net.core.bridge.context import BridgeContext
 from .base import BaseAgent
 
@@ -31,6 +29,7 @@ class OpenAIAssistantAgent(BaseAgent):
         :param kwargs: keyword arguments
         :return: Agent provider instance
         """
+        from llama_index.agent.openai import OpenAIAssistantAgent as Agent
         context = kwargs.get("context", BridgeContext())
         tools = kwargs.get("tools", [])
         verbose = kwargs.get("verbose", False)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 21:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any, Optional
@@ -38,7 +38,7 @@ class BaseProvider:
     def load_base(self) -> Optional[Dict[str, Any]]:
         pass
 
-    def save(self, items: Dict[str, Any], filename: str = 'config.json'):
+    def save(self, items: Dict[str, Any], filename: str = 'config.json', background: bool = False):
         pass
 
     def get_options(self) -> Optional[Dict[str, Any]]:
@@ -6,12 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 21:00:00                  #
 # ================================================== #
 
 import json
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
 from packaging.version import Version
@@ -30,6 +32,11 @@ class JsonFileProvider(BaseProvider):
         self.config_file = 'config.json'
         self.settings_file = 'settings.json'
         self.sections_file = 'settings_section.json'
+        self.lock = threading.Lock()
+        self.seq = 0  # save request counter
+        self.written = {}  # path => last written seq
+        self.dumps = {}  # path => last written dump
+        self.executor = None  # background writer
 
     def install(self):
         """
@@ -92,21 +99,69 @@ class JsonFileProvider(BaseProvider):
             print("FATAL ERROR: {}".format(e))
         return data
 
-    def save(self, data: Dict[str, Any], filename: str = 'config.json'):
+    def save(
+            self,
+            data: Dict[str, Any],
+            filename: str = 'config.json',
+            background: bool = False
+    ):
         """
         Save config to JSON file
 
+        Data is serialized on the caller thread, file is written atomically (temp file + rename).
+        Writes with unchanged content and outdated writes are skipped.
+
         :param dict with data: data to save
         :param filename: filename, default: config.json
+        :param background: write file in background thread
         """
         path = os.path.join(self.path, filename)
         try:
             data['__meta__'] = self.meta
             dump = json.dumps(data, indent=4)
-            with open(path, 'w', encoding="utf-8") as f:
-                f.write(dump)
         except Exception as e:
             print("FATAL ERROR: {}".format(e))
+            return
+        with self.lock:
+            self.seq += 1
+            seq = self.seq
+        if background:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config")
+            self.executor.submit(self.write, path, dump, seq)
+        else:
+            self.write(path, dump, seq)
+
+    def write(self, path: str, dump: str, seq: int = 0):
+        """
+        Write JSON dump to file (atomic)
+
+        :param path: file path
+        :param dump: JSON dump
+        :param seq: save request number
+        """
+        with self.lock:
+            if seq and seq < self.written.get(path, 0):
+                return  # newer data already written
+            if self.dumps.get(path) == dump and os.path.exists(path):
+                return  # not changed
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding="utf-8") as f:
+                    f.write(dump)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+                self.written[path] = seq
+                self.dumps[path] = dump
+            except Exception as e:
+                print("FATAL ERROR: {}".format(e))
+
+    def flush(self):
+        """Wait for pending background writes"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
 
     def get_options(self) -> Optional[Dict[str, Any]]:
         """
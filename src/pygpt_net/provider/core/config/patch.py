@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.19 02:00:00                  #
+# Updated Date: 2025.01.20 10:00:00                  #
 # ================================================== #
 
 import copy
@@ -1831,6 +1831,41 @@ class Patch:
                             item['key_modifier'] = ''
                 updated = True
 
+            # < 2.4.58
+            if old < parse_version("2.4.58"):
+                print("Migrating config from < 2.4.58...")
+                if 'render.stream.incremental' not in data:
+                    data["render.stream.incremental"] = True
+                if 'render.stream.interval' not in data:
+                    data["render.stream.interval"] = 30
+                if 'llama.idx.cache.size' not in data:
+                    data["llama.idx.cache.size"] = 512
+                if 'llama.idx.incremental' not in data:
+                    data["llama.idx.incremental"] = True
+                if 'llama.idx.embeddings.batch_size' not in data:
+                    data["llama.idx.embeddings.batch_size"] = 100
+                if 'llama.idx.workers' not in data:
+                    data["llama.idx.workers"] = 4
+                if 'llama.idx.embeddings.cache.size' not in data:
+                    data["llama.idx.embeddings.cache.size"] = 1024
+                if 'render.window.size' not in data:
+                    data["render.window.size"] = 50
+                if 'render.cache.size' not in data:
+                    data["render.cache.size"] = 32
+                if 'render.cache.disk' not in data:
+                    data["render.cache.disk"] = False
+                if 'web.http.cache' not in data:
+                    data["web.http.cache"] = False
+                if 'web.http.cache.size' not in data:
+                    data["web.http.cache.size"] = 64
+                if 'web.http.pool.size' not in data:
+                    data["web.http.pool.size"] = 10
+                if 'cmd.parallel' not in data:
+                    data["cmd.parallel"] = 4
+                if 'ctx.write_behind' not in data:
+                    data["ctx.write_behind"] = True
+                updated = True
+
         # update file
         migrated = False
         if updated:
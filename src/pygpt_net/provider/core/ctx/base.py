@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from typing import List, Dict, Optional
@@ -31,6 +31,9 @@ class BaseProvider:
     def patch(self, version: Version) -> bool:
         pass
 
+    def reset_schema(self):
+        pass
+
     def append_item(self, meta: CtxMeta, item: CtxItem) -> bool:
         pass
 
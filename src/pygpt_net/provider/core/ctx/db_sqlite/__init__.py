@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 import time
@@ -46,6 +46,10 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.patcher.execute(version)
 
+    def reset_schema(self):
+        """Reset cached schema state (after DB migration)"""
+        self.storage.reset_schema()
+
     def create_id(self, meta: CtxMeta) -> int:
         """
         Create ctx ID
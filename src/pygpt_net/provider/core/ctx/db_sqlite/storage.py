@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from datetime import datetime
@@ -20,6 +20,7 @@ from pygpt_net.utils import get_tz_offset
 from pygpt_net.item.ctx import CtxMeta, CtxItem, CtxGroup
 from .utils import \
     search_by_date_string, \
+    prepare_fts_query, \
     pack_item_value, \
     unpack_meta, \
     unpack_item, \
@@ -36,6 +37,8 @@ class Storage:
         :param window: Window instance
         """
         self.window = window
+        self.fts = None  # FTS availability, checked once per database
+        self.fts_db = None
 
     def attach(self, window):
         """
@@ -45,6 +48,44 @@ class Storage:
         """
         self.window = window
 
+    def get_db(self):
+        """
+        Get database engine (commit queued writes first)
+
+        :return: database engine
+        """
+        self.window.core.ctx.writer.flush()
+        return self.window.core.db.get_db()
+
+    def get_writer(self):
+        """
+        Get write-behind queue
+
+        :return: Writer instance or None if disabled
+        """
+        if self.window.core.config.get("ctx.write_behind", False):
+            writer = self.window.core.ctx.writer
+            if writer.is_enabled():
+                return writer
+        return None
+
+    def execute(self, stmt, key: Optional[tuple] = None) -> bool:
+        """
+        Execute write statement (queued if write-behind is enabled)
+
+        :param stmt: statement with bound params
+        :param key: coalescing key (table, row ID) for queued updates
+        :return: True if executed or queued
+        """
+        writer = self.get_writer()
+        if writer is not None:
+            writer.add(stmt, key)
+            return True
+        db = self.get_db()
+        with db.begin() as conn:
+            conn.execute(stmt)
+        return True
+
     def prepare_query(
             self,
             search_string: Optional[str] = None,
@@ -80,7 +121,26 @@ class Storage:
                 search_string.strip(),
             )
             if search_string:
-                if search_content:
+                fts_query = ""
+                if search_content and self.has_fts():
+                    fts_query = prepare_fts_query(search_string)
+                if fts_query:
+                    # full-text index, best bm25 rank per meta
+                    where_clauses.append("(fts.meta_id IS NOT NULL OR m.name LIKE :search_string)")
+                    join_clauses.append("""LEFT JOIN (
+                        SELECT meta_id, MIN(rank) AS rank FROM (
+                            SELECT i.meta_id AS meta_id, bm25(ctx_item_fts) AS rank
+                            FROM ctx_item_fts
+                            JOIN ctx_item i ON i.id = ctx_item_fts.rowid
+                            WHERE ctx_item_fts MATCH :fts_query
+                            UNION ALL
+                            SELECT rowid AS meta_id, bm25(ctx_meta_fts) AS rank
+                            FROM ctx_meta_fts
+                            WHERE ctx_meta_fts MATCH :fts_query
+                        ) GROUP BY meta_id
+                    ) fts ON fts.meta_id = m.id""")
+                    bind_params['fts_query'] = fts_query
+                elif search_content:
                     where_clauses.append(
                         "(m.name LIKE :search_string OR i.input LIKE :search_string OR i.output LIKE :search_string)"
                     )
@@ -125,6 +185,29 @@ class Storage:
 
         return where_statement, join_statement, bind_params
 
+    def has_fts(self) -> bool:
+        """
+        Check if full-text search index is available
+
+        :return: True if FTS5 tables exist
+        """
+        db = self.get_db()
+        if self.fts is not None and self.fts_db is db:
+            return self.fts
+        stmt = text("""
+            SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name IN ('ctx_item_fts', 'ctx_meta_fts')
+        """)
+        with db.connect() as conn:
+            result = conn.execute(stmt).fetchone()
+        self.fts = result[0] == 2
+        self.fts_db = db
+        return self.fts
+
+    def reset_schema(self):
+        """Reset cached schema state (after DB migration)"""
+        self.fts = None
+        self.fts_db = None
+
     def get_meta(
             self,
             search_string: Optional[str] = None,
@@ -157,6 +240,9 @@ class Storage:
             search_content=search_content,
             append_date_ranges=True,
         )
+        order_statement = "m.updated_ts DESC"
+        if 'fts_query' in bind_params:
+            order_statement = "fts.rank IS NULL, fts.rank ASC, m.updated_ts DESC"  # bm25: lower is better
         stmt_text = f"""
             SELECT 
                 m.*,
@@ -169,12 +255,12 @@ class Storage:
             WHERE 
                 {where_statement}
             ORDER BY 
-                m.updated_ts DESC {limit_suffix}
+                {order_statement} {limit_suffix}
         """
         stmt = text(stmt_text).bindparams(**bind_params)
 
         items = {}
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             for row in result:
@@ -205,7 +291,7 @@ class Storage:
         """
         stmt = text(stmt_text)
         items = {}
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             for row in result:
@@ -223,7 +309,7 @@ class Storage:
         stmt = text("""
             SELECT * FROM ctx_item WHERE id = :id
         """).bindparams(id=id)
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             row = result.fetchone()
@@ -253,7 +339,7 @@ class Storage:
             preset_id=preset_id,
         )
         items = {}
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             for row in result:
@@ -271,7 +357,7 @@ class Storage:
         stmt = text("""
             SELECT * FROM ctx_meta WHERE id = :id
         """).bindparams(id=id)
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             row = result.fetchone()
@@ -290,7 +376,7 @@ class Storage:
         stmt = text("""
             SELECT id FROM ctx_meta ORDER BY updated_ts DESC LIMIT 1
         """)
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             row = result.fetchone()
@@ -308,7 +394,7 @@ class Storage:
             SELECT * FROM ctx_item WHERE meta_id = :id ORDER BY id ASC
         """).bindparams(id=id)
         items = []
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             for row in result:
@@ -324,7 +410,7 @@ class Storage:
         :param reset: reset table sequence (autoincrement)
         :return: True if truncated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(text("DELETE FROM ctx_item"))
             conn.execute(text("DELETE FROM ctx_meta"))
@@ -343,7 +429,7 @@ class Storage:
         stmt = text("""
             DELETE FROM ctx_meta WHERE id = :id
         """).bindparams(id=id)
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(stmt)
         self.delete_items_by_meta_id(id)
@@ -359,7 +445,7 @@ class Storage:
         stmt = text("""
             DELETE FROM ctx_item WHERE id = :id
         """).bindparams(id=id)
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(stmt)
         return True
@@ -378,7 +464,7 @@ class Storage:
             meta_id=meta_id,
             item_id=item_id,
         )
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(stmt)
         return True
@@ -393,7 +479,7 @@ class Storage:
         stmt = text("""
             DELETE FROM ctx_item WHERE meta_id = :id
         """).bindparams(id=id)
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(stmt)
         return True
@@ -405,7 +491,6 @@ class Storage:
         :param meta: CtxMeta
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET
@@ -453,8 +538,7 @@ class Storage:
             parent_id=meta.parent_id,
             additional_ctx_json=pack_item_value(meta.additional_ctx),
         )
-        with db.begin() as conn:
-            conn.execute(stmt)
+        self.execute(stmt, key=("ctx_meta", meta.id))
 
         # update group
         if meta.group:
@@ -471,8 +555,7 @@ class Storage:
                 additional_ctx_json=pack_item_value(meta.group.additional_ctx),
                 updated_ts=int(time.time()),
             )
-            with db.begin() as conn:
-                conn.execute(stmt)
+            self.execute(stmt, key=("ctx_group", meta.group.id))
 
         return True
 
@@ -501,7 +584,6 @@ class Storage:
         :param ts: timestamp
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET
@@ -511,9 +593,7 @@ class Storage:
             id=id,
             updated_ts=ts,
         )
-        with db.begin() as conn:
-            conn.execute(stmt)
-            return True
+        return self.execute(stmt, key=("ctx_meta.updated_ts", id))
 
     def set_meta_indexed_by_id(self, id: int, ts: int) -> bool:
         """
@@ -523,7 +603,7 @@ class Storage:
         :param ts: timestamp
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET
@@ -545,7 +625,7 @@ class Storage:
         :param meta: CtxMeta
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET
@@ -566,7 +646,6 @@ class Storage:
         :param id: ctx meta ID
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
         ts = int(time.time())
         stmt = text("""
             UPDATE ctx_meta 
@@ -577,9 +656,7 @@ class Storage:
             id=id,
             updated_ts=ts,
         )
-        with db.begin() as conn:
-            conn.execute(stmt)
-            return True
+        return self.execute(stmt, key=("ctx_meta.updated_ts", id))
 
     def update_meta_indexed_by_id(self, id: int) -> bool:
         """
@@ -588,12 +665,12 @@ class Storage:
         :param id: ctx meta ID
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         ts = int(time.time())
         stmt = text("""
             UPDATE ctx_meta 
             SET
-                indexed_ts = indexed_ts
+                indexed_ts = :indexed_ts
             WHERE id = :id
         """).bindparams(
             id=id,
@@ -610,7 +687,7 @@ class Storage:
         :param ts: timestamp to update to
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET
@@ -630,7 +707,7 @@ class Storage:
         :param id: ctx meta ID
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET
@@ -649,7 +726,7 @@ class Storage:
 
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET indexed_ts = 0
@@ -665,10 +742,10 @@ class Storage:
         :param meta: CtxMeta
         :return: inserted record ID
         """
-        db = self.window.core.db.get_db()
         stmt = text("""
             INSERT INTO ctx_meta 
             (
+                id,
                 uuid,
                 external_id,
                 created_ts,
@@ -696,6 +773,7 @@ class Storage:
             )
             VALUES 
             (
+                :id,
                 :uuid,
                 :external_id,
                 :created_ts,
@@ -747,6 +825,12 @@ class Storage:
             parent_id=meta.parent_id,
             additional_ctx_json=pack_item_value(meta.additional_ctx),
         )
+        writer = self.get_writer()
+        if writer is not None:
+            meta.id = writer.insert("ctx_meta", stmt)  # ID allocated by queue
+            return meta.id
+        stmt = stmt.bindparams(id=None)  # auto-increment
+        db = self.get_db()
         with db.begin() as conn:
             result = conn.execute(stmt)
             meta.id = result.lastrowid
@@ -760,10 +844,10 @@ class Storage:
         :param item: Context item (CtxItem)
         :return: inserted record ID
         """
-        db = self.window.core.db.get_db()
         stmt = text("""
             INSERT INTO ctx_item 
             (
+                id,
                 meta_id,
                 external_id,
                 input,
@@ -797,6 +881,7 @@ class Storage:
             )
             VALUES 
             (
+                :id,
                 :meta_id,
                 :external_id,
                 :input,
@@ -860,6 +945,12 @@ class Storage:
             audio_id=item.audio_id,
             audio_expires_ts=int(item.audio_expires_ts or 0)
         )
+        writer = self.get_writer()
+        if writer is not None:
+            item.id = writer.insert("ctx_item", stmt)  # ID allocated by queue
+            return item.id
+        stmt = stmt.bindparams(id=None)  # auto-increment
+        db = self.get_db()
         with db.begin() as conn:
             result = conn.execute(stmt)
             item.id = result.lastrowid
@@ -873,7 +964,6 @@ class Storage:
         :param item: Context item (CtxItem)
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
         stmt = text("""
             UPDATE ctx_item SET
                 input = :input,
@@ -936,9 +1026,7 @@ class Storage:
             audio_id=item.audio_id,
             audio_expires_ts=int(item.audio_expires_ts or 0)
         )
-        with db.begin() as conn:
-            conn.execute(stmt)
-        return True
+        return self.execute(stmt, key=("ctx_item", item.id))
 
     def get_ctx_count_by_day(
             self,
@@ -981,7 +1069,7 @@ class Storage:
         elif offset_seconds < 0:
             offset_suffix = f" - {abs(offset_seconds)}"
 
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             # by day
             if year and month and day:
@@ -1077,7 +1165,7 @@ class Storage:
         elif offset_seconds < 0:
             offset_suffix = f" - {abs(offset_seconds)}"
 
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             # by day
             if year and month and day:
@@ -1180,7 +1268,7 @@ class Storage:
         stmt = text(stmt_text)
 
         items = {}
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.connect() as conn:
             result = conn.execute(stmt)
             for row in result:
@@ -1203,7 +1291,7 @@ class Storage:
         """).bindparams(
             id=id,
         )
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(stmt)
 
@@ -1235,7 +1323,7 @@ class Storage:
 
         :return: True if truncated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(text("DELETE FROM ctx_group"))
             conn.execute(text("DELETE FROM sqlite_sequence WHERE name='ctx_group'"))
@@ -1248,7 +1336,7 @@ class Storage:
         :param meta_id: meta ID
         :return: True if cleared
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         with db.begin() as conn:
             conn.execute(text(f"DELETE FROM ctx_item WHERE meta_id = {meta_id}"))
         return True
@@ -1261,7 +1349,7 @@ class Storage:
         :return: True if updated
         """
         id = group.id
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             UPDATE ctx_group
             SET
@@ -1284,7 +1372,7 @@ class Storage:
         :param group: CtxGroup
         :return: inserted record ID
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             INSERT INTO ctx_group 
             (
@@ -1319,7 +1407,7 @@ class Storage:
         :param group_id: ctx group ID
         :return: True if updated
         """
-        db = self.window.core.db.get_db()
+        db = self.get_db()
         stmt = text("""
             UPDATE ctx_meta 
             SET
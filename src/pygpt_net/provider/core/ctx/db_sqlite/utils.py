@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 08:00:00                  #
 # ================================================== #
 
 import json
@@ -66,6 +66,17 @@ def search_by_date_string(search_string: str) -> List[Tuple[Any, Any]]:
     return date_ranges
 
 
+def prepare_fts_query(search_string: str) -> str:
+    """
+    Prepare FTS5 MATCH expression from search string (all words, prefix match)
+
+    :param search_string: search string
+    :return: FTS5 query or empty string if no words found
+    """
+    words = re.findall(r'\w+', search_string, re.UNICODE)
+    return " ".join(['"{}"*'.format(word) for word in words])
+
+
 def get_month_start_end_timestamps(year: int, month: int) -> Tuple[int, int]:
     """
     Get start and end timestamps for given month
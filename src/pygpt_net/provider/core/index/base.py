@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any, Optional
@@ -66,7 +66,25 @@ class BaseProvider:
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        pass
+
+    def get_file_state(
+            self,
+            store_id: str,
+            idx: str,
+            file_id: str
+    ) -> Optional[Dict[str, Any]]:
+        pass
+
+    def update_file_state(
+            self,
+            store_id: str,
+            idx: str,
+            file_id: str,
+            state: Dict[str, Any]
     ) -> bool:
         pass
 
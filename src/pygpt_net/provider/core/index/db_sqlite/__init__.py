@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any, Optional
@@ -211,7 +211,8 @@ class DbSqliteProvider(BaseProvider):
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Update indexed timestamp of indexed file
@@ -219,8 +220,42 @@ class DbSqliteProvider(BaseProvider):
         :param: id: db record ID
         :param: doc_id: document ID
         :param: ts: timestamp
+        :param: state: file state (hash, size, mtime)
+        """
+        return self.storage.update_file(id, doc_id, ts, state)
+
+    def get_file_state(
+            self,
+            store_id: str,
+            idx: str,
+            file_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get stored state of indexed file
+
+        :param: store_id: store ID
+        :param: idx: index
+        :param: file_id: file ID
+        :return: file state (doc_id, hash, size, mtime) or None if not indexed
+        """
+        return self.storage.get_file_state(store_id, idx, file_id)
+
+    def update_file_state(
+            self,
+            store_id: str,
+            idx: str,
+            file_id: str,
+            state: Dict[str, Any]
+    ) -> bool:
+        """
+        Update stored state of indexed file
+
+        :param: store_id: store ID
+        :param: idx: index
+        :param: file_id: file ID
+        :param: state: file state (hash, size, mtime)
         """
-        return self.storage.update_file(id, doc_id, ts)
+        return self.storage.update_file_state(store_id, idx, file_id, state)
 
     def update_ctx_meta(
             self,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 import uuid
@@ -95,7 +95,10 @@ class Storage:
                 name,
                 path,
                 store,
-                idx
+                idx,
+                hash,
+                size,
+                mtime
             )
             VALUES 
             (
@@ -106,7 +109,10 @@ class Storage:
                 :name,
                 :path,
                 :store,
-                :idx
+                :idx,
+                :hash,
+                :size,
+                :mtime
             )
         """).bindparams(
             uuid=str(uuid.uuid4()),
@@ -117,6 +123,9 @@ class Storage:
             path=data['path'],
             store=store_id,
             idx=idx,
+            hash=data.get('hash'),
+            size=data.get('size'),
+            mtime=data.get('mtime'),
         )
         with db.begin() as conn:
             result = conn.execute(stmt)
@@ -436,7 +445,8 @@ class Storage:
             self,
             id: int,
             doc_id: str,
-            ts: int
+            ts: int,
+            state: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Update timestamp of file in index
@@ -444,18 +454,99 @@ class Storage:
         :param id: db record ID
         :param doc_id: document ID
         :param ts: timestamp
+        :param state: file state (hash, size, mtime)
         """
+        if state is None:
+            state = {}
         db = self.window.core.db.get_db()
         stmt = text("""
             UPDATE idx_file
             SET 
             updated_ts = :updated_ts,
-            doc_id = :doc_id
+            doc_id = :doc_id,
+            hash = :hash,
+            size = :size,
+            mtime = :mtime
             WHERE id = :id
         """).bindparams(
             id=id,
             doc_id=doc_id,
             updated_ts=ts,
+            hash=state.get('hash'),
+            size=state.get('size'),
+            mtime=state.get('mtime'),
+        )
+        with db.begin() as conn:
+            conn.execute(stmt)
+        return True
+
+    def get_file_state(
+            self,
+            store_id: str,
+            idx: str,
+            file_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get stored state of indexed file
+
+        :param store_id: store ID
+        :param idx: index name
+        :param file_id: file ID
+        :return: file state (doc_id, hash, size, mtime) or None if not indexed
+        """
+        db = self.window.core.db.get_db()
+        stmt = text("""
+            SELECT doc_id, hash, size, mtime
+            FROM idx_file
+            WHERE store = :store_id
+            AND idx = :idx
+            AND name = :file_id
+            ORDER BY id DESC
+            LIMIT 1
+        """).bindparams(
+            store_id=store_id,
+            idx=idx,
+            file_id=file_id,
+        )
+        with db.connect() as conn:
+            result = conn.execute(stmt)
+            row = result.fetchone()
+            if row is None:
+                return None
+            return row._asdict()
+
+    def update_file_state(
+            self,
+            store_id: str,
+            idx: str,
+            file_id: str,
+            state: Dict[str, Any]
+    ) -> bool:
+        """
+        Update stored state of indexed file (without re-indexing)
+
+        :param store_id: store ID
+        :param idx: index name
+        :param file_id: file ID
+        :param state: file state (hash, size, mtime)
+        """
+        db = self.window.core.db.get_db()
+        stmt = text("""
+            UPDATE idx_file
+            SET 
+            hash = :hash,
+            size = :size,
+            mtime = :mtime
+            WHERE store = :store_id
+            AND idx = :idx
+            AND name = :file_id
+        """).bindparams(
+            store_id=store_id,
+            idx=idx,
+            file_id=file_id,
+            hash=state.get('hash'),
+            size=state.get('size'),
+            mtime=state.get('mtime'),
         )
         with db.begin() as conn:
             conn.execute(stmt)
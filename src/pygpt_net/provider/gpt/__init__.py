@@ -6,9 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 19:00:00                  #
+# Updated Date: 2025.01.21 04:00:00                  #
 # ================================================== #
 
+import threading
+from typing import Tuple, Optional
+
 from httpx_socks import SyncProxyTransport
 
 from openai import OpenAI, DefaultHttpxClient
@@ -49,32 +52,77 @@ class Gpt:
         self.store = Store(window)
         self.summarizer = Summarizer(window)
         self.vision = Vision(window)
+        self.clients = {}  # shared clients (connection pools) by API config
+        self.clients_lock = threading.Lock()
+
+    def get_client_key(self) -> Tuple[Optional[str], Optional[str], str, str]:
+        """
+        Get client cache key from current API config
+
+        :return: key tuple (api key, organization, endpoint, proxy)
+        """
+        endpoint = ""
+        proxy = ""
+        if self.window.core.config.has('api_endpoint'):
+            endpoint = self.window.core.config.get('api_endpoint') or ""
+        if self.window.core.config.has('api_proxy'):
+            proxy = self.window.core.config.get('api_proxy') or ""
+        return (
+            self.window.core.config.get('api_key'),
+            self.window.core.config.get('organization_key'),
+            endpoint,
+            proxy,
+        )
 
     def get_client(self) -> OpenAI:
         """
-        Return OpenAI client
+        Return OpenAI client (shared, created once per API config)
+
+        :return: OpenAI client
+        """
+        key = self.get_client_key()
+        with self.clients_lock:
+            if key not in self.clients:
+                # API config changed, drop old clients (closed when released by running requests)
+                self.clients = {key: self.create_client(*key)}
+            return self.clients[key]
 
+    def create_client(
+            self,
+            api_key: Optional[str],
+            organization: Optional[str],
+            endpoint: str,
+            proxy: str
+    ) -> OpenAI:
+        """
+        Create OpenAI client
+
+        :param api_key: API key
+        :param organization: organization key
+        :param endpoint: API endpoint
+        :param proxy: proxy URL
         :return: OpenAI client
         """
         args = {
-            "api_key": self.window.core.config.get('api_key'),
-            "organization": self.window.core.config.get('organization_key'),
+            "api_key": api_key,
+            "organization": organization,
         }
         # api endpoint
-        if self.window.core.config.has('api_endpoint'):
-            endpoint = self.window.core.config.get('api_endpoint')
-            if endpoint:
-                args["base_url"] = endpoint
+        if endpoint:
+            args["base_url"] = endpoint
         # proxy
-        if self.window.core.config.has('api_proxy'):
-            proxy = self.window.core.config.get('api_proxy')
-            if proxy:
-                transport = SyncProxyTransport.from_url(proxy)
-                args["http_client"] = DefaultHttpxClient(
-                    transport=transport,
-                )
+        if proxy:
+            transport = SyncProxyTransport.from_url(proxy)
+            args["http_client"] = DefaultHttpxClient(
+                transport=transport,
+            )
         return OpenAI(**args)
 
+    def reset_clients(self):
+        """Drop shared clients (will be recreated on next request)"""
+        with self.clients_lock:
+            self.clients = {}
+
     def call(self, context: BridgeContext, extra: dict = None) -> bool:
         """
         Call OpenAI API
@@ -6,10 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
-from llama_index.llms.anthropic import Anthropic
 from llama_index.core.llms.llm import BaseLLM as LlamaBaseLLM
 
 from pygpt_net.core.types import (
@@ -46,5 +45,6 @@ class AnthropicLLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.llms.anthropic import Anthropic
         args = self.parse_args(model.llama_index)
         return Anthropic(**args)
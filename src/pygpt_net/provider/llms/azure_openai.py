@@ -6,18 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Dict
 
-from langchain_openai import AzureOpenAI
-from langchain_openai import AzureChatOpenAI
-
 from llama_index.core.llms.llm import BaseLLM as LlamaBaseLLM
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.llms.azure_openai import AzureOpenAI as LlamaAzureOpenAI
-from llama_index.embeddings.azure_openai import AzureOpenAIEmbedding
 
 from pygpt_net.core.types import (
     MODE_LANGCHAIN,
@@ -55,6 +50,7 @@ class AzureOpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import AzureOpenAI
         args = self.parse_args(model.langchain)
         return AzureOpenAI(**args)
 
@@ -72,6 +68,7 @@ class AzureOpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import AzureChatOpenAI
         args = self.parse_args(model.langchain)
         return AzureChatOpenAI(**args)
 
@@ -89,6 +86,7 @@ class AzureOpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.llms.azure_openai import AzureOpenAI as LlamaAzureOpenAI
         args = self.parse_args(model.llama_index)
         return LlamaAzureOpenAI(**args)
 
@@ -104,6 +102,7 @@ class AzureOpenAILLM(BaseLLM):
         :param config: config keyword arguments list
         :return: Embedding provider instance
         """
+        from llama_index.embeddings.azure_openai import AzureOpenAIEmbedding
         args = {}
         if config is not None:
             args = self.parse_args({
@@ -6,15 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Dict
 
-from llama_index.llms.gemini import Gemini
 from llama_index.core.llms.llm import BaseLLM as LlamaBaseLLM
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.embeddings.gemini import GeminiEmbedding
 
 from pygpt_net.core.types import (
     MODE_LLAMA_INDEX,
@@ -50,6 +48,7 @@ class GoogleLLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.llms.gemini import Gemini
         args = self.parse_args(model.llama_index)
         return Gemini(**args)
 
@@ -65,6 +64,7 @@ class GoogleLLM(BaseLLM):
         :param config: config keyword arguments list
         :return: Embedding provider instance
         """
+        from llama_index.embeddings.gemini import GeminiEmbedding
         args = {}
         if config is not None:
             args = self.parse_args({
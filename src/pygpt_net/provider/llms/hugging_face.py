@@ -6,11 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
-from langchain_community.llms import HuggingFaceHub
-
 from pygpt_net.core.types import (
     MODE_LANGCHAIN,
 )
@@ -38,6 +36,7 @@ class HuggingFaceLLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_community.llms import HuggingFaceHub
         args = self.parse_args(model.langchain)
         return HuggingFaceHub(**args)
 
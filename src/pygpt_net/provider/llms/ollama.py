@@ -6,18 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import os
 from typing import Optional, List, Dict
 
-from langchain_community.chat_models import ChatOllama
-
-from llama_index.llms.ollama import Ollama
 from llama_index.core.llms.llm import BaseLLM as LlamaBaseLLM
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.embeddings.ollama import OllamaEmbedding
 
 from pygpt_net.core.types import (
     MODE_LANGCHAIN,
@@ -25,7 +21,6 @@ from pygpt_net.core.types import (
 )
 from pygpt_net.provider.llms.base import BaseLLM
 from pygpt_net.item.model import ModelItem
-import nest_asyncio
 
 
 class OllamaLLM(BaseLLM):
@@ -64,6 +59,7 @@ class OllamaLLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_community.chat_models import ChatOllama
         args = self.parse_args(model.langchain)
         return ChatOllama(**args)
 
@@ -81,6 +77,8 @@ class OllamaLLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.llms.ollama import Ollama
+        import nest_asyncio
         nest_asyncio.apply()
         args = self.parse_args(model.llama_index)
         return Ollama(**args)
@@ -97,6 +95,7 @@ class OllamaLLM(BaseLLM):
         :param config: config keyword arguments list
         :return: Embedding provider instance
         """
+        from llama_index.embeddings.ollama import OllamaEmbedding
         args = {}
         if config is not None:
             args = self.parse_args({
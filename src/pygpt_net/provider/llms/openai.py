@@ -6,20 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Dict
 
-from langchain_openai import OpenAI
-from langchain_openai import ChatOpenAI
-
 from llama_index.core.llms.llm import BaseLLM as LlamaBaseLLM
 from llama_index.core.multi_modal_llms import MultiModalLLM as LlamaMultiModalLLM
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from llama_index.llms.openai import OpenAI as LlamaOpenAI
-from llama_index.multi_modal_llms.openai import OpenAIMultiModal as LlamaOpenAIMultiModal
-from llama_index.embeddings.openai import OpenAIEmbedding
 
 from pygpt_net.core.types import (
     MODE_LANGCHAIN,
@@ -49,6 +43,7 @@ class OpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import OpenAI
         args = self.parse_args(model.langchain)
         return OpenAI(**args)
 
@@ -66,6 +61,7 @@ class OpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from langchain_openai import ChatOpenAI
         args = self.parse_args(model.langchain)
         return ChatOpenAI(**args)
 
@@ -83,6 +79,7 @@ class OpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.llms.openai import OpenAI as LlamaOpenAI
         args = self.parse_args(model.llama_index)
         return LlamaOpenAI(**args)
 
@@ -100,6 +97,7 @@ class OpenAILLM(BaseLLM):
         :param stream: stream mode
         :return: LLM provider instance
         """
+        from llama_index.multi_modal_llms.openai import OpenAIMultiModal as LlamaOpenAIMultiModal
         args = self.parse_args(model.llama_index)
         return LlamaOpenAIMultiModal(**args)
 
@@ -115,6 +113,7 @@ class OpenAILLM(BaseLLM):
         :param config: config keyword arguments list
         :return: Embedding provider instance
         """
+        from llama_index.embeddings.openai import OpenAIEmbedding
         args = {}
         if config is not None:
             args = self.parse_args({
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 04:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -27,6 +27,7 @@ class BaseLoader:
         self.init_args_desc = {}
         self.allow_compiled = True  # allow in compiled and Snap versions
         # This is required due to some readers may require Python environment to install additional packages
+        self.allow_process = False  # reader can be created and run in indexing worker process (no window access)
 
     def attach_window(self, window):
         """
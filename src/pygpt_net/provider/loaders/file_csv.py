@@ -6,12 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.04.17 01:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
 
-from .hub.simple_csv.base import SimpleCSVReader
 from .base import BaseLoader
 
 
@@ -22,6 +21,7 @@ class Loader(BaseLoader):
         self.name = "CSV files"
         self.extensions = ["csv"]
         self.type = ["file"]
+        self.allow_process = True  # CPU-bound parsing, run in worker process
         self.init_args = {
             "concat_rows": True,
             "encoding": "utf-8",
@@ -37,5 +37,6 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from .hub.simple_csv.base import SimpleCSVReader
         args = self.get_args()
         return SimpleCSVReader(**args)
@@ -6,11 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.02.28 22:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
-from llama_index.readers.file.epub import EpubReader
 
 from .base import BaseLoader
 
@@ -22,6 +21,7 @@ class Loader(BaseLoader):
         self.name = "Epub files"
         self.extensions = ["epub"]
         self.type = ["file"]
+        self.allow_process = True  # CPU-bound parsing, run in worker process
 
     def get(self) -> BaseReader:
         """
@@ -29,4 +29,5 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from llama_index.readers.file.epub import EpubReader
         return EpubReader()  # no args
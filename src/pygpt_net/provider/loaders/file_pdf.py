@@ -6,11 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.04.17 01:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
-from llama_index.readers.file.docs import PDFReader
 
 from .base import BaseLoader
 
@@ -22,6 +21,7 @@ class Loader(BaseLoader):
         self.name = "PDF documents"
         self.extensions = ["pdf"]
         self.type = ["file"]
+        self.allow_process = True  # CPU-bound parsing, run in worker process
         self.init_args = {
             "return_full_document": False,
         }
@@ -35,5 +35,6 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from llama_index.readers.file.docs import PDFReader
         args = self.get_args()
         return PDFReader(**args)
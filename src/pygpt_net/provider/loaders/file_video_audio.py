@@ -6,12 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.04.17 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
 
-from .hub.video_audio.base import VideoAudioReader
 from .base import BaseLoader
 
 
@@ -47,6 +46,7 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from .hub.video_audio.base import VideoAudioReader
         args = self.get_args()
         args["window"] = self.window  # pass window instance
         if self.window is not None:
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+# Entry point for file loaders running in indexing worker processes.
+# Imported in child process, keep it free of window and Qt imports.
+
+import importlib
+from pathlib import Path
+from typing import List, Dict, Any
+
+from llama_index.core.schema import Document
+
+readers = {}  # reader instances cached per worker process
+
+
+def load_file(
+        module: str,
+        name: str,
+        args: Dict[str, Any],
+        path: str
+) -> List[Document]:
+    """
+    Read documents from file using data loader created in worker process
+
+    :param module: loader module name
+    :param name: loader class name
+    :param args: reader keyword arguments
+    :param path: file path
+    :return: list of documents
+    """
+    key = (module, name, repr(sorted(args.items())))
+    reader = readers.get(key)
+    if reader is None:
+        loader = getattr(importlib.import_module(module), name)()
+        loader.set_args(args)
+        reader = loader.get()
+        readers[key] = reader
+    return reader.load_data(file=Path(path))
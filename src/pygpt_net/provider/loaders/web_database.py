@@ -6,14 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import json
 
 from llama_index.core.readers.base import BaseReader
 
-from .hub.database.base import DatabaseReader
 from .base import BaseLoader
 
 
@@ -72,6 +71,7 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from .hub.database.base import DatabaseReader
         args = self.get_args()
         return DatabaseReader(**args)
 
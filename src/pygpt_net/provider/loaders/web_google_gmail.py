@@ -6,14 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import json
 
 from llama_index.core.readers.base import BaseReader
 
-from .hub.google.gmail import GmailReader
 from .base import BaseLoader
 
 
@@ -60,6 +59,7 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from .hub.google.gmail import GmailReader
         args = self.get_args()
         return GmailReader(**args)
 
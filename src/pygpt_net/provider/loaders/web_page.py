@@ -6,12 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
 
-from .hub.web_page.base import WebPage
 from .base import BaseLoader
 
 
@@ -42,6 +41,7 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from .hub.web_page.base import WebPage
         return WebPage()
 
     def prepare_args(self, **kwargs) -> dict:
@@ -6,11 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
-from llama_index.readers.web.sitemap.base import SitemapReader
 
 from .base import BaseLoader
 
@@ -54,6 +53,7 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        from llama_index.readers.web.sitemap.base import SitemapReader
         args = self.get_args()
         return SitemapReader(**args)
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import hashlib
@@ -16,6 +16,7 @@ from llama_index.core.indices.base import BaseIndex
 from llama_index.core.indices.vector_store.base import VectorStoreIndex
 
 from .base import BaseStore
+from .cache import IndexCache
 from .ctx_attachment import CtxAttachmentProvider
 from .temp import TempProvider
 
@@ -31,6 +32,7 @@ class Storage:
         self.storages = {}
         self.indexes = {}
         self.tmp_storage = TempProvider(window=window)
+        self.cache = IndexCache(window=window)
 
     def get_storage(self) -> Optional[BaseStore]:
         """
@@ -111,6 +113,7 @@ class Storage:
             id: str,
             llm: Optional = None,
             embed_model: Optional = None,
+            cache: bool = False,
     ) -> BaseIndex:
         """
         Get index instance
@@ -118,16 +121,31 @@ class Storage:
         :param id: index name
         :param llm: LLM instance
         :param embed_model: Embedding model instance
+        :param cache: use in-memory index cache (read-only usage, e.g. querying)
         :return: index instance
         """
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
-        return storage.get(
+        path = storage.get_path(id) if cache else None  # resolved in current workdir
+        if cache:
+            index = self.cache.get(storage.id, id, embed_model, path)
+            if index is not None:
+                return index
+        index = storage.get(
             id=id,
             llm=llm,
             embed_model=embed_model,
         )
+        if cache:
+            self.cache.put(
+                store=storage.id,
+                id=id,
+                index=index,
+                embed_model=embed_model,
+                path=path,
+            )
+        return index
 
     def store(
             self,
@@ -143,10 +161,13 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
-        storage.store(
-            id=id,
-            index=index,
-        )
+        try:
+            storage.store(
+                id=id,
+                index=index,
+            )
+        finally:
+            self.cache.invalidate(storage.id, id)  # after write, index may be re-cached while storing
 
     def remove(self, id: str) -> bool:
         """
@@ -158,7 +179,10 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
-        return storage.remove(id)
+        try:
+            return storage.remove(id)
+        finally:
+            self.cache.invalidate(storage.id, id)
 
     def truncate(self, id: str) -> bool:
         """
@@ -170,7 +194,10 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
-        return storage.truncate(id)
+        try:
+            return storage.truncate(id)
+        finally:
+            self.cache.invalidate(storage.id, id)
 
     def remove_document(self, id: str, doc_id: str) -> bool:
         """
@@ -183,10 +210,13 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
-        return storage.remove_document(
-            id=id,
-            doc_id=doc_id,
-        )
+        try:
+            return storage.remove_document(
+                id=id,
+                doc_id=doc_id,
+            )
+        finally:
+            self.cache.invalidate(storage.id, id)
 
     def get_tmp(
             self,
@@ -259,6 +289,7 @@ class Storage:
             path: str,
             llm: Optional = None,
             embed_model: Optional = None,
+            cache: bool = False,
     ) -> BaseIndex:
         """
         Get context index instance
@@ -266,17 +297,31 @@ class Storage:
         :param path: path to index directory
         :param llm: LLM instance
         :param embed_model: Embedding model instance
+        :param cache: use in-memory index cache (read-only usage, e.g. querying)
         :return: index instance
         """
         # convert path to md5 hash
         storage = self.get_ctx_idx_storage(path)
         if storage is None:
             raise Exception('Storage engine not found!')
-        return storage.get(
+        if cache:
+            index = self.cache.get(storage.id, path, embed_model, path)
+            if index is not None:
+                return index
+        index = storage.get(
             id="",
             llm=llm,
             embed_model=embed_model,
         )
+        if cache:
+            self.cache.put(
+                store=storage.id,
+                id=path,
+                index=index,
+                embed_model=embed_model,
+                path=path,
+            )
+        return index
 
     def store_ctx_idx(
             self,
@@ -292,10 +337,13 @@ class Storage:
         storage = self.get_ctx_idx_storage(path)
         if storage is None:
             raise Exception('Storage engine not found!')
-        storage.store(
-            id="",
-            index=index,
-        )
+        try:
+            storage.store(
+                id="",
+                index=index,
+            )
+        finally:
+            self.cache.invalidate(storage.id, path)
 
     def clean_ctx_idx(self, path: str):
         """
@@ -306,7 +354,14 @@ class Storage:
         storage = self.get_ctx_idx_storage(path)
         if storage is None:
             raise Exception('Storage engine not found!')
-        storage.clean()
+        try:
+            storage.clean()
+        finally:
+            self.cache.invalidate(storage.id, path)
+
+    def clear_cache(self):
+        """Clear in-memory index cache"""
+        self.cache.clear()
 
     def index_from_empty(self) -> BaseIndex:
         """
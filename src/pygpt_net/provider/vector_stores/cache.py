@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 09:00:00                  #
+# ================================================== #
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Any
+
+from llama_index.core.indices.base import BaseIndex
+
+
+class IndexCache:
+    def __init__(self, window=None):
+        """
+        In-memory cache of loaded indexes (LRU, bounded by memory budget)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.items = OrderedDict()  # key => (index, size)
+        self.size = 0  # total size of cached items, in bytes
+        self.lock = threading.Lock()
+
+    def get_limit(self) -> int:
+        """
+        Get cache memory budget
+
+        :return: budget in bytes, 0 = cache disabled
+        """
+        limit = 512
+        if self.window is not None:
+            limit = self.window.core.config.get("llama.idx.cache.size", 512)
+        return max(0, int(limit or 0)) * 1024 * 1024
+
+    def make_key(
+            self,
+            store: str,
+            id: str,
+            embed_model: Optional[Any] = None,
+            path: Optional[str] = None
+    ) -> Tuple[str, str, str, str]:
+        """
+        Make cache key
+
+        :param store: vector store ID
+        :param id: index name or path
+        :param embed_model: Embedding model instance
+        :param path: path to index on disk (differs per workdir)
+        :return: cache key
+        """
+        model = ""
+        if embed_model is not None:
+            model = embed_model.__class__.__name__ + ":" + str(getattr(embed_model, "model_name", ""))
+        return store, id, model, path or ""
+
+    def get(
+            self,
+            store: str,
+            id: str,
+            embed_model: Optional[Any] = None,
+            path: Optional[str] = None
+    ) -> Optional[BaseIndex]:
+        """
+        Get cached index
+
+        :param store: vector store ID
+        :param id: index name or path
+        :param embed_model: Embedding model instance
+        :param path: path to index on disk
+        :return: index instance or None if not cached
+        """
+        key = self.make_key(store, id, embed_model, path)
+        with self.lock:
+            if key not in self.items:
+                return None
+            self.items.move_to_end(key)
+            index = self.items[key][0]
+        if embed_model is not None and hasattr(index, "_embed_model"):
+            index._embed_model = embed_model  # use current embed model instance
+        return index
+
+    def put(
+            self,
+            store: str,
+            id: str,
+            index: BaseIndex,
+            embed_model: Optional[Any] = None,
+            path: Optional[str] = None
+    ):
+        """
+        Put index into cache
+
+        :param store: vector store ID
+        :param id: index name or path
+        :param index: index instance
+        :param embed_model: Embedding model instance
+        :param path: path to index on disk (used to estimate size)
+        """
+        limit = self.get_limit()
+        if limit == 0:
+            return
+        size = self.get_size(path)
+        if size > limit:
+            return  # too big to cache
+        key = self.make_key(store, id, embed_model, path)
+        with self.lock:
+            if key in self.items:
+                self.size -= self.items.pop(key)[1]
+            self.items[key] = (index, size)
+            self.size += size
+            while self.size > limit and len(self.items) > 1:
+                _, (_, evicted) = self.items.popitem(last=False)  # least recently used
+                self.size -= evicted
+
+    def invalidate(self, store: str, id: str):
+        """
+        Remove index from cache (all embed models and paths)
+
+        :param store: vector store ID
+        :param id: index name or path
+        """
+        with self.lock:
+            for key in [k for k in self.items if k[0] == store and k[1] == id]:
+                self.size -= self.items.pop(key)[1]
+
+    def clear(self):
+        """Clear cache"""
+        with self.lock:
+            self.items.clear()
+            self.size = 0
+
+    def get_size(self, path: Optional[str] = None) -> int:
+        """
+        Estimate index size by its size on disk
+
+        :param path: path to index directory
+        :return: size in bytes
+        """
+        if path is None or not os.path.exists(path):
+            return 0
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        size = 0
+        for root, dirs, files in os.walk(path):
+            for file in files:
+                try:
+                    size += os.path.getsize(os.path.join(root, file))
+                except OSError:
+                    pass
+        return size
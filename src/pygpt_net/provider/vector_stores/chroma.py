@@ -6,18 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import os.path
 from typing import Optional
 
-import chromadb
-from chromadb.config import Settings
-
 from llama_index.core.indices.base import BaseIndex
 from llama_index.core import StorageContext
-from llama_index.vector_stores.chroma import ChromaVectorStore
 
 from .base import BaseStore
 
@@ -43,6 +39,8 @@ class ChromaProvider(BaseStore):
         :param id: index name
         :return: database instance
         """
+        import chromadb
+        from chromadb.config import Settings
         path = self.get_path(id)
         return chromadb.PersistentClient(
             path=path, 
@@ -79,6 +77,7 @@ class ChromaProvider(BaseStore):
         :param embed_model: Embedding model instance
         :return: index instance
         """
+        from llama_index.vector_stores.chroma import ChromaVectorStore
         if not self.exists(id):
             self.create(id)
         path = self.get_path(id)
@@ -6,18 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2025.01.21 00:00:00                  #
 # ================================================== #
 
 import datetime
 import os.path
 from typing import Optional
 
-from pinecone import Pinecone, ServerlessSpec
-
 from llama_index.core import StorageContext
 from llama_index.core.indices.base import BaseIndex
-from llama_index.vector_stores.pinecone import PineconeVectorStore
 
 from pygpt_net.utils import parse_args
 from .base import BaseStore
@@ -43,6 +40,7 @@ class PinecodeProvider(BaseStore):
 
         :param id: index name
         """
+        from pinecone import ServerlessSpec
         # spec kwargs
         spec_kwargs = {
             "cloud": "aws",
@@ -87,12 +85,13 @@ class PinecodeProvider(BaseStore):
             os.makedirs(path)
             self.store(id)
 
-    def get_client(self) -> Pinecone:
+    def get_client(self) -> "Pinecone":
         """
         Get Pinecone client
 
         :return: Pinecone client
         """
+        from pinecone import Pinecone
         base_kwargs = {
             "api_key": "",
         }
@@ -103,13 +102,14 @@ class PinecodeProvider(BaseStore):
             base_kwargs["api_key"] = kwargs_additional["api_key"]
         return Pinecone(**base_kwargs)  # api_key argument is required
 
-    def get_store(self, id: str) -> PineconeVectorStore:
+    def get_store(self, id: str) -> "PineconeVectorStore":
         """
         Get Pinecone store
 
         :param id: index name
         :return: PineconeVectorStore client
         """
+        from llama_index.vector_stores.pinecone import PineconeVectorStore
         pc = self.get_client()
         name = id
         kwargs = parse_args(
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 19:00:00                  #
 # ================================================== #
 
 from typing import Dict, Optional
@@ -77,6 +77,22 @@ class Tools:
         for id in self.tools:
             self.tools[id].on_post_update()
 
+    def has_update(self) -> bool:
+        """
+        Check if any tool requires update loop
+
+        :return: True if required
+        """
+        return any(self.tools[id].has_update() for id in self.tools)
+
+    def has_post_update(self) -> bool:
+        """
+        Check if any tool requires post-update loop
+
+        :return: True if required
+        """
+        return any(self.tools[id].has_post_update() for id in self.tools)
+
     def on_exit(self):
         """On app exit"""
         for id in self.tools:
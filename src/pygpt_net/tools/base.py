@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2025.01.20 19:00:00                  #
 # ================================================== #
 
 from typing import Optional, Dict
@@ -50,6 +50,22 @@ class BaseTool(QObject):
         """On app main loop update"""
         pass
 
+    def has_update(self) -> bool:
+        """
+        Check if tool implements on_update (tools without own implementation are not polled)
+
+        :return: True if implemented
+        """
+        return type(self).on_update is not BaseTool.on_update
+
+    def has_post_update(self) -> bool:
+        """
+        Check if tool implements on_post_update
+
+        :return: True if implemented
+        """
+        return type(self).on_post_update is not BaseTool.on_post_update
+
     def on_exit(self):
         """On app exit"""
         pass
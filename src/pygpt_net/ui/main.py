@@ -6,14 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.19 03:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 import copy
 import os
 
 from PySide6 import QtWidgets
-from PySide6.QtCore import QTimer, Signal, Slot, QThreadPool, QEvent, Qt, QLoggingCategory
+from PySide6.QtCore import Signal, Slot, QThreadPool, QEvent, Qt, QLoggingCategory
 from PySide6.QtGui import QShortcut, QKeySequence
 from PySide6.QtWidgets import QApplication, QMainWindow
 from qt_material import QtStyleTools
@@ -49,9 +49,6 @@ class MainWindow(QMainWindow, QtStyleTools):
         super().__init__()
         self.app = app
         self.args = args
-        self.timer = None
-        self.post_timer = None
-        self.update_timer = None
         self.threadpool = None
         self.is_closing = False
         self.timer_interval = 30
@@ -206,15 +203,14 @@ class MainWindow(QMainWindow, QtStyleTools):
     def post_setup(self):
         """Called after setup"""
         self.controller.layout.post_setup()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update)
-        self.timer.start(self.timer_interval)
-        self.post_timer = QTimer()
-        self.post_timer.timeout.connect(self.post_update)
-        self.post_timer.start(self.post_timer_interval)
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.core.updater.run_check)
-        self.update_timer.start(self.update_timer_interval)
+        self.core.scheduler.add(
+            "app.updater",
+            self.core.updater.run_check,
+            self.update_timer_interval,
+            repeat=True,
+        )
+        self.core.scheduler.setup()
+        self.update_loop()
         self.logger_message.connect(self.controller.debug.handle_log)
         self.ui.post_setup()
         self.tools.post_setup()
@@ -224,12 +220,31 @@ class MainWindow(QMainWindow, QtStyleTools):
         self.controller.on_update()
         self.controller.plugins.on_update()
         self.tools.on_update()
+        self.update_loop()
 
     def post_update(self):
         """Called on post-update (lazy)"""
         self.controller.debug.on_post_update()
         self.controller.plugins.on_post_update()
         self.tools.on_post_update()
+        self.update_loop()
+
+    def update_loop(self):
+        """Start or stop update loops, loops are scheduled only if any component requires them"""
+        scheduler = self.core.scheduler
+        if self.controller.plugins.has_update() or self.tools.has_update():
+            if not scheduler.has("app.update"):
+                scheduler.add("app.update", self.update, self.timer_interval, repeat=True)
+        else:
+            scheduler.remove("app.update")
+
+        if self.controller.debug.has_post_update() \
+                or self.controller.plugins.has_post_update() \
+                or self.tools.has_post_update():
+            if not scheduler.has("app.post_update"):
+                scheduler.add("app.post_update", self.post_update, self.post_timer_interval, repeat=True)
+        else:
+            scheduler.remove("app.post_update")
 
     @Slot(str)
     def update_status(self, message: str = ""):
@@ -277,6 +292,8 @@ class MainWindow(QMainWindow, QtStyleTools):
         self.controller.kernel.terminate()
         print("Saving ctx groups...")
         self.controller.ctx.save_all()
+        print("Flushing ctx writes...")
+        self.core.ctx.writer.stop()
         print("Saving tabs...")
         self.core.tabs.save()
         print("Saving notepad...")
@@ -290,11 +307,9 @@ class MainWindow(QMainWindow, QtStyleTools):
         print("Saving layout state...")
         self.controller.layout.save()
         print("Stopping timers...")
-        self.timer.stop()
-        self.post_timer.stop()
-        self.update_timer.stop()
+        self.core.scheduler.clear()
         print("Saving config...")
-        self.core.config.save()
+        self.core.config.save(force=True)
         print("Saving presets...")
         self.core.presets.save_all()
         print("Exiting...")
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.13 19:00:00                  #
+# Updated Date: 2025.01.21 03:00:00                  #
 # ================================================== #
 
 from PySide6.QtGui import QAction
@@ -42,6 +42,7 @@ class Debug:
         self.window.ui.menu['debug.app.log'] = QAction(trans("menu.debug.app.log"), self.window, checkable=True)
         self.window.ui.menu['debug.kernel'] = QAction(trans("menu.debug.kernel"), self.window, checkable=True)
         self.window.ui.menu['debug.render'] = QAction(trans("menu.debug.render"), self.window, checkable=True)
+        self.window.ui.menu['debug.web'] = QAction(trans("menu.debug.web"), self.window, checkable=True)
 
         self.window.ui.menu['debug.config'].triggered.connect(
             lambda: self.window.controller.debug.toggle('config'))
@@ -77,6 +78,8 @@ class Debug:
             lambda: self.window.controller.debug.toggle('kernel'))
         self.window.ui.menu['debug.render'].triggered.connect(
             lambda: self.window.controller.debug.toggle_render())
+        self.window.ui.menu['debug.web'].triggered.connect(
+            lambda: self.window.controller.debug.toggle('web'))
 
         self.window.ui.menu['menu.debug'] = self.window.menuBar().addMenu(trans("menu.debug"))
         self.window.ui.menu['menu.debug'].addAction(self.window.ui.menu['debug.logger'])
@@ -97,6 +100,7 @@ class Debug:
         self.window.ui.menu['menu.debug'].addAction(self.window.ui.menu['debug.presets'])
         self.window.ui.menu['menu.debug'].addAction(self.window.ui.menu['debug.tabs'])
         self.window.ui.menu['menu.debug'].addAction(self.window.ui.menu['debug.ui'])
+        self.window.ui.menu['menu.debug'].addAction(self.window.ui.menu['debug.web'])
 
         # restore state
         if self.window.core.config.get('debug.render'):
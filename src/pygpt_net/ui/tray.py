@@ -6,9 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.17 03:00:00                  #
+# Updated Date: 2025.01.20 20:00:00                  #
 # ================================================== #
 
+from datetime import datetime
+from typing import Optional
+
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu
 
@@ -185,16 +188,19 @@ class Tray:
             return
         self.window.ui.tray_menu['scheduled'].setVisible(False)
 
-    def update_schedule_tasks(self, tasks: int = 0):
+    def update_schedule_tasks(self, tasks: int = 0, next_run: Optional[datetime] = None):
         """
         Update scheduled jobs number
 
         :param tasks: Number of scheduled tasks
+        :param next_run: Next run time
         """
         if not self.is_tray:
             return
         if tasks > 0:
             info = trans("menu.tray.scheduled") + ": {}".format(tasks)
+            if next_run is not None:
+                info += " ({}: {})".format(trans("menu.tray.scheduled.next"), next_run.strftime("%Y-%m-%d %H:%M"))
             self.window.ui.tray_menu['scheduled'].setText(info)
             self.show_schedule_menu()
         else:
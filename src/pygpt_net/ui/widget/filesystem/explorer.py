@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.19 02:00:00                  #
+# Updated Date: 2025.01.21 06:00:00                  #
 # ================================================== #
 
 import datetime
@@ -521,6 +521,7 @@ class IndexedFileSystemModel(QFileSystemModel):
         super().__init__(*args, **kwargs)
         self.window = window
         self.index_dict = index_dict
+        self.index_status = self.build_index_status(index_dict)
         self.directoryLoaded.connect(self.refresh_path)
 
     def refresh_path(self, path):
@@ -592,33 +593,35 @@ class IndexedFileSystemModel(QFileSystemModel):
         :return: file index status
         """
         file_id = self.window.core.idx.files.get_id(file_path)
-        indexed_in = []
-        indexed_timestamps = {}
-        last_index_at = 0
-        for idx in self.index_dict:
-            items = self.index_dict[idx]
-            if file_id in items:
-                indexed_in.append(idx)  # append idx where file is indexed
-                indexed_timestamps[idx] = items[file_id]['indexed_ts']
-                if items[file_id]['indexed_ts'] > last_index_at:
-                    last_index_at = items[file_id]['indexed_ts']
-
-        # sort indexed_in by timestamp DESC
-        indexed_in = sorted(
-            indexed_in,
-            key=lambda x: indexed_timestamps[x],
-            reverse=True,
-        )
-        if len(indexed_in) > 0:
-            return {
+        return self.index_status.get(file_id, {'indexed': False})
+
+    def build_index_status(self, index_dict: dict) -> dict:
+        """
+        Build index status lookup (called once per index data update, not per painted cell)
+
+        :param index_dict: indexed files data (idx => file ID => data)
+        :return: dict: file ID => file index status
+        """
+        timestamps = {}
+        for idx in index_dict:
+            items = index_dict[idx]
+            for file_id in items:
+                timestamps.setdefault(file_id, {})[idx] = items[file_id]['indexed_ts']
+
+        status = {}
+        for file_id, indexed_timestamps in timestamps.items():
+            # sort indexed_in by timestamp DESC
+            indexed_in = sorted(
+                indexed_timestamps,
+                key=lambda x: indexed_timestamps[x],
+                reverse=True,
+            )
+            status[file_id] = {
                 'indexed': True,
                 'indexed_in': indexed_in,
-                'last_index_at': last_index_at,
-            }
-        else:
-            return {
-                'indexed': False,
+                'last_index_at': max(indexed_timestamps.values()),
             }
+        return status
 
     def headerData(self, section, orientation, role=Qt.DisplayRole) -> str:
         """
@@ -649,6 +652,7 @@ class IndexedFileSystemModel(QFileSystemModel):
         :param idx_data: new index data dict
         """
         self.index_dict = idx_data
+        self.index_status = self.build_index_status(idx_data)
         top_left_index = self.index(0, 0)
         bottom_right_index = self.index(self.rowCount() - 1, self.columnCount() - 1)
         path = self.rootPath()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.19 02:00:00                  #
+# Updated Date: 2025.01.20 22:00:00                  #
 # ================================================== #
 
 import re
@@ -353,6 +353,24 @@ class Bridge(QObject):
         """
         self.window.controller.chat.render.scroll = pos
 
+    @Slot(int)
+    def load_more(self, pid: int):
+        """
+        Load previous items to web view (on scroll up)
+
+        :param pid: context PID
+        """
+        self.window.controller.chat.render.load_more(pid)
+
+    @Slot(int)
+    def trim_nodes(self, pid: int):
+        """
+        Remove far-off items from web view (on scroll to the bottom)
+
+        :param pid: context PID
+        """
+        self.window.controller.chat.render.trim(pid)
+
 
 class WebEngineSignals(QObject):
     save_as = Signal(str, str)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.controller.chat.stream import Stream, StreamWorker, StreamState
+from pygpt_net.item.ctx import CtxItem, CtxMeta
+
+
+def test_worker_run_coalesce(mock_window):
+    """Test stream worker coalesces chunks"""
+    mock_window.controller.kernel.stopped = MagicMock(return_value=False)
+    ctx = CtxItem()
+    ctx.stream = iter(["Hello", " ", "world", "!"])
+    worker = StreamWorker()
+    worker.window = mock_window
+    worker.ctx = ctx
+    worker.interval = 3600  # only first chunk emitted immediately, rest flushed at end
+    worker.signals = MagicMock()
+    worker.run()
+
+    chunks = [c.args[0] for c in worker.signals.chunk.emit.call_args_list]
+    assert chunks == ["Hello", " world!"]
+    result = worker.signals.finished.emit.call_args.args[0]
+    assert result["output"] == "Hello world!"
+    assert result["output_tokens"] == 4
+    assert result["tool_calls"] == []
+    assert result["error"] is None
+
+
+def test_worker_run_stopped(mock_window):
+    """Test stream worker stops on kernel stop"""
+    mock_window.controller.kernel.stopped = MagicMock(return_value=True)
+    ctx = CtxItem()
+    ctx.stream = iter(["Hello", "world"])
+    worker = StreamWorker()
+    worker.window = mock_window
+    worker.ctx = ctx
+    worker.signals = MagicMock()
+    worker.run()
+
+    worker.signals.chunk.emit.assert_not_called()
+    result = worker.signals.finished.emit.call_args.args[0]
+    assert result["output"] == ""
+
+
+def test_handle_chunk(mock_window):
+    """Test handle chunk"""
+    stream = Stream(mock_window)
+    ctx = CtxItem()
+    ctx.meta = CtxMeta()
+    state = StreamState(ctx)
+    stream.handle_chunk(state, "abc")
+    stream.handle_chunk(state, "def")
+    assert mock_window.dispatch.call_count == 2
+    first = mock_window.dispatch.call_args_list[0].args[0]
+    second = mock_window.dispatch.call_args_list[1].args[0]
+    assert first.data["chunk"] == "abc"
+    assert first.data["begin"] is True
+    assert second.data["begin"] is False
+
+
+def test_handle_chunk_nested(mock_window):
+    """Test nested streams keep own state"""
+    stream = Stream(mock_window)
+    outer = StreamState(CtxItem())
+    inner = StreamState(CtxItem())
+    stream.handle_chunk(outer, "a")
+    stream.handle_chunk(inner, "b")  # started from local event loop of outer stream
+    stream.handle_finished(inner, {"output": "b"})
+    stream.handle_chunk(outer, "c")
+    stream.handle_finished(outer, {"output": "ac"})
+    events = [c.args[0].data for c in mock_window.dispatch.call_args_list]
+    assert [(e["ctx"], e["chunk"], e["begin"]) for e in events] == [
+        (outer.ctx, "a", True),
+        (inner.ctx, "b", True),
+        (outer.ctx, "c", False),
+    ]
+    assert inner.result == {"output": "b"}
+    assert outer.result == {"output": "ac"}
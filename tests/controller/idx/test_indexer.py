@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.27 19:00:00                  #
+# Updated Date: 2025.01.20 13:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock
@@ -178,6 +178,12 @@ def test_handle_finished_file(mock_window):
     idx.update_idx_status = MagicMock()
     mock_window.core.idx.append = MagicMock()
     mock_window.controller.idx.after_index = MagicMock()
+    mock_window.core.idx.indexing.get_stats = MagicMock(return_value={
+        "new": 1,
+        "updated": 0,
+        "skipped": 2,
+        "removed": 0,
+    })
     files = {
         "file.txt": "id",
     }
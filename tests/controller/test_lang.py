@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 16:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock
@@ -48,6 +48,7 @@ def test_toggle(mock_window):
     mock_window.tools = MagicMock()
     lang.toggle('en')
     assert mock_window.core.config.data['lang'] == 'en'
+    mock_window.core.config.save.assert_called_once_with(force=True)
     lang.update.assert_called_once()
     lang.plugins.apply.assert_called_once()
     mock_window.controller.ctx.common.update_label_by_current.assert_called_once()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.07 23:00:00                  #
+# Updated Date: 2025.01.20 17:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch
@@ -780,6 +780,25 @@ def test_get_prompt_items():
     assert ctx.get_prompt_items('test_model', 'test_mode', 100, 1000) == []
 
 
+def test_get_history_prefix_sums():
+    """
+    Test get_history and count_history with different item sizes
+    """
+    ctx = Ctx()
+    ctx.window = MagicMock()
+    items = [CtxItem() for _ in range(5)]
+    counts = {id(item): num for item, num in zip(items, [50, 400, 100, 200, 30])}
+    ctx.window.core.tokens.from_ctx = MagicMock(side_effect=lambda item, mode, model: counts[id(item)])
+
+    assert ctx.count_history(items, 'test_model', 'test_mode', 100, 430) == (3, 330)
+    assert ctx.count_history(items, 'test_model', 'test_mode', 100, 850) == (4, 730)
+    assert ctx.count_history(items, 'test_model', 'test_mode', 100, 100) == (0, 0)
+    assert ctx.count_history(items, 'test_model', 'test_mode', 100, 50) == (0, 0)
+    assert ctx.get_history(items, 'test_model', 'test_mode', 100, 400) == items[2:4]
+    assert ctx.get_history(items, 'test_model', 'test_mode', 100, 850, False) == items[1:]
+    assert ctx.get_history([], 'test_model', 'test_mode', 100, 1000) == []
+
+
 def test_get_all_items(mock_window_conf):
     """
     Test get_all_items
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from pygpt_net.core.ctx.writer import Writer
+
+
+@pytest.fixture
+def writer(tmp_path):
+    engine = create_engine("sqlite:///{}".format(tmp_path / "db.sqlite"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE ctx_item (id INTEGER PRIMARY KEY AUTOINCREMENT, output TEXT)"))
+        conn.execute(text("INSERT INTO ctx_item (id, output) VALUES (5, 'a')"))
+    window = MagicMock()
+    window.core.db.get_db = MagicMock(return_value=engine)
+    window.core.config.get = MagicMock(return_value=True)
+    writer = Writer(window)
+    yield writer
+    writer.stop()
+
+
+def get_rows(writer):
+    with writer.window.core.db.get_db().connect() as conn:
+        return [tuple(row) for row in conn.execute(text("SELECT id, output FROM ctx_item ORDER BY id"))]
+
+
+def test_flush_coalesce(writer):
+    """Test queued writes are committed in one batch with coalesced updates"""
+    writer.DELAY = 10  # only explicit flush
+    stmt = text("INSERT INTO ctx_item (id, output) VALUES (:id, :output)").bindparams(output="b")
+    id = writer.insert("ctx_item", stmt)
+    assert id == 6
+    for output in ["c", "d", "e"]:
+        writer.add(
+            text("UPDATE ctx_item SET output = :output WHERE id = :id").bindparams(id=id, output=output),
+            key=("ctx_item", id),
+        )
+    assert writer.get_stats()["queued"] == 2
+    assert get_rows(writer) == [(5, "a")]
+    writer.flush()
+    assert get_rows(writer) == [(5, "a"), (6, "e")]
+    assert writer.get_stats() == {"queued": 0, "batches": 1, "writes": 2}
+
+
+def test_next_id(writer):
+    """Test IDs are allocated after existing and deleted rows"""
+    with writer.window.core.db.get_db().begin() as conn:
+        conn.execute(text("INSERT INTO ctx_item (output) VALUES ('x')"))
+        conn.execute(text("DELETE FROM ctx_item WHERE id = 6"))
+    assert writer.next_id("ctx_item") == 7  # AUTOINCREMENT does not reuse IDs
+    assert writer.next_id("ctx_item") == 8
+
+
+def test_background_commit(writer):
+    """Test queued writes are committed without flush"""
+    writer.DELAY = 0.01
+    writer.add(text("UPDATE ctx_item SET output = 'z' WHERE id = 5"))
+    for i in range(100):
+        if writer.get_stats()["batches"] == 1:
+            break
+        time.sleep(0.02)
+    assert get_rows(writer) == [(5, "z")]
+
+
+def test_stop(writer):
+    """Test stop commits queued writes and disables queue"""
+    writer.DELAY = 10
+    writer.add(text("UPDATE ctx_item SET output = 'y' WHERE id = 5"))
+    writer.stop()
+    assert get_rows(writer) == [(5, "y")]
+    assert not writer.is_enabled()
+
+
+def test_commit_retry(writer):
+    """Test failed batch is retried statement by statement"""
+    writer.DELAY = 10
+    errors = []
+    writer.signals.error = MagicMock()
+    writer.signals.error.emit = MagicMock(side_effect=errors.extend)
+    stmt = text("INSERT INTO ctx_item (id, output) VALUES (:id, :output)")
+    id = writer.insert("ctx_item", stmt.bindparams(output="b"))
+    writer.add(text("INSERT INTO missing_table (id) VALUES (1)"))
+    writer.add(text("UPDATE ctx_item SET output = 'c' WHERE id = 5"))
+    writer.flush()
+    assert get_rows(writer) == [(5, "c"), (id, "b")]
+    assert len(errors) == 1
+    assert "missing_table" in str(errors[0])
+    assert writer.get_stats()["writes"] == 2
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 import os
@@ -33,6 +33,18 @@ def test_prepare(mock_window):
     assert db.engine is not None
 
 
+def test_on_connect(mock_window):
+    """Test on connect pragmas"""
+    db = Database(mock_window)
+    dbapi_conn = MagicMock()
+    cursor = dbapi_conn.cursor.return_value
+    db.on_connect(dbapi_conn, None)
+    cursor.execute.assert_any_call("PRAGMA journal_mode = WAL")
+    cursor.execute.assert_any_call("PRAGMA synchronous = NORMAL")
+    assert cursor.execute.call_count == len(db.pragmas)
+    cursor.close.assert_called_once()
+
+
 def test_install(mock_window):
     """Test install"""
     db = Database(mock_window)
@@ -86,6 +98,7 @@ def test_migrate(mock_window):
     db.apply_migration = MagicMock()
     db.migrate()
     db.apply_migration.assert_called()
+    mock_window.core.ctx.reset_schema.assert_called_once()
 
 
 def test_get_param(mock_window):
@@ -120,3 +133,11 @@ def test_set_param_execption(mock_window):
     db.set_param("test", "test")
     db.engine.begin.assert_called_once()
 
+
+def test_viewer_flush(mock_window):
+    """Test viewer commits queued ctx writes before query"""
+    db = Database(mock_window)
+    db.engine = MagicMock()
+    db.viewer.fetch_data("ctx_item", ["id", "output"], "id", "ASC")
+    mock_window.core.ctx.writer.flush.assert_called_once()
+    db.engine.connect.assert_called_once()
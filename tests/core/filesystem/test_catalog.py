@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 06:00:00                  #
+# ================================================== #
+
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.core.filesystem.catalog import Catalog
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "a").mkdir()
+    (data / "a" / "b").mkdir()
+    (data / "a" / "one.txt").write_text("1")
+    (data / "a" / "b" / "two.txt").write_text("22")
+    (data / "root.md").write_text("root")
+    dirs = {"data": str(data), "tmp": str(tmp_path / "tmp")}
+    window = MagicMock()
+    window.core.config.get_user_dir = MagicMock(side_effect=lambda name: dirs[name])
+    catalog = Catalog(window)
+    yield catalog
+    if catalog.engine is not None:
+        catalog.engine.dispose()
+
+
+def make_old(path: str):
+    """Set mtime in the past, so directory is not re-listed as recently modified"""
+    ts = time.time() - 60
+    os.utime(path, (ts, ts))
+
+
+def test_list_dir(catalog):
+    """Test list directory"""
+    root = catalog.get_root()
+    names = [entry["name"] for entry in catalog.list_dir(root)]
+    assert names == ["a", "root.md"]
+    entries = catalog.list_dir(os.path.join(root, "a"), pattern="*.txt")
+    assert [entry["name"] for entry in entries] == ["one.txt"]
+    assert entries[0]["size"] == 1
+    assert len(catalog.list_dir(root, limit=1)) == 1
+
+
+def test_find(catalog):
+    """Test find files"""
+    root = catalog.get_root()
+    entries = catalog.find(root, "*.txt")
+    assert [entry["path"] for entry in entries] == ["a/b/two.txt", "a/one.txt"]
+    assert catalog.to_abs(entries[0]["path"]) == os.path.join(root, "a", "b", "two.txt")
+    assert catalog.find(root, "*.txt", recursive=False) == []
+    assert [entry["name"] for entry in catalog.find(root, "b", files_only=False)] == ["b"]
+
+
+def test_walk_depth(catalog):
+    """Test subtree with depth limit"""
+    root = catalog.get_root()
+    children = catalog.walk(root)
+    assert [entry["name"] for entry in children["a/b"]] == ["two.txt"]
+    children = catalog.walk(root, max_depth=2)
+    assert "a" in children
+    assert "a/b" not in children
+
+
+def test_refresh_incremental(catalog):
+    """Test only modified directories are re-listed"""
+    root = catalog.get_root()
+    for path in [os.path.join(root, "a", "b"), os.path.join(root, "a"), root]:
+        make_old(path)
+    catalog.refresh()
+    assert catalog.scanned == 3
+    catalog.refresh()
+    assert catalog.scanned == 0  # nothing changed
+
+    os.remove(os.path.join(root, "a", "b", "two.txt"))
+    with open(os.path.join(root, "a", "b", "three.txt"), "w") as f:
+        f.write("333")
+    catalog.refresh()
+    assert catalog.scanned == 1
+    assert [entry["name"] for entry in catalog.find(root, "*.txt")] == ["three.txt", "one.txt"]
+
+
+def test_refresh_removed_dir(catalog):
+    """Test removed directory subtree is removed from catalog"""
+    root = catalog.get_root()
+    catalog.refresh()
+    os.remove(os.path.join(root, "a", "b", "two.txt"))
+    os.rmdir(os.path.join(root, "a", "b"))
+    assert [entry["path"] for entry in catalog.find(root, "*", files_only=False)] == ["a", "a/one.txt", "root.md"]
+
+
+def test_get_id(catalog, tmp_path):
+    """Test catalog path"""
+    root = catalog.get_root()
+    assert catalog.get_id(root) == ""
+    assert catalog.get_id(os.path.join(root, "a", "b")) == "a/b"
+    assert catalog.get_id(str(tmp_path / "other")) is None
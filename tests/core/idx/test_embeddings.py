@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 09:00:00                  #
+# ================================================== #
+
+import os
+from unittest.mock import MagicMock
+
+from llama_index.core.embeddings import MockEmbedding
+
+from tests.mocks import mock_window
+from pygpt_net.core.idx.embeddings import EmbeddingCache, CachedEmbedding
+
+
+def test_get_put(mock_window, tmp_path):
+    """Test get and put embeddings"""
+    cache = EmbeddingCache(mock_window)
+    cache.get_path = MagicMock(return_value=os.path.join(str(tmp_path), "embeddings.db"))
+    cache.put_many("openai:test", {"text1": [0.1, 0.2], "text2": [0.3, 0.4]})
+    found = cache.get_many("openai:test", ["text1", "text3"])
+    assert found == {"text1": [0.1, 0.2]}
+    assert cache.get_many("other:test", ["text1"]) == {}
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_evict(mock_window, tmp_path):
+    """Test eviction of least recently used embeddings"""
+    cache = EmbeddingCache(mock_window)
+    cache.get_path = MagicMock(return_value=os.path.join(str(tmp_path), "embeddings.db"))
+    cache.get_limit = MagicMock(return_value=8 * 100 * 3)  # 3 vectors
+    cache.put_many("test", {"text1": [0.1] * 100})
+    cache.put_many("test", {"text2": [0.2] * 100})
+    cache.put_many("test", {"text3": [0.3] * 100})
+    cache.put_many("test", {"text4": [0.4] * 100})
+    assert cache.get_size() <= 8 * 100 * 3
+    found = cache.get_many("test", ["text1", "text2", "text3", "text4"])
+    assert "text1" not in found
+    assert "text4" in found
+
+
+def test_cached_embedding(mock_window, tmp_path):
+    """Test cached embeddings model"""
+    cache = EmbeddingCache(mock_window)
+    cache.get_path = MagicMock(return_value=os.path.join(str(tmp_path), "embeddings.db"))
+    model = MockEmbedding(embed_dim=4)
+    embed_model = CachedEmbedding(embed_model=model, cache=cache, model_id="mock")
+    first = embed_model.get_text_embedding_batch(["a", "b", "a"])
+    second = embed_model.get_text_embedding_batch(["a", "b"])
+    assert first[:2] == second
+    assert cache.misses == 2  # a and b embedded once
+    assert cache.hits == 2
+
+
+def test_cached_embedding_no_model_name(mock_window):
+    """Test cached embeddings model without model name"""
+    model = MagicMock()
+    model.model_name = None
+    model.embed_batch_size = 10
+    model.callback_manager = None
+    embed_model = CachedEmbedding(embed_model=model, cache=EmbeddingCache(mock_window), model_id="mock")
+    assert embed_model.model_name == "MagicMock"
+
+
+def test_workdir_changed(mock_window, tmp_path):
+    """Test database is reopened after workdir change"""
+    cache = EmbeddingCache(mock_window)
+    cache.get_path = MagicMock(return_value=os.path.join(str(tmp_path), "old", "embeddings.db"))
+    cache.put_many("test", {"text1": [0.1, 0.2]})
+    old_engine = cache.get_db()
+    old_engine.dispose = MagicMock()
+    cache.get_path = MagicMock(return_value=os.path.join(str(tmp_path), "new", "embeddings.db"))
+    assert cache.get_many("test", ["text1"]) == {}
+    assert cache.get_db() is not old_engine
+    old_engine.dispose.assert_called_once()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.23 19:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import os
@@ -16,6 +16,8 @@ from llama_index.core import Document
 
 from tests.mocks import mock_window
 from pygpt_net.core.idx import Indexing
+from pygpt_net.core.idx.types.files import Files
+from pygpt_net.provider.loaders.file_json import Loader as JsonLoader
 
 
 def test_get_online_loader(mock_window):
@@ -110,6 +112,142 @@ def test_index_files_in_directory(mock_window):
     assert errors == []
 
 
+def test_index_files_skip_unchanged(mock_window):
+    """Test skip unchanged files"""
+    index = MagicMock()
+    path = "file.pdf"
+    idx = Indexing(mock_window)
+    idx.get_documents = MagicMock(return_value=[Document()])
+    idx.window.controller.idx = MagicMock()
+    idx.window.controller.idx.is_stopped = MagicMock(return_value=False)
+    idx.get_file_status = MagicMock(return_value="unchanged")
+    with patch("os.path.isdir") as mock_isdir:
+        mock_isdir.return_value = False
+        with patch("os.path.isfile") as mock_isfile:
+            mock_isfile.return_value = True
+            indexed, errors = idx.index_files("base", index, path, recursive=False)
+    assert indexed == {}
+    assert errors == []
+    assert idx.get_stats()["skipped"] == 1
+    idx.get_documents.assert_not_called()
+
+
+def test_read_files_parallel(mock_window):
+    """Test parallel reading keeps order and per-file errors"""
+    mock_window.core.config.set("llama.idx.workers", 3)
+    idx = Indexing(mock_window)
+    idx.window.controller.idx = MagicMock()
+    idx.window.controller.idx.is_stopped = MagicMock(return_value=False)
+    idx.get_file_status = MagicMock(side_effect=lambda i, f, t: "unchanged" if f == "skip.txt" else "new")
+
+    def get_documents(path):
+        if path == "error.txt":
+            raise Exception("error: " + path)
+        return [Document(text=path)]
+
+    idx.get_documents = MagicMock(side_effect=get_documents)
+    files = ["a.txt", "error.txt", "skip.txt", "b.txt", "c.txt", "d.txt", "e.txt", "f.txt"]
+    result = list(idx.read_files("base", files))
+    assert [r[0] for r in result] == ["a.txt", "error.txt", "b.txt", "c.txt", "d.txt", "e.txt", "f.txt"]
+    assert str(result[1][3]) == "error: error.txt"
+    assert result[1][2] == []
+    assert result[0][2][0].text == "a.txt"
+    assert idx.get_stats()["skipped"] == 1
+
+
+def test_read_files_process(mock_window, tmp_path):
+    """Test CPU-bound loaders are run in worker processes"""
+    mock_window.core.config.set("llama.idx.workers", 2)
+    mock_window.core.config.is_compiled = MagicMock(return_value=False)
+    mock_window.core.platforms.is_snap = MagicMock(return_value=False)
+    mock_window.core.filesystem.packer.is_archive = MagicMock(return_value=False)
+    idx = Indexing(mock_window)
+    idx.window.controller.idx = MagicMock()
+    idx.window.controller.idx.is_stopped = MagicMock(return_value=False)
+    idx.get_file_status = MagicMock(return_value="new")
+    idx.is_excluded = MagicMock(return_value=False)
+    idx.is_excluded_path = MagicMock(return_value=False)
+    idx.get_loader_arguments = MagicMock(return_value={})
+    idx.register_loader(JsonLoader())
+    idx.get_documents = MagicMock(return_value=[Document(text="thread")])
+
+    files = []
+    for name, data in [("a.json", '{"a": 1}'), ("b.txt", "b"), ("c.json", "{")]:
+        path = tmp_path / name
+        path.write_text(data)
+        files.append(str(path))
+    assert idx.get_process_args(files[0]) == ("pygpt_net.provider.loaders.file_json", "Loader", {})
+    assert idx.get_process_args(files[1]) is None
+
+    result = list(idx.read_files("base", files))
+    assert [r[0] for r in result] == files
+    assert '"a": 1' in result[0][2][0].text
+    assert result[1][2][0].text == "thread"
+    assert result[2][3] is not None  # invalid JSON, error from worker process
+    idx.get_documents.assert_called_once_with(files[1])
+    mock_window.core.idx.metadata.append_file_metadata.assert_any_call(result[0][2], files[0])
+
+
+def test_index_document_batch(mock_window):
+    """Test batched documents insert"""
+    mock_window.core.config.set("llama.idx.embeddings.batch_size", 3)
+    mock_window.core.config.set("llama.idx.embeddings.limit.rpm", 0)
+    idx = Indexing(mock_window)
+    index = MagicMock()
+    index._transformations = []
+    index._embed_model.embed_batch_size = 2
+    index._embed_model.get_text_embedding_batch = MagicMock(
+        side_effect=lambda texts: [[0.1, 0.2] for _ in texts]
+    )
+    docs = []
+    for i in range(4):
+        doc = Document(text="test {}".format(i))
+        docs.append(doc)
+        idx.index_document(index, doc)
+    index.insert.assert_not_called()
+    assert idx.flush_documents(index, force=False) is True  # batch is full
+    assert idx.flush_documents(index, force=False) is False  # empty buffer
+    assert index._embed_model.get_text_embedding_batch.call_count == 2  # 2 nodes per API call
+    index.insert_nodes.assert_called_once_with(docs)
+    assert all(doc.embedding == [0.1, 0.2] for doc in docs)
+
+
+def test_flush_pending_error(mock_window):
+    """Test pending items dropped on insert error"""
+    idx = Indexing(mock_window)
+    index = MagicMock()
+    idx.flush_documents = MagicMock(side_effect=Exception("error"))
+    pending = {"file.txt": "test_id"}
+    errors = []
+    assert idx.flush_pending(index, pending, errors) == {}
+    assert pending == {}
+    assert errors == ["error"]
+
+
+def test_files_is_changed(mock_window, tmp_path):
+    """Test file changed check"""
+    file = tmp_path / "file.txt"
+    file.write_text("test")
+    provider = MagicMock()
+    files = Files(mock_window, provider)
+    state = files.get_state(str(file))
+
+    provider.get_file_state = MagicMock(return_value=None)
+    assert files.is_changed("store", "base", "file.txt", str(file)) is True  # not indexed
+
+    provider.get_file_state = MagicMock(return_value=dict(state))
+    assert files.is_changed("store", "base", "file.txt", str(file)) is False  # same size and mtime
+
+    stored = dict(state)
+    stored["mtime"] = 0
+    provider.get_file_state = MagicMock(return_value=stored)
+    assert files.is_changed("store", "base", "file.txt", str(file)) is False  # touched only
+    provider.update_file_state.assert_called_once()
+
+    stored["hash"] = "other"
+    assert files.is_changed("store", "base", "file.txt", str(file)) is True  # content changed
+
+
 def test_get_db_data_from_ts(mock_window):
     """Test get db data from ts"""
     idx = Indexing(mock_window)
@@ -131,6 +269,7 @@ def test_get_db_data_from_ts(mock_window):
         mock_window.core.db.get_db = mock_get_db
         mock_get_db.return_value.connect.return_value.__enter__.return_value = conn
         documents = idx.get_db_data_from_ts(updated_ts)
+    mock_window.core.ctx.writer.flush.assert_called_once()  # queued writes committed before read
     assert documents[0].text == 'User: user_input1; Assistant: assistant_output1'
     assert documents[1].text == 'User: user_input2; Assistant: assistant_output2'
 
@@ -152,6 +291,7 @@ def test_get_db_data_by_id(mock_window):
         mock_window.core.db.get_db = mock_get_db
         mock_get_db.return_value.connect.return_value.__enter__.return_value = conn
         documents = idx.get_db_data_by_id(id)
+    mock_window.core.ctx.writer.flush.assert_called_once()  # queued writes committed before read
     assert documents[0].text == 'User: user_input1; Assistant: assistant_output1'
     assert documents[1].text == 'User: user_input2; Assistant: assistant_output2'
 
@@ -185,3 +325,39 @@ def test_index_db_from_updated_ts(mock_window):
     indexed, errors = idx.index_db_from_updated_ts("base", index, 123)
     assert indexed == 1
     assert errors == []
+
+
+def test_register_loader_lazy(mock_window):
+    """Test reader is created on first use"""
+    idx = Indexing(mock_window)
+    mock_window.core.config.is_compiled = MagicMock(return_value=False)
+    mock_window.core.platforms.is_snap = MagicMock(return_value=False)
+    reader = MagicMock()
+    loader = MagicMock()
+    loader.id = "test"
+    loader.type = ["file"]
+    loader.extensions = ["pdf", "txt"]
+    loader.allow_compiled = True
+    loader.get = MagicMock(return_value=reader)
+    idx.register_loader(loader)
+    loader.get.assert_not_called()
+    assert "pdf" in idx.loaders["file"]
+    assert idx.get_reader("file", "pdf") == reader
+    assert idx.get_reader("file", "txt") == reader
+    loader.get.assert_called_once()
+
+
+def test_get_reader_import_error(mock_window):
+    """Test loader with missing dependencies is unregistered on first use"""
+    idx = Indexing(mock_window)
+    mock_window.core.config.is_compiled = MagicMock(return_value=False)
+    mock_window.core.platforms.is_snap = MagicMock(return_value=False)
+    loader = MagicMock()
+    loader.id = "test"
+    loader.type = ["file"]
+    loader.extensions = ["pdf"]
+    loader.allow_compiled = True
+    loader.get = MagicMock(side_effect=ImportError("missing"))
+    idx.register_loader(loader)
+    assert idx.get_reader("file", "pdf") is None
+    assert "pdf" not in idx.loaders["file"]
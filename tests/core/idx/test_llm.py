@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.23 19:00:00                  #
+# Updated Date: 2025.01.21 04:00:00                  #
 # ================================================== #
 
 import os
@@ -41,3 +41,34 @@ def test_get(mock_window):
     llm.get(model)
     provider.init.assert_called_once()
     provider.llama.assert_called_once()
+
+
+def test_get_shared(mock_window):
+    """Test LLM instance is shared until model args change"""
+    model = ModelItem()
+    model.id = "test"
+    provider = MagicMock()
+    provider.llama = MagicMock(side_effect=lambda **kwargs: MagicMock())
+    mock_window.core.llm.llms = {
+        "openai": provider
+    }
+    model.llama_index = {
+        "provider": "openai",
+        "args": [{"name": "model", "value": "gpt-4o", "type": "str"}],
+        "env": [{"name": "OPENAI_API_KEY", "value": "{api_key}"}],
+    }
+    llm = Llm(mock_window)
+    first = llm.get(model)
+    assert llm.get(model) is first
+    assert provider.init.call_count == 2  # ENV is always set
+    assert provider.llama.call_count == 1
+
+    mock_window.core.config.set("api_key", "new_api_key")
+    second = llm.get(model)
+    assert second is not first
+
+    model.llama_index["args"][0]["value"] = "gpt-4o-mini"
+    assert llm.get(model) is not second
+
+    llm.reset()
+    assert llm.instances == {}
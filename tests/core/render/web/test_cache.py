@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import tempfile
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.core.render.web.cache import RenderCache
+
+
+def prepare_cache(mock_window, options: dict) -> RenderCache:
+    config = {
+        "theme": "dark",
+        "lang": "en",
+        "render.code_syntax": "github-dark",
+        "render.cache.size": 1,
+        "render.cache.disk": False,
+    }
+    config.update(options)
+    mock_window.core.config.get = MagicMock(side_effect=lambda key, default=None: config.get(key, default))
+    mock_window.core.config.get_user_path = MagicMock(return_value="/tmp/pygpt")
+    return RenderCache(window=mock_window)
+
+
+def test_get_put(mock_window):
+    """Test get and put"""
+    cache = prepare_cache(mock_window, {})
+    assert cache.get(1, 1, "text") is None
+    cache.put(1, 1, "text", "<p>text</p>")
+    assert cache.get(1, 1, "text") == "<p>text</p>"
+    assert cache.get(1, 1, "changed") is None
+    assert cache.get(1, 0, "text") is None  # other node type
+    assert cache.get(2, 1, "text") is None  # other item
+    assert cache.get(None, 1, "text") is None
+    assert cache.hits == 1
+
+
+def test_settings_key(mock_window):
+    """Test render settings in key"""
+    config = {}
+    cache = prepare_cache(mock_window, config)
+    cache.put(1, 1, "text", "<p>text</p>")
+    mock_window.core.config.get = MagicMock(side_effect=lambda key, default=None: {
+        "render.code_syntax": "monokai",
+        "render.cache.size": 1,
+    }.get(key, default))
+    assert cache.get(1, 1, "text") is None
+
+
+def test_lang_key(mock_window):
+    """Test language in key"""
+    cache = prepare_cache(mock_window, {})
+    cache.put(1, 1, "text", "<p>text</p>")
+    assert cache.get(1, 1, "text") == "<p>text</p>"
+    prepare_cache(mock_window, {"lang": "pl"})  # language switched
+    assert cache.get(1, 1, "text") is None
+
+
+def test_invalidate(mock_window):
+    """Test invalidate"""
+    cache = prepare_cache(mock_window, {})
+    cache.put(1, 0, "input", "<p>input</p>")
+    cache.put(1, 1, "output", "<p>output</p>")
+    cache.put(2, 1, "output", "<p>output</p>")
+    cache.invalidate(1)
+    assert cache.get(1, 0, "input") is None
+    assert cache.get(1, 1, "output") is None
+    assert cache.get(2, 1, "output") == "<p>output</p>"
+    assert cache.size == len("<p>output</p>")
+
+
+def test_evict_spill(mock_window):
+    """Test LRU eviction and spill to disk"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = prepare_cache(mock_window, {"render.cache.disk": True})
+        cache.get_path = MagicMock(return_value=tmp_dir)
+        html = "x" * (400 * 1024)
+        cache.put(1, 1, "a", html)
+        cache.put(2, 1, "b", html)
+        assert cache.get(1, 1, "a") == html  # a is now most recently used
+        cache.put(3, 1, "c", html)
+        assert 2 not in cache.ids
+        assert cache.size == 800 * 1024
+
+        # loaded from disk
+        assert cache.get(2, 1, "b") == html
+        assert 2 in cache.ids
+
+        cache.invalidate(2)
+        cache.clear()
+        assert cache.get(2, 1, "b") is None
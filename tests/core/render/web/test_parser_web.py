@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 09:00:00                  #
+# ================================================== #
+
+from pygpt_net.core.render.web.parser import Parser
+
+
+def test_get_completed_offset_paragraphs():
+    parser = Parser()
+    text = "First paragraph\n\nSecond paragraph\n\nThird\n"
+    offset = parser.get_completed_offset(text)
+    assert text[:offset] == "First paragraph\n\nSecond paragraph\n\n"
+    assert text[offset:] == "Third\n"
+
+
+def test_get_completed_offset_unconfirmed():
+    parser = Parser()
+    assert parser.get_completed_offset("") == 0
+    assert parser.get_completed_offset("Some text") == 0
+    assert parser.get_completed_offset("Some text\n\nNext") == 0  # next line not completed yet
+
+
+def test_get_completed_offset_code_fence():
+    parser = Parser()
+    text = "Code:\n\n```python\nx = 1\n\ny = 2\n```\nafter"
+    offset = parser.get_completed_offset(text)
+    assert text[:offset] == "Code:\n\n```python\nx = 1\n\ny = 2\n```\n"
+
+    # open fence is never split
+    text = "Code:\n\n```python\nx = 1\n\ny = 2\n"
+    offset = parser.get_completed_offset(text)
+    assert text[:offset] == "Code:\n\n"
+
+
+def test_get_completed_offset_lists():
+    parser = Parser()
+    text = "- a\n\n- b\n\n"
+    assert parser.get_completed_offset(text) == 0  # list may be continued
+    text = "- a\n\n- b\n\nNext\n"
+    offset = parser.get_completed_offset(text)
+    assert text[:offset] == "- a\n\n- b\n\n"
+
+
+def test_get_completed_offset_math():
+    parser = Parser()
+    text = "$$\nx\n\ny\n$$\n\nz\n"
+    offset = parser.get_completed_offset(text)
+    assert text[:offset] == "$$\nx\n\ny\n$$\n\n"
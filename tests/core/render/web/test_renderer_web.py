@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 23:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.core.render.web.renderer import Renderer
+from pygpt_net.item.ctx import CtxItem, CtxMeta
+
+
+def prepare_renderer(mock_window, size: int) -> Renderer:
+    renderer = Renderer(mock_window)
+    renderer.get_pid = MagicMock(return_value=1)
+    renderer.get_window_size = MagicMock(return_value=size)
+    renderer.init = MagicMock()
+    renderer.reset = MagicMock()
+    renderer.update_names = MagicMock()
+    renderer.append_context_item = MagicMock()
+    return renderer
+
+
+def prepare_items(num: int) -> list:
+    items = []
+    for i in range(num):
+        item = CtxItem()
+        item.id = i + 1
+        items.append(item)
+    return items
+
+
+def get_rendered(renderer: Renderer) -> list:
+    return [call.args[1] for call in renderer.append_context_item.call_args_list]
+
+
+def test_append_context_window(mock_window):
+    """Test render only the last window of items"""
+    renderer = prepare_renderer(mock_window, 3)
+    items = prepare_items(10)
+    renderer.append_context(CtxMeta(), items)
+    assert renderer.pids[1].offset == 7
+    assert get_rendered(renderer) == items[7:]
+    assert renderer.append_context_item.call_args_list[0].kwargs["prev_ctx"] == items[6]
+
+    renderer = prepare_renderer(mock_window, 0)  # disabled
+    renderer.append_context(CtxMeta(), items)
+    assert renderer.pids[1].offset == 0
+    assert get_rendered(renderer) == items
+
+
+def test_load_more(mock_window):
+    """Test render previous pages"""
+    renderer = prepare_renderer(mock_window, 3)
+    items = prepare_items(8)
+    renderer.append_context(CtxMeta(), items)
+    renderer.pids[1].loaded = True
+    page = mock_window.core.ctx.output.get_by_pid.return_value.page.return_value
+
+    renderer.append_context_item.reset_mock()
+    renderer.load_more(1)
+    assert renderer.pids[1].offset == 2
+    assert get_rendered(renderer) == items[2:5]
+    js = page.runJavaScript.call_args.args[0]
+    assert js.startswith("prependNodes(") and js.endswith(", true);")
+
+    renderer.append_context_item.reset_mock()
+    renderer.load_more(1)
+    assert renderer.pids[1].offset == 0
+    assert get_rendered(renderer) == items[:2]
+    assert items[0].first
+    assert page.runJavaScript.call_args.args[0].endswith(", false);")
+
+    renderer.append_context_item.reset_mock()
+    renderer.load_more(1)  # nothing more to load
+    renderer.append_context_item.assert_not_called()
+    assert page.runJavaScript.call_args.args[0] == "setHasMore(false);"
+
+
+def test_trim(mock_window):
+    """Test remove far-off items"""
+    renderer = prepare_renderer(mock_window, 3)
+    items = prepare_items(8)
+    renderer.append_context(CtxMeta(), items)
+    renderer.pids[1].loaded = True
+    renderer.load_more(1)
+    assert renderer.pids[1].offset == 2
+
+    page = mock_window.core.ctx.output.get_by_pid.return_value.page.return_value
+    renderer.trim(1)
+    args = page.runJavaScript.call_args.args
+    assert args[0] == "trimNodes(6);"
+    args[2](True)  # JS callback
+    assert renderer.pids[1].offset == 5
+
+
+def test_format_text_cache(mock_window):
+    """Test format text from cache"""
+    renderer = Renderer(mock_window)
+    renderer.cache.get_limit = MagicMock(return_value=1024 * 1024)
+    renderer.parser.parse = MagicMock(return_value="<p>Hello</p>")
+    renderer.helpers.pre_format_text = MagicMock(side_effect=lambda text: text)
+    renderer.helpers.post_format_text = MagicMock(side_effect=lambda text: text)
+    ctx = CtxItem()
+    ctx.id = 1
+    assert renderer.format_text(ctx, "Hello", Renderer.NODE_OUTPUT) == "<p>Hello</p>"
+    assert renderer.format_text(ctx, "Hello", Renderer.NODE_OUTPUT) == "<p>Hello</p>"
+    renderer.parser.parse.assert_called_once()
+
+    ctx.output_timestamp = 1700000000
+    ctx.input_timestamp = 1700000000
+    renderer.format_text(ctx, "Hello", Renderer.NODE_OUTPUT)  # timestamp changed
+    assert renderer.parser.parse.call_count == 2
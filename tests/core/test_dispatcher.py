@@ -6,11 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2025.01.20 18:00:00                  #
 # ================================================== #
 
 import json
 import os
+import time
 from unittest.mock import MagicMock, patch
 
 from tests.mocks import mock_window
@@ -29,6 +30,74 @@ def test_dispatch(mock_window):
     assert event.name == 'test'
 
 
+def test_dispatch_subscribed(mock_window):
+    """Test dispatch to plugins with declared events"""
+    dispatcher = Dispatcher(mock_window)
+    dispatcher.apply = MagicMock()
+    plugin1 = MagicMock()
+    plugin1.events = [Event.CMD_EXECUTE]
+    plugin2 = MagicMock()
+    plugin2.events = None  # not declared, receives all
+    plugin3 = MagicMock()
+    plugin3.events = [Event.SYSTEM_PROMPT, Event.CMD_EXECUTE]
+    mock_window.core.plugins.plugins = {'test1': plugin1, 'test2': plugin2, 'test3': plugin3}
+    mock_window.controller.plugins.is_enabled = MagicMock(return_value=True)
+
+    affected, event = dispatcher.dispatch(Event(Event.CMD_EXECUTE))
+    assert affected == ['test1', 'test2', 'test3']
+    affected, event = dispatcher.dispatch(Event(Event.SYSTEM_PROMPT))
+    assert affected == ['test2', 'test3']
+    affected, event = dispatcher.dispatch(Event('test'))
+    assert affected == ['test2']
+    affected, event = dispatcher.dispatch(Event('test'), all=True)
+    assert affected == ['test1', 'test2', 'test3']
+
+    # disable plugin
+    mock_window.controller.plugins.is_enabled = MagicMock(side_effect=lambda id: id != 'test3')
+    dispatcher.reset()
+    affected, event = dispatcher.dispatch(Event(Event.SYSTEM_PROMPT))
+    assert affected == ['test2']
+
+
+def test_dispatch_benchmark(mock_window):
+    """
+    Benchmark per-event dispatch cost against plugins count (run with -s to see results)
+
+    Every plugin handles 2 events, dispatched event is handled by 2 of them
+    """
+    class Plugin:
+        def __init__(self, events):
+            self.events = events
+            self.calls = 0
+
+        def handle(self, event):
+            self.calls += 1
+
+    mock_window.controller.plugins.is_enabled = lambda id: True
+    mock_window.core.config.get = MagicMock(return_value=False)
+    rounds = 1000
+    for count in [5, 15, 30, 60]:
+        results = {}
+        for mode in ["broadcast", "subscribed"]:
+            plugins = {}
+            for i in range(count):
+                events = ["test.{}".format(i if i > 1 else 0), "other.{}".format(i)]
+                plugins["plugin_{}".format(i)] = Plugin(events if mode == "subscribed" else None)
+            mock_window.core.plugins.plugins = plugins
+            dispatcher = Dispatcher(mock_window)
+            begin = time.perf_counter()
+            for _ in range(rounds):
+                dispatcher.dispatch(Event("test.0"))
+            results[mode] = (time.perf_counter() - begin) / rounds * 1000000
+            calls = sum(plugin.calls for plugin in plugins.values())
+            if mode == "subscribed":
+                assert calls == rounds * 2
+            else:
+                assert calls == rounds * count
+        print("\nplugins: {}, broadcast: {:.1f} us/event, subscribed: {:.1f} us/event".format(
+            count, results["broadcast"], results["subscribed"]))
+
+
 def test_apply(mock_window):
     """Test apply"""
     dispatcher = Dispatcher(mock_window)
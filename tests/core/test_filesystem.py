@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import os
@@ -155,3 +155,35 @@ def test_is_schema(mock_window):
     assert result is False
 
 
+
+
+def test_get_db_size(mock_window):
+    """Test get db size (WAL sidecars included)"""
+    filesystem = Filesystem(mock_window)
+    with patch('os.path.exists', return_value=True), \
+            patch('os.path.getsize', return_value=10):
+        assert filesystem.get_db_size('workdir', human_readable=False) == 40
+
+
+def test_copy_workdir_without_db(mock_window):
+    """Test copy workdir without database"""
+    filesystem = Filesystem(mock_window)
+    files = ['db.sqlite', 'db.sqlite-wal', 'db.sqlite-shm', 'db.sqlite.backup', 'config.json']
+    with patch('os.path.isdir', side_effect=lambda p: p == 'workdir'), \
+            patch('os.listdir', return_value=files), \
+            patch('os.path.exists', return_value=False), \
+            patch('shutil.copy2') as copy2, \
+            patch('builtins.open'):
+        filesystem.copy_workdir('workdir', 'new', copy_db=False)
+    copy2.assert_called_once_with(os.path.join('workdir', 'config.json'), os.path.join('new', 'config.json'))
+
+
+def test_clear_workdir_keep_db(mock_window):
+    """Test clear workdir keeping database"""
+    filesystem = Filesystem(mock_window)
+    files = ['db.sqlite', 'db.sqlite-wal', 'db.sqlite-shm', 'config.json']
+    with patch('os.listdir', return_value=files), \
+            patch('os.path.isfile', return_value=True), \
+            patch('os.remove') as remove:
+        filesystem.clear_workdir('workdir', remove_db=False)
+    remove.assert_called_once_with(os.path.join('workdir', 'config.json'))
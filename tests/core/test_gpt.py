@@ -6,15 +6,19 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2025.01.21 04:00:00                  #
 # ================================================== #
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
 
 from pygpt_net.core.bridge.context import BridgeContext
 from pygpt_net.provider.gpt import Gpt
 from tests.mocks import mock_window_conf
 
+
 def mock_get(key):
     if key == "use_context":
         return True
@@ -50,3 +54,86 @@ def test_quick_call(mock_window_conf):
         context=bridge_context,
     )
     assert response == 'test_response'
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+    connections = set()
+
+    def do_POST(self):
+        self.connections.add(self.client_address)
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({
+            "id": "test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "test_response"},
+                "finish_reason": "stop",
+            }],
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_get_client_shared(mock_window_conf):
+    """
+    Test client is shared between calls and recreated on API config change
+    """
+    config = {
+        "api_key": "test_key",
+        "organization_key": "",
+        "api_endpoint": "",
+        "api_proxy": "",
+    }
+    gpt = Gpt(mock_window_conf)
+    gpt.window.core.config.get.side_effect = lambda key, default=None: config.get(key, default)
+    gpt.window.core.config.has.side_effect = lambda key: key in config
+    client = gpt.get_client()
+    assert gpt.get_client() is client
+
+    config["api_key"] = "new_key"
+    new_client = gpt.get_client()
+    assert new_client is not client
+    assert new_client.api_key == "new_key"
+
+    gpt.reset_clients()
+    assert gpt.get_client() is not new_client
+
+
+def test_get_client_keep_alive(mock_window_conf):
+    """
+    Test requests reuse connection (mock API server)
+    """
+    MockApiHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = {
+        "api_key": "test_key",
+        "organization_key": "",
+        "api_endpoint": "http://127.0.0.1:{}/v1".format(server.server_address[1]),
+        "api_proxy": "",
+    }
+    gpt = Gpt(mock_window_conf)
+    gpt.window.core.config.get.side_effect = lambda key, default=None: config.get(key, default)
+    gpt.window.core.config.has.side_effect = lambda key: key in config
+    try:
+        for i in range(3):
+            response = gpt.get_client().chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "test"}],
+            )
+            assert response.choices[0].message.content == "test_response"
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert len(MockApiHandler.connections) == 1
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 19:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock, patch
+
+from tests.mocks import mock_window
+from pygpt_net.core.scheduler import Scheduler
+
+
+def test_run_due(mock_window):
+    """Test run due jobs"""
+    scheduler = Scheduler(mock_window)
+    once = MagicMock()
+    periodic = MagicMock()
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=100.0):
+        scheduler.add("once", once, 500)
+        scheduler.add("periodic", periodic, 1000, repeat=True)
+        assert scheduler.get_next() == 100.5
+
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=100.6):
+        scheduler.run()
+    once.assert_called_once()
+    periodic.assert_not_called()
+    assert not scheduler.has("once")
+    assert scheduler.get_next() == 101.0
+
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=101.0):
+        scheduler.run()
+    periodic.assert_called_once()
+    assert scheduler.get_next() == 102.0
+
+    # missed intervals are skipped, not run in burst
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=110.5):
+        scheduler.run()
+    assert periodic.call_count == 2
+    assert scheduler.get_next() == 111.5
+
+
+def test_remove(mock_window):
+    """Test remove and replace jobs"""
+    scheduler = Scheduler(mock_window)
+    callback = MagicMock()
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=100.0):
+        scheduler.add("test", callback, 100, repeat=True)
+        scheduler.add("test", callback, 2000, repeat=True)  # replace
+        assert scheduler.get_next() == 102.0
+        scheduler.remove("test")
+        assert scheduler.get_next() is None
+        assert scheduler.get_ids() == []
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=200.0):
+        scheduler.run()
+    callback.assert_not_called()
+
+
+def test_arm(mock_window):
+    """Test timer armed for earliest deadline and stopped when empty"""
+    scheduler = Scheduler(mock_window)
+    scheduler.timer = MagicMock()
+    scheduler.timer.isActive = MagicMock(return_value=False)
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=100.0):
+        scheduler.add("a", MagicMock(), 5000)
+        scheduler.timer.start.assert_called_with(5000)
+        scheduler.add("b", MagicMock(), 300)
+        scheduler.timer.start.assert_called_with(300)
+        scheduler.remove("b")
+        scheduler.timer.start.assert_called_with(5000)
+        scheduler.remove("a")
+    scheduler.timer.stop.assert_called()
+
+
+def test_error(mock_window):
+    """Test error in callback does not stop other jobs"""
+    scheduler = Scheduler(mock_window)
+    callback = MagicMock()
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=100.0):
+        scheduler.add("error", MagicMock(side_effect=Exception("test")), 10)
+        scheduler.add("test", callback, 20)
+    with patch('pygpt_net.core.scheduler.time.monotonic', return_value=101.0):
+        scheduler.run()
+    callback.assert_called_once()
+    mock_window.core.debug.log.assert_called_once()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2025.01.21 09:00:00                  #
 # ================================================== #
 
 import os
@@ -123,6 +123,15 @@ def test_load_editor(mock_window):
             encoding='utf-8'
         )
         assert mock_window.ui.dialog['config.editor'].file == 'test.json'
+    mock_window.core.config.save.assert_not_called()
+
+
+def test_load_editor_config(mock_window):
+    """Test pending config changes are saved before config.json is loaded to editor"""
+    settings = Settings(mock_window)
+    with patch('builtins.open', mock_open(read_data='{}')):
+        settings.load_editor('config.json')
+    mock_window.core.config.save.assert_called_once_with(force=True)
 
 
 def test_save_editor(mock_window):
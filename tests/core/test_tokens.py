@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.02 11:00:00                  #
+# Updated Date: 2025.01.20 17:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch
@@ -88,6 +88,23 @@ def test_from_ctx():
         assert Tokens.from_ctx(item, 'chat', model) == 56
 
 
+def test_from_ctx_memo():
+    """Test from_ctx memoized count"""
+    item = CtxItem()
+    item.input = "This is a test"
+    item.output = "This is a second test"
+    model = "gpt-4-0613"
+    with patch('pygpt_net.core.tokens.Tokens.count_ctx', return_value=56) as count:
+        assert Tokens.from_ctx(item, 'chat', model) == 56
+        assert Tokens.from_ctx(item, 'vision', model) == 56
+        assert count.call_count == 1  # from memo
+        item.output = "Changed"
+        Tokens.from_ctx(item, 'chat', model)
+        assert count.call_count == 2
+        Tokens.from_ctx(item, 'chat', "gpt-3.5-turbo")
+        assert count.call_count == 3
+
+
 def test_get_config():
     """Test get_config"""
     model = "gpt-4-0613"
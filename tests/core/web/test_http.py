@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.core.web.http import Http
+
+
+def get_http(mock_window, tmp_path) -> Http:
+    mock_window.core.config.data['web.http.cache'] = True
+    mock_window.core.config.data['web.http.cache.size'] = 1
+    mock_window.core.config.data['web.http.pool.size'] = 2
+    mock_window.core.config.get_user_dir = MagicMock(return_value=str(tmp_path))
+    return Http(mock_window)
+
+
+def get_response(status_code: int, headers: dict, content: bytes = b"") -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers
+    response.content = content
+    return response
+
+
+def test_get_expires(mock_window, tmp_path):
+    """Test expiration time from headers"""
+    cache = get_http(mock_window, tmp_path).cache
+    assert cache.get_expires({"Cache-Control": "no-store", "ETag": "x"}) is None
+    assert cache.get_expires({"Cache-Control": "no-cache"}) == 0.0
+    assert cache.get_expires({"Cache-Control": "public, max-age=60"}) > time.time() + 50
+    assert cache.get_expires({"ETag": "x"}) == 0.0
+    assert cache.get_expires({"Content-Type": "text/html"}) is None
+
+
+def test_get_fresh(mock_window, tmp_path):
+    """Test fresh response is served from cache"""
+    http = get_http(mock_window, tmp_path)
+    http.request = MagicMock(return_value=get_response(200, {"Cache-Control": "max-age=60"}, b"page"))
+    first = http.get("https://example.com")
+    second = http.get("https://example.com")
+    assert http.request.call_count == 1
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.text == "page"
+    assert http.cache.hits == 1
+
+
+def test_get_revalidate(mock_window, tmp_path):
+    """Test conditional request and 304 response"""
+    http = get_http(mock_window, tmp_path)
+    http.request = MagicMock(return_value=get_response(200, {"ETag": '"v1"'}, b"page"))
+    http.get("https://example.com")
+    http.request = MagicMock(return_value=get_response(304, {"ETag": '"v1"'}))
+    response = http.get("https://example.com")
+    assert http.request.call_args[1]["headers"]["If-None-Match"] == '"v1"'
+    assert response.status_code == 200
+    assert response.content == b"page"
+    assert http.cache.revalidated == 1
+
+
+def test_get_not_cached(mock_window, tmp_path):
+    """Test errors and disabled cache are not stored"""
+    http = get_http(mock_window, tmp_path)
+    http.request = MagicMock(return_value=get_response(404, {"Cache-Control": "max-age=60"}, b"error"))
+    http.get("https://example.com")
+    http.get("https://example.com")
+    assert http.request.call_count == 2
+
+    mock_window.core.config.data['web.http.cache'] = False
+    http.request = MagicMock(return_value=get_response(200, {"Cache-Control": "max-age=60"}, b"page"))
+    http.get("https://example.com/page")
+    http.get("https://example.com/page")
+    assert http.request.call_count == 2
+
+
+def test_evict(mock_window, tmp_path):
+    """Test least recently used responses are removed over size limit"""
+    http = get_http(mock_window, tmp_path)
+    cache = http.cache
+    content = b"x" * (200 * 1024)
+    keys = []
+    for i in range(6):
+        key = cache.get_key("https://example.com/{}".format(i))
+        assert cache.store(key, "url", 200, {"ETag": "x"}, content)
+        keys.append(key)
+        time.sleep(0.01)
+    assert cache.get_size() <= cache.get_limit()
+    assert cache.load(keys[0]) is None  # oldest removed
+    assert cache.load(keys[-1]) is not None
+
+
+def test_get_session(mock_window, tmp_path):
+    """Test sessions share one connection pool"""
+    http = get_http(mock_window, tmp_path)
+    session = http.get_session()
+    assert session is not http.get_session()
+    assert session.get_adapter("https://example.com") is http.get_adapter()
+    assert http.get_session().get_adapter("http://example.com") is http.get_adapter()
+    http.reset()
+    assert http.get_session().get_adapter("https://example.com") is not session.get_adapter("https://example.com")
+
+
+def test_request_cookies(mock_window, tmp_path):
+    """Test cookies are not shared between requests"""
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "sid=secret; Path=/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        http = get_http(mock_window, tmp_path)
+        url = "http://127.0.0.1:{}/".format(server.server_port)
+        for i in range(2):
+            assert http.request("GET", url, timeout=5).status_code == 200
+        assert http.get(url, cache=False).status_code == 200
+        assert received == [None, None, None]
+        assert http.get_stats()["pools"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
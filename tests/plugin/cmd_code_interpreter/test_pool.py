@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.plugin.cmd_code_interpreter.pool import Pool
+
+
+@pytest.fixture
+def pool():
+    options = {
+        "python_cmd_tpl": '"' + sys.executable + '" {filename}',
+        "python_worker": True,
+        "python_worker_preload": "json, not_existing_module",
+        "python_worker_timeout": 10,
+        "python_worker_memory": 0,
+        "python_worker_max_runs": 2,
+        "python_worker_pool": 1,
+    }
+    plugin = MagicMock()
+    plugin.get_option_value = MagicMock(side_effect=lambda key: options[key])
+    pool = Pool(plugin)
+    pool.test_options = options
+    yield pool
+    pool.shutdown()
+
+
+def write(tmp_path, name, code):
+    path = tmp_path / name
+    path.write_text(code, encoding="utf-8")
+    return str(path)
+
+
+def test_execute_stream(pool, tmp_path):
+    """Test output is streamed and worker is reused"""
+    path = write(tmp_path, "a.py", "import sys\nprint('hello')\nprint('err', file=sys.stderr)\n")
+    output = []
+    stdout, stderr, status = pool.execute(path, callback=lambda data, type: output.append((type, data)))
+    assert status == "ok"
+    assert stdout == "hello\n"
+    assert "err\n" in stderr
+    assert ("stdout", "hello\n") in output
+    assert len(pool.get_workers()) == 1
+
+    worker = pool.get_workers()[0]
+    stdout, stderr, status = pool.execute(path)
+    assert status == "ok"
+    assert worker.runs == 2
+    assert worker not in pool.get_workers()  # recycled after max runs
+    assert len(pool.get_workers()) == 1  # replaced with warm worker
+
+
+def test_execute_clean_globals(pool, tmp_path):
+    """Test each run starts with clean globals"""
+    first = write(tmp_path, "a.py", "x = 1\n")
+    second = write(tmp_path, "b.py", "print('x' in globals())\n")
+    pool.execute(first)
+    stdout, stderr, status = pool.execute(second)
+    assert stdout == "False\n"
+
+
+def test_execute_patched_json(pool, tmp_path):
+    """Test user code replacing json functions does not break protocol"""
+    first = write(tmp_path, "a.py", "import json\njson.dumps = json.loads = lambda *a, **k: 'broken'\nprint('ok')\n")
+    second = write(tmp_path, "b.py", "print('next')\n")
+    stdout, stderr, status = pool.execute(first)
+    assert (stdout, status) == ("ok\n", "ok")
+    stdout, stderr, status = pool.execute(second)
+    assert (stdout, status) == ("next\n", "ok")
+
+
+def test_execute_error(pool, tmp_path):
+    """Test exception traceback"""
+    path = write(tmp_path, "a.py", "raise ValueError('test')\n")
+    stdout, stderr, status = pool.execute(path)
+    assert status == "error"
+    assert "ValueError: test" in stderr
+    assert "runpy" not in stderr
+
+
+def test_execute_timeout(pool, tmp_path):
+    """Test worker is killed on timeout"""
+    pool.test_options["python_worker_timeout"] = 1
+    path = write(tmp_path, "a.py", "import time\ntime.sleep(30)\n")
+    stdout, stderr, status = pool.execute(path)
+    assert status == "timeout"
+    assert len(pool.get_workers()) == 1  # replaced with warm worker
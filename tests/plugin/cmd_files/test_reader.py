@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 07:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.plugin.cmd_files.reader import Reader
+
+
+@pytest.fixture
+def reader():
+    plugin = MagicMock()
+    plugin.window.core.tokens.from_str = MagicMock(side_effect=lambda text: len(text.split()))
+    return Reader(plugin)
+
+
+@pytest.fixture
+def path(tmp_path):
+    file = tmp_path / "test.log"
+    file.write_bytes("".join("line {}\n".format(i) for i in range(1, 101)).encode("utf-8"))
+    return str(file)
+
+
+def test_read_range(reader, path):
+    """Test bytes range"""
+    assert reader.read_range(path, 0, 6) == ("line 1", False)
+    assert reader.read_range(path, -4) == ("100\n", False)
+    assert reader.read_range(path, 0, 0, max_size=4) == ("line", True)
+
+
+def test_read_lines(reader, path):
+    """Test lines range, head and tail"""
+    assert reader.read_lines(path, 2, 3) == ("line 2\nline 3\n", False)
+    assert reader.read_lines(path, 1, 2) == ("line 1\nline 2\n", False)
+    assert reader.read_lines(path, 100, 200) == ("line 100\n", False)
+    assert reader.read_lines(path, 101) == ("", False)
+    assert reader.tail(path, 2) == ("line 99\nline 100\n", False)
+    assert reader.tail(path, 500)[0].startswith("line 1\n")
+
+
+def test_grep(reader, path):
+    """Test grep with context lines"""
+    result, truncated = reader.grep(path, r"line (5|8|50)$", context=1)
+    assert result == "4-line 4\n5:line 5\n6-line 6\n7-line 7\n8:line 8\n9-line 9\n--\n" \
+                     "49-line 49\n50:line 50\n51-line 51"
+    assert not truncated
+    assert reader.grep(path, "LINE 10$", ignore_case=True) == ("10:line 10", False)
+    assert reader.grep(path, "line", max_size=20) == ("1:line 1\n2:line 2\n3:line 3", True)
+
+
+def test_read(reader, path):
+    """Test partial read with tokens budget"""
+    assert reader.is_partial({"path": path, "tail": 1})
+    assert not reader.is_partial({"path": path})
+    content, note = reader.read(path, {"grep": "^line 9$"})
+    assert content == "9:line 9"
+    assert note is None
+    content, note = reader.read(path, {"head": 10}, max_tokens=4)
+    assert content.split() == ["line", "1", "line"]
+    assert "truncated" in note
+    content, note = reader.read(path, {"grep": "missing"})
+    assert content == "No matches found"
+
+
+def test_empty_file(reader, tmp_path):
+    """Test empty file"""
+    file = tmp_path / "empty.txt"
+    file.write_bytes(b"")
+    assert reader.read_range(str(file)) == ("", False)
+    assert reader.tail(str(file), 5) == ("", False)
+    assert reader.grep(str(file), ".*") == ("", False)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 08:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from pygpt_net.plugin.cmd_files.worker import Worker
+
+
+def get_worker(cmds: list, workers: int = 4, options: dict = None) -> Worker:
+    read_only = ["read_file", "list_dir"]
+    options = options or {}
+    worker = Worker()
+    worker.plugin = MagicMock()
+    worker.plugin.get_option_value = MagicMock(side_effect=lambda key: options.get(key, False))
+    worker.plugin.window.core.config.get = MagicMock(return_value=workers)
+    worker.plugin.window.controller.kernel.stopped = MagicMock(return_value=False)
+    worker.plugin.is_cmd_read_only = MagicMock(side_effect=lambda cmd: cmd in read_only)
+    worker.cmds = cmds
+    return worker
+
+
+def test_run_cmds_parallel():
+    """Test read-only commands are executed concurrently, results in order"""
+    cmds = [{"cmd": "read_file", "params": {"path": str(i)}} for i in range(4)]
+    worker = get_worker(cmds)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def handle(item):
+        with lock:
+            active.append(item)
+            peak.append(len(active))
+        time.sleep(0.05 * (4 - int(item["params"]["path"])))
+        with lock:
+            active.remove(item)
+        return worker.make_response(item, item["params"]["path"])
+
+    responses = worker.run_cmds(handle)
+    assert max(peak) > 1
+    assert [response["result"] for response in responses] == ["0", "1", "2", "3"]
+
+
+def test_run_cmds_serialized():
+    """Test commands with side effects wait for previous commands"""
+    cmds = [
+        {"cmd": "read_file", "params": {"path": "a"}},
+        {"cmd": "save_file", "params": {"path": "a"}},
+        {"cmd": "read_file", "params": {"path": "b"}},
+        {"cmd": "list_dir", "params": {"path": "c"}},
+    ]
+    worker = get_worker(cmds)
+    events = []
+
+    def handle(item):
+        events.append(("start", item["cmd"]))
+        if item["cmd"] == "read_file" and item["params"]["path"] == "a":
+            time.sleep(0.1)
+        events.append(("end", item["cmd"]))
+        if item["cmd"] == "list_dir":
+            raise ValueError("test")
+        return worker.make_response(item, "OK")
+
+    responses = worker.run_cmds(handle)
+    save = events.index(("start", "save_file"))
+    assert events.index(("end", "read_file")) < save  # first read finished before save
+    assert events.index(("end", "save_file")) < events.index(("start", "list_dir"))
+    assert [response["request"]["cmd"] for response in responses] == ["read_file", "save_file", "read_file", "list_dir"]
+    assert responses[-1]["result"] == "Error: test"
+
+
+def test_run_cmds_sequential():
+    """Test sequential execution if disabled"""
+    cmds = [{"cmd": "read_file", "params": {"path": str(i)}} for i in range(3)]
+    worker = get_worker(cmds, workers=1)
+    threads = set()
+
+    def handle(item):
+        threads.add(threading.get_ident())
+        return None if item["params"]["path"] == "1" else worker.make_response(item, "OK")
+
+    responses = worker.run_cmds(handle)
+    assert threads == {threading.get_ident()}
+    assert len(responses) == 2
+
+
+def test_build_tree():
+    """Test tree with depth and limit"""
+    worker = get_worker([])
+    entries = {
+        "": (["root.md"], [("a", "a"), ("c", "c")]),
+        "a": (["one.txt", "two.txt"], [("a/b", "b")]),
+        "a/b": (["three.txt"], []),
+        "c": ([], []),
+    }
+    tree, tree_str = worker.build_tree("", "data", lambda key: entries[key])
+    assert tree_str == "data/\n    root.md\n    a/\n        one.txt\n        two.txt\n" \
+                       "        b/\n            three.txt\n    c/\n"
+    assert tree["b"] == ["three.txt"]
+
+    tree, tree_str = worker.build_tree("", "data", lambda key: entries[key], depth=1)
+    assert tree_str == "data/\n    root.md\n    a/\n    c/\n"
+
+    tree, tree_str = worker.build_tree("", "data", lambda key: entries[key], limit=4)
+    assert "three.txt" not in tree_str
+    assert "limit of 4 entries reached" in tree_str
+
+
+def test_get_limit():
+    """Test entries limit"""
+    worker = get_worker([])
+    worker.plugin.get_option_value = MagicMock(return_value=100)
+    assert worker.get_limit({"params": {}}) == 100
+    assert worker.get_limit({"params": {"limit": 10}}) == 10
+    assert worker.get_limit({"params": {"limit": 1000}}) == 100
+    assert worker.apply_limit(["a", "b", "c"], 2)[:2] == ["a", "b"]
+    assert len(worker.apply_limit(["a", "b", "c"], 2)) == 3
+
+
+def test_is_read_only_indexing():
+    """Test read_file is not executed concurrently if read files are indexed"""
+    item = {"cmd": "read_file", "params": {"path": "a"}}
+    assert get_worker([]).is_read_only(item)
+    assert not get_worker([], options={"auto_index": True}).is_read_only(item)
+    assert not get_worker([], options={"only_index": True}).is_read_only(item)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 02:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from pygpt_net.plugin.cmd_web.websearch import WebSearch, RateLimiter
+
+
+def get_websearch(options: dict) -> WebSearch:
+    defaults = {
+        "raw": False,
+        "pipeline": True,
+        "pipeline_fetch_workers": 4,
+        "pipeline_summary_workers": 4,
+        "pipeline_rpm": 0,
+        "max_page_content_length": 0,
+        "chunk_size": 10,
+        "max_result_length": 0,
+        "summary_max_tokens": 100,
+        "summary_model": "gpt-4o-mini",
+        "prompt_summarize": "Summarize: {query}",
+        "prompt_summarize_url": "Summarize",
+        "prompt_reduce": "Merge: {query}",
+        "img_thumbnail": False,
+        "auto_index": False,
+    }
+    defaults.update(options)
+    plugin = MagicMock()
+    plugin.get_option_value = MagicMock(side_effect=lambda key: defaults[key])
+    return WebSearch(plugin)
+
+
+def test_make_query_pipeline():
+    """Test concurrent fetch and map-reduce summarize"""
+    websearch = get_websearch({})
+    websearch.get_urls = MagicMock(return_value=["url1", "url2", "url3"])
+    pages = {"url1": "a" * 15, "url2": "", "url3": "c" * 5}
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def query_url(url):
+        with lock:
+            active.append(url)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(url)
+        return pages[url]
+
+    websearch.query_url = MagicMock(side_effect=query_url)
+    websearch.summarize = MagicMock(side_effect=lambda text, *args: "S({})".format(text))
+    result, total, current, url, img = websearch.make_query("test", 1)
+    assert max(peak) > 1  # fetched concurrently
+    assert total == 3
+    assert url == "url1"
+    # 2 chunks from url1, 1 from url3 (url2 is empty) + reduce call
+    assert websearch.summarize.call_count == 4
+    reduce_text = websearch.summarize.call_args_list[-1][0][0]
+    assert "From: url1\nS(aaaaaaaaaa)S(aaaaa)" in reduce_text
+    assert "From: url3\nS(ccccc)" in reduce_text
+    assert result == "S({})".format(reduce_text)
+
+
+def test_make_query_single():
+    """Test single result mode (first page with content)"""
+    websearch = get_websearch({"pipeline": False})
+    websearch.get_urls = MagicMock(return_value=["url1", "url2"])
+    websearch.query_url = MagicMock(side_effect=lambda url: "" if url == "url1" else "content")
+    websearch.summarize = MagicMock(return_value="summary")
+    result, total, current, url, img = websearch.make_query("test", 1)
+    assert result == "summary"
+    assert url == "url2"
+    assert websearch.summarize.call_count == 1
+
+
+def test_get_summaries_order():
+    """Test summaries are returned in order of chunks"""
+    websearch = get_websearch({})
+
+    def summarize(text, *args):
+        time.sleep(0.01 * (5 - int(text)))
+        return text
+
+    websearch.summarize = MagicMock(side_effect=summarize)
+    assert websearch.get_summaries(["1", "2", "3", "4"], "test") == ["1", "2", "3", "4"]
+
+
+def test_rate_limiter():
+    """Test requests per minute limit"""
+    limiter = RateLimiter(rpm=600)  # 1 request per 0.1s
+    start = time.monotonic()
+    for i in range(3):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.2
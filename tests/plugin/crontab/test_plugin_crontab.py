@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.20 20:00:00                  #
+# ================================================== #
+
+from datetime import datetime
+
+from pygpt_net.plugin.crontab.scheduler import Scheduler
+
+
+def get_crontab():
+    return [
+        {"enabled": True, "crontab": "30 9 * * *", "prompt": "a", "preset": "_"},
+        {"enabled": True, "crontab": "0 * * * *", "prompt": "b", "preset": "_"},
+        {"enabled": False, "crontab": "* * * * *", "prompt": "c", "preset": "_"},
+        {"enabled": True, "crontab": "invalid", "prompt": "d", "preset": "_"},
+    ]
+
+
+def test_build():
+    """Test build queue"""
+    scheduler = Scheduler()
+    crontab = get_crontab()
+    scheduler.build(crontab, datetime(2025, 1, 20, 8, 15))
+    assert scheduler.count() == 2  # disabled and invalid are skipped
+    assert scheduler.get_next() == datetime(2025, 1, 20, 9, 0)
+    upcoming = scheduler.get_upcoming()
+    assert [item["prompt"] for _, item in upcoming] == ["b", "a"]
+    assert not scheduler.is_changed(crontab)
+    crontab[0]["crontab"] = "0 10 * * *"
+    assert scheduler.is_changed(crontab)
+
+
+def test_get_due():
+    """Test pop due tasks"""
+    scheduler = Scheduler()
+    scheduler.build(get_crontab(), datetime(2025, 1, 20, 8, 15))
+    assert scheduler.get_due(datetime(2025, 1, 20, 8, 59)) == []
+    due = scheduler.get_due(datetime(2025, 1, 20, 9, 0, 1))
+    assert [item["prompt"] for item in due] == ["b"]
+    assert scheduler.get_next() == datetime(2025, 1, 20, 9, 30)
+    due = scheduler.get_due(datetime(2025, 1, 20, 9, 30))
+    assert [item["prompt"] for item in due] == ["a"]
+    assert scheduler.get_next() == datetime(2025, 1, 20, 10, 0)
+
+
+def test_catch_up():
+    """Test missed runs policy"""
+    now = datetime(2025, 1, 20, 13, 10)  # resumed after suspend at 8:15
+    for policy, expected in [("once", ["a", "b"]), ("skip", []), ("all", ["a", "b", "b", "b", "b", "b"])]:
+        scheduler = Scheduler()
+        scheduler.build(get_crontab(), datetime(2025, 1, 20, 8, 15))
+        due = scheduler.get_due(now, policy)
+        assert sorted(item["prompt"] for item in due) == expected
+        assert scheduler.get_next() == datetime(2025, 1, 20, 14, 0)
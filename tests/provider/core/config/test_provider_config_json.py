@@ -6,11 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.04 13:00:00                  #
+# Updated Date: 2025.01.20 21:00:00                  #
 # ================================================== #
 
 import json
 import os
+import tempfile
 from unittest.mock import MagicMock, patch, mock_open
 from packaging.version import parse as parse_version, Version
 
@@ -78,12 +79,47 @@ def test_save(mock_window):
     data = items
     data['__meta__'] = mock_window.core.config.append_meta()
     dump = json.dumps(data, indent=4)
-    with patch('builtins.open', mock_open()) as mocked_file:
+    with patch('builtins.open', mock_open()) as mocked_file, \
+            patch('os.fsync'), \
+            patch('os.replace') as mock_replace:
         with patch('json.dumps', return_value=dump) as mock_json_dumps:
             provider.save(items)
             mock_json_dumps.assert_called_once_with(data, indent=4)
-            mocked_file.assert_called_once_with(path, 'w', encoding="utf-8")
+            mocked_file.assert_called_once_with(path + ".tmp", 'w', encoding="utf-8")
             mocked_file().write.assert_called_once_with(dump)
+            mock_replace.assert_called_once_with(path + ".tmp", path)
+
+
+def test_save_atomic(mock_window):
+    """Test atomic save and skip unchanged"""
+    provider = JsonFileProvider(mock_window)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        provider.path = tmp_dir
+        path = os.path.join(tmp_dir, provider.config_file)
+        provider.save({"foo": "bar"})
+        with open(path, 'r', encoding="utf-8") as f:
+            assert json.load(f)["foo"] == "bar"
+        assert not os.path.exists(path + ".tmp")
+
+        with patch('os.replace') as mock_replace:
+            provider.save({"foo": "bar"})  # not changed
+            mock_replace.assert_not_called()
+
+        provider.save({"foo": "baz"}, background=True)
+        provider.flush()
+        with open(path, 'r', encoding="utf-8") as f:
+            assert json.load(f)["foo"] == "baz"
+
+
+def test_write_outdated(mock_window):
+    """Test skip outdated write"""
+    provider = JsonFileProvider(mock_window)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, provider.config_file)
+        provider.write(path, '{"foo": "new"}', 2)
+        provider.write(path, '{"foo": "old"}', 1)
+        with open(path, 'r', encoding="utf-8") as f:
+            assert json.load(f)["foo"] == "new"
 
 
 def test_get_options(mock_window):
@@ -6,12 +6,17 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 19:00:00                  #
+# Updated Date: 2025.01.21 08:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch, mock_open, Mock
 
-from pygpt_net.item.ctx import CtxItem, CtxMeta
+import pytest
+from sqlalchemy import create_engine, text
+
+from pygpt_net.core.ctx.writer import Writer
+from pygpt_net.item.ctx import CtxItem, CtxMeta, CtxGroup
+from pygpt_net.migrations import Migrations
 from tests.mocks import mock_window
 from pygpt_net.provider.core.ctx.db_sqlite.storage import Storage
 from pygpt_net.provider.core.ctx.db_sqlite.utils import *
@@ -267,6 +272,99 @@ def test_insert_item(mock_window):
     assert result == 1
 
 
+def test_insert_item_queued(mock_window):
+    """Test insert item with write-behind queue"""
+    storage = Storage(mock_window)
+    mock_window.core.config.data["ctx.write_behind"] = True
+    mock_window.core.ctx.writer.insert = MagicMock(return_value=10)
+    meta = CtxMeta()
+    item = CtxItem()
+    meta.id = 1
+    mock_db = MagicMock()
+    with patch('pygpt_net.core.db.Database.get_db', return_value=mock_db) as mock_get_db:
+        mock_window.core.db.get_db = mock_get_db
+        result = storage.insert_item(meta, item)
+        storage.update_item(item)
+
+    assert result == 10
+    assert item.id == 10
+    assert mock_window.core.ctx.writer.insert.call_args[0][0] == "ctx_item"
+    assert mock_window.core.ctx.writer.add.call_args[0][1] == ("ctx_item", 10)
+    mock_db.begin.assert_not_called()
+
+
+@pytest.fixture
+def sqlite_window(mock_window, tmp_path):
+    engine = create_engine("sqlite:///{}".format(tmp_path / "db.sqlite"))
+    with engine.begin() as conn:
+        migrations = sorted(Migrations().get_versions(), key=lambda m: m.__class__.__name__)
+        for migration in migrations:
+            migration.up(conn)
+    mock_window.core.db.get_db = MagicMock(return_value=engine)
+    mock_window.core.config.data["ctx.write_behind"] = True
+    mock_window.core.ctx.writer = Writer(mock_window)
+    yield mock_window
+    mock_window.core.ctx.writer.stop()
+
+
+def test_write_behind_sqlite(sqlite_window):
+    """Test queued and direct writes on real database"""
+    storage = Storage(sqlite_window)
+    writer = sqlite_window.core.ctx.writer
+    writer.DELAY = 10  # commit on flush only
+    meta = CtxMeta()
+    meta.name = "test"
+    item = CtxItem()
+    item.output = "output"
+    storage.insert_meta(meta)
+    storage.insert_item(meta, item)
+    item.output = "updated"
+    storage.update_item(item)
+    storage.update_meta_ts(meta.id)
+    storage.set_meta_ts(meta.id, 100)
+    storage.update_meta(meta)
+    assert writer.get_stats()["queued"] == 5  # inserts, item update, meta ts (coalesced), meta update
+
+    storage.set_meta_indexed_by_id(meta.id, 200)  # direct, flushes queue
+    meta.indexes = {"base": {}}
+    storage.update_meta_indexes_by_id(meta.id, meta)
+    assert writer.get_stats() == {"queued": 0, "batches": 1, "writes": 5}
+
+    items = storage.get_items(meta.id)
+    assert [(i.id, i.output) for i in items] == [(item.id, "updated")]
+    db = sqlite_window.core.db.get_db()
+    with db.connect() as conn:
+        row = conn.execute(text("SELECT updated_ts, indexed_ts, indexes_json FROM ctx_meta WHERE id = :id")
+                           .bindparams(id=meta.id)).fetchone()
+    assert row[0] == 100
+    assert row[1] == 200
+    assert "base" in row[2]
+
+    storage.update_meta_indexed_by_id(meta.id)
+    storage.clear_meta_indexed_by_id(meta.id)
+    assert storage.get_meta_by_id(meta.id).indexed == 0
+
+    group = CtxGroup()
+    group.name = "group"
+    storage.insert_group(group)
+    group.name = "renamed"
+    storage.update_group(group)
+    assert storage.get_groups()[group.id].name == "renamed"
+    storage.delete_group(group.id)
+    assert storage.get_groups() == {}
+
+
+def test_has_fts_cached(sqlite_window):
+    """Test FTS availability is checked once per database"""
+    storage = Storage(sqlite_window)
+    assert storage.has_fts()
+    with sqlite_window.core.db.get_db().begin() as conn:
+        conn.execute(text("DROP TABLE ctx_item_fts"))
+    assert storage.has_fts()  # cached
+    storage.reset_schema()  # after migration
+    assert not storage.has_fts()
+
+
 def test_unpack_meta(mock_window):
     """Test unpack meta"""
     storage = Storage(mock_window)
@@ -408,3 +506,11 @@ def test_unpack_item_value():
     assert unpack_item_value('1') == 1
     assert unpack_item_value('[1, 2, 3]') == [1, 2, 3]
     assert unpack_item_value('{"a": 1, "b": 2}') == {'a': 1, 'b': 2}
+
+
+def test_prepare_fts_query():
+    """Test prepare FTS query"""
+    assert prepare_fts_query('') == ''
+    assert prepare_fts_query('  ?! ') == ''
+    assert prepare_fts_query('hello') == '"hello"*'
+    assert prepare_fts_query('hello "world" OR x') == '"hello"* "world"* "OR"* "x"*'
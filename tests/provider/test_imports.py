@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 09:00:00                  #
+# ================================================== #
+
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+# providers registered at startup, integration packages must be imported on first use only
+MODULES = [
+    "pygpt_net.provider.llms.anthropic",
+    "pygpt_net.provider.llms.azure_openai",
+    "pygpt_net.provider.llms.google",
+    "pygpt_net.provider.llms.hugging_face",
+    "pygpt_net.provider.llms.hugging_face_api",
+    "pygpt_net.provider.llms.local",
+    "pygpt_net.provider.llms.ollama",
+    "pygpt_net.provider.llms.openai",
+    "pygpt_net.provider.vector_stores.chroma",
+    "pygpt_net.provider.vector_stores.elasticsearch",
+    "pygpt_net.provider.vector_stores.pinecode",
+    "pygpt_net.provider.vector_stores.redis",
+    "pygpt_net.provider.loaders.file_csv",
+    "pygpt_net.provider.loaders.file_docx",
+    "pygpt_net.provider.loaders.file_pdf",
+    "pygpt_net.provider.loaders.web_yt",
+    "pygpt_net.provider.loaders.web_github_repo",
+    "pygpt_net.provider.audio_input.google_speech_recognition",
+    "pygpt_net.core.idx.llm",
+]
+HEAVY = [
+    "chromadb",
+    "pinecone",
+    "docker",
+    "jupyter_client",
+    "speech_recognition",
+    "langchain_openai",
+    "langchain_community",
+    "llama_index.llms.openai",
+    "llama_index.llms.anthropic",
+    "llama_index.vector_stores.chroma",
+    "llama_index.vector_stores.pinecone",
+    "llama_index.readers.file",
+]
+
+
+def get_imported(stderr: str) -> list:
+    """
+    Get names of imported modules from -X importtime output
+
+    :param stderr: stderr of python process
+    :return: list of module names
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            name = line.split("|")[2].strip()
+            if name != "imported package":  # header line
+                modules.append(name)
+    return modules
+
+
+def test_provider_imports_are_lazy():
+    """Test importing providers does not import integration packages"""
+    code = (
+        "for name in {modules!r}:\n"
+        "    __import__(name)\n"  # importlib.import_module() is not reported by -X importtime
+    ).format(modules=MODULES)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    imported = get_imported(result.stderr)
+    assert "pygpt_net.provider.llms.openai" in imported
+    loaded = [m for m in imported if any(m == h or m.startswith(h + ".") for h in HEAVY)]
+    assert loaded == []
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2025.01.21 09:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.provider.vector_stores import Storage
+from pygpt_net.provider.vector_stores.cache import IndexCache
+
+
+def test_get_put(mock_window):
+    """Test get and put"""
+    mock_window.core.config.get = MagicMock(return_value=1)
+    cache = IndexCache(window=mock_window)
+    index = MagicMock()
+    embed_model = MagicMock()
+    embed_model.model_name = "test-embed"
+    assert cache.get("SimpleVectorStore", "base", embed_model) is None
+    cache.put("SimpleVectorStore", "base", index, embed_model)
+    assert cache.get("SimpleVectorStore", "base", embed_model) == index
+    assert cache.get("SimpleVectorStore", "other", embed_model) is None
+    assert cache.get("ChromaVectorStore", "base", embed_model) is None
+
+
+def test_disabled(mock_window):
+    """Test disabled cache"""
+    mock_window.core.config.get = MagicMock(return_value=0)
+    cache = IndexCache(window=mock_window)
+    cache.put("SimpleVectorStore", "base", MagicMock())
+    assert cache.get("SimpleVectorStore", "base") is None
+
+
+def test_invalidate(mock_window):
+    """Test invalidate"""
+    mock_window.core.config.get = MagicMock(return_value=1)
+    cache = IndexCache(window=mock_window)
+    embed_model = MagicMock()
+    embed_model.model_name = "test-embed"
+    cache.put("SimpleVectorStore", "base", MagicMock())
+    cache.put("SimpleVectorStore", "base", MagicMock(), embed_model)
+    cache.put("SimpleVectorStore", "other", MagicMock())
+    cache.invalidate("SimpleVectorStore", "base")
+    assert cache.get("SimpleVectorStore", "base") is None
+    assert cache.get("SimpleVectorStore", "base", embed_model) is None
+    assert cache.get("SimpleVectorStore", "other") is not None
+
+
+def test_evict(mock_window):
+    """Test LRU eviction"""
+    mock_window.core.config.get = MagicMock(return_value=1)  # 1 MB
+    cache = IndexCache(window=mock_window)
+    cache.get_size = MagicMock(return_value=400 * 1024)
+    cache.put("SimpleVectorStore", "a", MagicMock())
+    cache.put("SimpleVectorStore", "b", MagicMock())
+    assert cache.get("SimpleVectorStore", "a") is not None  # a is now most recently used
+    cache.put("SimpleVectorStore", "c", MagicMock())
+    assert cache.get("SimpleVectorStore", "b") is None
+    assert cache.get("SimpleVectorStore", "a") is not None
+    assert cache.get("SimpleVectorStore", "c") is not None
+    assert cache.size == 800 * 1024
+
+    cache.get_size = MagicMock(return_value=2 * 1024 * 1024)  # too big
+    cache.put("SimpleVectorStore", "d", MagicMock())
+    assert cache.get("SimpleVectorStore", "d") is None
+
+
+def test_invalidate_after_write(mock_window):
+    """Test index cached while storing is invalidated after write"""
+    mock_window.core.config.get = MagicMock(return_value=1)
+    storage = Storage(window=mock_window)
+    store = MagicMock()
+    store.id = "SimpleVectorStore"
+    storage.get_storage = MagicMock(return_value=store)
+
+    def write(*args, **kwargs):
+        storage.cache.put(store.id, "base", MagicMock())  # concurrent get() during write
+
+    store.store = MagicMock(side_effect=write)
+    store.remove_document = MagicMock(side_effect=write)
+    storage.store("base", MagicMock())
+    assert storage.cache.get(store.id, "base") is None
+    storage.remove_document("base", "doc_id")
+    assert storage.cache.get(store.id, "base") is None
+
+
+def test_get_workdir_changed(mock_window):
+    """Test index cached in previous workdir is not returned"""
+    mock_window.core.config.get = MagicMock(return_value=1)
+    storage = Storage(window=mock_window)
+    store = MagicMock()
+    store.id = "SimpleVectorStore"
+    store.get_path = MagicMock(return_value="/old/idx/base")
+    store.get = MagicMock(side_effect=lambda **kwargs: MagicMock())
+    storage.get_storage = MagicMock(return_value=store)
+
+    index = storage.get("base", cache=True)
+    assert storage.get("base", cache=True) == index
+    store.get_path = MagicMock(return_value="/new/idx/base")
+    assert storage.get("base", cache=True) != index
+    assert store.get.call_count == 2